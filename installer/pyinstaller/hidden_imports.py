@@ -1,13 +1,21 @@
 from samcli.cli.command import _SAM_CLI_COMMAND_PACKAGES
+from samcli.commands.local.local import LOCAL_COMMAND_PACKAGES
+from samcli.commands.pipeline.pipeline import PIPELINE_COMMAND_PACKAGES
 
-SAM_CLI_HIDDEN_IMPORTS = _SAM_CLI_COMMAND_PACKAGES + [
-    "cookiecutter.extensions",
-    "jinja2_time",
-    "text_unidecode",
-    "samtranslator",
-    # default hidden import 'pkg_resources.py2_warn' is added
-    # since pyInstaller 4.0.
-    "pkg_resources.py2_warn",
-    "aws_lambda_builders.workflows",
-    "configparser",
-]
+# Subcommands of the command groups are imported lazily, so they are not found by PyInstaller's import analysis
+SAM_CLI_HIDDEN_IMPORTS = (
+    _SAM_CLI_COMMAND_PACKAGES
+    + list(LOCAL_COMMAND_PACKAGES.values())
+    + list(PIPELINE_COMMAND_PACKAGES.values())
+    + [
+        "cookiecutter.extensions",
+        "jinja2_time",
+        "text_unidecode",
+        "samtranslator",
+        # default hidden import 'pkg_resources.py2_warn' is added
+        # since pyInstaller 4.0.
+        "pkg_resources.py2_warn",
+        "aws_lambda_builders.workflows",
+        "configparser",
+    ]
+)
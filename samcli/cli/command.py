@@ -5,6 +5,7 @@ Base classes that implement the CLI framework
 import logging
 import importlib
 from collections import OrderedDict
+from typing import Dict, List, Optional
 
 import click
 
@@ -121,3 +122,31 @@ class BaseCommand(click.MultiCommand):
             return None
 
         return mod.cli
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported only when they are invoked, or when their help is shown.
+
+    Like ``BaseCommand``, each subcommand is expected to be exposed through an attribute called ``cli`` of its module,
+    so that the modules (and the libraries they import) of the other subcommands are not loaded when a subcommand runs.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Parameters
+        ----------
+        lazy_commands : Optional[Dict[str, str]]
+            Names of the subcommands mapped to the names of the modules which implement them
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands.keys()))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module = importlib.import_module(self.lazy_commands[cmd_name])
+            self.add_command(module.cli, cmd_name)
+        return super().get_command(ctx, cmd_name)
@@ -6,13 +6,10 @@ import logging
 import uuid
 from typing import Optional, cast, List
 
-import boto3
-import botocore
-import botocore.session
-from botocore import credentials
 import click
 
 from samcli.commands.exceptions import CredentialsError
+from samcli.lib.utils.lazy_module import LazyModule
 from samcli.lib.utils.sam_logging import (
     LAMBDA_BULDERS_LOGGER_NAME,
     SamCliLogger,
@@ -20,6 +17,12 @@ from samcli.lib.utils.sam_logging import (
     SAM_CLI_LOGGER_NAME,
 )
 
+# boto3 and botocore are imported when the session is refreshed, to keep them out of the startup of every command
+boto3 = LazyModule("boto3")
+botocore_session_module = LazyModule("botocore.session")
+botocore_exceptions = LazyModule("botocore.exceptions")
+credentials = LazyModule("botocore.credentials")
+
 
 class Context:
     """
@@ -182,7 +185,7 @@ class Context:
         region & profile), it will call this method to create a new session with latest values for these properties.
         """
         try:
-            botocore_session = botocore.session.get_session()
+            botocore_session = botocore_session_module.get_session()
             boto3.setup_default_session(
                 botocore_session=botocore_session, region_name=self._aws_region, profile_name=self._aws_profile
             )
@@ -191,7 +194,7 @@ class Context:
                 "assume-role"
             ).cache = credentials.JSONFileCache()
 
-        except botocore.exceptions.ProfileNotFound as ex:
+        except botocore_exceptions.ProfileNotFound as ex:
             raise CredentialsError(str(ex)) from ex
 
 
@@ -9,13 +9,14 @@ import click
 
 from samcli import __version__
 from samcli.lib.telemetry.metric import send_installed_metric, emit_all_metrics
+from samcli.lib.telemetry.telemetry import flush_in_background
 from samcli.lib.utils.sam_logging import (
     LAMBDA_BULDERS_LOGGER_NAME,
     SamCliLogger,
     SAM_CLI_FORMATTER,
     SAM_CLI_LOGGER_NAME,
 )
-from .options import debug_option, region_option, profile_option
+from .options import debug_option, region_option, profile_option, trace_file_option
 from .context import Context
 from .command import BaseCommand
 from .global_config import GlobalConfig
@@ -34,6 +35,7 @@ def common_options(f):
     :return: Callback function
     """
     f = debug_option(f)
+    f = trace_file_option(f)
     return f
 
 
@@ -136,7 +138,11 @@ def cli(ctx):
     lambda_builders_logger = logging.getLogger(LAMBDA_BULDERS_LOGGER_NAME)
     botocore_logger = logging.getLogger("botocore")
 
+    # metrics are only spooled by the command, and sent in the background so that exiting never waits for them.
+    # exit handlers are called in the reverse order, the spool is flushed after all the metrics are emitted
+    atexit.register(flush_in_background, on_exit=True)
     atexit.register(emit_all_metrics)
+    flush_in_background(on_exit=False)
 
     SamCliLogger.configure_logger(sam_cli_logger, SAM_CLI_FORMATTER, logging.INFO)
     SamCliLogger.configure_logger(lambda_builders_logger, SAM_CLI_FORMATTER, logging.INFO)
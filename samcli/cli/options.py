@@ -5,6 +5,8 @@ become a repository of options that other commands could use when needed.
 
 import click
 
+from samcli.lib.utils.profiling import TRACE_FILE_ENV_VAR, enable_profiling
+
 from .context import Context
 
 
@@ -30,6 +32,28 @@ def debug_option(f):
     )(f)
 
 
+def trace_file_option(f):
+    """
+    Configures --trace-file option for CLI
+
+    :param f: Callback Function to be passed to Click
+    """
+
+    def callback(ctx, param, value):
+        if value:
+            enable_profiling(value)
+        return value
+
+    return click.option(
+        "--trace-file",
+        expose_value=False,
+        type=click.Path(dir_okay=False, writable=True),
+        envvar=TRACE_FILE_ENV_VAR,
+        help="Profile the command, and write the duration of its phases to the given file in Chrome trace format.",
+        callback=callback,
+    )(f)
+
+
 def region_option(f):
     """
     Configures --region option for CLI
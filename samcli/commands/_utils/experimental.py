@@ -11,7 +11,7 @@ import click
 from samcli.cli.context import Context
 
 from samcli.cli.global_config import ConfigEntry, GlobalConfig
-from samcli.commands._utils.options import parameterized_option
+from samcli.commands._utils.option_decorators import parameterized_option
 from samcli.lib.utils.colors import Colored
 
 LOG = logging.getLogger(__name__)
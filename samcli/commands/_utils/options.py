@@ -5,7 +5,6 @@ Common CLI options shared by various commands
 import os
 import logging
 from functools import partial
-import types
 
 import click
 from click.types import FuncParamType
@@ -20,6 +19,7 @@ from samcli.cli.types import (
     ImageRepositoriesType,
 )
 from samcli.commands._utils.custom_options.option_nargs import OptionNargs
+from samcli.commands._utils.option_decorators import parameterized_option
 from samcli.commands._utils.template import get_template_artifacts_format
 from samcli.lib.observability.util import OutputOption
 from samcli.lib.utils.packagetype import ZIP, IMAGE
@@ -33,43 +33,6 @@ DEFAULT_CACHE_DIR = os.path.join(".aws-sam", "cache")
 LOG = logging.getLogger(__name__)
 
 
-def parameterized_option(option):
-    """Meta decorator for option decorators.
-    This adds the ability to specify optional parameters for option decorators.
-
-    Usage:
-        @parameterized_option
-        def some_option(f, required=False)
-            ...
-
-        @some_option
-        def command(...)
-
-        or
-
-        @some_option(required=True)
-        def command(...)
-    """
-
-    def parameter_wrapper(*args, **kwargs):
-        if len(args) == 1 and isinstance(args[0], types.FunctionType):
-            # Case when option decorator does not have parameter
-            # @stack_name_option
-            # def command(...)
-            return option(args[0])
-
-        # Case when option decorator does have parameter
-        # @stack_name_option("a", "b")
-        # def command(...)
-
-        def option_wrapper(f):
-            return option(f, *args, **kwargs)
-
-        return option_wrapper
-
-    return parameter_wrapper
-
-
 def get_or_default_template_file_name(ctx, param, provided_value, include_build):
     """
     Default value for the template file name option is more complex than what Click can handle.
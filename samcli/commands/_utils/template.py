@@ -12,6 +12,7 @@ from botocore.utils import set_value_from_jmespath
 from samcli.commands.exceptions import UserException
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer, ASSET_PATH_METADATA_KEY
 from samcli.lib.utils.packagetype import ZIP, IMAGE
+from samcli.lib.utils.profiling import CATEGORY_TEMPLATE, profile_phase
 from samcli.yamlhelper import yaml_parse, yaml_dump
 from samcli.lib.utils.resources import (
     METADATA_WITH_LOCAL_PATHS,
@@ -47,7 +48,9 @@ def get_template_data(template_file):
     if not pathlib.Path(template_file).exists():
         raise TemplateNotFoundException("Template file not found at {}".format(template_file))
 
-    with open(template_file, "r", encoding="utf-8") as fp:
+    with profile_phase("parse_template", CATEGORY_TEMPLATE, template=template_file), open(
+        template_file, "r", encoding="utf-8"
+    ) as fp:
         try:
             return yaml_parse(fp.read())
         except (ValueError, yaml.YAMLError) as ex:
@@ -224,8 +224,16 @@ class InitTemplates:
         In an attempt to reduce initial wait time to achieve an interactive
         flow <= 10sec, This method first attempts to spools just the manifest file and
         if the manifest can't be spooled, it attempts to clone the cli template git repo or
-        use local cli template
+        use local cli template. If the local clone is already at the required commit, its manifest is used without
+        any network call.
         """
+        if self._git_repo.is_clone_up_to_date(
+            GlobalConfig().config_dir, APP_TEMPLATES_REPO_NAME, APP_TEMPLATES_REPO_COMMIT
+        ):
+            self.clone_templates_repo()
+            with open(str(self.get_manifest_path())) as fp:
+                return json.loads(fp.read())
+
         try:
             response = requests.get(MANIFEST_URL, timeout=10)
             body = response.text
@@ -19,6 +19,7 @@ from samcli.commands.local.cli_common.user_exceptions import InvokeContextExcept
 from samcli.commands.local.lib.local_lambda import LocalLambdaRunner
 from samcli.commands.local.lib.debug_context import DebugContext
 from samcli.local.lambdafn.runtime import LambdaRuntime, WarmLambdaRuntime
+from samcli.local.lambdafn.container_pool import DEFAULT_POOL_MIN_SIZE, DEFAULT_POOL_MAX_SIZE
 from samcli.local.docker.lambda_image import LambdaImage
 from samcli.local.docker.manager import ContainerManager
 from samcli.commands._utils.template import TemplateNotFoundException, TemplateFailedParsingException
@@ -70,10 +71,14 @@ class InvokeContext:
         parameter_overrides: Optional[Dict] = None,
         layer_cache_basedir: Optional[str] = None,
         force_image_build: Optional[bool] = None,
+        mount_local_layers: bool = False,
         aws_region: Optional[str] = None,
         aws_profile: Optional[str] = None,
         warm_container_initialization_mode: Optional[str] = None,
         debug_function: Optional[str] = None,
+        warm_containers_pool_min_size: Optional[int] = None,
+        warm_containers_pool_max_size: Optional[int] = None,
+        warm_containers_idle_timeout: Optional[int] = None,
         shutdown: bool = False,
         container_host: Optional[str] = None,
         container_host_interface: Optional[str] = None,
@@ -112,6 +117,9 @@ class InvokeContext:
             String representing the path to the layer cache directory
         force_image_build bool
             Whether or not to force build the image
+        mount_local_layers bool
+            Optional. If True, the layers defined in the template are mounted into the container instead of being
+            built into the image. Default False.
         aws_region str
             AWS region to use
         warm_container_initialization_mode str
@@ -122,6 +130,14 @@ class InvokeContext:
         debug_function str
             The Lambda function logicalId that will have the debugging options enabled in case of warm containers
             option is enabled
+        warm_containers_pool_min_size int
+            Optional. Number of warm containers kept for each function, even if they are idle. Default 1.
+        warm_containers_pool_max_size int
+            Optional. Maximum number of warm containers for each function, so the number of concurrent invocations
+            that each function can serve. Default 1.
+        warm_containers_idle_timeout int
+            Optional. Number of seconds after which an idle warm container above the minimum pool size is terminated.
+            Idle containers are not terminated by default.
         shutdown bool
             Optional. If True, perform a SHUTDOWN event when tearing down containers. Default False.
         container_host string
@@ -151,6 +167,7 @@ class InvokeContext:
 
         self._layer_cache_basedir = layer_cache_basedir
         self._force_image_build = force_image_build
+        self._mount_local_layers = mount_local_layers
         self._aws_region = aws_region
         self._aws_profile = aws_profile
         self._shutdown = shutdown
@@ -167,6 +184,11 @@ class InvokeContext:
             self._containers_initializing_mode = ContainersInitializationMode(warm_container_initialization_mode)
 
         self._debug_function = debug_function
+        self._warm_containers_pool_min_size = (
+            warm_containers_pool_min_size if warm_containers_pool_min_size is not None else DEFAULT_POOL_MIN_SIZE
+        )
+        self._warm_containers_pool_max_size = warm_containers_pool_max_size or DEFAULT_POOL_MAX_SIZE
+        self._warm_containers_idle_timeout = warm_containers_idle_timeout
 
         # Note(xinhol): despite self._function_provider and self._stacks are initialized as None
         # they will be assigned with a non-None value in __enter__() and
@@ -330,10 +352,20 @@ class InvokeContext:
         if not self._lambda_runtimes:
             layer_downloader = LayerDownloader(self._layer_cache_basedir, self.get_cwd(), self._stacks)
             image_builder = LambdaImage(
-                layer_downloader, self._skip_pull_image, self._force_image_build, invoke_images=self._invoke_images
+                layer_downloader,
+                self._skip_pull_image,
+                self._force_image_build,
+                invoke_images=self._invoke_images,
+                mount_local_layers=self._mount_local_layers,
             )
             self._lambda_runtimes = {
-                ContainersMode.WARM: WarmLambdaRuntime(self._container_manager, image_builder),
+                ContainersMode.WARM: WarmLambdaRuntime(
+                    self._container_manager,
+                    image_builder,
+                    pool_min_size=self._warm_containers_pool_min_size,
+                    pool_max_size=max(self._warm_containers_pool_max_size, self._warm_containers_pool_min_size),
+                    pool_idle_timeout=self._warm_containers_idle_timeout,
+                ),
                 ContainersMode.COLD: LambdaRuntime(self._container_manager, image_builder),
             }
 
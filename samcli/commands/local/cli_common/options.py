@@ -194,7 +194,15 @@ def invoke_common_options(f):
                 help="Specify whether CLI should rebuild the image used for invoking functions with layers.",
                 envvar="SAM_FORCE_IMAGE_BUILD",
                 default=False,
-            )
+            ),
+            click.option(
+                "--mount-local-layers",
+                is_flag=True,
+                help="Specify whether CLI should mount the layers which are defined in the template into the "
+                "container, instead of building an image which contains them.",
+                envvar="SAM_MOUNT_LOCAL_LAYERS",
+                default=False,
+            ),
         ]
     )
 
@@ -237,6 +245,24 @@ def warm_containers_common_options(f):
             type=click.STRING,
             multiple=False,
         ),
+        click.option(
+            "--warm-containers-pool-min-size",
+            help="Optional. Number of warm containers kept for each function when --warm-containers is specified,"
+            " even if they are idle. Default is 1.",
+            type=click.IntRange(min=0),
+        ),
+        click.option(
+            "--warm-containers-pool-max-size",
+            help="Optional. Maximum number of warm containers for each function when --warm-containers is specified,"
+            " which is the number of concurrent invocations a function can serve. Default is 1.",
+            type=click.IntRange(min=1),
+        ),
+        click.option(
+            "--warm-containers-idle-timeout",
+            help="Optional. Number of seconds after which an idle warm container above"
+            " --warm-containers-pool-min-size is terminated. By default idle containers are not terminated.",
+            type=click.IntRange(min=0),
+        ),
     ]
 
     # Reverse the list to maintain ordering of options in help text printed with --help
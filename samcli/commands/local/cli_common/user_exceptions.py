@@ -47,6 +47,12 @@ class ResourceNotFound(UserException):
     """
 
 
+class LayerChecksumMismatch(UserException):
+    """
+    The downloaded content of a LayerVersion doesn't match its CodeSha256
+    """
+
+
 class InvalidLayerVersionArn(UserException):
     """
     The LayerVersion Arn given in the template is Invalid
@@ -69,6 +69,7 @@ def cli(
     layer_cache_basedir,
     skip_pull_image,
     force_image_build,
+    mount_local_layers,
     shutdown,
     parameter_overrides,
     config_file,
@@ -99,6 +100,7 @@ def cli(
         layer_cache_basedir,
         skip_pull_image,
         force_image_build,
+        mount_local_layers,
         shutdown,
         parameter_overrides,
         container_host,
@@ -124,6 +126,7 @@ def do_cli(  # pylint: disable=R0914
     layer_cache_basedir,
     skip_pull_image,
     force_image_build,
+    mount_local_layers,
     shutdown,
     parameter_overrides,
     container_host,
@@ -170,6 +173,7 @@ def do_cli(  # pylint: disable=R0914
             parameter_overrides=parameter_overrides,
             layer_cache_basedir=layer_cache_basedir,
             force_image_build=force_image_build,
+            mount_local_layers=mount_local_layers,
             aws_region=ctx.region,
             aws_profile=ctx.profile,
             shutdown=shutdown,
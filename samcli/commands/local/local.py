@@ -5,21 +5,19 @@ setting up stdin/stdout etc
 
 import click
 
-from .invoke.cli import cli as invoke_cli
-from .start_api.cli import cli as start_api_cli
-from .generate_event.cli import cli as generate_event_cli
-from .start_lambda.cli import cli as start_lambda_cli
+from samcli.cli.command import LazyGroup
 
+# Subcommands are imported only when they are invoked
+LOCAL_COMMAND_PACKAGES = {
+    "invoke": "samcli.commands.local.invoke.cli",
+    "start-api": "samcli.commands.local.start_api.cli",
+    "generate-event": "samcli.commands.local.generate_event.cli",
+    "start-lambda": "samcli.commands.local.start_lambda.cli",
+}
 
-@click.group()
+
+@click.group(cls=LazyGroup, lazy_commands=LOCAL_COMMAND_PACKAGES)
 def cli():
     """
     Run your Serverless application locally for quick development & testing
     """
-
-
-# Add individual commands under this group
-cli.add_command(invoke_cli)
-cli.add_command(start_api_cli)
-cli.add_command(generate_event_cli)
-cli.add_command(start_lambda_cli)
@@ -87,12 +87,16 @@ def cli(
     layer_cache_basedir,
     skip_pull_image,
     force_image_build,
+    mount_local_layers,
     parameter_overrides,
     config_file,
     config_env,
     warm_containers,
     shutdown,
     debug_function,
+    warm_containers_pool_min_size,
+    warm_containers_pool_max_size,
+    warm_containers_idle_timeout,
     container_host,
     container_host_interface,
     invoke_image,
@@ -118,10 +122,14 @@ def cli(
         layer_cache_basedir,
         skip_pull_image,
         force_image_build,
+        mount_local_layers,
         parameter_overrides,
         warm_containers,
         shutdown,
         debug_function,
+        warm_containers_pool_min_size,
+        warm_containers_pool_max_size,
+        warm_containers_idle_timeout,
         container_host,
         container_host_interface,
         invoke_image,
@@ -144,10 +152,14 @@ def do_cli(  # pylint: disable=R0914
     layer_cache_basedir,
     skip_pull_image,
     force_image_build,
+    mount_local_layers,
     parameter_overrides,
     warm_containers,
     shutdown,
     debug_function,
+    warm_containers_pool_min_size,
+    warm_containers_pool_max_size,
+    warm_containers_idle_timeout,
     container_host,
     container_host_interface,
     invoke_image,
@@ -187,10 +199,14 @@ def do_cli(  # pylint: disable=R0914
             parameter_overrides=parameter_overrides,
             layer_cache_basedir=layer_cache_basedir,
             force_image_build=force_image_build,
+            mount_local_layers=mount_local_layers,
             aws_region=ctx.region,
             aws_profile=ctx.profile,
             warm_container_initialization_mode=warm_containers,
             debug_function=debug_function,
+            warm_containers_pool_min_size=warm_containers_pool_min_size,
+            warm_containers_pool_max_size=warm_containers_pool_max_size,
+            warm_containers_idle_timeout=warm_containers_idle_timeout,
             shutdown=shutdown,
             container_host=container_host,
             container_host_interface=container_host_interface,
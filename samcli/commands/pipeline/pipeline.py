@@ -5,17 +5,17 @@ setting up stdin/stdout etc
 
 import click
 
-from .bootstrap.cli import cli as bootstrap_cli
-from .init.cli import cli as init_cli
+from samcli.cli.command import LazyGroup
 
+# Subcommands are imported only when they are invoked
+PIPELINE_COMMAND_PACKAGES = {
+    "bootstrap": "samcli.commands.pipeline.bootstrap.cli",
+    "init": "samcli.commands.pipeline.init.cli",
+}
 
-@click.group()
+
+@click.group(cls=LazyGroup, lazy_commands=PIPELINE_COMMAND_PACKAGES)
 def cli() -> None:
     """
     Manage the continuous delivery of the application
     """
-
-
-# Add individual commands under this group
-cli.add_command(bootstrap_cli)
-cli.add_command(init_cli)
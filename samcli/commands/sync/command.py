@@ -127,6 +127,13 @@ DEFAULT_CAPABILITIES = ("CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND")
     help="This option separates the dependencies of individual function into another layer, for speeding up the sync"
     "process",
 )
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of resources which are synced at the same time. "
+    "Defaults to a value based on the number of processors of the machine.",
+)
 @stack_name_option(required=True)  # pylint: disable=E1120
 @base_dir_option
 @image_repository_option
@@ -157,6 +164,7 @@ def cli(
     resource_id: Optional[Tuple[str]],
     resource: Optional[Tuple[str]],
     dependency_layer: bool,
+    max_workers: Optional[int],
     stack_name: str,
     base_dir: Optional[str],
     parameter_overrides: dict,
@@ -185,6 +193,7 @@ def cli(
         resource_id,
         resource,
         dependency_layer,
+        max_workers,
         stack_name,
         ctx.region,
         ctx.profile,
@@ -212,6 +221,7 @@ def do_cli(
     resource_id: Optional[Tuple[str]],
     resource: Optional[Tuple[str]],
     dependency_layer: bool,
+    max_workers: Optional[int],
     stack_name: str,
     region: str,
     profile: str,
@@ -321,10 +331,23 @@ def do_cli(
                     disable_rollback=False,
                 ) as deploy_context:
                     if watch:
-                        execute_watch(template_file, build_context, package_context, deploy_context, dependency_layer)
+                        execute_watch(
+                            template_file,
+                            build_context,
+                            package_context,
+                            deploy_context,
+                            dependency_layer,
+                            max_workers=max_workers,
+                        )
                     elif code:
                         execute_code_sync(
-                            template_file, build_context, deploy_context, resource_id, resource, dependency_layer
+                            template_file,
+                            build_context,
+                            deploy_context,
+                            resource_id,
+                            resource,
+                            dependency_layer,
+                            max_workers=max_workers,
                         )
                     else:
                         execute_infra_contexts(build_context, package_context, deploy_context)
@@ -361,6 +384,7 @@ def execute_code_sync(
     resource_ids: Optional[Tuple[str]],
     resource_types: Optional[Tuple[str]],
     auto_dependency_layer: bool,
+    max_workers: Optional[int] = None,
 ) -> None:
     """Executes the sync flow for code.
 
@@ -378,11 +402,13 @@ def execute_code_sync(
         List of resource types to be synced.
     auto_dependency_layer: bool
         Boolean flag to whether enable certain sync flows for auto dependency layer feature
+    max_workers : Optional[int]
+        Maximum number of sync flows which are executed at the same time
     """
     stacks = SamLocalStackProvider.get_stacks(template)[0]
     factory = SyncFlowFactory(build_context, deploy_context, stacks, auto_dependency_layer)
     factory.load_physical_id_mapping()
-    executor = SyncFlowExecutor()
+    executor = SyncFlowExecutor(max_workers=max_workers)
 
     sync_flow_resource_ids: Set[ResourceIdentifier] = (
         get_unique_resource_ids(stacks, resource_ids, resource_types)
@@ -405,6 +431,7 @@ def execute_watch(
     package_context: "PackageContext",
     deploy_context: "DeployContext",
     auto_dependency_layer: bool,
+    max_workers: Optional[int] = None,
 ):
     """Start sync watch execution
 
@@ -418,6 +445,12 @@ def execute_watch(
         PackageContext
     deploy_context : DeployContext
         DeployContext
+    auto_dependency_layer: bool
+        Boolean flag to whether enable certain sync flows for auto dependency layer feature
+    max_workers : Optional[int]
+        Maximum number of sync flows which are executed at the same time
     """
-    watch_manager = WatchManager(template, build_context, package_context, deploy_context, auto_dependency_layer)
+    watch_manager = WatchManager(
+        template, build_context, package_context, deploy_context, auto_dependency_layer, max_workers=max_workers
+    )
     watch_manager.start()
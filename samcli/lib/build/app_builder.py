@@ -24,7 +24,9 @@ from samcli.lib.build.build_strategy import (
     CachedOrIncrementalBuildStrategyWrapper,
     ParallelBuildStrategy,
     BuildStrategy,
+    DEFAULT_MAX_PARALLEL_CONTAINER_BUILDS,
 )
+from samcli.lib.build.build_container_pool import BuildContainerPool
 from samcli.lib.utils.resources import (
     AWS_CLOUDFORMATION_STACK,
     AWS_LAMBDA_FUNCTION,
@@ -39,8 +41,10 @@ from samcli.lib.providers.provider import ResourcesToBuildCollector, Function, g
 from samcli.lib.utils.colors import Colored
 from samcli.lib.utils import osutils
 from samcli.lib.utils.packagetype import IMAGE, ZIP
+from samcli.lib.utils.profiling import CATEGORY_BUILD, CATEGORY_DOCKER, profiled
 from samcli.lib.utils.stream_writer import StreamWriter
-from samcli.local.docker.lambda_build_container import LambdaBuildContainer
+from samcli.local.docker.exceptions import ContainerExecutableNotFoundException
+from samcli.local.docker.lambda_build_container import LambdaBuildContainer, WarmLambdaBuildContainer
 from samcli.local.docker.utils import is_docker_reachable, get_docker_platform
 from samcli.local.docker.manager import ContainerManager
 from samcli.commands._utils.experimental import get_enabled_experimental_flags
@@ -173,6 +177,8 @@ class ApplicationBuilder:
         self._container_env_var_file = container_env_var_file
         self._build_images = build_images or {}
         self._combine_dependencies = combine_dependencies
+        # warm build containers which are shared by the container builds, only available while building
+        self._build_container_pool: Optional[BuildContainerPool] = None
 
     def build(self) -> ApplicationBuildResult:
         """
@@ -202,9 +208,12 @@ class ApplicationBuilder:
                         self._manifest_path_override,
                         self._is_building_specific_resource,
                     ),
+                    is_container_build=bool(self._container_manager),
                 )
             else:
-                build_strategy = ParallelBuildStrategy(build_graph, build_strategy)
+                build_strategy = ParallelBuildStrategy(
+                    build_graph, build_strategy, is_container_build=bool(self._container_manager)
+                )
         elif self._cached:
             build_strategy = CachedOrIncrementalBuildStrategyWrapper(
                 build_graph,
@@ -216,8 +225,18 @@ class ApplicationBuilder:
                 self._is_building_specific_resource,
             )
 
-        return ApplicationBuildResult(build_graph, build_strategy.build())
+        if self._container_manager:
+            self._build_container_pool = BuildContainerPool(
+                self._container_manager, self._base_dir, DEFAULT_MAX_PARALLEL_CONTAINER_BUILDS
+            )
+        try:
+            return ApplicationBuildResult(build_graph, build_strategy.build())
+        finally:
+            if self._build_container_pool:
+                self._build_container_pool.close()
+                self._build_container_pool = None
 
+    @profiled(CATEGORY_BUILD, "build_graph")
     def _get_build_graph(
         self, inline_env_vars: Optional[Dict] = None, env_vars_file: Optional[str] = None
     ) -> BuildGraph:
@@ -360,6 +379,7 @@ class ApplicationBuilder:
         if resource_type == AWS_SERVERLESS_FUNCTION and resource_properties.get("PackageType", ZIP) == IMAGE:
             resource_properties["ImageUri"] = path
 
+    @profiled(CATEGORY_DOCKER, "docker_build_image")
     def _build_lambda_image(self, function_name: str, metadata: Dict, architecture: str) -> str:
         """
         Build an Lambda image
@@ -792,6 +812,22 @@ class ApplicationBuilder:
 
         container_env_vars = container_env_vars or {}
 
+        if self._build_container_pool and self._build_container_pool.can_build(source_dir, manifest_path):
+            return self._build_function_on_warm_container(
+                self._build_container_pool,
+                config,
+                source_dir,
+                artifacts_dir,
+                manifest_path,
+                runtime,
+                architecture,
+                options,
+                container_env_vars,
+                build_image,
+                is_building_layer,
+                log_level,
+            )
+
         container = LambdaBuildContainer(
             lambda_builders_protocol_version,
             config.language,
@@ -827,23 +863,82 @@ class ApplicationBuilder:
             stderr_stream = osutils.stderr()
             container.wait_for_logs(stdout=stdout_stream, stderr=stderr_stream)
 
-            stdout_data = stdout_stream.getvalue().decode("utf-8")
-            LOG.debug("Build inside container returned response %s", stdout_data)
-
-            response = self._parse_builder_response(stdout_data, container.image)
-
-            # Request is successful. Now copy the artifacts back to the host
-            LOG.debug("Build inside container was successful. Copying artifacts from container to host")
-
-            # "/." is a Docker thing that instructions the copy command to download contents of the folder only
-            result_dir_in_container = response["result"]["artifacts_dir"] + "/."
-            container.copy(result_dir_in_container, artifacts_dir)
+            self._copy_artifacts_from_container(container, stdout_stream, artifacts_dir)
         finally:
             self._container_manager.stop(container)
 
         LOG.debug("Build inside container succeeded")
         return artifacts_dir
 
+    def _build_function_on_warm_container(
+        self,  # pylint: disable=too-many-locals
+        build_container_pool: BuildContainerPool,
+        config: CONFIG,
+        source_dir: str,
+        artifacts_dir: str,
+        manifest_path: str,
+        runtime: str,
+        architecture: str,
+        options: Optional[Dict],
+        container_env_vars: Dict,
+        build_image: Optional[str],
+        is_building_layer: bool,
+        log_level: int,
+    ) -> str:
+        """
+        Builds the function or layer in a warm build container, which is kept running to build the other functions
+        and layers with the same runtime, architecture, build image and environment variables
+        """
+        with build_container_pool.checkout(
+            runtime, architecture, build_image, container_env_vars, log_level
+        ) as container:
+            stdout_stream = io.BytesIO()
+            try:
+                with container.build(
+                    lambda_builders_protocol_version,
+                    config.language,
+                    config.dependency_manager,
+                    config.application_framework,
+                    source_dir,
+                    manifest_path,
+                    runtime,
+                    architecture,
+                    options=options,
+                    executable_search_paths=config.executable_search_paths,
+                    mode=self._mode,
+                    is_building_layer=is_building_layer,
+                    stdout=stdout_stream,
+                    stderr=osutils.stderr(),
+                ):
+                    self._copy_artifacts_from_container(container, stdout_stream, artifacts_dir)
+            except ContainerExecutableNotFoundException as ex:
+                raise UnsupportedBuilderLibraryVersionError(container.image, str(ex)) from ex
+
+        LOG.debug("Build inside warm container succeeded")
+        return artifacts_dir
+
+    def _copy_artifacts_from_container(
+        self,
+        container: Union[LambdaBuildContainer, WarmLambdaBuildContainer],
+        stdout_stream: io.BytesIO,
+        artifacts_dir: str,
+    ) -> None:
+        """
+        Parses the response of the builder which is written into stdout_stream, and copies the built artifacts from
+        the container to the host if the build succeeded
+        """
+        stdout_data = stdout_stream.getvalue().decode("utf-8")
+        LOG.debug("Build inside container returned response %s", stdout_data)
+
+        response = self._parse_builder_response(stdout_data, container.image)
+
+        # Request is successful. Now copy the artifacts back to the host
+        LOG.debug("Build inside container was successful. Copying artifacts from container to host")
+
+        # "/." is a Docker thing that instructions the copy command to download contents of the folder only
+        result_dir_in_container = response["result"]["artifacts_dir"] + "/."
+        container.copy(result_dir_in_container, artifacts_dir)
+
     @staticmethod
     def _parse_builder_response(stdout_data: str, image_name: str) -> Dict:
 
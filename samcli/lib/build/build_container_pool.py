@@ -0,0 +1,126 @@
+"""
+Pool of warm build containers, which are shared by the container builds of an application
+"""
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from samcli.local.docker.lambda_build_container import WarmLambdaBuildContainer
+from samcli.local.docker.manager import ContainerManager
+from samcli.local.lambdafn.container_pool import WarmContainerPool
+
+LOG = logging.getLogger(__name__)
+
+
+class BuildContainerPool:
+    """
+    Keeps the warm build containers of an application build, so that the functions and layers which are built with
+    the same runtime, architecture, build image and environment variables are built one after another in the same
+    running container, instead of creating, starting and removing a new container for each of them.
+
+    Each warm container mounts the base directory of the application, so only the functions and layers whose sources
+    and manifests are in it can be built with a warm container.
+    """
+
+    def __init__(self, container_manager: ContainerManager, mount_dir: str, max_size: int) -> None:
+        """
+        Parameters
+        ----------
+        container_manager : ContainerManager
+            Container manager which runs and stops the warm containers
+        mount_dir : str
+            Directory on the host which is mounted into the warm containers
+        max_size : int
+            Maximum number of warm containers with the same configuration, which is the number of builds that can
+            run concurrently with that configuration
+        """
+        self._container_manager = container_manager
+        self._mount_dir = mount_dir
+        self._max_size = max_size
+        self._pools: Dict[Tuple, WarmContainerPool] = {}
+        self._lock = threading.Lock()
+
+    def can_build(self, source_dir: str, manifest_path: str) -> bool:
+        """
+        Returns True if the given source and manifest can be built with a warm container
+        """
+        return WarmLambdaBuildContainer.can_build(self._mount_dir, source_dir, manifest_path)
+
+    @contextmanager
+    def checkout(
+        self,
+        runtime: str,
+        architecture: str,
+        image: Optional[str],
+        env_vars: Optional[Dict],
+        log_level: Optional[Union[int, str]],
+    ) -> Iterator[WarmLambdaBuildContainer]:
+        """
+        Context manager which checks out a warm container with the given configuration for the duration of a build.
+        A new container is started if all warm containers with the same configuration are busy, until the maximum
+        number of containers is reached. If the container stops running during the build, it is removed instead of
+        being used by the next builds.
+
+        Yields
+        ------
+        WarmLambdaBuildContainer
+            The checked out container
+        """
+        env_vars = env_vars or {}
+        key = (runtime, architecture, image, json.dumps(env_vars, sort_keys=True, default=str), log_level)
+        with self._lock:
+            pool = self._pools.get(key)
+            if not pool:
+                pool = WarmContainerPool(min_size=0, max_size=self._max_size)
+                self._pools[key] = pool
+
+        container, _ = pool.checkout(lambda: self._start_container(runtime, architecture, image, env_vars, log_level))
+        if not container:
+            raise RuntimeError("Build container pool is closed")
+
+        is_running = True
+        try:
+            yield container
+        except BaseException:
+            is_running = container.is_running()
+            raise
+        finally:
+            if is_running:
+                pool.release(container)
+            else:
+                LOG.debug("Warm build container %s is not running anymore, removing it", container.id)
+                pool.discard(container)
+                self._container_manager.stop(container)
+
+    def close(self) -> None:
+        """
+        Stops and removes all warm containers, the pool can't be used anymore after it is closed
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+        for pool in pools:
+            for container in pool.clear():
+                LOG.debug("Removing warm build container %s", container.id)
+                self._container_manager.stop(container)
+
+    def _start_container(
+        self,
+        runtime: str,
+        architecture: str,
+        image: Optional[str],
+        env_vars: Dict,
+        log_level: Optional[Union[int, str]],
+    ) -> WarmLambdaBuildContainer:
+        container = WarmLambdaBuildContainer(
+            self._mount_dir, runtime, architecture, log_level=log_level, env_vars=env_vars, image=image
+        )
+        LOG.debug("Starting a warm build container for %s (%s)", runtime, architecture)
+        try:
+            self._container_manager.run(container)
+        except BaseException:
+            self._container_manager.stop(container)
+            raise
+        return container
@@ -44,6 +44,7 @@ COMPATIBLE_RUNTIMES_FIELD = "compatible_runtimes"
 LAYER_FIELD = "layer"
 ARCHITECTURE_FIELD = "architecture"
 HANDLER_FIELD = "handler"
+BUILD_DURATION_FIELD = "build_duration"
 
 
 def _function_build_definition_to_toml_table(
@@ -78,6 +79,8 @@ def _function_build_definition_to_toml_table(
         toml_table[METADATA_FIELD] = function_build_definition.metadata
     if function_build_definition.env_vars:
         toml_table[ENV_VARS_FIELD] = function_build_definition.env_vars
+    if function_build_definition.build_duration:
+        toml_table[BUILD_DURATION_FIELD] = function_build_definition.build_duration
 
     return toml_table
 
@@ -110,6 +113,7 @@ def _toml_table_to_function_build_definition(uuid: str, toml_table: tomlkit.api.
         dict(toml_table.get(ENV_VARS_FIELD, {})),
     )
     function_build_definition.uuid = uuid
+    function_build_definition.build_duration = float(toml_table.get(BUILD_DURATION_FIELD, 0))
     return function_build_definition
 
 
@@ -139,6 +143,8 @@ def _layer_build_definition_to_toml_table(layer_build_definition: "LayerBuildDef
     if layer_build_definition.env_vars:
         toml_table[ENV_VARS_FIELD] = layer_build_definition.env_vars
     toml_table[LAYER_FIELD] = layer_build_definition.layer.full_path
+    if layer_build_definition.build_duration:
+        toml_table[BUILD_DURATION_FIELD] = layer_build_definition.build_duration
 
     return toml_table
 
@@ -170,6 +176,7 @@ def _toml_table_to_layer_build_definition(uuid: str, toml_table: tomlkit.api.Tab
         dict(toml_table.get(ENV_VARS_FIELD, {})),
     )
     layer_build_definition.uuid = uuid
+    layer_build_definition.build_duration = float(toml_table.get(BUILD_DURATION_FIELD, 0))
     return layer_build_definition
 
 
@@ -396,6 +403,33 @@ class BuildGraph:
 
         self._filepath.write_text(tomlkit.dumps(document))  # type: ignore
 
+    def update_build_durations(self) -> None:
+        """
+        Updates the build.toml file with the latest build durations of the definitions, which are used to schedule
+        the longest builds first in the next parallel build
+
+        This operation is atomic, that no other thread accesses build.toml
+        during the process of reading and modifying the durations
+        """
+        with BuildGraph.__toml_lock:
+            if not self._filepath.exists():
+                return
+
+            document = cast(Dict, tomlkit.loads(self._filepath.read_text()))
+            is_updated = False
+            for table_key, build_definitions in (
+                (BuildGraph.FUNCTION_BUILD_DEFINITIONS, self._function_build_definitions),
+                (BuildGraph.LAYER_BUILD_DEFINITIONS, self._layer_build_definitions),
+            ):
+                definitions_table = document.get(table_key, {})
+                for build_definition in cast(Sequence[AbstractBuildDefinition], build_definitions):
+                    if build_definition.build_duration and build_definition.uuid in definitions_table:
+                        definitions_table[build_definition.uuid][BUILD_DURATION_FIELD] = build_definition.build_duration
+                        is_updated = True
+
+            if is_updated:
+                self._filepath.write_text(tomlkit.dumps(document))  # type: ignore
+
     def _read(self) -> None:
         """
         Reads build.toml file into array of build definition
@@ -490,6 +524,8 @@ class AbstractBuildDefinition:
         self.manifest_hash = manifest_hash
         self._env_vars = env_vars if env_vars else {}
         self.architecture = architecture
+        # duration of the last full build in seconds, used to schedule the longest builds first
+        self.build_duration: float = 0
         # following properties are used during build time and they don't serialize into build.toml file
         self.download_dependencies: bool = True
 
@@ -2,19 +2,23 @@
 Keeps implementation of different build strategies
 """
 import hashlib
+import heapq
 import logging
 import os.path
 import pathlib
 import shutil
+import time
 from abc import abstractmethod, ABC
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import deepcopy
-from typing import Callable, Dict, List, Any, Optional, cast, Set
+from functools import partial
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Tuple, cast, Set
 
 from samcli.commands._utils.experimental import is_experimental_enabled, ExperimentalFlag
 from samcli.lib.utils import osutils
-from samcli.lib.utils.async_utils import AsyncContext
-from samcli.lib.utils.hash import dir_checksum
+from samcli.lib.utils.hash import dir_checksum, FileHashIndex, FILE_HASH_INDEX_FILE_NAME
 from samcli.lib.utils.packagetype import ZIP, IMAGE
+from samcli.lib.utils.profiling import CATEGORY_BUILD, profile_phase
 from samcli.lib.build.dependency_hash_generator import DependencyHashGenerator
 from samcli.lib.build.build_graph import (
     BuildGraph,
@@ -28,6 +32,11 @@ from samcli.lib.build.exceptions import MissingBuildMethodException
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of in-process builds running at the same time, same as the ThreadPoolExecutor default
+DEFAULT_MAX_PARALLEL_BUILDS = min(32, (os.cpu_count() or 1) + 4)
+# Maximum number of container builds running at the same time, each of them runs a separate docker container
+DEFAULT_MAX_PARALLEL_CONTAINER_BUILDS = max(1, (os.cpu_count() or 1) // 2)
+
 
 def clean_redundant_folders(base_dir: str, uuids: Set[str]) -> None:
     """
@@ -46,7 +55,7 @@ def clean_redundant_folders(base_dir: str, uuids: Set[str]) -> None:
         return
 
     for full_dir_path in pathlib.Path(base_dir).iterdir():
-        if full_dir_path.name not in uuids:
+        if full_dir_path.is_dir() and full_dir_path.name not in uuids:
             shutil.rmtree(pathlib.Path(base_dir, full_dir_path.name))
 
 
@@ -148,24 +157,30 @@ class DefaultBuildStrategy(BuildStrategy):
 
         LOG.debug("Building to following folder %s", single_build_dir)
 
+        # artifacts might be linked to other functions, make sure the build doesn't modify them
+        osutils.break_hardlinks(single_build_dir)
+
         # we should create a copy and pass it down, otherwise additional env vars like LAMBDA_BUILDERS_LOG_LEVEL
         # will make cache invalid all the time
         container_env_vars = deepcopy(build_definition.env_vars)
 
         # when a function is passed here, it is ZIP function, codeuri and runtime are not None
-        result = self._build_function(
-            build_definition.get_function_name(),
-            build_definition.codeuri,  # type: ignore
-            build_definition.packagetype,
-            build_definition.runtime,  # type: ignore
-            build_definition.architecture,
-            build_definition.get_handler_name(),
-            single_build_dir,
-            build_definition.metadata,
-            container_env_vars,
-            build_definition.dependencies_dir if is_experimental_enabled(ExperimentalFlag.Accelerate) else None,
-            build_definition.download_dependencies,
-        )
+        start_time = time.monotonic()
+        with profile_phase("build_function", CATEGORY_BUILD, functions=single_full_path, uuid=build_definition.uuid):
+            result = self._build_function(
+                build_definition.get_function_name(),
+                build_definition.codeuri,  # type: ignore
+                build_definition.packagetype,
+                build_definition.runtime,  # type: ignore
+                build_definition.architecture,
+                build_definition.get_handler_name(),
+                single_build_dir,
+                build_definition.metadata,
+                container_env_vars,
+                build_definition.dependencies_dir if is_experimental_enabled(ExperimentalFlag.Accelerate) else None,
+                build_definition.download_dependencies,
+            )
+        self._record_build_duration(build_definition, start_time)
         function_build_results[single_full_path] = result
 
         # copy results to other functions
@@ -176,7 +191,7 @@ class DefaultBuildStrategy(BuildStrategy):
                     # artifacts directory will be created by the builder
                     artifacts_dir = function.get_build_dir(self._build_dir)
                     LOG.debug("Copying artifacts from %s to %s", single_build_dir, artifacts_dir)
-                    osutils.copytree(single_build_dir, artifacts_dir)
+                    osutils.link_or_copytree(single_build_dir, artifacts_dir)
                     function_build_results[function.full_path] = artifacts_dir
         elif build_definition.packagetype == IMAGE:
             for function in build_definition.functions:
@@ -199,10 +214,12 @@ class DefaultBuildStrategy(BuildStrategy):
             )
 
         single_build_dir = layer.get_build_dir(self._build_dir)
+        osutils.break_hardlinks(single_build_dir)
         # when a layer is passed here, it is ZIP function, codeuri and runtime are not None
         # codeuri and compatible_runtimes are not None
-        return {
-            layer.full_path: self._build_layer(
+        start_time = time.monotonic()
+        with profile_phase("build_layer", CATEGORY_BUILD, layer=layer.full_path, uuid=layer_definition.uuid):
+            result = self._build_layer(
                 layer.name,
                 layer.codeuri,  # type: ignore
                 layer.build_method,
@@ -213,7 +230,17 @@ class DefaultBuildStrategy(BuildStrategy):
                 layer_definition.dependencies_dir if is_experimental_enabled(ExperimentalFlag.Accelerate) else None,
                 layer_definition.download_dependencies,
             )
-        }
+        self._record_build_duration(layer_definition, start_time)
+        return {layer.full_path: result}
+
+    @staticmethod
+    def _record_build_duration(build_definition: AbstractBuildDefinition, start_time: float) -> None:
+        """
+        Keeps the duration of a full build in the build definition, which is used to schedule the longest builds
+        first. Incremental builds which don't download dependencies keep the duration of the last full build
+        """
+        if build_definition.download_dependencies:
+            build_definition.build_duration = round(time.monotonic() - start_time, 3)
 
 
 class CachedBuildStrategy(BuildStrategy):
@@ -238,6 +265,7 @@ class CachedBuildStrategy(BuildStrategy):
         self._base_dir = base_dir
         self._build_dir = build_dir
         self._cache_dir = cache_dir
+        self._hash_index = FileHashIndex(os.path.join(str(cache_dir), FILE_HASH_INDEX_FILE_NAME))
 
     def build(self) -> Dict[str, str]:
         result = {}
@@ -245,6 +273,12 @@ class CachedBuildStrategy(BuildStrategy):
             result.update(super().build())
         return result
 
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """
+        Persists the file hash index, so that unchanged source files won't be read again in the next build
+        """
+        self._hash_index.save()
+
     def build_single_function_definition(self, build_definition: FunctionBuildDefinition) -> Dict[str, str]:
         """
         Builds single function definition with caching
@@ -253,7 +287,9 @@ class CachedBuildStrategy(BuildStrategy):
             return self._delegate_build_strategy.build_single_function_definition(build_definition)
 
         code_dir = str(pathlib.Path(self._base_dir, cast(str, build_definition.codeuri)).resolve())
-        source_hash = dir_checksum(code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256())
+        source_hash = dir_checksum(
+            code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256(), hash_index=self._hash_index
+        )
         cache_function_dir = pathlib.Path(self._cache_dir, build_definition.uuid)
         function_build_results = {}
 
@@ -262,27 +298,29 @@ class CachedBuildStrategy(BuildStrategy):
                 "Cache is invalid, running build and copying resources to function build definition of %s",
                 build_definition.uuid,
             )
-            build_result = self._delegate_build_strategy.build_single_function_definition(build_definition)
-            function_build_results.update(build_result)
-
+            # remove the invalid cache first, so that its files are never used again even if the build fails
             if cache_function_dir.exists():
                 shutil.rmtree(str(cache_function_dir))
 
+            build_result = self._delegate_build_strategy.build_single_function_definition(build_definition)
+            function_build_results.update(build_result)
+
             build_definition.source_hash = source_hash
             # Since all the build contents are same for a build definition, just copy any one of them into the cache
             for _, value in build_result.items():
-                osutils.copytree(value, cache_function_dir)
+                osutils.link_or_copytree(value, cache_function_dir, allow_hardlinks=False)
                 break
         else:
             LOG.info(
                 "Valid cache found, copying previously built resources from function build definition of %s",
                 build_definition.uuid,
             )
+            # artifacts are not hardlinked to the cache, since they may be modified after the build
             for function in build_definition.functions:
                 # artifacts directory will be created by the builder
                 artifacts_dir = function.get_build_dir(self._build_dir)
                 LOG.debug("Copying artifacts from %s to %s", cache_function_dir, artifacts_dir)
-                osutils.copytree(cache_function_dir, artifacts_dir)
+                osutils.link_or_copytree(cache_function_dir, artifacts_dir, allow_hardlinks=False)
                 function_build_results[function.full_path] = artifacts_dir
 
         return function_build_results
@@ -292,7 +330,9 @@ class CachedBuildStrategy(BuildStrategy):
         Builds single layer definition with caching
         """
         code_dir = str(pathlib.Path(self._base_dir, cast(str, layer_definition.codeuri)).resolve())
-        source_hash = dir_checksum(code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256())
+        source_hash = dir_checksum(
+            code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256(), hash_index=self._hash_index
+        )
         cache_function_dir = pathlib.Path(self._cache_dir, layer_definition.uuid)
         layer_build_result = {}
 
@@ -301,16 +341,17 @@ class CachedBuildStrategy(BuildStrategy):
                 "Cache is invalid, running build and copying resources to layer build definition of %s",
                 layer_definition.uuid,
             )
-            build_result = self._delegate_build_strategy.build_single_layer_definition(layer_definition)
-            layer_build_result.update(build_result)
-
+            # remove the invalid cache first, so that its files are never used again even if the build fails
             if cache_function_dir.exists():
                 shutil.rmtree(str(cache_function_dir))
 
+            build_result = self._delegate_build_strategy.build_single_layer_definition(layer_definition)
+            layer_build_result.update(build_result)
+
             layer_definition.source_hash = source_hash
             # Since all the build contents are same for a build definition, just copy any one of them into the cache
             for _, value in build_result.items():
-                osutils.copytree(value, cache_function_dir)
+                osutils.link_or_copytree(value, cache_function_dir, allow_hardlinks=False)
                 break
         else:
             LOG.info(
@@ -320,7 +361,7 @@ class CachedBuildStrategy(BuildStrategy):
             # artifacts directory will be created by the builder
             artifacts_dir = str(pathlib.Path(self._build_dir, layer_definition.layer.full_path))
             LOG.debug("Copying artifacts from %s to %s", cache_function_dir, artifacts_dir)
-            osutils.copytree(cache_function_dir, artifacts_dir)
+            osutils.link_or_copytree(cache_function_dir, artifacts_dir, allow_hardlinks=False)
             layer_build_result[layer_definition.layer.full_path] = artifacts_dir
 
         return layer_build_result
@@ -334,57 +375,227 @@ class CachedBuildStrategy(BuildStrategy):
         clean_redundant_folders(self._cache_dir, uuids)
 
 
+class _BuildJob(NamedTuple):
+    """
+    Single unit of work of the ParallelBuildStrategy
+    """
+
+    build_definition: AbstractBuildDefinition
+    build: Callable[[], Dict[str, str]]
+    # uuids of the build definitions which should be built before this one
+    dependencies: Set[str]
+    is_container_build: bool
+
+
+class _BuildJobScheduler:
+    """
+    Keeps track of the build jobs of the ParallelBuildStrategy which can be started. A job can be started once its
+    dependencies are built, and the in-process and container builds which run at the same time are limited separately.
+    """
+
+    def __init__(self, jobs: Dict[str, _BuildJob], max_workers: int, max_container_workers: int) -> None:
+        self._jobs = jobs
+        # dependencies which are not part of this build are ignored
+        self._remaining_dependencies = {uuid: job.dependencies & set(jobs) for uuid, job in jobs.items()}
+        self._dependents: Dict[str, List[str]] = {uuid: [] for uuid in jobs}
+        for uuid, dependencies in self._remaining_dependencies.items():
+            for dependency in dependencies:
+                self._dependents[dependency].append(uuid)
+
+        self._order = {uuid: index for index, uuid in enumerate(jobs)}
+        self._ready: Dict[bool, List[Tuple[float, int, str]]] = {False: [], True: []}
+        self._limits = {False: max_workers, True: max_container_workers}
+        self._running_counts = {False: 0, True: 0}
+        self.finished_count = 0
+
+        for uuid, dependencies in self._remaining_dependencies.items():
+            if not dependencies:
+                self._make_ready(uuid)
+
+    def start_ready_jobs(self) -> List[str]:
+        """
+        Returns the uuids of the jobs which can be started now, the longest builds of the previous build first
+        """
+        started = []
+        for is_container_build, ready_jobs in self._ready.items():
+            while ready_jobs and self._running_counts[is_container_build] < self._limits[is_container_build]:
+                _, _, uuid = heapq.heappop(ready_jobs)
+                started.append(uuid)
+                self._running_counts[is_container_build] += 1
+        return started
+
+    def complete_job(self, uuid: str, succeeded: bool) -> None:
+        """
+        Marks a started job as finished, the jobs which depend on it can be started if it succeeded
+        """
+        self._running_counts[self._jobs[uuid].is_container_build] -= 1
+        if not succeeded:
+            return
+
+        self.finished_count += 1
+        for dependent in self._dependents[uuid]:
+            self._remaining_dependencies[dependent].discard(uuid)
+            if not self._remaining_dependencies[dependent]:
+                self._make_ready(dependent)
+
+    def _make_ready(self, uuid: str) -> None:
+        job = self._jobs[uuid]
+        heapq.heappush(
+            self._ready[job.is_container_build], (-job.build_definition.build_duration, self._order[uuid], uuid)
+        )
+
+
 class ParallelBuildStrategy(BuildStrategy):
     """
     Parallel implementation of Build Strategy
     This strategy runs each build in parallel.
     For actual build implementation it calls delegate implementation (could be one of the other Build Strategy)
+
+    Builds are scheduled as a graph, a function is built after the layers that it uses. In-process builds and container
+    builds are limited separately, so that a large application doesn't start too many containers at once. Among the
+    builds which can be started, the ones which took the longest in the previous build are started first.
     """
 
     def __init__(
         self,
         build_graph: BuildGraph,
         delegate_build_strategy: BuildStrategy,
-        async_context: Optional[AsyncContext] = None,
+        max_workers: Optional[int] = None,
+        max_container_workers: Optional[int] = None,
+        is_container_build: bool = False,
     ) -> None:
+        """
+        Parameters
+        ----------
+        build_graph : BuildGraph
+            Build graph to build
+        delegate_build_strategy : BuildStrategy
+            Build strategy which builds each definition
+        max_workers : Optional[int]
+            Maximum number of in-process builds running at the same time
+        max_container_workers : Optional[int]
+            Maximum number of container (and image) builds running at the same time
+        is_container_build : bool
+            Whether ZIP functions and layers are built in containers
+        """
         super().__init__(build_graph)
         self._delegate_build_strategy = delegate_build_strategy
-        self._async_context = async_context if async_context else AsyncContext()
+        self._max_workers = max_workers or DEFAULT_MAX_PARALLEL_BUILDS
+        self._max_container_workers = max_container_workers or DEFAULT_MAX_PARALLEL_CONTAINER_BUILDS
+        self._is_container_build = is_container_build
+        self._jobs: Dict[str, _BuildJob] = {}
 
     def build(self) -> Dict[str, str]:
         """
-        Runs all build and collects results from async context
+        Schedules all builds and collects their results
         """
         result = {}
+        self._jobs = {}
         with self._delegate_build_strategy:
-            # ignore result
+            # ignore result, this only collects the build jobs
             super().build()
-            # wait for other executions to complete
-
-            async_results = self._async_context.run_async()
-            for async_result in async_results:
-                result.update(async_result)
+            result.update(self._run_jobs())
 
+        self._build_graph.update_build_durations()
         return result
 
     def build_single_function_definition(self, build_definition: FunctionBuildDefinition) -> Dict[str, str]:
         """
-        Passes single function build into async context, no actual result returned from this function
+        Collects the single function build to be scheduled, no actual result returned from this function
         """
-        self._async_context.add_async_task(
-            self._delegate_build_strategy.build_single_function_definition, build_definition
+        layer_paths = {layer.full_path for function in build_definition.functions for layer in function.layers}
+        dependencies = {
+            layer_definition.uuid
+            for layer_definition in self._build_graph.get_layer_build_definitions()
+            if layer_definition.layer and layer_definition.layer.full_path in layer_paths
+        }
+        self._jobs[build_definition.uuid] = _BuildJob(
+            build_definition,
+            partial(self._delegate_build_strategy.build_single_function_definition, build_definition),
+            dependencies,
+            self._is_container_build or build_definition.packagetype == IMAGE,
         )
         return {}
 
     def build_single_layer_definition(self, layer_definition: LayerBuildDefinition) -> Dict[str, str]:
         """
-        Passes single layer build into async context, no actual result returned from this function
+        Collects the single layer build to be scheduled, no actual result returned from this function
         """
-        self._async_context.add_async_task(
-            self._delegate_build_strategy.build_single_layer_definition, layer_definition
+        self._jobs[layer_definition.uuid] = _BuildJob(
+            layer_definition,
+            partial(self._delegate_build_strategy.build_single_layer_definition, layer_definition),
+            set(),
+            self._is_container_build,
         )
         return {}
 
+    def _run_jobs(self) -> Dict[str, str]:
+        """
+        Runs the collected build jobs in dependency order, and returns their merged results.
+        If a build fails, no new build is started and the first exception is raised once running builds are finished.
+        """
+        scheduler = _BuildJobScheduler(self._jobs, self._max_workers, self._max_container_workers)
+        result: Dict[str, str] = {}
+        running: Dict[Future, str] = {}
+        first_exception: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self._max_workers + self._max_container_workers) as executor:
+            while True:
+                if first_exception is None:
+                    for uuid in scheduler.start_ready_jobs():
+                        running[executor.submit(self._run_job, self._jobs[uuid])] = uuid
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    exception = self._complete_job(scheduler, running.pop(future), future, result)
+                    first_exception = first_exception or exception
+
+        if first_exception is not None:
+            raise first_exception
+        return result
+
+    def _complete_job(
+        self, scheduler: _BuildJobScheduler, uuid: str, future: Future, result: Dict[str, str]
+    ) -> Optional[BaseException]:
+        """
+        Collects the result of a finished build job into the given result, and returns its exception if it failed
+        """
+        exception = future.exception()
+        scheduler.complete_job(uuid, exception is None)
+        if exception is not None:
+            return exception
+
+        job_result, elapsed_time = future.result()
+        result.update(job_result)
+        LOG.info(
+            "[%d/%d] Finished building %s in %.1fs",
+            scheduler.finished_count,
+            len(self._jobs),
+            self._get_definition_name(self._jobs[uuid].build_definition),
+            elapsed_time,
+        )
+        return None
+
+    @staticmethod
+    def _run_job(job: _BuildJob) -> Tuple[Dict[str, str], float]:
+        """
+        Runs a build job and returns its result with the elapsed time. Build durations used for scheduling are
+        recorded by the delegate build strategy, only when a definition is actually built
+        """
+        start_time = time.monotonic()
+        build_result = job.build()
+        return build_result, time.monotonic() - start_time
+
+    @staticmethod
+    def _get_definition_name(build_definition: AbstractBuildDefinition) -> str:
+        if isinstance(build_definition, LayerBuildDefinition):
+            return build_definition.full_path
+        functions = cast(FunctionBuildDefinition, build_definition).functions
+        return ", ".join(function.full_path for function in functions)
+
 
 class IncrementalBuildStrategy(BuildStrategy):
     """
@@ -504,11 +715,12 @@ class CachedOrIncrementalBuildStrategyWrapper(BuildStrategy):
         )
         self._is_building_specific_resource = is_building_specific_resource
 
-    def build(self) -> Dict[str, str]:
-        result = {}
-        with self._cached_build_strategy, self._incremental_build_strategy:
-            result.update(super().build())
-        return result
+    def __enter__(self) -> None:
+        """
+        Enters the wrapped strategies as well, since ParallelBuildStrategy only enters this wrapper
+        """
+        self._cached_build_strategy.__enter__()
+        self._incremental_build_strategy.__enter__()
 
     def build_single_function_definition(self, build_definition: FunctionBuildDefinition) -> Dict[str, str]:
         if self._is_incremental_build_supported(build_definition.runtime):
@@ -557,6 +769,10 @@ class CachedOrIncrementalBuildStrategyWrapper(BuildStrategy):
             self._cached_build_strategy._clean_redundant_cached()
             self._incremental_build_strategy._clean_redundant_dependencies()
 
+        # saves the file hash index of the cached build strategy
+        self._incremental_build_strategy.__exit__(exc_type, exc_val, exc_tb)
+        self._cached_build_strategy.__exit__(exc_type, exc_val, exc_tb)
+
     @staticmethod
     def _is_incremental_build_supported(runtime: Optional[str]) -> bool:
         if not runtime or not is_experimental_enabled(ExperimentalFlag.Accelerate):
@@ -21,6 +21,7 @@ from samcli.lib.intrinsic_resolver.invalid_intrinsic_validation import (
 )
 from samcli.lib.intrinsic_resolver.invalid_intrinsic_exception import InvalidIntrinsicException, InvalidSymbolException
 from samcli.commands._utils.template import get_template_data
+from samcli.lib.utils.profiling import CATEGORY_TEMPLATE, profiled
 
 LOG = logging.getLogger(__name__)
 
@@ -236,6 +237,7 @@ class IntrinsicResolver:
 
         return sanitized_dict
 
+    @profiled(CATEGORY_TEMPLATE, "resolve_intrinsics")
     def resolve_template(self, ignore_errors=False):
         """
         This resolves all the attributes of the CloudFormation dictionary Resources, Outputs, Mappings, Parameters,
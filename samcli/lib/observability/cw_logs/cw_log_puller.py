@@ -9,13 +9,13 @@ from typing import Optional, Any, List, Union, Dict
 from botocore.exceptions import ClientError
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
-from samcli.lib.observability.observability_info_puller import ObservabilityPuller, ObservabilityEventConsumer
+from samcli.lib.observability.observability_info_puller import ObservabilityPollablePuller, ObservabilityEventConsumer
 from samcli.lib.utils.time import to_timestamp, to_datetime
 
 LOG = logging.getLogger(__name__)
 
 
-class CWLogPuller(ObservabilityPuller):
+class CWLogPuller(ObservabilityPollablePuller):
     """
     Puller implementation that can pull events from CloudWatch log group
     """
@@ -95,6 +95,18 @@ class CWLogPuller(ObservabilityPuller):
             # This also helps us scoot under the TPS limit for CloudWatch API call.
             time.sleep(self._poll_interval)
 
+    def poll(self, filter_pattern: Optional[str] = None) -> bool:
+        LOG.debug("Polling logs from %s starting at %s", self.cw_log_group, str(self.latest_event_time))
+        try:
+            self.load_time_period(to_datetime(self.latest_event_time), filter_pattern=filter_pattern)
+        finally:
+            had_data = self.had_data
+            # set the timestamp for next poll, one extra millisecond to fetch next log event
+            if had_data:
+                self.latest_event_time += 1
+                self.had_data = False
+        return had_data
+
     def load_time_period(
         self,
         start_time: Optional[datetime] = None,
@@ -1,15 +1,32 @@
 """
 Interfaces and generic implementations for observability events (like CW logs)
 """
+import heapq
+import itertools
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Generic, TypeVar, Any, Sequence, Union
+from typing import Deque, Dict, List, Optional, Generic, TypeVar, Any, Sequence, Tuple, Union
+
+from botocore.exceptions import ClientError
 
 from samcli.lib.utils.async_utils import AsyncContext
+from samcli.lib.utils.time import to_timestamp
 
 LOG = logging.getLogger(__name__)
 
+# Pollable pullers which return new events are polled every DEFAULT_MIN_POLL_INTERVAL seconds, the interval of the
+# quiet ones is doubled after each empty poll up to DEFAULT_MAX_POLL_INTERVAL seconds
+DEFAULT_MIN_POLL_INTERVAL = 1
+DEFAULT_MAX_POLL_INTERVAL = 4
+# Number of consecutive empty polls after which a pollable puller is not polled anymore while tailing
+DEFAULT_MAX_RETRIES = 1000
+# Maximum number of events which are buffered while merging the events of multiple pullers in timestamp order
+DEFAULT_MERGE_BUFFER_SIZE = 10000
+
 # Generic type for the internal observability event
 InternalEventType = TypeVar("InternalEventType")
 
@@ -89,6 +106,34 @@ class ObservabilityPuller(ABC):
         """
 
 
+class ObservabilityPollablePuller(ObservabilityPuller):
+    """
+    Interface definition for pullers which can pull new events with a single poll, so that multiple pullers can be
+    polled by a shared scheduler (see ObservabilityCombinedPuller) instead of each of them tailing in its own loop.
+    """
+
+    # consumer which the pulled events are passed to
+    consumer: "ObservabilityEventConsumer"
+    # timestamp (in milliseconds) of the latest event pulled, the next poll starts from this timestamp
+    latest_event_time: int
+
+    @abstractmethod
+    def poll(self, filter_pattern: Optional[str] = None) -> bool:
+        """
+        Pulls the events which are published since the latest pulled event, and passes them to the consumer
+
+        Parameters
+        ----------
+        filter_pattern : Optional[str]
+            Optional parameter to filter events with given string
+
+        Returns
+        -------
+        bool
+            True if any event is pulled, False otherwise
+        """
+
+
 # pylint: disable=fixme
 # fixme add ABC parent class back once we bump the pylint to a version 2.8.2 or higher
 class ObservabilityEventMapper(Generic[ObservabilityEventType]):
@@ -159,37 +204,351 @@ class ObservabilityEventConsumerDecorator(ObservabilityEventConsumer):
         self._consumer.consume(event)
 
 
+class MergedEventSource(ObservabilityEventConsumer):
+    """
+    Consumer which passes the events of a single puller to ObservabilityEventMerger, instead of consuming them
+    directly. Events are consumed by the given consumer once the merger emits them in timestamp order.
+    """
+
+    def __init__(self, merger: "ObservabilityEventMerger", consumer: ObservabilityEventConsumer, ordered: bool):
+        """
+        Parameters
+        ----------
+        merger : ObservabilityEventMerger
+            Merger which the events are passed to
+        consumer : ObservabilityEventConsumer
+            Actual consumer which will handle the events after they are merged
+        ordered : bool
+            True if the puller produces its events in timestamp order, so that receiving an event also advances the
+            watermark of this source
+        """
+        self.merger = merger
+        self.consumer = consumer
+        self.ordered = ordered
+
+    def consume(self, event: ObservabilityEvent):
+        self.merger.push(self, event)
+
+    def advance(self, timestamp: int) -> None:
+        """
+        Marks that all the events of this source up to the given timestamp are received
+        """
+        self.merger.advance(self, timestamp)
+
+    def close(self) -> None:
+        """
+        Marks that all the events of this source are received
+        """
+        self.merger.close_source(self)
+
+
+class ObservabilityEventMerger:
+    """
+    Merges the events of multiple pullers into a single stream ordered by timestamp.
+
+    Events are buffered in a heap and emitted once their timestamp is not after the watermark, which is the minimum of
+    the timestamps that each source has received all events up to. If the buffer grows beyond max_buffer_size, or an
+    event stays in the buffer longer than max_delay, it is emitted regardless of the watermark.
+    """
+
+    def __init__(self, max_buffer_size: int = DEFAULT_MERGE_BUFFER_SIZE, max_delay: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        max_buffer_size : int
+            Maximum number of events which are kept in the buffer
+        max_delay : Optional[int]
+            Optional maximum number of milliseconds that an event can wait in the buffer for the watermark
+        """
+        self._max_buffer_size = max_buffer_size
+        self._max_delay = max_delay
+        self._heap: List[Tuple[int, int, ObservabilityEvent, ObservabilityEventConsumer]] = []
+        self._watermarks: Dict[MergedEventSource, int] = {}
+        # push times (in milliseconds) and timestamps of the buffered events in push order, to find the ones which
+        # waited longer than max_delay
+        self._push_times: Deque[Tuple[int, int]] = deque()
+        # events with a timestamp up to this one waited longer than max_delay, or are ordered before such an event
+        self._delayed_watermark: Optional[int] = None
+        # used to keep the order of the events with the same timestamp, and to never compare event objects in the heap
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def add_source(self, consumer: ObservabilityEventConsumer, ordered: bool = False) -> MergedEventSource:
+        """
+        Creates a new source, which should be used as the consumer of a puller whose events will be merged
+
+        Parameters
+        ----------
+        consumer : ObservabilityEventConsumer
+            Consumer of the puller, which will consume the events of this source once they are emitted
+        ordered : bool
+            True if the puller produces its events in timestamp order
+
+        Returns
+        -------
+        MergedEventSource
+            Consumer which should be given to the puller instead of its own consumer
+        """
+        source = MergedEventSource(self, consumer, ordered)
+        with self._lock:
+            self._watermarks[source] = 0
+        return source
+
+    def push(self, source: MergedEventSource, event: ObservabilityEvent) -> None:
+        with self._lock:
+            heapq.heappush(self._heap, (event.timestamp, next(self._sequence), event, source.consumer))
+            if self._max_delay is not None:
+                self._push_times.append((int(time.time() * 1000), event.timestamp))
+            if source.ordered and source in self._watermarks:
+                self._watermarks[source] = max(self._watermarks[source], event.timestamp)
+            self._emit_ready()
+
+    def advance(self, source: MergedEventSource, timestamp: int) -> None:
+        with self._lock:
+            if source in self._watermarks:
+                self._watermarks[source] = max(self._watermarks[source], timestamp)
+            self._emit_ready()
+
+    def close_source(self, source: MergedEventSource) -> None:
+        with self._lock:
+            self._watermarks.pop(source, None)
+            self._emit_ready()
+
+    def emit_ready(self) -> None:
+        """
+        Emits the buffered events which are not after the watermark, or which waited longer than max_delay
+        """
+        with self._lock:
+            self._emit_ready()
+
+    def flush(self) -> None:
+        """
+        Emits all the buffered events in timestamp order
+        """
+        with self._lock:
+            while self._heap:
+                self._emit_oldest()
+
+    def _emit_ready(self) -> None:
+        watermark = min(self._watermarks.values()) if self._watermarks else None
+        if self._max_delay is not None:
+            # events are emitted in timestamp order, so an event which waited too long also releases the earlier ones
+            delayed_until = int(time.time() * 1000) - self._max_delay
+            while self._push_times and self._push_times[0][0] < delayed_until:
+                _, timestamp = self._push_times.popleft()
+                if self._delayed_watermark is None or timestamp > self._delayed_watermark:
+                    self._delayed_watermark = timestamp
+            if watermark is not None and self._delayed_watermark is not None:
+                watermark = max(watermark, self._delayed_watermark)
+        while self._heap and (
+            watermark is None or self._heap[0][0] <= watermark or len(self._heap) > self._max_buffer_size
+        ):
+            self._emit_oldest()
+
+    def _emit_oldest(self) -> None:
+        _, _, event, consumer = heapq.heappop(self._heap)
+        consumer.consume(event)
+
+
+class ObservabilityPollScheduler:
+    """
+    Schedules the polls of multiple pollable pullers from a single thread.
+
+    Pullers which return new events are polled every min_poll_interval seconds, while the poll interval of the ones
+    which return nothing is doubled after each empty poll, up to max_poll_interval seconds. Since all pullers share the
+    same API limits, throttling of any poll increases the gap between any two consecutive polls, which is then reduced
+    again after each successful poll.
+    """
+
+    def __init__(
+        self,
+        pullers: Sequence[ObservabilityPollablePuller],
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
+        """
+        Parameters
+        ----------
+        pullers : Sequence[ObservabilityPollablePuller]
+            Pullers to be polled, all of them are due immediately
+        min_poll_interval : float
+            Interval in seconds between the polls of a puller which returns new events
+        max_poll_interval : float
+            Maximum interval in seconds between the polls of a puller which does not return new events
+        max_retries : int
+            Number of consecutive empty polls after which a puller is not scheduled anymore
+        """
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max(max_poll_interval, min_poll_interval)
+        self._max_retries = max_retries
+        self._schedule: List[Tuple[float, int, ObservabilityPollablePuller]] = [
+            (0.0, index, puller) for index, puller in enumerate(pullers)
+        ]
+        self._intervals: Dict[int, float] = {index: min_poll_interval for index in range(len(pullers))}
+        self._empty_polls: Dict[int, int] = {index: 0 for index in range(len(pullers))}
+        self._request_gap = 0.0
+        self._last_poll_time = 0.0
+
+    def next_poll(self) -> Optional[Tuple[ObservabilityPollablePuller, float]]:
+        """
+        Returns the puller which should be polled next, with the number of seconds to wait before polling it.
+        None if there is no puller left to poll.
+        """
+        if not self._schedule:
+            return None
+        due_time, _, puller = self._schedule[0]
+        due_time = max(due_time, self._last_poll_time + self._request_gap)
+        return puller, max(due_time - time.monotonic(), 0.0)
+
+    def complete_poll(self, had_data: bool, throttled: bool = False) -> bool:
+        """
+        Reschedules the puller which is returned by next_poll, after it is polled
+
+        Parameters
+        ----------
+        had_data : bool
+            True if the poll returned new events
+        throttled : bool
+            True if the poll got throttled
+
+        Returns
+        -------
+        bool
+            True if the puller is rescheduled, False if it reached the maximum number of empty polls
+        """
+        now = time.monotonic()
+        self._last_poll_time = now
+        _, index, puller = heapq.heappop(self._schedule)
+
+        if throttled:
+            self._request_gap = min(max(self._request_gap * 2, self._min_poll_interval), self._max_poll_interval)
+            LOG.warning(
+                "Throttled by the API, consider pulling information for certain resources. "
+                "Increasing the interval between requests to %s seconds",
+                self._request_gap,
+            )
+        else:
+            self._request_gap /= 2
+            if had_data:
+                self._empty_polls[index] = 0
+                self._intervals[index] = self._min_poll_interval
+            else:
+                self._empty_polls[index] += 1
+                if self._empty_polls[index] >= self._max_retries:
+                    LOG.debug("Stop polling puller (%s) since it has no new events", puller)
+                    return False
+                self._intervals[index] = min(self._intervals[index] * 2, self._max_poll_interval)
+
+        heapq.heappush(self._schedule, (now + self._intervals[index], index, puller))
+        return True
+
+
 class ObservabilityCombinedPuller(ObservabilityPuller):
     """
     A decorator class which will contain multiple ObservabilityPuller instance and pull information from each of them
+
+    Events of the pollable pullers (like CloudWatch log groups) are merged, so that they are consumed in timestamp
+    order across all of them. While tailing, pollable pullers are polled by a single shared scheduler instead of each
+    of them polling the API in its own loop.
     """
 
-    def __init__(self, pullers: Sequence[ObservabilityPuller]):
+    def __init__(
+        self,
+        pullers: Sequence[ObservabilityPuller],
+        min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        max_buffer_size: int = DEFAULT_MERGE_BUFFER_SIZE,
+    ):
         """
         Parameters
         ----------
         pullers : List[ObservabilityPuller]
             List of pullers which will be managed by this class
+        min_poll_interval : float
+            Interval in seconds between the polls of a pollable puller which returns new events while tailing
+        max_poll_interval : float
+            Maximum interval in seconds between the polls of a pollable puller which does not return new events
+        max_buffer_size : int
+            Maximum number of events which are buffered while merging the events of pollable pullers
         """
         self._pullers = pullers
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._max_buffer_size = max_buffer_size
 
     def tail(self, start_time: Optional[datetime] = None, filter_pattern: Optional[str] = None):
         """
         Implementation of ObservabilityPuller.tail method with AsyncContext.
-        It will create tasks by calling tail methods of all given pullers, and execute them in async
+        It will create tasks by calling tail methods of all given pullers, and execute them in async.
+        All pollable pullers are tailed by a single task, see _tail_pollable_pullers.
         """
         async_context = AsyncContext()
+        pollable_pullers = []
         for puller in self._pullers:
+            if isinstance(puller, ObservabilityPollablePuller):
+                pollable_pullers.append(puller)
+                continue
             LOG.debug("Adding task 'tail' for puller (%s)", puller)
             async_context.add_async_task(puller.tail, start_time, filter_pattern)
+        if pollable_pullers:
+            LOG.debug("Adding task 'tail' for pollable pullers (%s)", pollable_pullers)
+            async_context.add_async_task(self._tail_pollable_pullers, pollable_pullers, start_time, filter_pattern)
         LOG.debug("Running all 'tail' tasks in parallel")
         try:
             async_context.run_async()
         except KeyboardInterrupt:
             LOG.info(" CTRL+C received, cancelling...")
+            self.cancelled = True
             for puller in self._pullers:
                 puller.cancelled = True
 
+    def _tail_pollable_pullers(
+        self,
+        pullers: List[ObservabilityPollablePuller],
+        start_time: Optional[datetime] = None,
+        filter_pattern: Optional[str] = None,
+    ):
+        """
+        Tails all pollable pullers with a shared ObservabilityPollScheduler, and merges their events in timestamp
+        order. Since a quiet puller is polled less often, events wait at most max_poll_interval for the watermark.
+        """
+        merger = ObservabilityEventMerger(self._max_buffer_size, int(self._max_poll_interval * 1000))
+        scheduler = ObservabilityPollScheduler(pullers, self._min_poll_interval, self._max_poll_interval)
+        sources = self._attach_merged_sources(merger, pullers, ordered=False)
+        if start_time:
+            for puller in pullers:
+                puller.latest_event_time = to_timestamp(start_time)
+
+        try:
+            while not self.cancelled:
+                next_poll = scheduler.next_poll()
+                if not next_poll:
+                    break
+                puller, wait_time = next_poll
+                if wait_time > 0:
+                    merger.emit_ready()
+                    time.sleep(wait_time)
+                    continue
+
+                poll_time = int(time.time() * 1000)
+                try:
+                    had_data = puller.poll(filter_pattern)
+                except ClientError as err:
+                    if err.response.get("Error", {}).get("Code") != "ThrottlingException":
+                        LOG.error("Failed while fetching new events", exc_info=err)
+                        raise err
+                    scheduler.complete_poll(False, throttled=True)
+                    continue
+
+                # the puller received all events which are published before this poll
+                sources[puller].advance(poll_time)
+                if not scheduler.complete_poll(had_data):
+                    sources[puller].close()
+        finally:
+            self._detach_merged_sources(sources)
+            merger.flush()
+
     def load_time_period(
         self,
         start_time: Optional[datetime] = None,
@@ -198,14 +557,53 @@ class ObservabilityCombinedPuller(ObservabilityPuller):
     ):
         """
         Implementation of ObservabilityPuller.load_time_period method with AsyncContext.
-        It will create tasks by calling load_time_period methods of all given pullers, and execute them in async
+        It will create tasks by calling load_time_period methods of all given pullers, and execute them in async.
+        Since each pollable puller loads its events in timestamp order, their events are merged in timestamp order.
         """
+        pollable_pullers = [puller for puller in self._pullers if isinstance(puller, ObservabilityPollablePuller)]
+        merger = ObservabilityEventMerger(self._max_buffer_size)
+        sources = self._attach_merged_sources(merger, pollable_pullers, ordered=True)
+
+        def _load_time_period(puller: ObservabilityPollablePuller):
+            try:
+                puller.load_time_period(start_time, end_time, filter_pattern)
+            finally:
+                sources[puller].close()
+
         async_context = AsyncContext()
         for puller in self._pullers:
             LOG.debug("Adding task 'load_time_period' for puller (%s)", puller)
-            async_context.add_async_task(puller.load_time_period, start_time, end_time, filter_pattern)
+            if isinstance(puller, ObservabilityPollablePuller):
+                async_context.add_async_task(_load_time_period, puller)
+            else:
+                async_context.add_async_task(puller.load_time_period, start_time, end_time, filter_pattern)
         LOG.debug("Running all 'load_time_period' tasks in parallel")
-        async_context.run_async()
+        try:
+            async_context.run_async()
+        finally:
+            self._detach_merged_sources(sources)
+            merger.flush()
+
+    @staticmethod
+    def _attach_merged_sources(
+        merger: ObservabilityEventMerger, pullers: List[ObservabilityPollablePuller], ordered: bool
+    ) -> Dict[ObservabilityPollablePuller, MergedEventSource]:
+        """
+        Replaces the consumers of the given pullers with sources of the merger
+        """
+        sources = {}
+        for puller in pullers:
+            sources[puller] = merger.add_source(puller.consumer, ordered)
+            puller.consumer = sources[puller]
+        return sources
+
+    @staticmethod
+    def _detach_merged_sources(sources: Dict[ObservabilityPollablePuller, MergedEventSource]) -> None:
+        """
+        Restores the original consumers of the pullers
+        """
+        for puller, source in sources.items():
+            puller.consumer = source.consumer
 
     def load_events(self, event_ids: Union[List[Any], Dict]):
         """
@@ -15,9 +15,12 @@ Exporting resources defined in the cloudformation template to the cloud.
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import copy
+import logging
 import os
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
+import jmespath
 from botocore.utils import set_value_from_jmespath
 
 from samcli.lib.providers.provider import get_full_path
@@ -35,6 +38,7 @@ from samcli.lib.package.packageable_resources import (
     RESOURCES_EXPORT_LIST,
     METADATA_EXPORT_LIST,
     GLOBAL_EXPORT_DICT,
+    Resource,
     ResourceZip,
     ECRResource,
 )
@@ -45,11 +49,15 @@ from samcli.lib.package.utils import (
     make_abs_path,
     is_local_file,
     is_s3_url,
+    resource_not_packageable,
 )
 from samcli.lib.package.local_files_utils import mktempfile, get_uploaded_s3_object_name
+from samcli.lib.utils.async_utils import AsyncContext
 from samcli.lib.utils.packagetype import ZIP
 from samcli.yamlhelper import yaml_parse, yaml_dump
 
+LOG = logging.getLogger(__name__)
+
 # NOTE: sriram-mv, A cyclic dependency on `Template` needs to be broken.
 
 
@@ -61,6 +69,8 @@ class CloudFormationStackResource(ResourceZip):
 
     RESOURCE_TYPE = AWS_CLOUDFORMATION_STACK
     PROPERTY_NAME = RESOURCES_WITH_LOCAL_PATHS[RESOURCE_TYPE][0]
+    # maximum number of artifacts of the nested template which are exported concurrently, see Template
+    max_workers: Optional[int] = None
 
     def do_export(self, resource_id, resource_dict, parent_dir):
         """
@@ -89,6 +99,7 @@ class CloudFormationStackResource(ResourceZip):
             normalize_template=True,
             normalize_parameters=True,
             parent_stack_id=resource_id,
+            max_workers=self.max_workers,
         ).export()
 
         exported_template_str = yaml_dump(exported_template_dict)
@@ -179,9 +190,13 @@ class Template:
         normalize_template: bool = False,
         normalize_parameters: bool = False,
         parent_stack_id: str = "",
+        max_workers: Optional[int] = None,
     ):
         """
         Reads the template and makes it ready for export
+
+        max_workers is the maximum number of artifacts which are packaged and uploaded concurrently,
+        ThreadPoolExecutor's default will be used if it is not given
         """
         if not template_str:
             if not (is_local_folder(parent_dir) and os.path.isabs(parent_dir)):
@@ -202,6 +217,7 @@ class Template:
         self.metadata_to_export = metadata_to_export
         self.uploaders = uploaders
         self.parent_stack_id = parent_stack_id
+        self.max_workers = max_workers
 
     def _export_global_artifacts(self, template_dict: Dict) -> Dict:
         """
@@ -277,6 +293,12 @@ class Template:
         self._apply_global_values()
         self.template_dict = self._export_global_artifacts(self.template_dict)
 
+        # Artifacts are exported concurrently; each export hashes, zips and uploads its own artifact so uploads of
+        # one artifact overlap with compression of the others.
+        async_context = AsyncContext(max_workers=self.max_workers)
+        exports: List[Tuple[Resource, str, Dict]] = []
+        exported_artifacts: Dict[Tuple, Dict] = {}
+        duplicate_exports: List[Tuple[Dict, str, Dict]] = []
         for resource_logical_id, resource in self.template_dict["Resources"].items():
             resource_type = resource.get("Type", None)
             resource_dict = resource.get("Properties", {})
@@ -290,10 +312,58 @@ class Template:
                     continue
                 # Export code resources
                 exporter = exporter_class(self.uploaders, self.code_signer)
-                exporter.export(full_path, resource_dict, self.template_dir)
+                if isinstance(exporter, CloudFormationStackResource):
+                    exporter.max_workers = self.max_workers
+                artifact_key = self._get_artifact_key(exporter, full_path, resource_dict)
+                if artifact_key:
+                    if artifact_key in exported_artifacts:
+                        LOG.debug("Artifact of %s is already being exported, reusing its result", full_path)
+                        duplicate_exports.append(
+                            (exported_artifacts[artifact_key], exporter.PROPERTY_NAME, resource_dict)
+                        )
+                        continue
+                    exported_artifacts[artifact_key] = resource_dict
+                exports.append((exporter, full_path, resource_dict))
+
+        # progress bars are redrawn in place, concurrent uploads would overwrite each other's progress bars
+        if len(exports) > 1 and (self.max_workers is None or self.max_workers > 1):
+            quiet_uploaders = self.uploaders.without_progressbar()
+            for exporter, _, _ in exports:
+                exporter.uploaders = quiet_uploaders
+
+        for exporter, full_path, resource_dict in exports:
+            async_context.add_async_task(exporter.export, full_path, resource_dict, self.template_dir)
+        async_context.run_async(default_executor=False)
+
+        for exported_resource_dict, property_name, resource_dict in duplicate_exports:
+            exported_value = jmespath.search(property_name, exported_resource_dict)
+            set_value_from_jmespath(resource_dict, property_name, copy.deepcopy(exported_value))
 
         return self.template_dict
 
+    def _get_artifact_key(self, exporter: ResourceZip, full_path: str, resource_dict: Dict) -> Optional[Tuple]:
+        """
+        Returns a key which identifies the artifact that will be exported by given exporter, so that resources
+        pointing to the same local artifact are packaged and uploaded only once. Returns None if the artifact
+        can't be shared with other resources (nested stacks, signed packages, non-local artifacts etc.)
+        """
+        if not isinstance(exporter, ResourceZip) or isinstance(
+            exporter, (CloudFormationStackResource, CloudFormationStackSetResource)
+        ):
+            return None
+        if not resource_dict or resource_not_packageable(resource_dict):
+            return None
+        if self.code_signer and self.code_signer.should_sign_package(full_path):
+            return None
+
+        property_value = jmespath.search(exporter.PROPERTY_NAME, resource_dict)
+        if not isinstance(property_value, str):
+            return None
+        local_path = make_abs_path(self.template_dir, property_value)
+        if not is_local_folder(local_path) and not is_local_file(local_path):
+            return None
+        return type(exporter), exporter.PROPERTY_NAME, os.path.realpath(local_path)
+
     def delete(self, retain_resources: List):
         """
         Deletes all the artifacts referenced by the given Cloudformation template
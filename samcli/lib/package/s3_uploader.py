@@ -30,6 +30,7 @@ from boto3.s3 import transfer
 
 from samcli.commands.package.exceptions import NoSuchBucketError, BucketNotSpecifiedError
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name
+from samcli.lib.utils.profiling import CATEGORY_PACKAGE, profiled
 
 LOG = logging.getLogger(__name__)
 
@@ -72,6 +73,7 @@ class S3Uploader:
 
         self._artifact_metadata = None
 
+    @profiled(CATEGORY_PACKAGE, "s3_upload")
     def upload(self, file_name: str, remote_path: str) -> str:
         """
         Uploads given file to S3
@@ -1,14 +1,17 @@
 """
 Contains Uploaders, a class to hold a S3Uploader and an ECRUploader
 """
-
+import copy
 from enum import Enum
-from typing import Union
+from typing import Optional, TypeVar, Union, cast
 
 from samcli.lib.package.ecr_uploader import ECRUploader
 from samcli.lib.package.s3_uploader import S3Uploader
 
 
+_Uploader = TypeVar("_Uploader", S3Uploader, ECRUploader)
+
+
 class Destination(Enum):
     S3 = "s3"  # pylint: disable=invalid-name
     ECR = "ecr"
@@ -33,6 +36,16 @@ class Uploaders:
             return self._ecr_uploader
         raise ValueError(f"destination has invalid value: {destination}")
 
+    def without_progressbar(self) -> "Uploaders":
+        """
+        Returns Uploaders which don't show the progress bar of each upload, to be used when several artifacts are
+        uploaded at the same time and their progress bars would overwrite each other
+        """
+        return Uploaders(
+            cast(S3Uploader, _without_progressbar(self._s3_uploader)),
+            cast(ECRUploader, _without_progressbar(self._ecr_uploader)),
+        )
+
     @property
     def s3(self):
         return self._s3_uploader
@@ -40,3 +53,14 @@ class Uploaders:
     @property
     def ecr(self):
         return self._ecr_uploader
+
+
+def _without_progressbar(uploader: Optional[_Uploader]) -> Optional[_Uploader]:
+    """
+    Returns a copy of the uploader with its progress bar turned off, the clients of the uploader are shared
+    """
+    if uploader is None or uploader.no_progressbar:
+        return uploader
+    quiet_uploader = copy.copy(uploader)
+    quiet_uploader.no_progressbar = True
+    return quiet_uploader
@@ -8,19 +8,28 @@ import re
 import shutil
 import tempfile
 import zipfile
+import uuid
+import hashlib
 import contextlib
 from contextlib import contextmanager
-from typing import Dict, Optional, cast
+from typing import Any, Dict, Optional, Tuple, cast
 
 import jmespath
 
 from samcli.commands.package.exceptions import ImageNotFoundError, InvalidLocalPathError
 from samcli.lib.package.ecr_utils import is_ecr_url
 from samcli.lib.package.s3_uploader import S3Uploader
-from samcli.lib.utils.hash import dir_checksum
+from samcli.lib.utils.profiling import CATEGORY_PACKAGE, profiled
 
 LOG = logging.getLogger(__name__)
 
+# Earliest timestamp that can be stored in a zip file, used for all entries of the reproducible zip files
+REPRODUCIBLE_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+# zlib's default compression level, pinned so that reproducible zip files don't depend on the defaults of the platform
+REPRODUCIBLE_ZIP_COMPRESSION_LEVEL = 6
+# Size of the chunks which files are streamed into zip files with, so that large files are not loaded into memory
+ZIP_CHUNK_SIZE = 1024 * 1024
+
 # https://docs.aws.amazon.com/AmazonS3/latest/dev-retired/UsingBucket.html
 _REGION_PATTERN = r"[a-zA-Z0-9-]+"
 _DOT_AMAZONAWS_COM_PATTERN = r"\.amazonaws\.com(\.cn)?"
@@ -195,6 +204,8 @@ def zip_folder(folder_path):
     Zip the entire folder and return a file to the zip. Use this inside
     a "with" statement to cleanup the zipfile after it is used.
 
+    The folder is read only once; its checksum is calculated while its contents are being compressed.
+
     Parameters
     ----------
     folder_path : str
@@ -207,10 +218,9 @@ def zip_folder(folder_path):
     md5hash : str
         The md5 hash of the directory
     """
-    md5hash = dir_checksum(folder_path, followlinks=True)
-    filename = os.path.join(tempfile.gettempdir(), "data-" + md5hash)
+    filename = os.path.join(tempfile.gettempdir(), "data-" + uuid.uuid4().hex)
 
-    zipfile_name = make_zip(filename, folder_path)
+    zipfile_name, md5hash = make_zip_with_checksum(filename, folder_path)
     try:
         yield zipfile_name, md5hash
     finally:
@@ -218,7 +228,8 @@ def zip_folder(folder_path):
             os.remove(zipfile_name)
 
 
-def make_zip(file_name, source_root):
+@profiled(CATEGORY_PACKAGE, "zip")
+def make_zip(file_name, source_root, reproducible=False):
     """
     Create a zip file from the source directory
 
@@ -228,6 +239,9 @@ def make_zip(file_name, source_root):
         The basename of the zip file, without .zip
     source_root : str
         The path to the source directory
+    reproducible : bool
+        If True, creates a reproducible archive; entries are sorted by their path, timestamps and permission bits are
+        normalized and compression level is pinned, so that identical inputs produce byte-identical zip files.
     Returns
     -------
     str
@@ -236,6 +250,10 @@ def make_zip(file_name, source_root):
     zipfile_name = "{0}.zip".format(file_name)
     source_root = os.path.abspath(source_root)
     compression_type = zipfile.ZIP_DEFLATED
+    if reproducible:
+        zipfile_name, _ = make_zip_with_checksum(file_name, source_root)
+        return zipfile_name
+
     with open(zipfile_name, "wb") as f:
         with contextlib.closing(zipfile.ZipFile(f, "w", compression_type)) as zf:
             for root, _, files in os.walk(source_root, followlinks=True):
@@ -264,6 +282,71 @@ def make_zip(file_name, source_root):
     return zipfile_name
 
 
+@profiled(CATEGORY_PACKAGE, "zip")
+def make_zip_with_checksum(file_name: str, source_root: str, hash_generator: Any = None) -> Tuple[str, str]:
+    """
+    Create a reproducible zip file from the source directory (see make_zip) and calculate checksum of the source
+    directory in the same pass, so that each file is read only once.
+    The checksum is identical to the one which is calculated by samcli.lib.utils.hash.dir_checksum.
+
+    Parameters
+    ----------
+    file_name : str
+        The basename of the zip file, without .zip
+    source_root : str
+        The path to the source directory
+    hash_generator : hashlib._Hash
+        The hashing method (hashlib _Hash object) that generates checksum. Defaults to hashlib.md5.
+
+    Returns
+    -------
+    Tuple[str, str]
+        The name of the zip file including .zip extension, and the checksum of the source directory
+    """
+    zipfile_name = "{0}.zip".format(file_name)
+    source_root = os.path.abspath(source_root)
+    if not hash_generator:
+        hash_generator = hashlib.md5()
+    is_windows = platform.system().lower() == "windows"
+
+    # entries are named and sorted by their path within the archive, which always uses "/" as the separator, so that
+    # the archive is the same on every platform
+    file_paths = []
+    for root, _, files in os.walk(source_root, followlinks=True):
+        for filename in files:
+            full_path = os.path.join(root, filename)
+            file_paths.append((os.path.relpath(full_path, source_root).replace(os.sep, "/"), full_path))
+
+    file_checksums = {}
+    with open(zipfile_name, "wb") as f:
+        with contextlib.closing(zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED)) as zf:
+            for archive_path, full_path in sorted(file_paths):
+                info = zipfile.ZipInfo(archive_path, date_time=REPRODUCIBLE_ZIP_DATE_TIME)
+                # executable bits can't be detected on Windows, keep using 0755 as in the default mode
+                is_executable = is_windows or os.access(full_path, os.X_OK)
+                info.external_attr = (0o100755 if is_executable else 0o100644) << 16
+                # Set host OS to Unix
+                info.create_system = 3
+                info.compress_type = zipfile.ZIP_DEFLATED
+                # ZipFile.open doesn't take a compression level, it is read from the ZipInfo as in ZipFile.writestr
+                info._compresslevel = REPRODUCIBLE_ZIP_COMPRESSION_LEVEL  # pylint: disable=protected-access
+                # file size is only used to decide whether the entry needs zip64 extensions
+                info.file_size = os.path.getsize(full_path)
+                file_hash = hashlib.md5()
+                with open(full_path, "rb") as data, zf.open(info, "w") as entry:
+                    for chunk in iter(lambda: data.read(ZIP_CHUNK_SIZE), b""):
+                        entry.write(chunk)
+                        file_hash.update(chunk)
+                file_checksums[full_path] = file_hash.hexdigest()
+
+    # the checksum is calculated in the order of dir_checksum, which sorts the files by their path on the system
+    for full_path in sorted(file_checksums):
+        hash_generator.update(os.path.relpath(full_path, source_root).encode("utf-8"))
+        hash_generator.update(file_checksums[full_path].encode("utf-8"))
+
+    return zipfile_name, cast(str, hash_generator.hexdigest())
+
+
 def copy_to_temp_dir(filepath):
     tmp_dir = tempfile.mkdtemp()
     dst = os.path.join(tmp_dir, os.path.basename(filepath))
@@ -2,9 +2,14 @@
 Base class for SAM Template providers
 """
 
+import json
 import logging
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 
-from typing import Any, Dict, Optional, cast, Iterable, Union
+from typing import Any, Callable, Dict, Optional, cast, Iterable, Union
 from samcli.lib.utils.resources import (
     AWS_LAMBDA_FUNCTION,
     AWS_SERVERLESS_FUNCTION,
@@ -17,10 +22,20 @@ from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymb
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
 from samcli.lib.samlib.wrapper import SamTranslatorWrapper
 from samcli.lib.package.ecr_utils import is_ecr_url
+from samcli.lib.utils.hash import str_checksum
 
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of processed templates which are kept in the translation cache
+TEMPLATE_CACHE_SIZE = 32
+
+# Processed templates keyed by the digest of the unprocessed template, parameter values and processing options.
+# The cache is shared by all providers, so the same stack is translated only once even if many providers are created
+# for it. Templates are kept pickled, so that each caller gets its own copy which it can modify freely.
+_TEMPLATE_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
 
 class SamBaseProvider:
     """
@@ -185,16 +200,27 @@ class SamBaseProvider:
         """
         template_dict = template_dict or {}
         parameters_values = SamBaseProvider._get_parameter_values(template_dict, parameter_overrides)
-        if template_dict:
-            template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
-        ResourceMetadataNormalizer.normalize(template_dict)
 
-        resolver = IntrinsicResolver(
-            template=template_dict,
-            symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters_values, template=template_dict),
+        def _process_template() -> Dict:
+            processed_template = template_dict
+            if processed_template:
+                processed_template = SamTranslatorWrapper(
+                    processed_template, parameter_values=parameters_values
+                ).run_plugins()
+            ResourceMetadataNormalizer.normalize(processed_template)
+
+            resolver = IntrinsicResolver(
+                template=processed_template,
+                symbol_resolver=IntrinsicsSymbolTable(
+                    logical_id_translator=parameters_values, template=processed_template
+                ),
+            )
+            return cast(Dict, resolver.resolve_template(ignore_errors=True))
+
+        return cast(
+            Dict,
+            SamBaseProvider._get_cached_template(_process_template, "get_template", template_dict, parameters_values),
         )
-        template_dict = resolver.resolve_template(ignore_errors=True)
-        return template_dict
 
     @staticmethod
     def get_resolved_template_dict(
@@ -224,17 +250,94 @@ class SamBaseProvider:
         """
         template_dict = template_dict or Stack()
         parameters_values = SamBaseProvider._get_parameter_values(template_dict, parameter_overrides)
-        if template_dict:
-            template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
-        if normalize_resource_metadata:
-            ResourceMetadataNormalizer.normalize(template_dict)
-
-        resolver = IntrinsicResolver(
-            template=template_dict,
-            symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters_values, template=template_dict),
+
+        def _process_template() -> Stack:
+            processed_template = template_dict
+            if processed_template:
+                processed_template = SamTranslatorWrapper(
+                    processed_template, parameter_values=parameters_values
+                ).run_plugins()
+            if normalize_resource_metadata:
+                ResourceMetadataNormalizer.normalize(processed_template)
+
+            resolver = IntrinsicResolver(
+                template=processed_template,
+                symbol_resolver=IntrinsicsSymbolTable(
+                    logical_id_translator=parameters_values, template=processed_template
+                ),
+            )
+            return cast(Stack, resolver.resolve_template(ignore_errors=True))
+
+        return cast(
+            Stack,
+            SamBaseProvider._get_cached_template(
+                _process_template,
+                "get_resolved_template_dict",
+                template_dict,
+                parameters_values,
+                normalize_resource_metadata,
+            ),
         )
-        template_dict = resolver.resolve_template(ignore_errors=True)
-        return template_dict
+
+    @staticmethod
+    def _get_cached_template(process_template: Callable[[], Any], *key_parts: Any) -> Any:
+        """
+        Returns a copy of the processed template from the translation cache, processing and caching it if it is
+        not in the cache yet.
+
+        Parameters
+        ----------
+        process_template : Callable[[], Any]
+            Function which processes the template
+        key_parts : Any
+            Everything the processed template depends on, like the unprocessed template and parameter values
+
+        Returns
+        -------
+        Any
+            Processed template, which is not shared with any other caller
+        """
+        try:
+            key: Optional[str] = str_checksum(json.dumps(key_parts, default=SamBaseProvider._to_cache_key_part))
+        except (TypeError, ValueError) as ex:
+            LOG.debug("Skip translation cache since the template can't be serialized", exc_info=ex)
+            key = None
+
+        if key:
+            with _TEMPLATE_CACHE_LOCK:
+                cached_template = _TEMPLATE_CACHE.get(key)
+                if cached_template is not None:
+                    _TEMPLATE_CACHE.move_to_end(key)
+            if cached_template is not None:
+                LOG.debug("Using the processed template from the translation cache")
+                return pickle.loads(cached_template)
+
+        processed_template = process_template()
+        if key:
+            try:
+                pickled_template = pickle.dumps(processed_template, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as ex:
+                LOG.debug("Skip caching the processed template since it can't be pickled", exc_info=ex)
+                return processed_template
+            with _TEMPLATE_CACHE_LOCK:
+                _TEMPLATE_CACHE[key] = pickled_template
+                while len(_TEMPLATE_CACHE) > TEMPLATE_CACHE_SIZE:
+                    _TEMPLATE_CACHE.popitem(last=False)
+        return processed_template
+
+    @staticmethod
+    def _to_cache_key_part(value: Any) -> Any:
+        """
+        Converts the values that JSON does not support while calculating the translation cache key
+        """
+        if isinstance(value, Mapping):
+            return dict(value)
+        if isinstance(value, (set, tuple)):
+            return list(value)
+        # only the values whose string representation reflects their content can be part of the key
+        if type(value).__str__ is object.__str__:
+            raise TypeError(f"Can't use {type(value)} as part of translation cache key")
+        return str(value)
 
     @staticmethod
     def _get_parameter_values(template_dict: Any, parameter_overrides: Optional[Dict]) -> Dict:
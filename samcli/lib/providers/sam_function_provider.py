@@ -2,7 +2,8 @@
 Class that provides functions from a given SAM template
 """
 import logging
-from typing import Dict, List, Optional, cast, Iterator, Any
+import threading
+from typing import Dict, List, Optional, Set, cast, Iterator, Any
 
 from samtranslator.policy_template_processor.exceptions import TemplateNotFoundException
 
@@ -58,6 +59,11 @@ class SamFunctionProvider(SamBaseProvider):
         for stack in stacks:
             LOG.debug("%d resources found in the stack %s", len(stack.resources), stack.stack_path)
 
+        # Index of function logical ID and function name to the functions, it is built on the first lookup by name,
+        # and dropped whenever functions is set
+        self._functions_index: Optional[Dict[str, List[Function]]] = None
+        self._functions: Dict[str, Function] = {}
+
         # Store a map of function full_path to function information for quick reference
         self.functions = SamFunctionProvider._extract_functions(
             self._stacks, use_raw_codeuri, ignore_code_extraction_warnings
@@ -65,6 +71,18 @@ class SamFunctionProvider(SamBaseProvider):
 
         self._colored = Colored()
 
+    @property
+    def functions(self) -> Dict[str, Function]:
+        """
+        Returns the map of function full_path to function information
+        """
+        return self._functions
+
+    @functions.setter
+    def functions(self, functions: Dict[str, Function]) -> None:
+        self._functions = functions
+        self._functions_index = None
+
     @property
     def stacks(self) -> List[Stack]:
         """
@@ -91,20 +109,16 @@ class SamFunctionProvider(SamBaseProvider):
         if not name:
             raise ValueError("Function name is required")
 
-        resolved_function = None
-
-        if name in self.functions:
-            # support lookup by full_path
-            resolved_function = self.functions.get(name)
+        # support lookup by full_path
+        resolved_function = self.functions.get(name)
 
         if not resolved_function:
-            # If function is not found by full path, search through all functions
-
-            found_fs = []
-
-            for f in self.get_all():
-                if name in (f.function_id, f.name, f.functionname):
-                    found_fs.append(f)
+            # If function is not found by full path, search for it by its logical ID or function name
+            functions_index = self._functions_index
+            if functions_index is None:
+                functions_index = SamFunctionProvider._index_functions(self._functions)
+                self._functions_index = functions_index
+            found_fs = list(functions_index.get(name, []))
 
             # If multiple functions are found, only return one of them
             if len(found_fs) > 1:
@@ -115,10 +129,10 @@ class SamFunctionProvider(SamBaseProvider):
                     f"invoked! If it's not the function you are going to invoke, please choose one of them from"
                     f" below:"
                 )
-                LOG.warning(Colored().yellow(message))
+                LOG.warning(self._colored.yellow(message))
 
                 for found_f in found_fs:
-                    LOG.warning(Colored().yellow(found_f.full_path))
+                    LOG.warning(self._colored.yellow(found_f.full_path))
 
                 resolved_function = found_fs[0]
 
@@ -130,6 +144,25 @@ class SamFunctionProvider(SamBaseProvider):
 
         return resolved_function
 
+    @staticmethod
+    def _index_functions(functions: Dict[str, Function]) -> Dict[str, List[Function]]:
+        """
+        Indexes the functions by their logical ID, name and function name, so that a function can be found without
+        scanning all the functions
+
+        :param dict functions: Map of function full_path to function information
+        :return dict: Map of logical ID, name and function name to the list of functions having it
+        """
+        index: Dict[str, List[Function]] = {}
+        for function in functions.values():
+            keys = []
+            for key in (function.function_id, function.name, function.functionname):
+                if key and key not in keys:
+                    keys.append(key)
+            for key in keys:
+                index.setdefault(key, []).append(function)
+        return index
+
     def _deprecate_notification(self, runtime: Optional[str]) -> None:
         if runtime in DEPRECATED_RUNTIMES:
             message = (
@@ -613,6 +646,9 @@ class RefreshableSamFunctionProvider(SamFunctionProvider):
                 self.parent_templates_paths.append(stack.location)
 
         self.is_changed = False
+        self._changed_templates_paths: Set[str] = set()
+        self._changed_templates_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
         self._observer = FileObserver(self._set_templates_changed)
         self._observer.start()
         self._watch_stack_templates(stacks)
@@ -677,9 +713,11 @@ class RefreshableSamFunctionProvider(SamFunctionProvider):
             "A change got detected in the templates %s. Mark templates as changed to be reloaded in the next invoke",
             ", ".join(paths),
         )
-        self.is_changed = True
-        for stack in self._stacks:
-            self._observer.unwatch(stack.location)
+        with self._changed_templates_lock:
+            self._changed_templates_paths.update(paths)
+            self.is_changed = True
+        for path in paths:
+            self._observer.unwatch(path)
 
     def _watch_stack_templates(self, stacks: List[Stack]) -> None:
         """
@@ -690,9 +728,57 @@ class RefreshableSamFunctionProvider(SamFunctionProvider):
 
     def _refresh_loaded_functions(self) -> None:
         """
-        Reload the stacks, and lambda functions from template files.
+        Reload the changed stacks, and their lambda functions from template files.
+        Only the stacks whose templates got changed are reloaded (including their nested stacks), the stacks and
+        functions of the other templates are kept as they are.
+        """
+        # concurrent callers wait for the running refresh, instead of using the stacks while they are being replaced
+        with self._refresh_lock:
+            with self._changed_templates_lock:
+                changed_templates_paths = self._changed_templates_paths
+                self._changed_templates_paths = set()
+                self.is_changed = False
+
+            if not changed_templates_paths:
+                # the changed templates are already reloaded by another caller
+                return
+            self._reload_changed_stacks(changed_templates_paths)
+
+    def _reload_changed_stacks(self, changed_templates_paths: Set[str]) -> None:
+        """
+        Reload the stacks of the changed templates, all the stacks are reloaded if a root stack template got changed
+        or if a changed template does not belong to any of the loaded stacks.
+        """
+        changed_stacks = [stack for stack in self._stacks if stack.location in changed_templates_paths]
+        known_templates_paths = {stack.location for stack in changed_stacks}
+        if changed_templates_paths - known_templates_paths or any(stack.is_root_stack for stack in changed_stacks):
+            self._reload_all_stacks(changed_templates_paths)
+            return
+
+        LOG.debug("A change got detected in the templates of stacks %s", [stack.stack_path for stack in changed_stacks])
+        watched_templates_paths = {stack.location for stack in self._stacks} - changed_templates_paths
+        reloaded_stack_paths: List[str] = []
+        # parent stacks are reloaded first, as reloading a stack also reloads its nested stacks
+        for stack in sorted(changed_stacks, key=lambda changed_stack: changed_stack.stack_path.count("/")):
+            if any(self._is_in_stack(stack.stack_path, stack_path) for stack_path in reloaded_stack_paths):
+                continue
+            reloaded_stack_paths.append(stack.stack_path)
+            self._reload_stack(stack)
+
+        current_templates_paths = {stack.location for stack in self._stacks}
+        for path in watched_templates_paths - current_templates_paths:
+            self._observer.unwatch(path)
+        for path in current_templates_paths - watched_templates_paths:
+            self._observer.watch(path)
+
+    def _reload_all_stacks(self, changed_templates_paths: Set[str]) -> None:
+        """
+        Reload all the stacks, and lambda functions from the parent template files.
         """
-        LOG.debug("A change got detected in one of the stack templates. Reload the lambda function resources")
+        LOG.debug("A change got detected in one of the parent templates. Reload all the lambda function resources")
+        for stack in self._stacks:
+            if stack.location not in changed_templates_paths:
+                self._observer.unwatch(stack.location)
         self._stacks = []
 
         for template_file in self.parent_templates_paths:
@@ -706,12 +792,52 @@ class RefreshableSamFunctionProvider(SamFunctionProvider):
             except (TemplateNotFoundException, TemplateFailedParsingException) as ex:
                 raise ex
 
-        self.is_changed = False
         self.functions = self._extract_functions(
             self._stacks, self._use_raw_codeuri, self._ignore_code_extraction_warnings
         )
         self._watch_stack_templates(self._stacks)
 
+    def _reload_stack(self, changed_stack: Stack) -> None:
+        """
+        Reload a single nested stack and its own nested stacks, and replace their lambda functions.
+        """
+        LOG.debug("Reload the lambda function resources of the stack %s", changed_stack.stack_path)
+        reloaded_stacks, _ = SamLocalStackProvider.get_stacks(
+            changed_stack.location,
+            changed_stack.parent_stack_path,
+            changed_stack.name,
+            changed_stack.parameters,
+            self._global_parameter_overrides,
+            changed_stack.metadata,
+        )
+        reloaded_functions = self._extract_functions(
+            reloaded_stacks, self._use_raw_codeuri, self._ignore_code_extraction_warnings
+        )
+
+        stacks: List[Stack] = []
+        for stack in self._stacks:
+            if not self._is_in_stack(stack.stack_path, changed_stack.stack_path):
+                stacks.append(stack)
+            elif stack is changed_stack:
+                # keep the reloaded stacks in the position of the old ones
+                stacks.extend(reloaded_stacks)
+        self._stacks = stacks
+
+        functions = {
+            full_path: function
+            for full_path, function in self.functions.items()
+            if not self._is_in_stack(function.stack_path, changed_stack.stack_path)
+        }
+        functions.update(reloaded_functions)
+        self.functions = functions
+
+    @staticmethod
+    def _is_in_stack(stack_path: str, parent_stack_path: str) -> bool:
+        """
+        Returns True if stack_path is the given parent stack itself or one of its nested stacks
+        """
+        return stack_path == parent_stack_path or stack_path.startswith(parent_stack_path + "/")
+
     def stop_observer(self) -> None:
         """
         Stop Observing.
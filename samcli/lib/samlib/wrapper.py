@@ -9,6 +9,7 @@ rich public interface.
 
 import copy
 import functools
+import pickle
 from typing import Dict
 
 from samtranslator.model import ResourceTypeResolver, sam_resources
@@ -25,6 +26,7 @@ from samtranslator.translator.translator import prepare_plugins
 from samtranslator.validator.validator import SamTemplateValidator
 
 from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
+from samcli.lib.utils.profiling import CATEGORY_TEMPLATE, profiled
 from .local_uri_plugin import SupportLocalUriPlugin
 
 
@@ -51,6 +53,7 @@ class SamTranslatorWrapper:
         self._sam_template = sam_template
         self._offline_fallback = offline_fallback
 
+    @profiled(CATEGORY_TEMPLATE, "translate_template")
     def run_plugins(self, convert_local_uris=True):
         template_copy = self.template
 
@@ -75,7 +78,11 @@ class SamTranslatorWrapper:
 
     @property
     def template(self):
-        return copy.deepcopy(self._sam_template)
+        # pickling round trip copies plain template dictionaries much faster than copy.deepcopy
+        try:
+            return pickle.loads(pickle.dumps(self._sam_template, protocol=pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return copy.deepcopy(self._sam_template)
 
 
 class _SamParserReimplemented:
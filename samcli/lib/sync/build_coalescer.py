@@ -0,0 +1,139 @@
+"""Coalesces the builds of SyncFlows for functions which share the same build definition"""
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from samcli.lib.build.app_builder import ApplicationBuildResult
+from samcli.lib.build.build_graph import FunctionBuildDefinition
+from samcli.lib.providers.provider import Function
+from samcli.lib.utils.packagetype import ZIP
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CoalescedBuildResult:
+    """Data struct for a build which is shared by multiple SyncFlows"""
+
+    # Time in seconds since epoch when the build was started
+    build_time: float
+
+    build_result: ApplicationBuildResult
+
+
+class BuildCoalescer:
+    """
+    When a shared source folder changes, a SyncFlow is queued for every function which uses it. Instead of each flow
+    running its own build, the first flow builds all functions which share its build definition at once, so that the
+    build definition is built only once and its artifacts are copied for every function. The other flows, which were
+    queued before this build started, reuse its result.
+    """
+
+    def __init__(self) -> None:
+        self._results: Dict[Tuple[str, bool], CoalescedBuildResult] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_build_group(function: Function, functions: List[Function]) -> List[Function]:
+        """
+        Returns the functions which are built with the same build definition as the given function.
+        Functions using different layers are kept out, so that building the group doesn't build other layers.
+
+        Parameters
+        ----------
+        function : Function
+            Function to be built
+        functions : List[Function]
+            All functions of the application
+
+        Returns
+        -------
+        List[Function]
+            Functions sharing the build definition of the given function, including the function itself
+        """
+        if function.packagetype != ZIP or function.inlinecode:
+            return [function]
+
+        build_definition = BuildCoalescer._get_build_definition(function)
+        group = [function]
+        for other_function in functions:
+            if (
+                other_function.full_path != function.full_path
+                and other_function.packagetype == ZIP
+                and not other_function.inlinecode
+                and BuildCoalescer._get_layer_paths(other_function) == BuildCoalescer._get_layer_paths(function)
+                and BuildCoalescer._get_build_definition(other_function) == build_definition
+            ):
+                group.append(other_function)
+        return group
+
+    def get_build(
+        self, function_identifier: str, combine_dependencies: bool, queued_time: float
+    ) -> Optional[CoalescedBuildResult]:
+        """
+        Returns the build result which contains the given function if it is started after the flow is queued
+
+        Parameters
+        ----------
+        function_identifier : str
+            Identifier of the function
+        combine_dependencies : bool
+            Whether dependencies are combined into the function artifacts
+        queued_time : float
+            Time in seconds since epoch when the SyncFlow of the function was queued
+
+        Returns
+        -------
+        Optional[CoalescedBuildResult]
+            The build result which can be reused, None if the function needs to be built
+        """
+        with self._lock:
+            result = self._results.get((function_identifier, combine_dependencies))
+
+        if not result or result.build_time < queued_time:
+            return None
+
+        artifact_folder = result.build_result.artifacts.get(function_identifier)
+        if not artifact_folder or not os.path.isdir(artifact_folder):
+            return None
+
+        LOG.debug("Reusing the build started at %s for %s", result.build_time, function_identifier)
+        return result
+
+    def put_build(self, build_time: float, combine_dependencies: bool, build_result: ApplicationBuildResult) -> None:
+        """
+        Stores the build result for all functions which are built
+
+        Parameters
+        ----------
+        build_time : float
+            Time in seconds since epoch when the build was started
+        combine_dependencies : bool
+            Whether dependencies are combined into the function artifacts
+        build_result : ApplicationBuildResult
+            Result of the build
+        """
+        coalesced_result = CoalescedBuildResult(build_time, build_result)
+        with self._lock:
+            for resource_identifier in build_result.artifacts:
+                key = (resource_identifier, combine_dependencies)
+                previous_result = self._results.get(key)
+                if not previous_result or previous_result.build_time <= build_time:
+                    self._results[key] = coalesced_result
+
+    @staticmethod
+    def _get_build_definition(function: Function) -> FunctionBuildDefinition:
+        return FunctionBuildDefinition(
+            function.runtime,
+            function.codeuri,
+            function.packagetype,
+            function.architecture,
+            function.metadata,
+            function.handler,
+        )
+
+    @staticmethod
+    def _get_layer_paths(function: Function) -> List[str]:
+        return [layer.full_path for layer in function.layers]
@@ -3,13 +3,12 @@ import time
 import logging
 
 from typing import Callable, Optional
-from concurrent.futures.thread import ThreadPoolExecutor
 
 from dataclasses import dataclass
 
 from samcli.lib.sync.exceptions import SyncFlowException
 from samcli.lib.sync.sync_flow import SyncFlow
-from samcli.lib.sync.sync_flow_executor import SyncFlowExecutor, SyncFlowFuture, SyncFlowTask, default_exception_handler
+from samcli.lib.sync.sync_flow_executor import SyncFlowExecutor, SyncFlowTask, default_exception_handler
 
 LOG = logging.getLogger(__name__)
 
@@ -32,8 +31,8 @@ class ContinuousSyncFlowExecutor(SyncFlowExecutor):
     # Flag for whether the executor should be stopped at the next available time
     _stop_flag: bool
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        super().__init__(max_workers=max_workers)
         self._stop_flag = False
 
     def stop(self, should_stop=True) -> None:
@@ -41,7 +40,7 @@ class ContinuousSyncFlowExecutor(SyncFlowExecutor):
         with self._flow_queue_lock:
             self._stop_flag = should_stop
             if should_stop:
-                self._flow_queue.queue.clear()
+                self._clear_pending_tasks()
 
     def should_stop(self) -> bool:
         """
@@ -55,33 +54,22 @@ class ContinuousSyncFlowExecutor(SyncFlowExecutor):
     def _can_exit(self):
         return self.should_stop() and super()._can_exit()
 
-    def _submit_sync_flow_task(
-        self, executor: ThreadPoolExecutor, sync_flow_task: SyncFlowTask
-    ) -> Optional[SyncFlowFuture]:
-        """Submit SyncFlowTask to be executed by ThreadPoolExecutor
-        and return its future
-        Adds additional time checks for DelayedSyncFlowTask
+    def _get_task_ready_time(self, sync_flow_task: SyncFlowTask) -> float:
+        """DelayedSyncFlowTask is kept in the timer heap until its wait time has passed
 
         Parameters
         ----------
-        executor : ThreadPoolExecutor
-            THreadPoolExecutor to be used for execution
         sync_flow_task : SyncFlowTask
             SyncFlowTask to be executed.
 
         Returns
         -------
-        Optional[SyncFlowFuture]
-            Returns SyncFlowFuture generated by the SyncFlowTask.
-            Can be None if the task cannot be executed yet.
+        float
+            Time in seconds since epoch after which the task can be executed
         """
-        if (
-            isinstance(sync_flow_task, DelayedSyncFlowTask)
-            and sync_flow_task.wait_time + sync_flow_task.queue_time > time.time()
-        ):
-            return None
-
-        return super()._submit_sync_flow_task(executor, sync_flow_task)
+        if isinstance(sync_flow_task, DelayedSyncFlowTask):
+            return sync_flow_task.queue_time + sync_flow_task.wait_time
+        return super()._get_task_ready_time(sync_flow_task)
 
     def _add_sync_flow_task(self, task: SyncFlowTask) -> None:
         """Add SyncFlowTask to the queue
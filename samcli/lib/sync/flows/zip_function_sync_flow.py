@@ -4,13 +4,14 @@ import logging
 import os
 import base64
 import tempfile
+import time
 import uuid
 from contextlib import ExitStack
 
 from typing import Any, Dict, List, Optional, TYPE_CHECKING, cast
 
 from samcli.lib.build.build_graph import BuildGraph
-from samcli.lib.providers.provider import Stack
+from samcli.lib.providers.provider import ResourcesToBuildCollector, Stack
 
 from samcli.lib.sync.flows.function_sync_flow import FunctionSyncFlow
 from samcli.lib.package.s3_uploader import S3Uploader
@@ -18,6 +19,7 @@ from samcli.lib.utils.hash import file_checksum
 from samcli.lib.package.utils import make_zip
 
 from samcli.lib.build.app_builder import ApplicationBuilder
+from samcli.lib.sync.build_coalescer import BuildCoalescer
 from samcli.lib.sync.sync_flow import ResourceAPICall, ApiCallTypes
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -36,6 +38,8 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
     _zip_file: Optional[str]
     _local_sha: Optional[str]
     _build_graph: Optional[BuildGraph]
+    _build_coalescer: Optional[BuildCoalescer]
+    _queued_time: float
 
     def __init__(
         self,
@@ -44,6 +48,7 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
         deploy_context: "DeployContext",
         physical_id_mapping: Dict[str, str],
         stacks: List[Stack],
+        build_coalescer: Optional[BuildCoalescer] = None,
     ):
 
         """
@@ -59,6 +64,8 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
             Physical ID Mapping
         stacks : Optional[List[Stack]]
             Stacks
+        build_coalescer : Optional[BuildCoalescer]
+            Shares the build of the functions with the same build definition between SyncFlows
         """
         super().__init__(function_identifier, build_context, deploy_context, physical_id_mapping, stacks)
         self._s3_client = None
@@ -66,6 +73,8 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
         self._zip_file = None
         self._local_sha = None
         self._build_graph = None
+        self._build_coalescer = build_coalescer
+        self._queued_time = time.time()
 
     def set_up(self) -> None:
         super().set_up()
@@ -77,28 +86,57 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
             if self.has_locks():
                 exit_stack.enter_context(self._get_lock_chain())
 
-            builder = ApplicationBuilder(
-                self._build_context.collect_build_resources(self._function_identifier),
-                self._build_context.build_dir,
-                self._build_context.base_dir,
-                self._build_context.cache_dir,
-                cached=True,
-                is_building_specific_resource=True,
-                manifest_path_override=self._build_context.manifest_path_override,
-                container_manager=self._build_context.container_manager,
-                mode=self._build_context.mode,
-                combine_dependencies=self._combine_dependencies(),
+            # A coalesced build rewrites the build folders of all functions in the build group. The functions of a
+            # group share their code and layers, hence the same locks, so builds are only coalesced while holding
+            # them and the artifacts are zipped before the locks are released.
+            build_coalescer = self._build_coalescer if self.has_locks() else None
+            coalesced_build = (
+                build_coalescer.get_build(self._function_identifier, self._combine_dependencies(), self._queued_time)
+                if build_coalescer
+                else None
             )
-            LOG.debug("%sBuilding Function", self.log_prefix)
-            build_result = builder.build()
+            if coalesced_build:
+                LOG.debug("%sReusing the build of the functions with the same build definition", self.log_prefix)
+                build_result = coalesced_build.build_result
+            else:
+                build_time = time.time()
+                builder = ApplicationBuilder(
+                    self._collect_build_resources(build_coalescer),
+                    self._build_context.build_dir,
+                    self._build_context.base_dir,
+                    self._build_context.cache_dir,
+                    cached=True,
+                    is_building_specific_resource=True,
+                    manifest_path_override=self._build_context.manifest_path_override,
+                    container_manager=self._build_context.container_manager,
+                    mode=self._build_context.mode,
+                    combine_dependencies=self._combine_dependencies(),
+                )
+                LOG.debug("%sBuilding Function", self.log_prefix)
+                build_result = builder.build()
+                if build_coalescer:
+                    build_coalescer.put_build(build_time, self._combine_dependencies(), build_result)
             self._build_graph = build_result.build_graph
             self._artifact_folder = build_result.artifacts.get(self._function_identifier)
 
-        zip_file_path = os.path.join(tempfile.gettempdir(), "data-" + uuid.uuid4().hex)
-        self._zip_file = make_zip(zip_file_path, self._artifact_folder)
-        LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
+            zip_file_path = os.path.join(tempfile.gettempdir(), "data-" + uuid.uuid4().hex)
+            self._zip_file = make_zip(zip_file_path, self._artifact_folder, reproducible=True)
+            LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
         self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
 
+    def _collect_build_resources(self, build_coalescer: Optional[BuildCoalescer]) -> ResourcesToBuildCollector:
+        """Collect the function and its layers, and the other functions sharing its build definition if builds are
+        coalesced"""
+        resources = self._build_context.collect_build_resources(self._function_identifier)
+        if build_coalescer:
+            build_group = BuildCoalescer.get_build_group(
+                self._function, self._build_context.function_provider.get_all()
+            )
+            resources.add_functions(
+                [function for function in build_group if function.full_path != self._function.full_path]
+            )
+        return resources
+
     def compare_remote(self) -> bool:
         remote_info = self._lambda_client.get_function(FunctionName=self.get_physical_id(self._function_identifier))
         remote_sha = base64.b64decode(remote_info["Configuration"]["CodeSha256"]).hex()
@@ -1,12 +1,14 @@
 """Executor for SyncFlows"""
+import heapq
 import logging
 import time
 
+from itertools import count
 from queue import Queue
-from typing import Callable, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
-from threading import RLock
+from threading import Condition, RLock
 from concurrent.futures import ThreadPoolExecutor, Future
 
 from botocore.exceptions import ClientError
@@ -109,27 +111,55 @@ def default_exception_handler(sync_flow_exception: SyncFlowException) -> None:
 class SyncFlowExecutor:
     """Executor for SyncFlows
     Can be used with ThreadPoolExecutor or ProcessPoolExecutor with/without manager
+
+    Scheduling is event driven. Finished SyncFlows are reported through future callbacks, tasks which should run
+    later are kept in a timer heap, and a SyncFlow which is already running is parked until the running one
+    finishes. SyncFlows are only dispatched when none of their locks is held or claimed by another running
+    SyncFlow, so they don't occupy a worker while blocking on a lock. Released locks are reported by the
+    LockDistributor. The execution loop only wakes up when one of these events happens.
     """
 
     _flow_queue: Queue
     _flow_queue_lock: RLock
+    _flow_queue_condition: Condition
     _lock_distributor: LockDistributor
     _running_flag: bool
     _color: Colored
     _running_futures: Set[SyncFlowFuture]
-
-    def __init__(
-        self,
-    ) -> None:
+    _finished_futures: List[SyncFlowFuture]
+    _blocked_tasks: List[SyncFlowTask]
+    _lock_waiting_tasks: List[SyncFlowTask]
+    _claimed_lock_keys: Dict[str, SyncFlow]
+    _lock_released: bool
+    _delayed_tasks: List[Tuple[float, int, SyncFlowTask]]
+    _max_workers: Optional[int]
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Parameters
+        ----------
+        max_workers : Optional[int]
+            Maximum number of SyncFlows executed at the same time, defaults to the ThreadPoolExecutor default
+        """
         self._flow_queue = Queue()
-        self._lock_distributor = LockDistributor(LockDistributorType.THREAD)
+        self._lock_distributor = LockDistributor(LockDistributorType.THREAD, release_callback=self._on_lock_released)
         self._running_flag = False
         self._flow_queue_lock = RLock()
+        self._flow_queue_condition = Condition(self._flow_queue_lock)
         self._color = Colored()
         self._running_futures = set()
+        self._finished_futures = []
+        self._blocked_tasks = []
+        self._lock_waiting_tasks = []
+        self._claimed_lock_keys = {}
+        self._lock_released = False
+        self._delayed_tasks = []
+        self._delayed_task_counter = count()
+        self._max_workers = max_workers
 
     def _add_sync_flow_task(self, task: SyncFlowTask) -> None:
         """Add SyncFlowTask to the queue
+        Tasks which are not ready to be executed yet are added to the timer heap instead.
 
         Parameters
         ----------
@@ -138,12 +168,52 @@ class SyncFlowExecutor:
         """
         # Lock flow_queue as check dedup and add is not atomic
         with self._flow_queue_lock:
-            if task.dedup and task.sync_flow in [task.sync_flow for task in self._flow_queue.queue]:
+            if task.dedup and self._is_sync_flow_queued(task.sync_flow):
                 LOG.debug("Found the same SyncFlow in queue. Skip adding.")
                 return
 
             task.sync_flow.set_locks_with_distributor(self._lock_distributor)
-            self._flow_queue.put(task)
+            ready_time = self._get_task_ready_time(task)
+            if ready_time > time.time():
+                heapq.heappush(self._delayed_tasks, (ready_time, next(self._delayed_task_counter), task))
+            else:
+                self._flow_queue.put(task)
+            self._flow_queue_condition.notify_all()
+
+    def _is_sync_flow_queued(self, sync_flow: SyncFlow) -> bool:
+        """
+        Returns
+        -------
+        bool
+            Whether the SyncFlow is waiting to be executed, either in the queue, in the timer heap,
+            behind the same SyncFlow which is currently running or for its locks
+        """
+        return (
+            any(task.sync_flow == sync_flow for task in self._flow_queue.queue)
+            or any(task.sync_flow == sync_flow for _, _, task in self._delayed_tasks)
+            or any(task.sync_flow == sync_flow for task in self._blocked_tasks)
+            or any(task.sync_flow == sync_flow for task in self._lock_waiting_tasks)
+        )
+
+    def _get_task_ready_time(self, sync_flow_task: SyncFlowTask) -> float:  # pylint: disable=no-self-use
+        """
+        Hook for the subclasses which delay the tasks, all tasks can be executed immediately by default
+
+        Returns
+        -------
+        float
+            Time in seconds since epoch after which the task can be executed
+        """
+        return 0
+
+    def _clear_pending_tasks(self) -> None:
+        """Remove all tasks which are not running yet"""
+        with self._flow_queue_lock:
+            self._flow_queue.queue.clear()
+            self._delayed_tasks.clear()
+            self._blocked_tasks.clear()
+            self._lock_waiting_tasks.clear()
+            self._flow_queue_condition.notify_all()
 
     def add_sync_flow(self, sync_flow: SyncFlow, dedup: bool = True) -> None:
         """Add a SyncFlow to queue to be executed
@@ -174,7 +244,25 @@ class SyncFlowExecutor:
         bool
             Can executor be safely exited
         """
-        return not self._running_futures and self._flow_queue.empty()
+        return (
+            not self._running_futures
+            and not self._finished_futures
+            and not self._delayed_tasks
+            and not self._blocked_tasks
+            and not self._lock_waiting_tasks
+            and self._flow_queue.empty()
+        )
+
+    def _get_wait_timeout(self) -> Optional[float]:
+        """
+        Returns
+        -------
+        Optional[float]
+            Number of seconds until the next delayed task is ready, None if there is no delayed task
+        """
+        if not self._delayed_tasks:
+            return None
+        return max(self._delayed_tasks[0][0] - time.time(), 0)
 
     def execute(
         self, exception_handler: Optional[Callable[[SyncFlowException], None]] = default_exception_handler
@@ -188,19 +276,21 @@ class SyncFlowExecutor:
             by default default_exception_handler.__func__
         """
         self._running_flag = True
-        with ThreadPoolExecutor() as executor:
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
             self._running_futures.clear()
             while True:
 
                 self._execute_step(executor, exception_handler)
 
-                # Exit execution if there are no running and pending sync flows
-                if self._can_exit():
-                    LOG.debug("No more SyncFlows in executor. Stopping.")
-                    break
+                with self._flow_queue_lock:
+                    # Exit execution if there are no running and pending sync flows
+                    if self._can_exit():
+                        LOG.debug("No more SyncFlows in executor. Stopping.")
+                        break
 
-                # Sleep for a bit to cut down CPU utilization of this busy wait loop
-                time.sleep(0.1)
+                    # Wait until a sync flow is added or finished, a lock is released or a delayed sync flow is ready
+                    if self._flow_queue.empty() and not self._finished_futures and not self._lock_released:
+                        self._flow_queue_condition.wait(self._get_wait_timeout())
         self._running_flag = False
 
     def _execute_step(
@@ -217,34 +307,100 @@ class SyncFlowExecutor:
         exception_handler : Optional[Callable[[SyncFlowException], None]]
             Exception handler
         """
-        # Execute all pending sync flows
         with self._flow_queue_lock:
-            # Putting nonsubmitted tasks into this deferred tasks list
-            # to avoid modifying the queue while emptying it
-            deferred_tasks = list()
-
-            # Go through all queued tasks and try to execute them
+            # Move the delayed tasks which are ready into the queue
+            now = time.time()
+            while self._delayed_tasks and self._delayed_tasks[0][0] <= now:
+                _, _, delayed_task = heapq.heappop(self._delayed_tasks)
+                self._flow_queue.put(delayed_task)
+
+            # Retry the sync flows waiting for locks before the newly queued ones to keep their order
+            pending_tasks = self._lock_waiting_tasks
+            self._lock_waiting_tasks = []
+            self._lock_released = False
             while not self._flow_queue.empty():
-                sync_flow_task: SyncFlowTask = self._flow_queue.get()
+                pending_tasks.append(self._flow_queue.get())
+
+            # Execute all pending sync flows
+            for sync_flow_task in pending_tasks:
+                # Don't dispatch a sync flow which would block a worker on a lock held by another sync flow
+                if not self._are_locks_available(sync_flow_task.sync_flow):
+                    self._lock_waiting_tasks.append(sync_flow_task)
+                    continue
 
                 sync_flow_future = self._submit_sync_flow_task(executor, sync_flow_task)
 
-                # sync_flow_future can be None if the task cannot be submitted currently
-                # Put it into deferred_tasks and add all of them at the end to avoid endless loop
+                # sync_flow_future can be None if the same sync flow is already running
+                # Park it until the running one is finished
                 if sync_flow_future:
+                    self._claim_locks(sync_flow_future.sync_flow)
                     self._running_futures.add(sync_flow_future)
                     LOG.info(self._color.cyan(f"Syncing {sync_flow_future.sync_flow.log_name}..."))
+                    sync_flow_future.future.add_done_callback(
+                        lambda _, finished=sync_flow_future: self._on_sync_flow_finished(finished)
+                    )
                 else:
-                    deferred_tasks.append(sync_flow_task)
+                    self._blocked_tasks.append(sync_flow_task)
+
+            finished_futures = self._finished_futures
+            self._finished_futures = []
 
-            # Add tasks that cannot be executed yet
-            for task in deferred_tasks:
-                self._add_sync_flow_task(task)
+        # Handle finished sync flows outside of the lock, as exception handler might take a while or raise
+        for sync_flow_future in finished_futures:
+            self._handle_result(sync_flow_future, exception_handler)
+            with self._flow_queue_lock:
+                self._running_futures.discard(sync_flow_future)
+                self._release_lock_claims(sync_flow_future.sync_flow)
+                self._unblock_sync_flow_tasks(sync_flow_future.sync_flow)
 
-        # Check for finished sync flows
-        for sync_flow_future in set(self._running_futures):
-            if self._handle_result(sync_flow_future, exception_handler):
-                self._running_futures.remove(sync_flow_future)
+    def _on_sync_flow_finished(self, sync_flow_future: SyncFlowFuture) -> None:
+        """Future callback, wakes the execution loop up to handle the finished SyncFlow"""
+        with self._flow_queue_lock:
+            self._finished_futures.append(sync_flow_future)
+            self._flow_queue_condition.notify_all()
+
+    def _on_lock_released(self, lock_key: str) -> None:
+        """LockDistributor callback, wakes the execution loop up to dispatch the SyncFlows waiting for the lock"""
+        with self._flow_queue_lock:
+            self._claimed_lock_keys.pop(lock_key, None)
+            if self._lock_waiting_tasks:
+                self._lock_released = True
+                self._flow_queue_condition.notify_all()
+
+    def _are_locks_available(self, sync_flow: SyncFlow) -> bool:
+        """
+        Returns
+        -------
+        bool
+            Whether none of the locks of the SyncFlow is held or claimed by a running SyncFlow
+        """
+        lock_keys = sync_flow.get_lock_keys()
+        if any(key in self._claimed_lock_keys for key in lock_keys):
+            return False
+        return not any(lock.locked() for lock in self._lock_distributor.get_locks(lock_keys).values())
+
+    def _claim_locks(self, sync_flow: SyncFlow) -> None:
+        """Claim the locks of a dispatched SyncFlow until it releases them or finishes,
+        so that SyncFlows sharing a lock are not dispatched before it acquires the lock"""
+        for key in sync_flow.get_lock_keys():
+            self._claimed_lock_keys[key] = sync_flow
+
+    def _release_lock_claims(self, sync_flow: SyncFlow) -> None:
+        """Release the lock claims of a finished SyncFlow which never acquired some of its locks"""
+        claimed_keys = [key for key, claimer in self._claimed_lock_keys.items() if claimer == sync_flow]
+        for key in claimed_keys:
+            del self._claimed_lock_keys[key]
+        if claimed_keys and self._lock_waiting_tasks:
+            self._lock_released = True
+
+    def _unblock_sync_flow_tasks(self, sync_flow: SyncFlow) -> None:
+        """Queue the tasks which were waiting for the finished SyncFlow"""
+        unblocked_tasks = [task for task in self._blocked_tasks if task.sync_flow == sync_flow]
+        if not unblocked_tasks:
+            return
+        self._blocked_tasks = [task for task in self._blocked_tasks if task.sync_flow != sync_flow]
+        for task in unblocked_tasks:
+            self._flow_queue.put(task)
 
     def _submit_sync_flow_task(
         self, executor: ThreadPoolExecutor, sync_flow_task: SyncFlowTask
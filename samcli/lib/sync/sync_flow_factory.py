@@ -13,6 +13,7 @@ from samcli.lib.utils.resource_type_based_factory import ResourceTypeBasedFactor
 from samcli.lib.sync.sync_flow import SyncFlow
 from samcli.lib.sync.flows.function_sync_flow import FunctionSyncFlow
 from samcli.lib.sync.flows.zip_function_sync_flow import ZipFunctionSyncFlow
+from samcli.lib.sync.build_coalescer import BuildCoalescer
 from samcli.lib.sync.flows.image_function_sync_flow import ImageFunctionSyncFlow
 from samcli.lib.sync.flows.rest_api_sync_flow import RestApiSyncFlow
 from samcli.lib.sync.flows.http_api_sync_flow import HttpApiSyncFlow
@@ -48,6 +49,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
     _build_context: "BuildContext"
     _physical_id_mapping: Dict[str, str]
     _auto_dependency_layer: bool
+    _build_coalescer: BuildCoalescer
 
     def __init__(
         self,
@@ -71,6 +73,8 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
         self._build_context = build_context
         self._auto_dependency_layer = auto_dependency_layer
         self._physical_id_mapping = dict()
+        # Shared by the ZIP function flows, so that functions with the same build definition are built once
+        self._build_coalescer = BuildCoalescer()
 
     def load_physical_id_mapping(self) -> None:
         """Load physical IDs of the stack resources from remote"""
@@ -116,6 +120,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
                     self._deploy_context,
                     self._physical_id_mapping,
                     self._stacks,
+                    build_coalescer=self._build_coalescer,
                 )
 
             return ZipFunctionSyncFlow(
@@ -124,6 +129,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
                 self._deploy_context,
                 self._physical_id_mapping,
                 self._stacks,
+                build_coalescer=self._build_coalescer,
             )
         if package_type == IMAGE:
             return ImageFunctionSyncFlow(
@@ -52,6 +52,7 @@ class WatchManager:
         package_context: "PackageContext",
         deploy_context: "DeployContext",
         auto_dependency_layer: bool,
+        max_workers: Optional[int] = None,
     ):
         """Manager for sync watch execution logic.
         This manager will observe template and its code resources.
@@ -67,6 +68,10 @@ class WatchManager:
             PackageContext
         deploy_context : DeployContext
             DeployContext
+        auto_dependency_layer : bool
+            Whether the auto dependency layer feature is enabled
+        max_workers : Optional[int]
+            Maximum number of sync flows which are executed at the same time
         """
         self._stacks = None
         self._template = template
@@ -76,7 +81,7 @@ class WatchManager:
         self._auto_dependency_layer = auto_dependency_layer
 
         self._sync_flow_factory = None
-        self._sync_flow_executor = ContinuousSyncFlowExecutor()
+        self._sync_flow_executor = ContinuousSyncFlowExecutor(max_workers=max_workers)
         self._executor_thread = None
 
         self._observer = HandlerObserver()
@@ -2,18 +2,42 @@
 Class to publish metrics
 """
 
+import json
 import logging
-import requests
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
 
 # Get the preconfigured endpoint URL
 from samcli.cli.global_config import GlobalConfig
+from samcli.lib.utils.lazy_module import LazyModule
 from samcli.settings import telemetry_endpoint_url as DEFAULT_ENDPOINT_URL
 
+# requests is only needed when the spooled metrics are flushed
+requests = LazyModule("requests")
+
 LOG = logging.getLogger(__name__)
 
+# Name of the file in the SAM CLI config directory where the metrics are kept until they are sent
+SPOOL_FILE_NAME = "telemetry-spool.jsonl"
+
+# Maximum number of metrics which are sent to the backend in a single request
+MAX_BATCH_SIZE = 100
+
+# Maximum number of metrics which are kept in the spool, the oldest ones are dropped if the backend is not reachable
+MAX_SPOOLED_METRICS = 1000
+
+# Number of seconds after which the metrics claimed by a flush are considered abandoned, and sent by another flush
+ABANDONED_FLUSH_TIMEOUT = 60
+
 
 class Telemetry:
-    def __init__(self, url=None):
+    def __init__(self, url=None, spool_path: Optional[Path] = None):
         """
         Initialize the Telemetry object.
 
@@ -21,15 +45,18 @@ class Telemetry:
         ----------
         url : str
             Optional, URL where the metrics should be published to
+        spool_path : Optional[Path]
+            Optional, file where the metrics are kept until they are sent, defaults to a file in SAM CLI config dir
         """
         self._url = url or DEFAULT_ENDPOINT_URL
+        self._spool_path = spool_path or Path(GlobalConfig().config_dir, SPOOL_FILE_NAME)
         LOG.debug("Telemetry endpoint configured to be %s", self._url)
 
     def emit(self, metric, force_emit=False):
         """
-        Emits the metric with given name and the attributes and send it immediately to the HTTP backend. This method
-        will return immediately without waiting for response from the backend. Before sending, this method will
-        also update ``attrs`` with some common attributes used by all metrics.
+        Emits the metric with given name and the attributes. The metric is not sent to the HTTP backend immediately,
+        it is appended to the local spool file and sent in a batch with the other metrics by ``flush``, so that this
+        method never waits for the network.
 
         Parameters
         ----------
@@ -37,32 +64,131 @@ class Telemetry:
             Metric to be published
 
         force_emit : bool
-            Defaults to False. Set to True to emit even when telemetry is turned off.
+            Defaults to False. Set to True to emit even when telemetry is turned off. Since the spool is dropped
+            while telemetry is turned off, such a metric is sent immediately instead.
+        """
+        if bool(GlobalConfig().telemetry_enabled):
+            self._spool({metric.get_metric_name(): metric.get_data()})
+        elif force_emit:
+            self._send([{metric.get_metric_name(): metric.get_data()}])
+
+    def flush(self) -> None:
+        """
+        Sends all the spooled metrics to the backend in batches. The metrics which can't be sent are put back into
+        the spool to be sent by a later flush. If telemetry is turned off, the spooled metrics are dropped instead.
+        """
+        if not self._url:
+            # Endpoint not configured. So simply return
+            LOG.debug("Not sending telemetry. Endpoint URL not configured")
+            return
+
+        claimed_paths = self._claim_spooled_metrics()
+        if bool(GlobalConfig().telemetry_enabled):
+            metrics = []
+            for claimed_path in claimed_paths:
+                metrics.extend(self._read_metrics(claimed_path))
+
+            for index in range(0, len(metrics), MAX_BATCH_SIZE):
+                if not self._send(metrics[index : index + MAX_BATCH_SIZE], wait_for_response=True):
+                    self._spool(*metrics[index:][-MAX_SPOOLED_METRICS:])
+                    break
+        else:
+            LOG.debug("Not sending telemetry. Telemetry is turned off, dropping the spooled metrics")
+
+        for claimed_path in claimed_paths:
+            try:
+                claimed_path.unlink()
+            except OSError as ex:
+                LOG.debug("Unable to remove the sent telemetry metrics %s", claimed_path, exc_info=ex)
+
+    def has_spooled_metrics(self) -> bool:
+        """
+        Returns True if there are metrics waiting to be sent
+        """
+        return self._spool_path.exists()
+
+    def _spool(self, *metrics: Dict) -> None:
+        """
+        Appends the metrics to the spool file, each metric is written as a single JSON line
+        """
+        try:
+            self._spool_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            lines = "".join(json.dumps(metric) + "\n" for metric in metrics)
+            with open(self._spool_path, "a", encoding="utf-8") as spool_file:
+                spool_file.write(lines)
+            LOG.debug("Spooled Telemetry: %s", metrics)
+        except (OSError, TypeError, ValueError) as ex:
+            # Telemetry should never fail the command
+            LOG.debug("Unable to spool telemetry metrics", exc_info=ex)
+
+    def _claim_spooled_metrics(self) -> List[Path]:
+        """
+        Atomically moves the spool file, and the ones which are abandoned by the earlier flushes, to new files owned
+        by this flush, so that the metrics are not sent twice by concurrent flushes.
         """
-        if bool(GlobalConfig().telemetry_enabled) or force_emit:
-            self._send({metric.get_metric_name(): metric.get_data()})
+        claimed_paths = []
+        claim_prefix = f"{self._spool_path.name}."
+        candidates = [self._spool_path]
+        try:
+            candidates += [
+                path
+                for path in self._spool_path.parent.glob(f"{claim_prefix}*")
+                if time.time() - path.stat().st_mtime > ABANDONED_FLUSH_TIMEOUT
+            ]
+        except OSError as ex:
+            LOG.debug("Unable to list the abandoned telemetry metrics", exc_info=ex)
+
+        for candidate in candidates:
+            claimed_path = candidate.with_name(f"{claim_prefix}{uuid.uuid4().hex}")
+            try:
+                os.replace(candidate, claimed_path)
+                claimed_path.touch()
+            except OSError:
+                # already claimed by another flush, or there is nothing spooled
+                continue
+            claimed_paths.append(claimed_path)
+        return claimed_paths
 
-    def _send(self, metric, wait_for_response=False):
+    @staticmethod
+    def _read_metrics(path: Path) -> List[Dict]:
+        metrics = []
+        try:
+            with open(path, "r", encoding="utf-8") as spool_file:
+                for line in spool_file:
+                    try:
+                        metrics.append(json.loads(line))
+                    except ValueError:
+                        LOG.debug("Skipping malformed telemetry metric %s", line)
+        except OSError as ex:
+            LOG.debug("Unable to read the spooled telemetry metrics %s", path, exc_info=ex)
+        return metrics
+
+    def _send(self, metrics, wait_for_response=False) -> bool:
         """
-        Serializes the metric data to JSON and sends to the backend.
+        Serializes the metrics data to JSON and sends to the backend.
 
         Parameters
         ----------
 
-        metric : dict
-            Dictionary of metric data to send to backend.
+        metrics : List[dict]
+            List of metric data to send to backend.
 
         wait_for_response : bool
             If set to True, this method will wait until the HTTP server returns a response. If not, it will return
             immediately after the request is sent.
+
+        Returns
+        -------
+        bool
+            False if the backend can't be reached, True otherwise
         """
 
         if not self._url:
             # Endpoint not configured. So simply return
             LOG.debug("Not sending telemetry. Endpoint URL not configured")
-            return
+            return True
 
-        payload = {"metrics": [metric]}
+        payload = {"metrics": metrics}
         LOG.debug("Sending Telemetry: %s", payload)
 
         timeout_ms = 2000 if wait_for_response else 100  # 2 seconds to wait for response or 100ms
@@ -74,7 +200,59 @@ class Telemetry:
         try:
             r = requests.post(self._url, json=payload, timeout=timeout)
             LOG.debug("Telemetry response: %d", r.status_code)
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as ex:
-            # Expected if request times out OR cannot connect to the backend (offline).
-            # Just print debug log and ignore the exception.
+        except requests.exceptions.ConnectionError as ex:
+            # Expected if the backend can't be reached (offline). Keep the metrics to be sent later.
             LOG.debug(str(ex))
+            return False
+        except requests.exceptions.Timeout as ex:
+            # Expected if request times out after it is sent. Just print debug log and ignore the exception.
+            LOG.debug(str(ex))
+        return True
+
+
+def flush_in_background(on_exit: bool) -> None:
+    """
+    Sends the spooled metrics without making the command wait for the network.
+
+    When SAM CLI runs on a Python interpreter, a detached process is started on exit which flushes the spool after
+    the command is done. A bundled SAM CLI can't start such a process, so the metrics spooled by the earlier commands
+    are flushed by a daemon thread while the command is running instead.
+
+    Parameters
+    ----------
+    on_exit : bool
+        True if it is called when SAM CLI exits, False if it is called when SAM CLI starts
+    """
+    is_frozen = bool(getattr(sys, "frozen", False))
+    if is_frozen == on_exit:
+        return
+
+    try:
+        telemetry = Telemetry()
+        if not telemetry.has_spooled_metrics():
+            return
+
+        if is_frozen:
+            threading.Thread(target=telemetry.flush, daemon=True).start()
+            return
+
+        kwargs: Dict = {}
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+        # pylint: disable=consider-using-with
+        subprocess.Popen(
+            [sys.executable, "-m", __name__],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+    except (OSError, ValueError) as ex:
+        LOG.debug("Unable to flush telemetry metrics in the background", exc_info=ex)
+
+
+if __name__ == "__main__":
+    Telemetry().flush()
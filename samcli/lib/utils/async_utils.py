@@ -95,8 +95,16 @@ class AsyncContext:
     A helper class to hold list of tasks, and manages their execution
     """
 
-    def __init__(self):
+    def __init__(self, max_workers=None):
+        """
+        Parameters
+        ----------
+        max_workers: int
+            Maximum number of workers that will be used when running with a new created executor.
+            If not given, ThreadPoolExecutor's default will be used
+        """
         self._async_tasks = []
+        self._max_workers = max_workers
         self.executor = None
 
     def add_async_task(self, function, *args):
@@ -126,6 +134,6 @@ class AsyncContext:
         """
         event_loop = asyncio.new_event_loop()
         if not default_executor:
-            with ThreadPoolExecutor() as self.executor:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as self.executor:
                 return run_given_tasks_async(self._async_tasks, event_loop, self.executor)
         return run_given_tasks_async(self._async_tasks, event_loop)
@@ -1,14 +1,16 @@
 """
 Wraps watchdog to observe file system for any change.
 """
+import hashlib
 import logging
+import os
 import threading
 import uuid
 from abc import ABC, abstractmethod
 
 from pathlib import Path
 from threading import Thread, Lock
-from typing import Callable, List, Dict, Optional
+from typing import Callable, Iterable, List, Dict, Optional
 
 import docker
 from docker import DockerClient
@@ -19,12 +21,19 @@ from watchdog.events import PatternMatchingEventHandler, FileSystemEvent, FileSy
 from watchdog.observers.api import ObservedWatch, BaseObserver
 
 from samcli.cli.global_config import Singleton
-from samcli.lib.utils.hash import dir_checksum, file_checksum
+from samcli.lib.utils.hash import dir_checksum, file_checksum, FileHashIndex
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.local.lambdafn.config import FunctionConfig
 
 LOG = logging.getLogger(__name__)
 
+# in-memory index of file checksums shared by all observers, so only changed files are re-read on each event
+_FILE_HASH_INDEX = FileHashIndex()
+
+# Number of seconds to wait after the first file system event before processing it, all the events received in this
+# window are coalesced into a single change notification
+DEFAULT_DEBOUNCE_INTERVAL = 0.1
+
 
 class ResourceObserver(ABC):
     @abstractmethod
@@ -388,52 +397,111 @@ class SingletonFileObserver(metaclass=Singleton):
         self._watch_lock = threading.Lock()
         self._lock: Lock = threading.Lock()
 
+        # per file checksums of the observed paths, shared by all the groups observing the same path
+        self._path_checksums: Dict[str, PathChecksum] = {}
+        self._debounce_interval = DEFAULT_DEBOUNCE_INTERVAL
+        self._pending_events: List[FileSystemEvent] = []
+        self._debounce_timer: Optional[threading.Timer] = None
+        self._events_lock: Lock = threading.Lock()
+
     def on_change(self, event: FileSystemEvent) -> None:
         """
         It got executed once there is a change in one of the paths that watchdog is observing.
-        This method will check if any of the input paths is really changed, and based on that it will
-        invoke the input on_change function with the changed paths
+        The event is not processed immediately, it is queued with the other events which are received within the
+        debounce interval, and all of them are processed together as a single batch.
 
         Parameters
         ----------
         event: watchdog.events.FileSystemEvent
             Determines that there is a change happened to some file/dir in the observed paths
         """
-        with self._watch_lock:
-            LOG.debug("a %s change got detected in path %s", event.event_type, event.src_path)
-            for group, _observed_paths in self._observed_paths_per_group.items():
-                if event.event_type == "deleted":
-                    observed_paths = [
-                        path
-                        for path in _observed_paths
-                        if path == event.src_path
-                        or path in self._watch_dog_observed_paths.get(f"{event.src_path}_False", [])
-                    ]
-                else:
-                    observed_paths = [path for path in _observed_paths if event.src_path.startswith(path)]
+        LOG.debug("a %s change got detected in path %s", event.event_type, event.src_path)
+        with self._events_lock:
+            self._pending_events.append(event)
+            if not self._debounce_timer:
+                self._debounce_timer = threading.Timer(self._debounce_interval, self._process_pending_events)
+                self._debounce_timer.daemon = True
+                self._debounce_timer.start()
+
+    def _process_pending_events(self) -> None:
+        """
+        Processes all the events which are queued since the debounce timer got started
+        """
+        with self._events_lock:
+            events = self._pending_events
+            self._pending_events = []
+            self._debounce_timer = None
+        if events:
+            self._process_events(events)
+
+    def _process_events(self, events: List[FileSystemEvent]) -> None:
+        """
+        Checks if any of the observed paths is really changed by the input batch of events, and based on that it will
+        invoke the on_change function of each group once with all of its changed paths.
+        Only the files and directories reported by the events are re-hashed, the checksums of the other files of the
+        observed paths are reused.
 
-                if not observed_paths:
+        Parameters
+        ----------
+        events: List[watchdog.events.FileSystemEvent]
+            The batch of changes happened to some files/dirs in the observed paths
+        """
+        with self._watch_lock:
+            all_observed_paths = {path for paths in self._observed_paths_per_group.values() for path in paths}
+            affected_paths: Dict[str, List[str]] = {}
+            for event in events:
+                event_paths = [event.src_path]
+                if event.event_type == "moved":
+                    # a renamed file or directory changes both its old and its new location
+                    event_paths.append(event.dest_path)
+                for path in all_observed_paths:
+                    for event_path in event_paths:
+                        if self._is_affected_path(path, event.event_type, event_path):
+                            affected_paths.setdefault(path, []).append(event_path)
+
+            if not affected_paths:
+                return
+
+            LOG.debug("affected paths of this change %s", list(affected_paths))
+            # calculate the new checksum of each affected path only once, even if it is observed by many groups
+            new_checksums: Dict[str, Optional[str]] = {}
+            for path, changed_sub_paths in affected_paths.items():
+                # The path got deleted
+                if not Path(path).exists():
+                    self._path_checksums.pop(path, None)
                     continue
+                path_checksum = self._path_checksums.get(path)
+                if path_checksum:
+                    path_checksum.update(changed_sub_paths)
+                    new_checksums[path] = path_checksum.checksum
+                else:
+                    new_checksums[path] = calculate_checksum(path)
 
-                LOG.debug("affected paths of this change %s", observed_paths)
+            for group, _observed_paths in self._observed_paths_per_group.items():
                 changed_paths = []
-                for path in observed_paths:
-                    path_obj = Path(path)
-                    # The path got deleted
-                    if not path_obj.exists():
+                for path in [path for path in _observed_paths if path in affected_paths]:
+                    if path not in new_checksums:
                         _observed_paths.pop(path, None)
                         changed_paths += [path]
+                        continue
+                    new_checksum = new_checksums[path]
+                    if new_checksum and new_checksum != _observed_paths.get(path, None):
+                        changed_paths += [path]
+                        _observed_paths[path] = new_checksum
                     else:
-                        new_checksum = calculate_checksum(path)
-                        if new_checksum and new_checksum != _observed_paths.get(path, None):
-                            changed_paths += [path]
-                            _observed_paths[path] = new_checksum
-                        else:
-                            LOG.debug("the path %s content does not change", path)
+                        LOG.debug("the path %s content does not change", path)
 
                 if changed_paths:
                     self._observed_groups_handlers[group](changed_paths)
 
+    def _is_affected_path(self, path: str, event_type: str, event_path: str) -> bool:
+        """
+        Checks if the input observed path is affected by an event of the input type on the input event path
+        """
+        if event_type == "deleted":
+            return path == event_path or path in self._watch_dog_observed_paths.get(f"{event_path}_False", [])
+        return bool(event_path == path or event_path.startswith(os.path.join(path, "")))
+
     def add_group(self, group: str, on_change: Callable) -> None:
         """
         Add new group to file observer. This enable FileObserver to watch the same path for
@@ -478,9 +546,11 @@ class SingletonFileObserver(metaclass=Singleton):
                 raise FileObserverException("Can not observe non exist path")
 
             _observed_paths = self._observed_paths_per_group[group]
-            _check_sum = calculate_checksum(resource)
+            path_checksum = PathChecksum(resource)
+            _check_sum = path_checksum.checksum
             if not _check_sum:
                 raise Exception(f"Failed to calculate the hash of resource {resource}")
+            self._path_checksums[resource] = path_checksum
             _observed_paths[resource] = _check_sum
 
             LOG.debug("watch resource %s", resource)
@@ -549,6 +619,9 @@ class SingletonFileObserver(metaclass=Singleton):
         # unwatch parent path
         self._unwatch_path(str(path_obj.parent), resource, group, False)
 
+        if not any(resource in _observed_paths for _observed_paths in self._observed_paths_per_group.values()):
+            self._path_checksums.pop(resource, None)
+
     def _unwatch_path(self, watch_dog_path: str, original_path: str, group: str, recursive: bool) -> None:
         """
         update the observed paths data structure, and call watch dog observer to unobserve the input watch dog path
@@ -598,6 +671,11 @@ class SingletonFileObserver(metaclass=Singleton):
         with self._lock:
             if self._observer.is_alive():
                 self._observer.stop()
+        with self._events_lock:
+            if self._debounce_timer:
+                self._debounce_timer.cancel()
+                self._debounce_timer = None
+            self._pending_events = []
 
 
 def calculate_checksum(path: str) -> Optional[str]:
@@ -606,7 +684,122 @@ def calculate_checksum(path: str) -> Optional[str]:
         if path_obj.is_file():
             checksum = file_checksum(path)
         else:
-            checksum = dir_checksum(path)
+            checksum = dir_checksum(path, hash_index=_FILE_HASH_INDEX)
         return checksum
     except Exception:
         return None
+
+
+class PathChecksum:
+    """
+    Keeps the checksums of all the files of an observed file or directory path, so that the checksum of the path
+    can be updated by re-hashing only the files which got changed, instead of re-hashing the whole directory tree.
+    The checksum of a directory is the same as the one calculated by dir_checksum.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            The file/dir path to be hashed
+        """
+        self._path = path
+        self._is_file = False
+        self._file_checksums: Dict[str, str] = {}
+        self.checksum: Optional[str] = None
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Re-calculates the checksums of all the files of the path
+        """
+        self._file_checksums = {}
+        if not os.path.exists(self._path):
+            self.checksum = None
+            return
+        try:
+            self._is_file = os.path.isfile(self._path)
+            if self._is_file:
+                self._file_checksums[self._path] = _FILE_HASH_INDEX.file_checksum(self._path)
+            else:
+                self._add_tree(self._path)
+            self.checksum = self._calculate_checksum()
+        except Exception as ex:
+            LOG.debug("Failed to calculate the checksum of %s", self._path, exc_info=ex)
+            self.checksum = None
+
+    def update(self, changed_paths: Iterable[str]) -> None:
+        """
+        Updates the checksum of the path by re-hashing only the input changed files and directories
+
+        Parameters
+        ----------
+        changed_paths: Iterable[str]
+            The changed files and directories under the observed path
+        """
+        if self._is_file or self.checksum is None:
+            self.refresh()
+            return
+        try:
+            # parent directories are processed before their children
+            for changed_path in sorted(set(changed_paths)):
+                self._update_path(changed_path)
+            self.checksum = self._calculate_checksum()
+        except Exception as ex:
+            LOG.debug("Failed to update the checksum of %s, re-calculating it", self._path, exc_info=ex)
+            self.refresh()
+
+    def _update_path(self, changed_path: str) -> None:
+        if os.path.isfile(changed_path):
+            self._file_checksums[changed_path] = _FILE_HASH_INDEX.file_checksum(changed_path)
+        elif os.path.isdir(changed_path):
+            self._sync_directory(changed_path)
+        else:
+            self._remove_tree(changed_path)
+
+    def _sync_directory(self, directory: str) -> None:
+        """
+        Syncs the direct children of the input directory, a directory event is received if a child is created,
+        deleted or renamed. Files are re-hashed only if their stat information changed since they were hashed.
+        """
+        children = set()
+        for entry in os.scandir(directory):
+            children.add(entry.path)
+            if entry.is_dir():
+                if not self._has_tree(entry.path):
+                    self._add_tree(entry.path)
+            elif entry.is_file():
+                self._file_checksums[entry.path] = _FILE_HASH_INDEX.file_checksum(entry.path)
+
+        prefix = os.path.join(directory, "")
+        for file_path in [file_path for file_path in self._file_checksums if file_path.startswith(prefix)]:
+            child = os.path.join(directory, file_path[len(prefix) :].split(os.sep, 1)[0])
+            if child not in children:
+                del self._file_checksums[file_path]
+
+    def _add_tree(self, directory: str) -> None:
+        for dirpath, _, filenames in os.walk(directory, followlinks=True):
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                self._file_checksums[file_path] = _FILE_HASH_INDEX.file_checksum(file_path)
+
+    def _has_tree(self, directory: str) -> bool:
+        prefix = os.path.join(directory, "")
+        return any(file_path.startswith(prefix) for file_path in self._file_checksums)
+
+    def _remove_tree(self, path: str) -> None:
+        prefix = os.path.join(path, "")
+        for file_path in [
+            file_path for file_path in self._file_checksums if file_path == path or file_path.startswith(prefix)
+        ]:
+            del self._file_checksums[file_path]
+
+    def _calculate_checksum(self) -> Optional[str]:
+        if self._is_file:
+            return self._file_checksums.get(self._path)
+        hash_generator = hashlib.md5()
+        for file_path in sorted(self._file_checksums):
+            hash_generator.update(os.path.relpath(file_path, self._path).encode("utf-8"))
+            hash_generator.update(self._file_checksums[file_path].encode("utf-8"))
+        return hash_generator.hexdigest()
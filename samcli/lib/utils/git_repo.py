@@ -1,5 +1,7 @@
 """ Manage Git repo """
 
+import hashlib
+import json
 import logging
 import os
 import platform
@@ -12,11 +14,17 @@ from pathlib import Path
 from subprocess import check_output
 from typing import Optional
 
-from samcli.lib.utils import osutils
+from samcli.lib.utils.hash import file_checksum
 from samcli.lib.utils.osutils import rmtree_callback
 
 LOG = logging.getLogger(__name__)
 
+# Directory inside the clone directory where the shallow Git repositories of the clones are kept
+GIT_CACHE_DIR_NAME = ".git-cache"
+
+# File inside the local clone which records the commit of the clone and the checksums of the files in its root
+CLONE_INDEX_FILE_NAME = ".sam-cli-clone-index.json"
+
 
 class CloneRepoException(Exception):
     """
@@ -95,6 +103,9 @@ class GitRepo:
            name of the local folder) instead of accepting the full path (the join of both) in one parameter
         2. It removes the "*.git" files/directories so the clone is not a GitRepo any more
         3. It has the option to replace the local folder(destination) if already exists
+        4. It keeps a shallow Git repository in a cache directory inside clone_dir, so that only the objects of the
+           required commit which are not already cached are fetched, instead of cloning the whole repository again
+        5. If the local clone is already at the given commit, it is used as it is without any network call
 
         Parameters
         ----------
@@ -115,7 +126,7 @@ class GitRepo:
         OSError:
             when file management errors like unable to mkdir, copytree, rmtree ...etc
         CloneRepoException:
-            General errors like for example; if an error occurred while running `git clone`
+            General errors like for example; if an error occurred while running `git fetch`
             or if the local_clone already exists and replace_existing is not set
         CloneRepoUnstableStateException:
             when reaching unstable state, for example with replace_existing flag set, unstable state can happen
@@ -123,35 +134,123 @@ class GitRepo:
         """
 
         GitRepo._ensure_clone_directory_exists(clone_dir=clone_dir)
-        # clone to temp then move to the destination(repo_local_path)
-        with osutils.mkdir_temp(ignore_errors=True) as tempdir:
-            try:
-                temp_path = os.path.normpath(os.path.join(tempdir, clone_name))
-                git_executable: str = GitRepo._git_executable()
-                LOG.info("\nCloning from %s (process may take a moment)", self.url)
-                check_output(
-                    [git_executable, "clone", self.url, clone_name],
-                    cwd=tempdir,
-                    stderr=subprocess.STDOUT,
-                )
-
-                # bind a certain sam cli release to a specific commit of the aws-sam-cli-app-templates's repo, avoiding
-                # regression
-                if commit:
-                    self._checkout_commit(temp_path, commit)
-
-                self.local_path = self._persist_local_repo(temp_path, clone_dir, clone_name, replace_existing)
+        try:
+            if self.is_clone_up_to_date(clone_dir, clone_name, commit):
+                LOG.debug("Local clone of %s is already at commit %s", self.url, commit)
+                self.local_path = Path(clone_dir, clone_name)
                 return self.local_path
-            except OSError as ex:
-                LOG.warning("WARN: Could not clone repo %s", self.url, exc_info=ex)
+
+            cache_path = Path(clone_dir, GIT_CACHE_DIR_NAME, clone_name)
+            LOG.info("\nCloning from %s (process may take a moment)", self.url)
+            head = self._fetch_to_cache(cache_path, commit)
+
+            self.local_path = self._persist_local_repo(str(cache_path), clone_dir, clone_name, replace_existing)
+            self._write_clone_index(self.local_path, head)
+            return self.local_path
+        except OSError as ex:
+            LOG.warning("WARN: Could not clone repo %s", self.url, exc_info=ex)
+            raise
+        except subprocess.CalledProcessError as clone_error:
+            output = clone_error.output.decode("utf-8")
+            if "not found" in output.lower():
+                LOG.warning("WARN: Could not clone repo %s", self.url, exc_info=clone_error)
+            raise CloneRepoException(output) from clone_error
+        finally:
+            self.clone_attempted = True
+
+    def is_clone_up_to_date(self, clone_dir: Path, clone_name: str, commit: str) -> bool:
+        """
+        Checks whether the local clone is a clone of this Git repository at the given commit, and the files in its
+        root directory (e.g. manifest files) are not changed since it is cloned. It doesn't need any network call.
+
+        Parameters
+        ----------
+        clone_dir: Path
+            The directory where the local clone is created inside
+        clone_name: str
+            The dirname of the local clone
+        commit: str
+            The commit which the local clone is expected to be at
+
+        Returns
+        -------
+        bool
+            True if the local clone can be used as it is
+        """
+        if not commit:
+            return False
+
+        clone_path = Path(clone_dir, clone_name)
+        try:
+            with open(clone_path.joinpath(CLONE_INDEX_FILE_NAME), "r", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+            if index.get("url") != self.url or not str(index.get("commit", "")).startswith(commit):
+                return False
+            return all(
+                clone_path.joinpath(file_name).is_file()
+                and file_checksum(str(clone_path.joinpath(file_name)), hashlib.sha256()) == checksum
+                for file_name, checksum in index.get("files", {}).items()
+            )
+        except (OSError, ValueError, AttributeError) as ex:
+            LOG.debug("Unable to use the index of the local clone %s", clone_path, exc_info=ex)
+            return False
+
+    def _fetch_to_cache(self, cache_path: Path, commit: str) -> str:
+        """
+        Fetches the given commit (or the latest one of the default branch) into the shallow Git repository in the
+        cache directory and checks it out. Returns the commit which is checked out.
+        """
+        git_executable: str = GitRepo._git_executable()
+        if not cache_path.joinpath(".git").is_dir():
+            if cache_path.exists():
+                shutil.rmtree(cache_path, onerror=rmtree_callback)
+            cache_path.mkdir(mode=0o700, parents=True)
+            check_output([git_executable, "init", "-q"], cwd=cache_path, stderr=subprocess.STDOUT)
+
+        fetch_command = [git_executable, "fetch", "-q", "--depth", "1", "--no-tags", self.url]
+        try:
+            # bind a certain sam cli release to a specific commit of the aws-sam-cli-app-templates's repo, avoiding
+            # regression
+            check_output(fetch_command + [commit or "HEAD"], cwd=cache_path, stderr=subprocess.STDOUT)
+        except subprocess.CalledProcessError:
+            if not commit:
                 raise
-            except subprocess.CalledProcessError as clone_error:
-                output = clone_error.output.decode("utf-8")
-                if "not found" in output.lower():
-                    LOG.warning("WARN: Could not clone repo %s", self.url, exc_info=clone_error)
-                raise CloneRepoException(output) from clone_error
-            finally:
-                self.clone_attempted = True
+            # if fetching the commit failed but the repo is reachable, it will use the latest commit instead
+            check_output(fetch_command + ["HEAD"], cwd=cache_path, stderr=subprocess.STDOUT)
+            LOG.warning("WARN: Commit not exist: %s, using the latest one", commit)
+
+        check_output(
+            [git_executable, "checkout", "-q", "--force", "--detach", "FETCH_HEAD"],
+            cwd=cache_path,
+            stderr=subprocess.STDOUT,
+        )
+        check_output([git_executable, "clean", "-q", "-d", "-x", "--force"], cwd=cache_path, stderr=subprocess.STDOUT)
+        return (
+            check_output([git_executable, "rev-parse", "HEAD"], cwd=cache_path, stderr=subprocess.STDOUT)
+            .decode("utf-8")
+            .strip()
+        )
+
+    def _write_clone_index(self, clone_path: Path, commit: str) -> None:
+        """
+        Writes the commit of the local clone and the checksums of the files in its root directory into the clone,
+        which are used by is_clone_up_to_date to detect that the clone doesn't need to be updated
+        """
+        try:
+            index = {
+                "url": self.url,
+                "commit": commit,
+                "files": {
+                    path.name: file_checksum(str(path), hashlib.sha256())
+                    for path in clone_path.iterdir()
+                    if path.is_file() and path.name != CLONE_INDEX_FILE_NAME
+                },
+            }
+            with open(clone_path.joinpath(CLONE_INDEX_FILE_NAME), "w", encoding="utf-8") as index_file:
+                json.dump(index, index_file)
+        except OSError as ex:
+            # the clone is still usable, it will be updated again by the next clone
+            LOG.debug("Unable to write the index of the local clone %s", clone_path, exc_info=ex)
 
     @staticmethod
     def _persist_local_repo(temp_path: str, dest_dir: Path, dest_name: str, replace_existing: bool) -> Path:
@@ -175,18 +274,3 @@ class GitRepo:
                 f"Check that you have permissions to create/delete files in {dest_dir} directory "
                 "or file an issue at https://github.com/aws/aws-sam-cli/issues"
             ) from ex
-
-    @staticmethod
-    def _checkout_commit(repo_dir: str, commit: str):
-        try:
-            # if the checkout commit failed, it will use the latest commit instead
-            git_executable = GitRepo._git_executable()
-            check_output(
-                [git_executable, "checkout", commit],
-                cwd=repo_dir,
-                stderr=subprocess.STDOUT,
-            )
-        except subprocess.CalledProcessError as checkout_error:
-            output = checkout_error.output.decode("utf-8")
-            if "fatal" in output.lower() or "error" in output.lower():
-                LOG.warning("WARN: Commit not exist: %s, using the latest one", commit, exc_info=checkout_error)
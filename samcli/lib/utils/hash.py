@@ -3,10 +3,25 @@ Hash calculation utilities for files and directories.
 """
 import os
 import hashlib
-from typing import Any, cast, List, Optional
+import json
+import logging
+import threading
+import time
+from typing import Any, cast, Dict, List, Optional, Tuple
+
+from samcli.lib.utils.profiling import CATEGORY_HASH, profiled
+
+LOG = logging.getLogger(__name__)
 
 BLOCK_SIZE = 4096
 
+# Name of the file (under the build cache directory) which keeps the persisted file hash index
+FILE_HASH_INDEX_FILE_NAME = "file-hashes.json"
+
+# Files modified within this window (in nanoseconds) of the time they are hashed are not indexed, since a following
+# write in the same mtime tick that keeps the size unchanged would not be detected ("racy" entries)
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+
 
 def file_checksum(file_name: str, hash_generator: Any = None) -> str:
     """
@@ -42,8 +57,109 @@ def file_checksum(file_name: str, hash_generator: Any = None) -> str:
         return cast(str, hash_generator.hexdigest())
 
 
+class FileHashIndex:
+    """
+    Content-addressed index of md5 checksums of files, keyed by the absolute path of the file and its stat
+    information (inode, size and modification time in nanoseconds).
+
+    A file whose stat information matches the indexed entry is not read again, its previously calculated checksum is
+    returned instead. If an index file is given, the index is loaded from it on first use and can be written back
+    with ``save``, so that subsequent runs of SAM CLI also benefit from it.
+    """
+
+    def __init__(self, index_file: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+        index_file : Optional[str]
+            Path of the JSON file which is used to persist the index. If not given, index is only kept in memory.
+        """
+        self._index_file = index_file
+        self._entries: Dict[str, Tuple[int, int, int, str]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def file_checksum(self, file_name: str) -> str:
+        """
+        Returns md5 checksum of the given file, reading the file only if it is not indexed or it has been changed
+        since it was indexed.
+
+        Parameters
+        ----------
+        file_name : str
+            file name of the file for which md5 checksum is required.
+
+        Returns
+        -------
+        md5 checksum of the given file.
+        """
+        path = os.path.abspath(file_name)
+        stat_result = os.stat(path)
+        signature = (stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+        with self._lock:
+            self._load()
+            entry = self._entries.get(path)
+        if entry and entry[:3] == signature:
+            return entry[3]
+
+        checksum = file_checksum(path)
+        with self._lock:
+            if time.time_ns() - stat_result.st_mtime_ns > _RACY_WINDOW_NS:
+                self._entries[path] = (*signature, checksum)
+                self._dirty = True
+            elif self._entries.pop(path, None):
+                self._dirty = True
+        return checksum
+
+    def save(self) -> None:
+        """
+        Writes the index back into the index file, if there is any change since it was loaded
+        """
+        with self._lock:
+            if not self._index_file or not self._dirty:
+                return
+            index_dir = os.path.dirname(self._index_file)
+            if index_dir and not os.path.isdir(index_dir):
+                LOG.debug("Skip saving file hash index since %s does not exist", index_dir)
+                return
+            # prune entries of the files which are not present anymore
+            entries = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+            temp_file = f"{self._index_file}.{os.getpid()}.tmp"
+            try:
+                with open(temp_file, "w") as file_handle:
+                    json.dump(entries, file_handle)
+                os.replace(temp_file, self._index_file)
+                self._dirty = False
+            except OSError as ex:
+                LOG.debug("Failed to save file hash index into %s", self._index_file, exc_info=ex)
+
+    def _load(self) -> None:
+        """
+        Loads the index from the index file once, ignoring files which are missing or corrupted
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._index_file or not os.path.isfile(self._index_file):
+            return
+        try:
+            with open(self._index_file, "r") as file_handle:
+                entries = json.load(file_handle)
+            self._entries = {path: tuple(entry) for path, entry in entries.items()}  # type: ignore
+        except (OSError, ValueError, TypeError, AttributeError) as ex:
+            LOG.debug("Ignoring invalid file hash index %s", self._index_file, exc_info=ex)
+            self._entries = {}
+
+
+@profiled(CATEGORY_HASH, "hash_directory")
 def dir_checksum(
-    directory: str, followlinks: bool = True, ignore_list: Optional[List[str]] = None, hash_generator: Any = None
+    directory: str,
+    followlinks: bool = True,
+    ignore_list: Optional[List[str]] = None,
+    hash_generator: Any = None,
+    hash_index: Optional[FileHashIndex] = None,
 ) -> str:
     """
 
@@ -57,6 +173,8 @@ def dir_checksum(
         The list of file/directory names to ignore in checksum
     hash_generator : hashlib._Hash
         The hashing method (hashlib _Hash object) that generates checksum. Defaults to hashlib.md5.
+    hash_index : Optional[FileHashIndex]
+        Index of file checksums, which is used to skip reading the files that have not been changed since last time
 
     Returns
     -------
@@ -83,7 +201,7 @@ def dir_checksum(
     files.sort()
     for file in files:
         hash_generator.update(os.path.relpath(file, directory).encode("utf-8"))
-        filepath_checksum = file_checksum(file)
+        filepath_checksum = hash_index.file_checksum(file) if hash_index else file_checksum(file)
         hash_generator.update(filepath_checksum.encode("utf-8"))
 
     return cast(str, hash_generator.hexdigest())
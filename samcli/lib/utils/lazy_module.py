@@ -0,0 +1,36 @@
+"""
+Lazily imported modules, which are used to keep heavy libraries out of the SAM CLI startup
+"""
+import importlib
+from types import ModuleType
+from typing import Any, Optional
+
+
+class LazyModule(ModuleType):
+    """
+    Proxy of a module, which imports the module when one of its attributes is accessed for the first time.
+
+    It allows modules on the startup path of SAM CLI to keep referring to a heavy library (e.g. boto3) as a module
+    level name, which can be patched in tests as usual, while the library is imported only if it is actually used.
+
+    Usage:
+        boto3 = LazyModule("boto3")
+
+        def get_session():
+            return boto3.session.Session()  # boto3 is imported here
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attribute: str) -> Any:
+        # only called for the attributes which are not defined on the proxy itself
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return getattr(self._module, attribute)
+
+    def __dir__(self):
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return dir(self._module)
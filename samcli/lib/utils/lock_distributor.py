@@ -2,7 +2,7 @@
 import threading
 import multiprocessing
 import multiprocessing.managers
-from typing import Dict, List, Optional, cast
+from typing import Callable, Dict, List, Optional, cast
 from enum import Enum, auto
 
 
@@ -37,6 +37,46 @@ class LockChain:
         self.release()
 
 
+class ObservableLock:
+    """Wrapper class for a lock which reports every release with the key of the lock
+    Can be used with `with` statement"""
+
+    def __init__(self, key: str, lock: threading.Lock, release_callback: Callable[[str], None]):
+        """
+        Parameters
+        ----------
+        key : str
+            Key of the lock, passed to release_callback
+        lock : threading.Lock
+            Lock to be wrapped
+        release_callback : Callable[[str], None]
+            Function to be called with the key after the lock is released
+        """
+        self._key = key
+        self._lock = lock
+        self._release_callback = release_callback
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquire the lock"""
+        return self._lock.acquire(blocking, timeout)
+
+    def release(self) -> None:
+        """Release the lock and report the release"""
+        self._lock.release()
+        self._release_callback(self._key)
+
+    def locked(self) -> bool:
+        """Whether the lock is currently held"""
+        return self._lock.locked()
+
+    def __enter__(self) -> "ObservableLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.release()
+
+
 class LockDistributorType(Enum):
     """Types of LockDistributor"""
 
@@ -53,11 +93,13 @@ class LockDistributor:
     _manager: Optional[multiprocessing.managers.SyncManager]
     _dict_lock: threading.Lock
     _locks: Dict[str, threading.Lock]
+    _release_callback: Optional[Callable[[str], None]]
 
     def __init__(
         self,
         lock_type: LockDistributorType = LockDistributorType.THREAD,
         manager: Optional[multiprocessing.managers.SyncManager] = None,
+        release_callback: Optional[Callable[[str], None]] = None,
     ):
         """[summary]
 
@@ -67,9 +109,13 @@ class LockDistributor:
             Whether locking with threads or processes, by default LockDistributorType.THREAD
         manager : Optional[multiprocessing.managers.SyncManager], optional
             Optional process sync mananger for creating proxy locks, by default None
+        release_callback : Optional[Callable[[str], None]], optional
+            Optional function called with the key of a distributed lock whenever it is released,
+            only supported for LockDistributorType.THREAD, by default None
         """
         self._lock_type = lock_type
         self._manager = manager
+        self._release_callback = release_callback if lock_type == LockDistributorType.THREAD else None
         self._dict_lock = self._create_new_lock()
         self._locks = (
             self._manager.dict()
@@ -105,7 +151,10 @@ class LockDistributor:
         """
         with self._dict_lock:
             if key not in self._locks:
-                self._locks[key] = self._create_new_lock()
+                lock = self._create_new_lock()
+                if self._release_callback is not None:
+                    lock = cast(threading.Lock, ObservableLock(key, lock, self._release_callback))
+                self._locks[key] = lock
             return self._locks[key]
 
     def get_locks(self, keys: List[str]) -> Dict[str, threading.Lock]:
@@ -8,7 +8,19 @@ import stat
 import sys
 import tempfile
 from contextlib import contextmanager
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # not available on Windows
+    fcntl = None  # type: ignore
+
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover
+    # only available on Windows
+    msvcrt = None  # type: ignore
 
 LOG = logging.getLogger(__name__)
 
@@ -16,6 +28,13 @@ LOG = logging.getLogger(__name__)
 # This is usually a optimal permission for directories
 BUILD_DIR_PERMISSIONS = 0o755
 
+# ioctl request for cloning a file on Linux (copy-on-write copy on btrfs, xfs etc.)
+FICLONE = 0x40049409
+
+# (source device, destination device) pairs which are known to not support reflinks or hardlinks
+_REFLINK_UNSUPPORTED_DEVICES: Set[Tuple[int, int]] = set()
+_HARDLINK_UNSUPPORTED_DEVICES: Set[Tuple[int, int]] = set()
+
 
 @contextmanager
 def mkdir_temp(mode=0o755, ignore_errors=False):
@@ -54,6 +73,40 @@ def mkdir_temp(mode=0o755, ignore_errors=False):
                 shutil.rmtree(temp_dir)
 
 
+@contextmanager
+def file_lock(lock_file_path: str) -> Iterator[None]:
+    """
+    Context manager which holds an exclusive lock on the given file, so that the code block isn't run by other
+    processes, or other threads of this process, at the same time. It waits until the lock is released by its owner.
+    The lock is released by the operating system if its owner dies.
+
+    Parameters
+    ----------
+    lock_file_path : str
+        Path of the lock file, it is created if it doesn't exist
+    """
+    with open(lock_file_path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:  # pragma: no cover
+            while True:
+                try:
+                    # locking() gives up after 10 seconds, keep waiting until the lock is acquired
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:  # pragma: no cover
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
 def rmtree_callback(function, path, excinfo):
     """
     Callback function for shutil.rmtree to change permissions on the file path, so that
@@ -161,6 +214,124 @@ def copytree(source, destination, ignore=None):
             shutil.copy2(new_source, new_destination)
 
 
+def link_or_copytree(source, destination, allow_hardlinks=True):
+    """
+    Same as copytree, but files are materialized with reflinks (copy-on-write clones) or hardlinks when the file system
+    allows it, and copied otherwise. This makes copying large unchanged artifact trees almost free.
+
+    Since hardlinked files share their content with the source, files in the destination must not be modified in
+    place afterwards, see break_hardlinks. Hardlinks can be disabled when the destination may be modified by others.
+
+    :type source: str
+    :param source:
+        Path to the source folder to materialize
+    :type destination: str
+    :param destination:
+        Path to destination folder
+    :type allow_hardlinks: bool
+    :param allow_hardlinks:
+        If False, files are only reflinked or copied
+    """
+    if not os.path.exists(destination):
+        os.makedirs(destination)
+
+        try:
+            shutil.copystat(source, destination)
+        except OSError as ex:
+            LOG.debug("Unable to copy file access times from %s to %s", source, destination, exc_info=ex)
+
+    for name in os.listdir(source):
+        new_source = os.path.join(source, name)
+        new_destination = os.path.join(destination, name)
+
+        if os.path.isdir(new_source):
+            link_or_copytree(new_source, new_destination, allow_hardlinks)
+        else:
+            link_or_copy_file(new_source, new_destination, allow_hardlinks)
+
+
+def link_or_copy_file(source, destination, allow_hardlinks=True):
+    """
+    Materializes a single file, trying a reflink first, then a hardlink and finally a copy
+
+    :type source: str
+    :param source:
+        Path to the source file
+    :type destination: str
+    :param destination:
+        Path to the destination file, which is replaced if it exists
+    :type allow_hardlinks: bool
+    :param allow_hardlinks:
+        If False, the file is only reflinked or copied
+    """
+    if os.path.lexists(destination):
+        try:
+            if allow_hardlinks and os.path.samefile(source, destination):
+                # already linked to the source
+                return
+        except OSError:
+            pass
+        os.remove(destination)
+
+    devices = (os.stat(source).st_dev, os.stat(os.path.dirname(destination) or ".").st_dev)
+
+    if devices not in _REFLINK_UNSUPPORTED_DEVICES:
+        if _reflink(source, destination):
+            return
+        _REFLINK_UNSUPPORTED_DEVICES.add(devices)
+
+    if allow_hardlinks and devices not in _HARDLINK_UNSUPPORTED_DEVICES:
+        try:
+            os.link(source, destination)
+            return
+        except OSError as ex:
+            LOG.debug("Unable to hardlink %s to %s, falling back to copy", source, destination, exc_info=ex)
+            _HARDLINK_UNSUPPORTED_DEVICES.add(devices)
+
+    shutil.copy2(source, destination)
+
+
+def _reflink(source, destination) -> bool:
+    """
+    Clones the source file into destination with copy-on-write, returns False if it is not supported
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+
+    try:
+        with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+            fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+        shutil.copystat(source, destination)
+        return True
+    except OSError:
+        if os.path.lexists(destination):
+            os.remove(destination)
+        return False
+
+
+def break_hardlinks(directory):
+    """
+    Replaces the files in the directory which are hardlinked with other files by their own copies, so that the
+    directory can be modified in place without changing the other files
+
+    :type directory: str
+    :param directory:
+        Path to the directory
+    """
+    directory = str(directory)
+    if not os.path.isdir(directory):
+        return
+
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            if os.path.islink(path) or os.stat(path).st_nlink <= 1:
+                continue
+            temp_path = path + ".sam-unlink"
+            shutil.copy2(path, temp_path)
+            os.replace(temp_path, path)
+
+
 def convert_files_to_unix_line_endings(path: str, target_files: Optional[List[str]] = None) -> None:
     for subdirectory, _, files in os.walk(path):
         for file in files:
@@ -0,0 +1,181 @@
+"""
+Phase level profiling of SAM CLI commands.
+
+When profiling is enabled, the duration of each instrumented phase (template parsing, building, zipping, uploading,
+Docker calls etc.) is recorded, and all of them are written into a trace file in Chrome trace event format when SAM
+CLI exits. The trace file can be opened in chrome://tracing or https://ui.perfetto.dev
+"""
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, cast
+
+LOG = logging.getLogger(__name__)
+
+# Environment variable to enable profiling, its value is the path of the trace file
+TRACE_FILE_ENV_VAR = "SAM_CLI_TRACE_FILE"
+
+# Categories of the phases, they can be used to filter the events in the trace viewer
+CATEGORY_TEMPLATE = "template"
+CATEGORY_BUILD = "build"
+CATEGORY_HASH = "hash"
+CATEGORY_PACKAGE = "package"
+CATEGORY_DOCKER = "docker"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _Profiler:
+    """
+    Collects the trace events of the phases, which can be recorded from any thread
+    """
+
+    def __init__(self, trace_file: str) -> None:
+        self.trace_file = trace_file
+        self._start_time = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def add_event(self, name: str, category: str, start_time: float, end_time: float, args: Dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._to_microseconds(start_time),
+            "dur": self._to_microseconds(end_time) - self._to_microseconds(start_time),
+            "pid": self._pid,
+            "tid": thread.ident,
+            "args": {key: str(value) for key, value in args.items()},
+        }
+        with self._lock:
+            self._events.append(event)
+            self._thread_names.setdefault(cast(int, thread.ident), thread.name)
+
+    def get_trace(self) -> Dict[str, Any]:
+        """
+        Returns the recorded events in Chrome trace event format
+        """
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+
+        end_time = time.perf_counter()
+        metadata_events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "sam"}},
+            {
+                "name": "sam",
+                "cat": "command",
+                "ph": "X",
+                "ts": 0,
+                "dur": self._to_microseconds(end_time),
+                "pid": self._pid,
+                "tid": threading.main_thread().ident,
+                "args": {},
+            },
+        ]
+        for tid, thread_name in thread_names.items():
+            metadata_events.append(
+                {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": thread_name}}
+            )
+        return {"traceEvents": metadata_events + events, "displayTimeUnit": "ms"}
+
+    def write(self) -> None:
+        """
+        Writes the trace file
+        """
+        try:
+            with open(self.trace_file, "w", encoding="utf-8") as trace_file:
+                json.dump(self.get_trace(), trace_file)
+            LOG.info("Profiling trace is written to %s", self.trace_file)
+        except OSError as ex:
+            LOG.warning("Unable to write the profiling trace to %s: %s", self.trace_file, ex)
+
+    def _to_microseconds(self, timestamp: float) -> int:
+        return int((timestamp - self._start_time) * 1_000_000)
+
+
+_PROFILER: Optional[_Profiler] = None
+
+
+def enable_profiling(trace_file: str) -> None:
+    """
+    Starts recording the phases, the trace file is written when SAM CLI exits
+
+    Parameters
+    ----------
+    trace_file : str
+        Path of the trace file
+    """
+    global _PROFILER  # pylint: disable=global-statement
+    if _PROFILER:
+        _PROFILER.trace_file = trace_file
+        return
+
+    LOG.debug("Profiling is enabled, trace will be written to %s", trace_file)
+    _PROFILER = _Profiler(trace_file)
+    atexit.register(_PROFILER.write)
+
+
+def is_profiling_enabled() -> bool:
+    return _PROFILER is not None
+
+
+@contextmanager
+def profile_phase(name: str, category: str, **args: Any) -> Iterator[None]:
+    """
+    Records the duration of the code block as a phase, if profiling is enabled
+
+    Parameters
+    ----------
+    name : str
+        Name of the phase
+    category : str
+        Category of the phase
+    args
+        Extra information about the phase, which is shown in the trace viewer
+    """
+    profiler = _PROFILER
+    if profiler is None:
+        yield
+        return
+
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.add_event(name, category, start_time, time.perf_counter(), args)
+
+
+def profiled(category: str, name: Optional[str] = None) -> Callable[[_F], _F]:
+    """
+    Decorator which records each call of the function as a phase, if profiling is enabled
+
+    Parameters
+    ----------
+    category : str
+        Category of the phase
+    name : Optional[str]
+        Name of the phase, defaults to the qualified name of the function
+    """
+
+    def decorator(func: _F) -> _F:
+        phase_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _PROFILER is None:
+                return func(*args, **kwargs)
+            with profile_phase(phase_name, category):
+                return func(*args, **kwargs)
+
+        return cast(_F, wrapper)
+
+    return decorator
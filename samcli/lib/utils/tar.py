@@ -2,9 +2,15 @@
 Tarball Archive utility
 """
 
+import io
+import os
 import tarfile
 from tempfile import TemporaryFile
 from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+# Size of the chunks which are generated by stream_tarball
+STREAM_CHUNK_SIZE = 1024 * 1024
 
 
 @contextmanager
@@ -36,3 +42,141 @@ def create_tarball(tar_paths, tar_filter=None):
         yield tarballfile
     finally:
         tarballfile.close()
+
+
+def stream_tarball(
+    tar_paths: Dict[str, str],
+    tar_filter: Optional[Callable[[tarfile.TarInfo], Optional[tarfile.TarInfo]]] = None,
+    progress_callback: Optional[Callable[[int], None]] = None,
+) -> Iterator[bytes]:
+    """
+    Generates the tarball of the given paths in chunks, while it is being read. Unlike create_tarball, the tarball is
+    never written to the disk and only a chunk of it is kept in memory, so it can be sent to Docker as the build
+    context while it is being created.
+
+    The tarball has the same contents as the one created by create_tarball: directories are added recursively and
+    the entries which tar_filter returns None for are skipped, together with their contents if they are directories.
+
+    Parameters
+    ----------
+    tar_paths dict(str, str)
+        Key representing a full path to the file or directory and the Value representing the path within the tarball
+    tar_filter Callable
+        Optional. Function which is called with the TarInfo of each entry, and returns the TarInfo to be added or
+        None to skip the entry
+    progress_callback Callable
+        Optional. Function which is called with the total number of bytes generated so far after each chunk
+
+    Yields
+    ------
+    bytes
+        Next chunk of the tarball, it is never empty
+    """
+    buffer = bytearray()
+    total_size = 0
+
+    def flush_buffer(force: bool) -> Iterator[bytes]:
+        nonlocal buffer, total_size
+        if buffer and (force or len(buffer) >= STREAM_CHUNK_SIZE):
+            chunk = bytes(buffer)
+            buffer = bytearray()
+            total_size += len(chunk)
+            yield chunk
+            if progress_callback:
+                progress_callback(total_size)
+
+    # The archive is only used to create the headers of the entries the same way TarFile.add does, which also
+    # keeps track of the hardlinks
+    with tarfile.TarFile(fileobj=io.BytesIO(), mode="w") as header_factory:
+        for path_on_system, path_in_tarball in tar_paths.items():
+            for tar_info, path in _get_tar_entries(header_factory, path_on_system, path_in_tarball, tar_filter):
+                buffer += tar_info.tobuf(header_factory.format, header_factory.encoding, header_factory.errors)
+                if not tar_info.isreg():
+                    continue
+
+                with open(path, "rb") as entry_file:
+                    remaining = tar_info.size
+                    while remaining:
+                        data = entry_file.read(min(remaining, STREAM_CHUNK_SIZE))
+                        if not data:
+                            raise OSError("{} is changed while it is being added to the tarball".format(path))
+                        buffer += data
+                        remaining -= len(data)
+                        yield from flush_buffer(force=False)
+
+                _, remainder = divmod(tar_info.size, tarfile.BLOCKSIZE)
+                if remainder:
+                    buffer += tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
+                yield from flush_buffer(force=False)
+
+        # end of archive marker, padded to the record size like TarFile.close does
+        buffer += tarfile.NUL * (tarfile.BLOCKSIZE * 2)
+        _, remainder = divmod(total_size + len(buffer), tarfile.RECORDSIZE)
+        if remainder:
+            buffer += tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+        yield from flush_buffer(force=True)
+
+
+def _get_tar_entries(header_factory, path_on_system, path_in_tarball, tar_filter):
+    """
+    Yields the TarInfo and the path of the given path and everything in it, in the same order as TarFile.add
+    """
+    tar_info = header_factory.gettarinfo(path_on_system, path_in_tarball)
+    if tar_info is None:
+        # unsupported file type, e.g. a socket, which TarFile.add skips as well
+        return
+    if tar_filter:
+        tar_info = tar_filter(tar_info)
+        if tar_info is None:
+            return
+
+    yield tar_info, path_on_system
+
+    if tar_info.isdir():
+        for name in sorted(os.listdir(path_on_system)):
+            yield from _get_tar_entries(
+                header_factory, os.path.join(path_on_system, name), os.path.join(path_in_tarball, name), tar_filter
+            )
+
+
+def extract_tarball(tar_chunks: Iterable[bytes], output_dir: str) -> None:
+    """
+    Extracts the tarball, which is given as the chunks of it (e.g. the response of Docker get_archive), into the
+    output directory while the chunks are being received, without writing the tarball to the disk first
+
+    Parameters
+    ----------
+    tar_chunks Iterable[bytes]
+        Chunks of the tarball
+    output_dir str
+        Directory to extract the tarball into
+    """
+    with io.BufferedReader(_ChunksReader(tar_chunks), buffer_size=STREAM_CHUNK_SIZE) as tar_stream:
+        with tarfile.open(fileobj=tar_stream, mode="r|") as archive:
+            archive.extractall(path=output_dir)
+
+
+class _ChunksReader(io.RawIOBase):
+    """
+    Readable file object over the chunks of a stream
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:  # pylint: disable=no-self-use
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
@@ -6,12 +6,15 @@ from datetime import datetime, timedelta
 from functools import wraps
 
 import click
-from requests import get
 from samcli import __version__ as installed_version
 from samcli.cli.global_config import GlobalConfig
+from samcli.lib.utils.lazy_module import LazyModule
 
 LOG = logging.getLogger(__name__)
 
+# requests is only needed when the version check is overdue
+requests = LazyModule("requests")
+
 AWS_SAM_CLI_PYPI_ENDPOINT = "https://pypi.org/pypi/aws-sam-cli/json"
 AWS_SAM_CLI_INSTALL_DOCS = (
     "https://docs.aws.amazon.com/serverless-application-model/latest/developerguide/serverless-sam-cli-install.html"
@@ -83,7 +86,7 @@ def fetch_and_compare_versions() -> None:
     """
     Compare current up to date version with the installed one, and inform if a newer version available
     """
-    response = get(AWS_SAM_CLI_PYPI_ENDPOINT, timeout=PYPI_CALL_TIMEOUT_IN_SECONDS)
+    response = requests.get(AWS_SAM_CLI_PYPI_ENDPOINT, timeout=PYPI_CALL_TIMEOUT_IN_SECONDS)
     result = response.json()
     latest_version = result.get("info", {}).get("version", None)
     LOG.debug("Installed version %s, current version %s", installed_version, latest_version)
@@ -3,8 +3,6 @@ Representation of a generic Docker container
 """
 import os
 import logging
-import tarfile
-import tempfile
 import threading
 import socket
 import time
@@ -14,6 +12,8 @@ import requests
 
 from docker.errors import NotFound as DockerNetworkNotFound
 from samcli.lib.utils.retry import retry
+from samcli.lib.utils.profiling import CATEGORY_DOCKER, profiled
+from samcli.lib.utils.tar import extract_tarball
 from .exceptions import ContainerNotStartableException
 
 from .utils import to_posix_path, find_free_port, NoFreePortsError
@@ -22,6 +22,11 @@ LOG = logging.getLogger(__name__)
 
 CONTAINER_CONNECTION_TIMEOUT = float(os.environ.get("SAM_CLI_CONTAINER_CONNECTION_TIMEOUT", 20))
 
+# Delays (in seconds) between the attempts to connect to the socket of a starting container. The delay starts small
+# and doubles after each failed attempt, so a fast starting container is not kept waiting for a fixed interval.
+SOCKET_CONNECTION_INITIAL_DELAY = 0.005
+SOCKET_CONNECTION_MAX_DELAY = 0.1
+
 
 class ContainerResponseException(Exception):
     """
@@ -100,6 +105,10 @@ class Container:
         self._container_opts = container_opts
         self._additional_volumes = additional_volumes
         self._logs_thread = None
+        # keep-alive HTTP session used to send the invoke requests to RAPID, and whether RAPID is known to be
+        # listening, so that subsequent invokes of a warm container skip both the connection setup and the wait
+        self._http_session = None
+        self._socket_connected = False
 
         # Use the given Docker client or create new one
         self.docker_client = docker_client or docker.from_env()
@@ -120,6 +129,7 @@ class Container:
         except NoFreePortsError as ex:
             raise ContainerNotStartableException(str(ex)) from ex
 
+    @profiled(CATEGORY_DOCKER, "docker_create_container")
     def create(self):
         """
         Calls Docker API to creates the Docker container instance. Creating the container does *not* run the container.
@@ -219,6 +229,7 @@ class Container:
             LOG.debug("Container was not created, cannot run stop.")
             return
 
+        self._close_http_session()
         try:
             self.docker_client.containers.get(self.id).stop(timeout=timeout)
         except docker.errors.NotFound:
@@ -242,6 +253,7 @@ class Container:
             LOG.debug("Container was not created. Skipping deletion")
             return
 
+        self._close_http_session()
         try:
             self.docker_client.containers.get(self.id).remove(force=True)  # Remove a container, even if it is running
         except docker.errors.NotFound:
@@ -259,6 +271,7 @@ class Container:
 
         self.id = None
 
+    @profiled(CATEGORY_DOCKER, "docker_start_container")
     def start(self, input_data=None):
         """
         Calls Docker API to start the container. The container must be created at the first place to run.
@@ -281,6 +294,7 @@ class Container:
         real_container = self.docker_client.containers.get(self.id)
 
         # Start the container
+        self._close_http_session()
         real_container.start()
 
     @retry(exc=requests.exceptions.RequestException, exc_raise=ContainerResponseException)
@@ -289,13 +303,36 @@ class Container:
         # NOTE(sriram-mv): There is a connection timeout set on the http call to `aws-lambda-rie`, however there is not
         # a read time out for the response received from the server.
 
-        resp = requests.post(
-            self.URL.format(host=self._container_host, port=self.rapid_port_host, function_name="function"),
-            data=event.encode("utf-8"),
-            timeout=(self.RAPID_CONNECTION_TIMEOUT, None),
-        )
+        try:
+            resp = self._get_http_session().post(
+                self.URL.format(host=self._container_host, port=self.rapid_port_host, function_name="function"),
+                data=event.encode("utf-8"),
+                timeout=(self.RAPID_CONNECTION_TIMEOUT, None),
+            )
+        except Exception:
+            # do not reuse a connection which might be broken, the retry will open a new one
+            self._close_http_session()
+            raise
         stdout.write(resp.content)
 
+    def _get_http_session(self) -> requests.Session:
+        """
+        Returns the keep-alive HTTP session of this container, so that the connection to RAPID is reused by all
+        invokes of a warm container instead of opening a new connection for each of them.
+        """
+        if not self._http_session:
+            self._http_session = requests.Session()
+        return self._http_session
+
+    def _close_http_session(self) -> None:
+        """
+        Closes the HTTP session, and its pooled connections, if the container is restarted or removed
+        """
+        self._socket_connected = False
+        if self._http_session:
+            self._http_session.close()
+            self._http_session = None
+
     def wait_for_result(self, full_path, event, stdout, stderr, start_timer=None):
         # NOTE(sriram-mv): Let logging happen in its own thread, so that a http request can be sent.
         # NOTE(sriram-mv): All logging is re-directed to stderr, so that only the lambda function return
@@ -337,11 +374,16 @@ class Container:
     def _wait_for_socket_connection(self) -> None:
         """
         Waits for a successful connection to the socket used to communicate with Docker.
+        Once connected, subsequent invokes of the same container do not wait anymore.
         """
+        if self._socket_connected:
+            return
 
         start_time = time.time()
+        delay = SOCKET_CONNECTION_INITIAL_DELAY
         while not self._can_connect_to_socket():
-            time.sleep(0.1)
+            time.sleep(delay)
+            delay = min(delay * 2, SOCKET_CONNECTION_MAX_DELAY)
             current_time = time.time()
             if current_time - start_time > CONTAINER_CONNECTION_TIMEOUT:
                 raise ContainerConnectionTimeoutException(
@@ -349,6 +391,7 @@ class Container:
                     f"timeout by setting the SAM_CLI_CONTAINER_CONNECTION_TIMEOUT environment variable. "
                     f"The current timeout is {CONTAINER_CONNECTION_TIMEOUT} (seconds)."
                 )
+        self._socket_connected = True
 
     def _can_connect_to_socket(self) -> bool:
         """
@@ -357,11 +400,13 @@ class Container:
 
         a_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         location = (self._container_host, self.rapid_port_host)
-        # connect_ex returns 0 if connection succeeded
-        connection_succeeded = not a_socket.connect_ex(location)
-        a_socket.close()
-        return connection_succeeded
+        try:
+            # connect_ex returns 0 if connection succeeded
+            return not a_socket.connect_ex(location)
+        finally:
+            a_socket.close()
 
+    @profiled(CATEGORY_DOCKER, "docker_copy_from_container")
     def copy(self, from_container_path, to_host_path):
 
         if not self.is_created():
@@ -370,16 +415,9 @@ class Container:
         real_container = self.docker_client.containers.get(self.id)
 
         LOG.debug("Copying from container: %s -> %s", from_container_path, to_host_path)
-        with tempfile.NamedTemporaryFile() as fp:
-            tar_stream, _ = real_container.get_archive(from_container_path)
-            for data in tar_stream:
-                fp.write(data)
-
-            # Seek the handle back to start of file for tarfile to use
-            fp.seek(0)
-
-            with tarfile.open(fileobj=fp, mode="r") as tar:
-                tar.extractall(path=to_host_path)
+        tar_stream, _ = real_container.get_archive(from_container_path)
+        # the archive is extracted while it is being received, instead of downloading it into a temporary file first
+        extract_tarball(tar_stream, to_host_path)
 
     @staticmethod
     def _write_container_output(output_itr, stdout=None, stderr=None):
@@ -11,3 +11,9 @@ class NoFreePortsError(Exception):
     """
     Exception to raise when there are no free ports found in a specified range.
     """
+
+
+class ContainerExecutableNotFoundException(Exception):
+    """
+    Exception to raise when the executable to run is not found in a running container.
+    """
@@ -5,9 +5,15 @@ Represents Lambda Build Containers.
 import json
 import logging
 import pathlib
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
+
+import docker
 
 from samcli.commands._utils.experimental import get_enabled_experimental_flags
 from samcli.local.docker.container import Container
+from samcli.local.docker.exceptions import ContainerExecutableNotFoundException
 
 LOG = logging.getLogger(__name__)
 
@@ -21,7 +27,7 @@ class LambdaBuildContainer(Container):
 
     _IMAGE_URI_PREFIX = "public.ecr.aws/sam/build"
     _IMAGE_TAG = "latest"
-    _BUILDERS_EXECUTABLE = "lambda-builders"
+    BUILDERS_EXECUTABLE = "lambda-builders"
 
     def __init__(  # pylint: disable=too-many-locals
         self,
@@ -56,7 +62,7 @@ class LambdaBuildContainer(Container):
         # host paths to container paths. But if a host path is NOT mounted within the container, we will simply ignore
         # it. In essence, only when the path is already in the mounted path, can the path resolver within the
         # container even find the executable.
-        executable_search_paths = LambdaBuildContainer._convert_to_container_dirs(
+        executable_search_paths = LambdaBuildContainer.convert_to_container_dirs(
             host_paths_to_convert=executable_search_paths,
             host_to_container_path_mapping={
                 source_dir: container_dirs["source_dir"],
@@ -64,7 +70,7 @@ class LambdaBuildContainer(Container):
             },
         )
 
-        request_json = self._make_request(
+        request_json = self.make_request(
             protocol_version,
             language,
             dependency_manager,
@@ -81,8 +87,8 @@ class LambdaBuildContainer(Container):
         )
 
         if image is None:
-            image = LambdaBuildContainer._get_image(runtime, architecture)
-        entry = LambdaBuildContainer._get_entrypoint(request_json)
+            image = LambdaBuildContainer.get_image(runtime, architecture)
+        entry = LambdaBuildContainer.get_entrypoint(request_json)
         cmd = []
 
         additional_volumes = {
@@ -106,10 +112,10 @@ class LambdaBuildContainer(Container):
 
     @property
     def executable_name(self):
-        return LambdaBuildContainer._BUILDERS_EXECUTABLE
+        return LambdaBuildContainer.BUILDERS_EXECUTABLE
 
     @staticmethod
-    def _make_request(
+    def make_request(
         protocol_version,
         language,
         dependency_manager,
@@ -157,8 +163,8 @@ class LambdaBuildContainer(Container):
         )
 
     @staticmethod
-    def _get_entrypoint(request_json):
-        return [LambdaBuildContainer._BUILDERS_EXECUTABLE, request_json]
+    def get_entrypoint(request_json):
+        return [LambdaBuildContainer.BUILDERS_EXECUTABLE, request_json]
 
     @staticmethod
     def _get_container_dirs(source_dir, manifest_dir):
@@ -194,7 +200,7 @@ class LambdaBuildContainer(Container):
         return result
 
     @staticmethod
-    def _convert_to_container_dirs(host_paths_to_convert, host_to_container_path_mapping):
+    def convert_to_container_dirs(host_paths_to_convert, host_to_container_path_mapping):
         """
         Use this method to convert a list of host paths to a list of equivalent paths within the container
         where the given host path is mounted. This is necessary when SAM CLI needs to pass path information to
@@ -245,7 +251,7 @@ class LambdaBuildContainer(Container):
         return result
 
     @staticmethod
-    def _get_image(runtime, architecture):
+    def get_image(runtime, architecture):
         """
         Parameters
         ----------
@@ -277,3 +283,190 @@ class LambdaBuildContainer(Container):
             Image tag
         """
         return f"{LambdaBuildContainer._IMAGE_TAG}-{architecture}"
+
+
+class WarmLambdaBuildContainer(Container):
+    """
+    Build container which is kept running to build several functions and layers, instead of creating a new container
+    for each of them. Docker can't add mounts to a running container, so the directory which contains the sources of
+    all the functions and layers is mounted once, and each build runs the Lambda Builder CLI within the running
+    container with its own artifacts and scratch directories.
+    """
+
+    _CONTAINER_MOUNT_DIR = "/tmp/samcli/mount"
+    _CONTAINER_JOBS_DIR = "/tmp/samcli/jobs"
+    # keeps the container running until it is stopped, the builds are executed in it
+    _KEEP_ALIVE_ENTRYPOINT = ["tail", "-f", "/dev/null"]
+    # exit codes of the shell when the command can't be executed or is not found
+    _EXECUTABLE_NOT_FOUND_EXIT_CODES = {126, 127}
+
+    def __init__(
+        self,
+        mount_dir: str,
+        runtime: str,
+        architecture: str,
+        log_level: Optional[Union[int, str]] = None,
+        env_vars: Optional[Dict] = None,
+        image: Optional[str] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        mount_dir : str
+            Directory on the host which is mounted into the container, only the sources and manifests in it can be
+            built by this container
+        runtime : str
+            Name of the Lambda runtime
+        architecture : str
+            Architecture type either 'x86_64' or 'arm64'
+        log_level : Optional[Union[int, str]]
+            Optional, log level of the Lambda Builder
+        env_vars : Optional[Dict]
+            Optional, environment variables of the container
+        image : Optional[str]
+            Optional, build image to use instead of the default one of the runtime
+        """
+        self._mount_dir = pathlib.Path(mount_dir).resolve()
+        env_vars = dict(env_vars) if env_vars else {}
+        if log_level:
+            env_vars["LAMBDA_BUILDERS_LOG_LEVEL"] = log_level
+
+        if image is None:
+            image = LambdaBuildContainer.get_image(runtime, architecture)
+
+        super().__init__(
+            image,
+            [],
+            WarmLambdaBuildContainer._CONTAINER_MOUNT_DIR,
+            str(self._mount_dir),
+            entrypoint=WarmLambdaBuildContainer._KEEP_ALIVE_ENTRYPOINT,
+            env_vars=env_vars,
+        )
+
+    @property
+    def executable_name(self):
+        return LambdaBuildContainer.BUILDERS_EXECUTABLE
+
+    @staticmethod
+    def can_build(mount_dir: str, source_dir: str, manifest_path: str) -> bool:
+        """
+        Returns True if both the source and the manifest are in the given directory, so that they can be built by
+        a warm build container which mounts that directory
+        """
+        mount_path = pathlib.Path(mount_dir).resolve()
+        return (
+            WarmLambdaBuildContainer._get_container_path(mount_path, source_dir) is not None
+            and WarmLambdaBuildContainer._get_container_path(mount_path, str(pathlib.Path(manifest_path).parent))
+            is not None
+        )
+
+    @contextmanager
+    def build(  # pylint: disable=too-many-locals
+        self,
+        protocol_version: str,
+        language: str,
+        dependency_manager: str,
+        application_framework: Optional[str],
+        source_dir: str,
+        manifest_path: str,
+        runtime: str,
+        architecture: str,
+        optimizations: Optional[Dict] = None,
+        options: Optional[Dict] = None,
+        executable_search_paths: Optional[List[str]] = None,
+        mode: Optional[str] = None,
+        is_building_layer: bool = False,
+        stdout=None,
+        stderr=None,
+    ) -> Iterator[None]:
+        """
+        Context manager which runs the Lambda Builder CLI within the running container to build the given source.
+        The response of the builder is written into stdout and its logs into stderr. The artifacts of the build are
+        kept in the container until the context is exited, so that they can be copied to the host.
+
+        Raises
+        ------
+        ContainerExecutableNotFoundException
+            If the Lambda Builder CLI is not found in the container
+        """
+        abs_manifest_path = pathlib.Path(manifest_path).resolve()
+        source_dir = str(pathlib.Path(source_dir).resolve())
+        manifest_dir = str(abs_manifest_path.parent)
+
+        job_dir = "{}/{}".format(WarmLambdaBuildContainer._CONTAINER_JOBS_DIR, uuid.uuid4().hex)
+        container_dirs = {
+            "source_dir": self._get_container_path(self._mount_dir, source_dir),
+            "artifacts_dir": "{}/artifacts".format(job_dir),
+            "scratch_dir": "{}/scratch".format(job_dir),
+            "manifest_dir": self._get_container_path(self._mount_dir, manifest_dir),
+        }
+
+        # same as LambdaBuildContainer, only the paths of the source and manifest directories are converted
+        executable_search_paths = LambdaBuildContainer.convert_to_container_dirs(
+            host_paths_to_convert=executable_search_paths,
+            host_to_container_path_mapping={
+                source_dir: container_dirs["source_dir"],
+                manifest_dir: container_dirs["manifest_dir"],
+            },
+        )
+
+        request_json = LambdaBuildContainer.make_request(
+            protocol_version,
+            language,
+            dependency_manager,
+            application_framework,
+            container_dirs,
+            abs_manifest_path.name,
+            runtime,
+            optimizations,
+            options,
+            executable_search_paths,
+            mode,
+            architecture,
+            is_building_layer,
+        )
+
+        try:
+            exit_code = self._exec(
+                LambdaBuildContainer.get_entrypoint(request_json),
+                container_dirs["source_dir"],
+                stdout=stdout,
+                stderr=stderr,
+            )
+            if exit_code in WarmLambdaBuildContainer._EXECUTABLE_NOT_FOUND_EXIT_CODES:
+                raise ContainerExecutableNotFoundException(
+                    "{} executable not found in container".format(self.executable_name)
+                )
+            yield
+        finally:
+            try:
+                self._exec(["rm", "-rf", job_dir], WarmLambdaBuildContainer._CONTAINER_MOUNT_DIR)
+            except docker.errors.APIError as ex:
+                LOG.debug("Unable to remove the build directory %s from the container", job_dir, exc_info=ex)
+
+    def _exec(self, cmd: List[str], working_dir: str, stdout=None, stderr=None) -> int:
+        """
+        Runs the command within the running container, and waits for it to complete
+
+        Returns
+        -------
+        int
+            Exit code of the command
+        """
+        api_client = self.docker_client.api
+        exec_id = api_client.exec_create(self.id, cmd, workdir=working_dir)["Id"]
+        output_itr = api_client.exec_start(exec_id, stream=True, demux=True)
+        self._write_container_output(output_itr, stdout=stdout, stderr=stderr)
+        return int(api_client.exec_inspect(exec_id)["ExitCode"])
+
+    @staticmethod
+    def _get_container_path(mount_path: pathlib.Path, host_path: str) -> Optional[str]:
+        """
+        Returns the path within the container of the given host path, None if it is not in the mounted directory
+        """
+        try:
+            relative_path = pathlib.Path(host_path).resolve().relative_to(mount_path)
+        except ValueError:
+            return None
+        # Path is always inside a Linux container. So '/' is valid
+        return "/".join([WarmLambdaBuildContainer._CONTAINER_MOUNT_DIR, *relative_path.parts])
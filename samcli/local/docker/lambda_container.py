@@ -2,7 +2,7 @@
 Represents Lambda runtime containers.
 """
 import logging
-from typing import List
+from typing import Dict, List
 
 from samcli.local.docker.lambda_debug_settings import LambdaDebugSettings
 from samcli.lib.utils.packagetype import IMAGE
@@ -97,7 +97,10 @@ class LambdaContainer(Container):
         config = LambdaContainer._get_config(lambda_image, image)
         entry, container_env_vars = LambdaContainer._get_debug_settings(runtime, debug_options)
         additional_options = LambdaContainer._get_additional_options(runtime, debug_options)
-        additional_volumes = LambdaContainer._get_additional_volumes(runtime, debug_options)
+        additional_volumes = {
+            **LambdaContainer._get_additional_volumes(runtime, debug_options),
+            **LambdaContainer._get_layers_volumes(lambda_image, packagetype, layers),
+        }
 
         _work_dir = self._WORKING_DIR
         _entrypoint = None
@@ -235,6 +238,27 @@ class LambdaContainer(Container):
         """
         return lambda_image.build(runtime, packagetype, image, layers, architecture, function_name=function_name)
 
+    @staticmethod
+    def _get_layers_volumes(lambda_image: LambdaImage, packagetype: str, layers: List[str]) -> Dict:
+        """
+        Returns the volume which mounts the layers into the container, if they are not built into the image
+
+        Parameters
+        ----------
+        lambda_image : LambdaImage
+            LambdaImage that can be used to build the image needed for starting the container
+        packagetype : str
+            Package type for the lambda function which is either zip or image.
+        layers : List[str]
+            List of layers
+
+        Returns
+        -------
+        dict
+            Dictionary containing volume map passed to container creation.
+        """
+        return lambda_image.get_layers_volumes(packagetype, layers)
+
     @staticmethod
     def _get_config(lambda_image, image):
         return lambda_image.get_config(image)
@@ -1,11 +1,14 @@
 """
 Generates a Docker Image to be used for invoking a function locally
 """
+import os
+import shutil
 import uuid
 import logging
 import hashlib
 from enum import Enum
 from pathlib import Path
+from typing import Dict, List, Optional
 
 import sys
 import platform
@@ -14,9 +17,11 @@ import docker
 from samcli.commands.local.cli_common.user_exceptions import ImageBuildException
 from samcli.commands.local.lib.exceptions import InvalidIntermediateImageError
 from samcli.lib.utils.architecture import has_runtime_multi_arch_image
+from samcli.lib.utils.hash import FILE_HASH_INDEX_FILE_NAME, FileHashIndex, dir_checksum
+from samcli.lib.utils.osutils import link_or_copytree
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.utils.stream_writer import StreamWriter
-from samcli.lib.utils.tar import create_tarball
+from samcli.lib.utils.tar import stream_tarball
 from samcli.local.docker.utils import get_rapid_name, get_docker_platform
 
 from samcli import __version__ as version
@@ -25,6 +30,12 @@ LOG = logging.getLogger(__name__)
 
 RAPID_IMAGE_TAG_PREFIX = "rapid"
 
+# Directory inside the layer cache where the layers of a function are merged to be mounted into the container
+LAYER_MOUNTS_DIR_NAME = "mounts"
+
+# Number of bytes of the build context sent to Docker, for which a progress dot is written
+BUILD_CONTEXT_PROGRESS_STEP = 10 * 1024 * 1024
+
 
 class Runtime(Enum):
     nodejs12x = "nodejs12.x"
@@ -61,7 +72,15 @@ class LambdaImage:
     _SAM_CLI_REPO_NAME = "samcli/lambda"
     _RAPID_SOURCE_PATH = Path(__file__).parent.joinpath("..", "rapid").resolve()
 
-    def __init__(self, layer_downloader, skip_pull_image, force_image_build, docker_client=None, invoke_images=None):
+    def __init__(
+        self,
+        layer_downloader,
+        skip_pull_image,
+        force_image_build,
+        docker_client=None,
+        invoke_images=None,
+        mount_local_layers=False,
+    ):
         """
 
         Parameters
@@ -74,12 +93,19 @@ class LambdaImage:
             True to download the layer and rebuild the image even if it exists already on the system
         docker_client docker.DockerClient
             Optional docker client object
+        invoke_images dict
+            Optional. Images to be used for invoking the functions, keyed by the function name
+        mount_local_layers bool
+            Optional. True to mount the layers into the container at /opt, instead of building an image with them,
+            when any of the layers is defined in the template
         """
         self.layer_downloader = layer_downloader
         self.skip_pull_image = skip_pull_image
         self.force_image_build = force_image_build
         self.docker_client = docker_client or docker.from_env()
         self.invoke_images = invoke_images
+        self.mount_local_layers = mount_local_layers
+        self._hash_index: Optional[FileHashIndex] = None
 
     def build(self, runtime, packagetype, image, layers, architecture, stream=None, function_name=None):
         """
@@ -135,8 +161,12 @@ class LambdaImage:
         if layers and packagetype == ZIP:
             downloaded_layers = self.layer_downloader.download_all(layers, self.force_image_build)
 
-            docker_image_version = self._generate_docker_image_version(downloaded_layers, runtime, architecture)
-            image_tag = f"{self._SAM_CLI_REPO_NAME}:{docker_image_version}"
+            if self._should_mount_layers(downloaded_layers):
+                # layers are mounted into the container (see get_layers_volumes), so the image doesn't contain them
+                downloaded_layers = []
+            else:
+                docker_image_version = self._generate_docker_image_version(downloaded_layers, runtime, architecture)
+                image_tag = f"{self._SAM_CLI_REPO_NAME}:{docker_image_version}"
 
         image_not_found = False
 
@@ -151,12 +181,17 @@ class LambdaImage:
         if image_not_found and image_tag == f"{image_repo}:{RAPID_IMAGE_TAG_PREFIX}-{version}-{architecture}":
             self._remove_rapid_images(image_repo)
 
-        if (
-            self.force_image_build
-            or image_not_found
-            or any(layer.is_defined_within_template for layer in downloaded_layers)
-            or not runtime
-        ):
+        # The tag of an image with layers contains the checksum of the layers defined in the template, so that the
+        # image is rebuilt only when their contents change. If it changed, the images of the earlier contents are
+        # not used anymore.
+        if image_not_found and any(layer.is_defined_within_template for layer in downloaded_layers):
+            outdated_prefix = (
+                f"{self._SAM_CLI_REPO_NAME}:"
+                f"{self._generate_layers_image_prefix(downloaded_layers, runtime, architecture)}-"
+            )
+            self._remove_outdated_layer_images(image_tag, outdated_prefix)
+
+        if self.force_image_build or image_not_found or not runtime:
             stream_writer = stream or StreamWriter(sys.stderr)
             stream_writer.write("Building image...")
             stream_writer.flush()
@@ -174,8 +209,75 @@ class LambdaImage:
         except docker.errors.ImageNotFound:
             return config
 
-    @staticmethod
-    def _generate_docker_image_version(layers, runtime, architecture):
+    def get_layers_volumes(self, packagetype: str, layers: List) -> Dict[str, Dict[str, str]]:
+        """
+        Returns the volume which mounts the layers at /opt of the container, if the layers are not built into the
+        image. A single layer is mounted directly, so its changes are visible to the container immediately. Multiple
+        layers are merged into a directory in the layer cache first, which is reused while their contents don't
+        change.
+
+        Parameters
+        ----------
+        packagetype : str
+            Packagetype for the Lambda
+        layers : list(samcli.commands.local.lib.provider.Layer)
+            List of layers
+
+        Returns
+        -------
+        dict
+            Volume to be mounted into the container, empty if the layers are built into the image
+        """
+        if not layers or packagetype != ZIP or not self.mount_local_layers:
+            return {}
+
+        downloaded_layers = self.layer_downloader.download_all(layers, self.force_image_build)
+        if not self._should_mount_layers(downloaded_layers):
+            return {}
+
+        if len(downloaded_layers) == 1:
+            layers_dir = downloaded_layers[0].codeuri
+        else:
+            layers_dir = self._merge_layers(downloaded_layers)
+        return {layers_dir: {"bind": self._LAYERS_DIR, "mode": "ro"}}
+
+    def _should_mount_layers(self, downloaded_layers: List) -> bool:
+        """
+        Layers are mounted, if it is enabled and at least one of them is defined in the template. Layers which are
+        not directories (e.g. zip files) can't be mounted, so they are built into the image.
+        """
+        return (
+            self.mount_local_layers
+            and any(layer.is_defined_within_template for layer in downloaded_layers)
+            and all(os.path.isdir(layer.codeuri) for layer in downloaded_layers)
+        )
+
+    def _merge_layers(self, downloaded_layers: List) -> str:
+        """
+        Merges the layers in the given order into a directory named after their checksum, like they are added into
+        /opt of an image. Files are linked instead of copied when the file system allows it. Merged directories are
+        not removed when the layers change, since they may still be mounted by running containers.
+        """
+        mounts_dir = Path(self.layer_downloader.layer_cache, LAYER_MOUNTS_DIR_NAME)
+        layers_dir = mounts_dir.joinpath(self._generate_docker_image_version(downloaded_layers, "layers", "merged"))
+        if layers_dir.is_dir():
+            return str(layers_dir)
+
+        LOG.debug("Merging layers into %s", layers_dir)
+        temp_dir = mounts_dir.joinpath(f"{layers_dir.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            for layer in downloaded_layers:
+                link_or_copytree(layer.codeuri, str(temp_dir))
+            os.replace(temp_dir, layers_dir)
+        except OSError:
+            if not layers_dir.is_dir():
+                raise
+            # merged by another container at the same time
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        return str(layers_dir)
+
+    def _generate_docker_image_version(self, layers, runtime, architecture):
         """
         Generate the Docker TAG that will be used to create the image
 
@@ -201,14 +303,51 @@ class LambdaImage:
         # specified in the template. This will allow reuse of the runtime and layers across different
         # functions that are defined. If two functions use the same runtime with the same layers (in the
         # same order), SAM CLI will only produce one image and use this image across both functions for invoke.
+        # Downloaded layers never change for a given name (which contains their version), but the layers defined in
+        # the template do, so the checksum of their contents is added to the TAG.
 
-        return (
+        docker_image_version = self._generate_layers_image_prefix(layers, runtime, architecture)
+        local_layers = [layer for layer in layers if layer.is_defined_within_template]
+        if local_layers:
+            docker_image_version += "-" + self._get_layers_checksum(local_layers)[0:16]
+        return docker_image_version
+
+    @staticmethod
+    def _generate_layers_image_prefix(layers: List, runtime: str, architecture: str) -> str:
+        """
+        Generates the part of the Docker TAG which doesn't depend on the contents of the layers. The paths of the
+        layers defined in the template are part of it, so that the same layers of different projects (or different
+        copies of a project) don't share the prefix.
+        """
+        prefix = (
             runtime
             + "-"
             + architecture
             + "-"
             + hashlib.sha256("-".join([layer.name for layer in layers]).encode("utf-8")).hexdigest()[0:25]
         )
+        local_layers = [layer for layer in layers if layer.is_defined_within_template]
+        if local_layers:
+            layer_paths = "-".join([os.path.abspath(layer.codeuri) for layer in local_layers])
+            prefix += "-" + hashlib.sha256(layer_paths.encode("utf-8")).hexdigest()[0:16]
+        return prefix
+
+    def _get_layers_checksum(self, layers: List) -> str:
+        """
+        Returns the checksum of the contents of the given layers. Files which are not changed since the last time
+        they are hashed are not read again.
+        """
+        if self._hash_index is None:
+            self._hash_index = FileHashIndex(os.path.join(self.layer_downloader.layer_cache, FILE_HASH_INDEX_FILE_NAME))
+
+        checksums = []
+        for layer in layers:
+            if os.path.isdir(layer.codeuri):
+                checksums.append(dir_checksum(layer.codeuri, hash_index=self._hash_index))
+            else:
+                checksums.append(self._hash_index.file_checksum(layer.codeuri))
+        self._hash_index.save()
+        return hashlib.sha256("-".join(checksums).encode("utf-8")).hexdigest()
 
     def _build_image(self, base_image, docker_tag, layers, architecture, stream=None):
         """
@@ -258,29 +397,44 @@ class LambdaImage:
             # Set only on Windows, unix systems will preserve the host permission into the tarball
             tar_filter = set_item_permission if platform.system().lower() == "windows" else None
 
-            with create_tarball(tar_paths, tar_filter=tar_filter) as tarballfile:
-                try:
-                    resp_stream = self.docker_client.api.build(
-                        fileobj=tarballfile,
-                        custom_context=True,
-                        rm=True,
-                        tag=docker_tag,
-                        pull=not self.skip_pull_image,
-                        decode=True,
-                        platform=get_docker_platform(architecture),
-                    )
-                    for log in resp_stream:
-                        stream_writer.write(".")
-                        stream_writer.flush()
-                        if "error" in log:
-                            stream_writer.write("\n")
-                            LOG.exception("Failed to build Docker Image")
-                            raise ImageBuildException("Error building docker image: {}".format(log["error"]))
-                    stream_writer.write("\n")
-                except (docker.errors.BuildError, docker.errors.APIError) as ex:
-                    stream_writer.write("\n")
-                    LOG.exception("Failed to build Docker Image")
-                    raise ImageBuildException("Building Image failed.") from ex
+            # The build context is generated while Docker reads it, instead of writing it into a temporary file
+            # first. A dot is written for every BUILD_CONTEXT_PROGRESS_STEP bytes sent, so that sending a large
+            # context doesn't look stuck.
+            reported_bytes = 0
+
+            def report_progress(sent_bytes):
+                nonlocal reported_bytes
+                while sent_bytes - reported_bytes >= BUILD_CONTEXT_PROGRESS_STEP:
+                    reported_bytes += BUILD_CONTEXT_PROGRESS_STEP
+                    stream_writer.write(".")
+                    stream_writer.flush()
+
+            build_context = stream_tarball(tar_paths, tar_filter=tar_filter, progress_callback=report_progress)
+            try:
+                resp_stream = self.docker_client.api.build(
+                    fileobj=build_context,
+                    custom_context=True,
+                    rm=True,
+                    tag=docker_tag,
+                    pull=not self.skip_pull_image,
+                    decode=True,
+                    platform=get_docker_platform(architecture),
+                )
+                for log in resp_stream:
+                    stream_writer.write(".")
+                    stream_writer.flush()
+                    if "error" in log:
+                        stream_writer.write("\n")
+                        LOG.exception("Failed to build Docker Image")
+                        raise ImageBuildException("Error building docker image: {}".format(log["error"]))
+                stream_writer.write("\n")
+            except (docker.errors.BuildError, docker.errors.APIError) as ex:
+                stream_writer.write("\n")
+                LOG.exception("Failed to build Docker Image")
+                raise ImageBuildException("Building Image failed.") from ex
+            finally:
+                # closes the files of the build context, if Docker stopped reading it
+                build_context.close()
         finally:
             if full_dockerfile_path.exists():
                 full_dockerfile_path.unlink()
@@ -320,6 +474,29 @@ class LambdaImage:
             dockerfile_content = dockerfile_content + f"ADD {layer.name} {LambdaImage._LAYERS_DIR}\n"
         return dockerfile_content
 
+    def _remove_outdated_layer_images(self, image_tag: str, outdated_prefix: str) -> None:
+        """
+        Remove the images of the same runtime and layers which are built for the earlier contents of the layers
+
+        Parameters
+        ----------
+        image_tag string
+            Image (REPOSITORY:TAG) which is going to be built
+        outdated_prefix string
+            Prefix (REPOSITORY:TAG) of the images of the same layers, see _generate_layers_image_prefix
+        """
+        try:
+            for image in self.docker_client.images.list(name=self._SAM_CLI_REPO_NAME):
+                if any(tag.startswith(outdated_prefix) and tag != image_tag for tag in image.tags):
+                    LOG.debug("Removing image %s of the earlier contents of the layers", image.tags)
+                    try:
+                        self.docker_client.images.remove(image.id)
+                    except docker.errors.APIError as ex:
+                        # it is still used by a container
+                        LOG.debug("Failed to remove image with ID: %s", image.id, exc_info=ex)
+        except docker.errors.APIError as ex:
+            LOG.debug("Failed getting images from repo %s", self._SAM_CLI_REPO_NAME, exc_info=ex)
+
     def _remove_rapid_images(self, repo: str) -> None:
         """
         Remove all rapid images for given repo
@@ -10,6 +10,7 @@ import threading
 import docker
 
 from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.lib.utils.profiling import CATEGORY_DOCKER, profiled
 from samcli.local.docker import utils
 from samcli.local.docker.container import Container
 from samcli.local.docker.lambda_image import LambdaImage
@@ -126,6 +127,7 @@ class ContainerManager:
             container.stop()
         container.delete()
 
+    @profiled(CATEGORY_DOCKER, "docker_pull_image")
     def pull_image(self, image_name, tag=None, stream=None):
         """
         Ask Docker to pull the container image with given name.
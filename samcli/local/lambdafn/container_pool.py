@@ -0,0 +1,200 @@
+"""
+Pool of warm containers of a single Lambda function
+"""
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from samcli.local.docker.container import Container
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 1
+
+
+class WarmContainerPool:
+    """
+    Keeps the warm containers of a single Lambda function. A container is checked out from the pool for the duration
+    of an invocation and returned back to the pool once the invocation is done, so concurrent invocations of the same
+    function never share a container. New containers are created on demand until the pool reaches its maximum size,
+    after which invocations wait for a container to be returned.
+
+    Idle containers above the minimum size are evicted once they have not been used for idle_timeout seconds.
+    Eviction is done lazily, whenever a container is checked out or returned back to the pool.
+    """
+
+    def __init__(
+        self,
+        min_size: int = DEFAULT_POOL_MIN_SIZE,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        idle_timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        min_size : int
+            Number of containers which are kept in the pool even if they are idle
+        max_size : int
+            Maximum number of containers that can be created for the function
+        idle_timeout : Optional[int]
+            Number of seconds after which an idle container above min_size is evicted, never evicted if not given
+        """
+        self.max_size = max(max_size, 1)
+        self.min_size = min(max(min_size, 0), self.max_size)
+        self.idle_timeout = idle_timeout
+        # idle containers with the time they were returned back to the pool, the most recently used one is at the end
+        self._idle: List[Tuple[Container, float]] = []
+        self._busy: List[Container] = []
+        self._creating = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of the containers in the pool, including the ones which are being created
+        """
+        with self._condition:
+            return len(self._idle) + len(self._busy) + self._creating
+
+    def get_containers(self) -> List[Container]:
+        """
+        Returns all containers in the pool, both idle and checked out ones
+        """
+        with self._condition:
+            return [container for container, _ in self._idle] + list(self._busy)
+
+    def get_idle_container(self) -> Optional[Container]:
+        """
+        Returns the most recently used idle container without checking it out, None if there is no idle container
+        """
+        with self._condition:
+            return self._idle[-1][0] if self._idle else None
+
+    def add(self, container: Container) -> None:
+        """
+        Adds a new container into the pool as an idle container
+        """
+        with self._condition:
+            self._idle.append((container, time.monotonic()))
+            self._condition.notify()
+
+    def remove(self, container: Container) -> None:
+        """
+        Removes an idle container from the pool, e.g. if its underlying Docker container does not exist anymore
+        """
+        with self._condition:
+            self._idle = [(idle_container, used) for idle_container, used in self._idle if idle_container != container]
+
+    def checkout(self, create_container: Callable[[], Container]) -> Tuple[Optional[Container], List[Container]]:
+        """
+        Checks out an idle container from the pool. If there is no idle container, creates a new one using
+        create_container if the pool has not reached its maximum size, otherwise waits for a container to be returned.
+        If the pool is cleared while waiting, no container is returned and the caller should use a new pool.
+
+        Parameters
+        ----------
+        create_container : Callable[[], Container]
+            Function which creates a new container for the pool
+
+        Returns
+        -------
+        Tuple[Optional[Container], List[Container]]
+            The checked out container, and the list of idle containers which are evicted from the pool and should
+            be stopped by the caller
+        """
+        with self._condition:
+            evicted = self._evict_idle_containers()
+            while True:
+                if self._closed:
+                    return None, evicted
+                if self._idle:
+                    container, _ = self._idle.pop()
+                    self._busy.append(container)
+                    return container, evicted
+                if len(self._busy) + self._creating < self.max_size:
+                    self._creating += 1
+                    break
+                LOG.debug("All %d warm containers are busy, waiting for one to be available", self.max_size)
+                self._condition.wait()
+
+        try:
+            container = create_container()
+        except BaseException:
+            with self._condition:
+                self._creating -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._creating -= 1
+            # container which is created after the pool is cleared is not kept, it is owned by the caller
+            if not self._closed:
+                self._busy.append(container)
+        return container, evicted
+
+    def release(self, container: Container) -> Tuple[bool, List[Container]]:
+        """
+        Returns a checked out container back to the pool.
+
+        Returns
+        -------
+        Tuple[bool, List[Container]]
+            Whether the container is owned by this pool, and the list of idle containers which are evicted from the
+            pool and should be stopped by the caller
+        """
+        with self._condition:
+            is_owned = container in self._busy
+            if is_owned:
+                self._busy.remove(container)
+                self._idle.append((container, time.monotonic()))
+                self._condition.notify()
+            return is_owned, self._evict_idle_containers()
+
+    def discard(self, container: Container) -> bool:
+        """
+        Removes a checked out container from the pool instead of returning it back, e.g. if it is not usable anymore.
+        A new container is created in its place when it is needed.
+
+        Returns
+        -------
+        bool
+            Whether the container is owned by this pool
+        """
+        with self._condition:
+            is_owned = container in self._busy
+            if is_owned:
+                self._busy.remove(container)
+                self._condition.notify()
+            return is_owned
+
+    def clear(self) -> List[Container]:
+        """
+        Removes all containers from the pool and returns them, so that they can be stopped by the caller.
+        The pool can't be used anymore after it is cleared.
+        """
+        with self._condition:
+            containers = [container for container, _ in self._idle] + list(self._busy)
+            self._idle = []
+            self._busy = []
+            self._closed = True
+            self._condition.notify_all()
+            return containers
+
+    def _evict_idle_containers(self) -> List[Container]:
+        """
+        Removes the idle containers above min_size which have not been used for idle_timeout seconds.
+        Must be called while holding the lock of the pool.
+        """
+        if self.idle_timeout is None:
+            return []
+
+        evicted = []
+        expire_before = time.monotonic() - self.idle_timeout
+        # least recently used containers are at the beginning of the idle list
+        while self._idle and len(self._idle) + len(self._busy) > self.min_size and self._idle[0][1] < expire_before:
+            container, _ = self._idle.pop(0)
+            evicted.append(container)
+        return evicted
@@ -11,6 +11,7 @@ import threading
 from typing import Optional, Union, Dict
 
 from samcli.local.docker.lambda_container import LambdaContainer
+from samcli.local.lambdafn.container_pool import WarmContainerPool, DEFAULT_POOL_MIN_SIZE, DEFAULT_POOL_MAX_SIZE
 from samcli.lib.utils.file_observer import LambdaFunctionObserver
 from samcli.lib.utils.packagetype import ZIP
 from samcli.lib.telemetry.metric import capture_parameter
@@ -174,7 +175,9 @@ class LambdaRuntime:
         container = None
         try:
             # Start the container. This call returns immediately after the container starts
-            container = self.create(function_config, debug_context, container_host, container_host_interface)
+            container = self._checkout_container(
+                function_config, debug_context, container_host, container_host_interface
+            )
             container = self.run(container, function_config, debug_context)
             # Setup appropriate interrupt - timeout or Ctrl+C - before function starts executing and
             # get callback function to start timeout timer
@@ -201,6 +204,29 @@ class LambdaRuntime:
             # Any case, cleanup the container.
             self._on_invoke_done(container)
 
+    def _checkout_container(self, function_config, debug_context, container_host, container_host_interface):
+        """
+        Returns the container which will be used exclusively by a single invocation of the given function,
+        until the invocation is done (see _on_invoke_done). A new container is created for each invocation.
+
+        Parameters
+        ----------
+        function_config FunctionConfig
+            Configuration of the function to be invoked
+        debug_context DebugContext
+            Debugging context for the function (includes port, args, and path)
+        container_host string
+            Host of locally emulated Lambda container
+        container_host_interface string
+            Interface that Docker host binds ports to
+
+        Returns
+        -------
+        Container
+            the created container
+        """
+        return self.create(function_config, debug_context, container_host, container_host_interface)
+
     def _on_invoke_done(self, container):
         """
         Cleanup the created resources, just before the invoke function ends
@@ -319,7 +345,14 @@ class WarmLambdaRuntime(LambdaRuntime):
     warm containers life cycle.
     """
 
-    def __init__(self, container_manager, image_builder):
+    def __init__(
+        self,
+        container_manager,
+        image_builder,
+        pool_min_size=DEFAULT_POOL_MIN_SIZE,
+        pool_max_size=DEFAULT_POOL_MAX_SIZE,
+        pool_idle_timeout=None,
+    ):
         """
         Initialize the Local Lambda runtime
 
@@ -329,11 +362,21 @@ class WarmLambdaRuntime(LambdaRuntime):
             Instance of the ContainerManager class that can run a local Docker container
         image_builder samcli.local.docker.lambda_image.LambdaImage
             Instance of the LambdaImage class that can create am image
-        warm_containers bool
-            Determines if the warm containers is enabled or not.
+        pool_min_size int
+            Number of warm containers which are kept for each function, even if they are idle
+        pool_max_size int
+            Maximum number of warm containers for each function, which is the number of concurrent invocations
+            that a function can serve
+        pool_idle_timeout int
+            Number of seconds after which an idle warm container above pool_min_size is terminated.
+            Idle containers are never terminated if it is not given
         """
         self._function_configs = {}
-        self._containers = {}
+        self._container_pools: Dict[str, WarmContainerPool] = {}
+        self._pool_min_size = pool_min_size
+        self._pool_max_size = pool_max_size
+        self._pool_idle_timeout = pool_idle_timeout
+        self._lock = threading.RLock()
 
         self._observer = LambdaFunctionObserver(self._on_code_change)
 
@@ -341,9 +384,10 @@ class WarmLambdaRuntime(LambdaRuntime):
 
     def create(self, function_config, debug_context=None, container_host=None, container_host_interface=None):
         """
-        Create a new Container for the passed function, then store it in a dictionary using the function name,
-        so it can be retrieved later and used in the other functions. Make sure to use the debug_context only
-        if the function_config.name equals debug_context.debug-function or the warm_containers option is disabled
+        Returns an idle warm container of the passed function if there is any, otherwise creates a new Container
+        for it and adds it into the container pool of the function, so it can be retrieved later and used in the
+        other functions. Make sure to use the debug_context only if the function_config.name equals
+        debug_context.debug-function or the warm_containers option is disabled
 
         Parameters
         ----------
@@ -361,25 +405,153 @@ class WarmLambdaRuntime(LambdaRuntime):
         Container
             the created container
         """
+        pool = self._get_container_pool(function_config, debug_context)
 
         # reuse the cached container if it is created, and if the function configuration is not changed
-        exist_function_config = self._function_configs.get(function_config.full_path, None)
-        container = self._containers.get(function_config.full_path, None)
-        if exist_function_config and _require_container_reloading(exist_function_config, function_config):
+        container = pool.get_idle_container()
+        if container:
+            if container.is_created():
+                LOG.info("Reuse the created warm container for Lambda function '%s'", function_config.full_path)
+                return container
+            pool.remove(container)
+
+        container = self._create_container(function_config, debug_context, container_host, container_host_interface)
+        pool.add(container)
+        return container
+
+    def run(self, container, function_config, debug_context, container_host=None, container_host_interface=None):
+        """
+        Runs the given container. If no container is given, the container pool of the function is warmed up;
+        containers are created and run until the pool has its minimum number of containers.
+
+        Parameters
+        ----------
+        container Container
+            the created container to be run
+        function_config FunctionConfig
+            Configuration of the function to run its created container.
+        debug_context DebugContext
+            Debugging context for the function (includes port, args, and path)
+        container_host string
+            Host of locally emulated Lambda container
+        container_host_interface string
+            Optional. Interface that Docker host binds ports to
+
+        Returns
+        -------
+        Container
+            the running container
+        """
+        if container:
+            return super().run(container, function_config, debug_context, container_host, container_host_interface)
+
+        pool = self._get_container_pool(function_config, debug_context)
+        container = super().run(None, function_config, debug_context, container_host, container_host_interface)
+        while pool.size < pool.min_size:
+            container = self._create_container(function_config, debug_context, container_host, container_host_interface)
+            pool.add(container)
+            container = super().run(container, function_config, debug_context, container_host, container_host_interface)
+        return container
+
+    def _checkout_container(self, function_config, debug_context, container_host, container_host_interface):
+        """
+        Checks out a warm container from the container pool of the function, which will be returned back to the
+        pool when the invocation is done. A new container is created if all containers of the function are busy,
+        until the pool reaches its maximum size. Then the invocation waits for a container to be available.
+        An idle container whose underlying Docker container does not exist anymore is discarded from the pool.
+
+        Parameters
+        ----------
+        function_config FunctionConfig
+            Configuration of the function to be invoked
+        debug_context DebugContext
+            Debugging context for the function (includes port, args, and path)
+        container_host string
+            Host of locally emulated Lambda container
+        container_host_interface string
+            Interface that Docker host binds ports to
+
+        Returns
+        -------
+        Container
+            the checked out container
+        """
+        created_containers = []
+
+        def create_container():
+            container = self._create_container(function_config, debug_context, container_host, container_host_interface)
+            created_containers.append(container)
+            return container
+
+        while True:
+            pool = self._get_container_pool(function_config, debug_context)
+            container, evicted_containers = pool.checkout(create_container)
+            self._stop_evicted_containers(function_config.full_path, evicted_containers)
+            if not container:
+                # the pool is terminated while waiting for a container, because of a change in the function
+                LOG.debug("Container pool of Lambda function '%s' is terminated, retrying", function_config.full_path)
+                continue
+            if created_containers or container.is_created():
+                return container
+            # the idle container is removed outside of SAM CLI, e.g. by docker rm or a restart of the docker daemon
             LOG.info(
-                "Lambda Function '%s' definition has been changed in the stack template, "
-                "terminate the created warm container.",
+                "Warm container of Lambda function '%s' does not exist anymore, create a new one",
                 function_config.full_path,
             )
-            self._function_configs.pop(exist_function_config.full_path, None)
-            if container:
-                self._container_manager.stop(container)
-                self._containers.pop(exist_function_config.full_path, None)
-            self._observer.unwatch(exist_function_config)
-        elif container and container.is_created():
-            LOG.info("Reuse the created warm container for Lambda function '%s'", function_config.full_path)
-            return container
+            pool.discard(container)
+
+    def _get_container_pool(self, function_config, debug_context):
+        """
+        Returns the container pool of the given function, creates a new one if the function does not have a pool yet
+        or if its definition has been changed in the stack template.
+
+        Parameters
+        ----------
+        function_config FunctionConfig
+            Configuration of the function
+        debug_context DebugContext
+            Debugging context for the function (includes port, args, and path)
 
+        Returns
+        -------
+        WarmContainerPool
+            the container pool of the function
+        """
+        with self._lock:
+            exist_function_config = self._function_configs.get(function_config.full_path, None)
+            if exist_function_config and _require_container_reloading(exist_function_config, function_config):
+                LOG.info(
+                    "Lambda Function '%s' definition has been changed in the stack template, "
+                    "terminate the created warm container.",
+                    function_config.full_path,
+                )
+                self._function_configs.pop(exist_function_config.full_path, None)
+                pool = self._container_pools.pop(exist_function_config.full_path, None)
+                if pool:
+                    for container in pool.clear():
+                        self._container_manager.stop(container)
+                self._observer.unwatch(exist_function_config)
+
+            pool = self._container_pools.get(function_config.full_path, None)
+            if pool:
+                return pool
+
+            # debugger port can't be shared between containers, so function being debugged can have only one container
+            is_debugging = bool(debug_context and debug_context.debug_function == function_config.name)
+            max_size = 1 if is_debugging else self._pool_max_size
+            pool = WarmContainerPool(self._pool_min_size, max_size, self._pool_idle_timeout)
+
+            self._observer.watch(function_config)
+            self._observer.start()
+
+            self._function_configs[function_config.full_path] = function_config
+            self._container_pools[function_config.full_path] = pool
+            return pool
+
+    def _create_container(self, function_config, debug_context, container_host, container_host_interface):
+        """
+        Creates a new container for the passed function, see LambdaRuntime.create
+        """
         # debug_context should be used only if the function name is the one defined
         # in debug-function option
         if debug_context and debug_context.debug_function != function_config.name:
@@ -390,26 +562,41 @@ class WarmLambdaRuntime(LambdaRuntime):
             )
             debug_context = None
 
-        self._observer.watch(function_config)
-        self._observer.start()
-
-        container = super().create(function_config, debug_context, container_host, container_host_interface)
-        self._function_configs[function_config.full_path] = function_config
-        self._containers[function_config.full_path] = container
+        return super().create(function_config, debug_context, container_host, container_host_interface)
 
-        return container
+    def _stop_evicted_containers(self, function_full_path, containers):
+        """
+        Stops the idle containers which are evicted from the container pool of the given function
+        """
+        for container in containers:
+            LOG.info("Terminate idle warm container of Lambda function '%s'", function_full_path)
+            self._container_manager.stop(container)
 
     def _on_invoke_done(self, container):
         """
         Cleanup the created resources, just before the invoke function ends.
-        In warm containers, the running containers will be closed just before the end of te command execution,
-        so no action is done here
+        In warm containers, the container is returned back to its pool to be used by the next invocations, the
+        running containers will be closed just before the end of te command execution.
 
         Parameters
         ----------
         container: Container
            The current running container
         """
+        if not container:
+            return
+
+        with self._lock:
+            pools = list(self._container_pools.items())
+        is_owned = False
+        for function_full_path, pool in pools:
+            is_released, evicted_containers = pool.release(container)
+            is_owned = is_owned or is_released
+            self._stop_evicted_containers(function_full_path, evicted_containers)
+
+        if not is_owned:
+            # the pool of the container is terminated during the invocation, because of a change in the function
+            self._container_manager.stop(container)
 
     def _configure_interrupt(self, function_full_path, timeout, container, is_debugging):
         """
@@ -461,9 +648,13 @@ class WarmLambdaRuntime(LambdaRuntime):
         Clean the running containers, the decompressed code dirs, and stop the created observer
         """
         LOG.debug("Terminating all running warm containers")
-        for function_name, container in self._containers.items():
-            LOG.debug("Terminate running warm container for Lambda Function '%s'", function_name)
-            self._container_manager.stop(container)
+        with self._lock:
+            container_pools = self._container_pools
+            self._container_pools = {}
+        for function_name, pool in container_pools.items():
+            for container in pool.clear():
+                LOG.debug("Terminate running warm container for Lambda Function '%s'", function_name)
+                self._container_manager.stop(container)
         self._clean_decompressed_paths()
         self._observer.stop()
 
@@ -486,12 +677,13 @@ class WarmLambdaRuntime(LambdaRuntime):
                 function_full_path,
                 resource,
             )
-            self._observer.unwatch(function_config)
-            self._function_configs.pop(function_full_path, None)
-            container = self._containers.get(function_full_path, None)
-            if container:
-                self._container_manager.stop(container)
-                self._containers.pop(function_full_path, None)
+            with self._lock:
+                self._observer.unwatch(function_config)
+                self._function_configs.pop(function_full_path, None)
+                pool = self._container_pools.pop(function_full_path, None)
+            if pool:
+                for container in pool.clear():
+                    self._container_manager.stop(container)
 
 
 def _unzip_file(filepath):
@@ -3,6 +3,8 @@ Helper methods to unzip an archive preserving the file permissions. Python's zip
 this feature natively (https://bugs.python.org/issue15795).
 """
 
+import base64
+import hashlib
 import os
 import logging
 import zipfile
@@ -148,7 +150,7 @@ def _set_permissions(zip_file_info, extracted_path):
     os.chmod(extracted_path, permission)
 
 
-def unzip_from_uri(uri, layer_zip_path, unzip_output_dir, progressbar_label):
+def unzip_from_uri(uri, layer_zip_path, unzip_output_dir, progressbar_label=None):
     """
     Download the LayerVersion Zip to the Layer Pkg Cache
 
@@ -161,27 +163,53 @@ def unzip_from_uri(uri, layer_zip_path, unzip_output_dir, progressbar_label):
     unzip_output_dir str
         Path to unzip the zip to
     progressbar_label str
-        Label to use in the Progressbar
+        Label to use in the Progressbar, the progressbar is not shown if it is not given
+
+    Returns
+    -------
+    str
+        Base64 encoded SHA256 of the downloaded zip, in the same format as the CodeSha256 of a LayerVersion
     """
     try:
         get_request = requests.get(uri, stream=True, verify=os.environ.get("AWS_CA_BUNDLE", True))
+        sha256 = hashlib.sha256()
 
         with open(layer_zip_path, "wb") as local_layer_file:
             file_length = int(get_request.headers["Content-length"])
 
-            with progressbar(file_length, progressbar_label) as p_bar:
+            with _optional_progressbar(file_length, progressbar_label) as p_bar:
                 # Set the chunk size to None. Since we are streaming the request, None will allow the data to be
                 # read as it arrives in whatever size the chunks are received.
                 for data in get_request.iter_content(chunk_size=None):
                     local_layer_file.write(data)
+                    sha256.update(data)
                     p_bar.update(len(data))
 
         # Forcefully set the permissions to 700 on files and directories. This is to ensure the owner
         # of the files is the only one that can read, write, or execute the files.
         unzip(layer_zip_path, unzip_output_dir, permission=0o700)
 
+        return base64.b64encode(sha256.digest()).decode("utf-8")
+
     finally:
         # Remove the downloaded zip file
         path_to_layer = Path(layer_zip_path)
         if path_to_layer.exists():
             path_to_layer.unlink()
+
+
+class _NoProgressbar:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def update(self, _):
+        pass
+
+
+def _optional_progressbar(length, label):
+    if label is None:
+        return _NoProgressbar()
+    return progressbar(length, label)
@@ -3,6 +3,11 @@ Downloads Layers locally
 """
 
 import logging
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -11,12 +16,26 @@ from botocore.exceptions import NoCredentialsError, ClientError
 
 from samcli.lib.providers.provider import Stack, LayerVersion
 from samcli.lib.utils.codeuri import resolve_code_path
+from samcli.lib.utils.osutils import file_lock, rmtree_callback
 from samcli.local.lambdafn.zip import unzip_from_uri
-from samcli.commands.local.cli_common.user_exceptions import CredentialsRequired, ResourceNotFound
+from samcli.commands.local.cli_common.user_exceptions import (
+    CredentialsRequired,
+    LayerChecksumMismatch,
+    ResourceNotFound,
+)
 
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of layers which are downloaded and extracted at the same time
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Suffix of the file next to a cached layer, which holds the CodeSha256 of the zip it is extracted from
+LAYER_CHECKSUM_FILE_SUFFIX = ".sha256"
+
+# Suffix of the file next to a cached layer, which is locked while the layer is downloaded
+LAYER_LOCK_FILE_SUFFIX = ".lock"
+
 
 class LayerDownloader:
     def __init__(self, layer_cache, cwd, stacks: List[Stack], lambda_client=None):
@@ -37,11 +56,14 @@ class LayerDownloader:
         self.cwd = cwd
         self._stacks = stacks
         self._lambda_client = lambda_client
+        # layers are downloaded concurrently, and creating clients from the default boto3 session is not thread safe
+        self._lambda_client_lock = threading.Lock()
 
     @property
     def lambda_client(self):
-        self._lambda_client = self._lambda_client or boto3.client("lambda")
-        return self._lambda_client
+        with self._lambda_client_lock:
+            self._lambda_client = self._lambda_client or boto3.client("lambda")
+            return self._lambda_client
 
     @property
     def layer_cache(self):
@@ -58,7 +80,8 @@ class LayerDownloader:
 
     def download_all(self, layers, force=False):
         """
-        Download a list of layers to the cache
+        Download a list of layers to the cache. Layers are downloaded and extracted at the same time, up to
+        MAX_CONCURRENT_DOWNLOADS of them.
 
         Parameters
         ----------
@@ -72,22 +95,29 @@ class LayerDownloader:
         List(Path)
             List of Paths to where the layer was cached
         """
-        layer_dirs = []
-        for layer in layers:
-            layer_dirs.append(self.download(layer, force))
+        if len(layers) <= 1:
+            return [self.download(layer, force) for layer in layers]
 
-        return layer_dirs
+        # Progress bars of the concurrent downloads would be mixed up on the terminal, so they are not shown
+        with ThreadPoolExecutor(max_workers=min(len(layers), MAX_CONCURRENT_DOWNLOADS)) as executor:
+            return list(executor.map(lambda layer: self.download(layer, force, show_progress=False), layers))
 
-    def download(self, layer: LayerVersion, force=False) -> LayerVersion:
+    def download(self, layer: LayerVersion, force=False, show_progress=True) -> LayerVersion:
         """
         Download a given layer to the local cache.
 
+        The layer is downloaded while holding a lock on it, so that other SAM CLI processes sharing the cache wait
+        for it instead of downloading the same layer, and it is moved into the cache only after it is extracted
+        and its zip is verified against the CodeSha256 of the LayerVersion.
+
         Parameters
         ----------
         layer samcli.commands.local.lib.provider.Layer
             Layer representing the layer to be downloaded.
         force bool
             True to download the layer even if it exists already on the system
+        show_progress bool
+            True to show a progress bar while the layer is downloaded
 
         Returns
         -------
@@ -100,27 +130,59 @@ class LayerDownloader:
             return layer
 
         layer_path = Path(self.layer_cache).resolve().joinpath(layer.name)
-        is_layer_downloaded = self._is_layer_cached(layer_path)
         layer.codeuri = str(layer_path)
 
-        if is_layer_downloaded and not force:
+        if self._is_layer_cached(layer_path) and not force:
             LOG.info("%s is already cached. Skipping download", layer.arn)
             return layer
 
-        layer_zip_path = layer.codeuri + ".zip"
-        layer_zip_uri = self._fetch_layer_uri(layer)
-        unzip_from_uri(
-            layer_zip_uri,
-            layer_zip_path,
-            unzip_output_dir=layer.codeuri,
-            progressbar_label="Downloading {}".format(layer.layer_arn),
-        )
+        with file_lock(layer.codeuri + LAYER_LOCK_FILE_SUFFIX):
+            # it might be downloaded by another process while waiting for the lock
+            if self._is_layer_cached(layer_path) and not force:
+                LOG.info("%s is already cached. Skipping download", layer.arn)
+                return layer
+
+            self._download_layer(layer, layer_path, show_progress)
 
         return layer
 
-    def _fetch_layer_uri(self, layer):
+    def _download_layer(self, layer: LayerVersion, layer_path: Path, show_progress: bool) -> None:
+        """
+        Downloads the layer into a temporary directory, and replaces the cached layer with it once it is verified
         """
-        Fetch the Layer Uri based on the LayerVersion Arn
+        content = self._fetch_layer_content(layer)
+        download_id = uuid.uuid4().hex
+        temp_layer_path = layer_path.with_name(f"{layer_path.name}.{download_id}.tmp")
+        checksum_path = layer_path.with_name(layer_path.name + LAYER_CHECKSUM_FILE_SUFFIX)
+
+        if not show_progress:
+            LOG.info("Downloading %s", layer.layer_arn)
+        try:
+            code_sha256 = unzip_from_uri(
+                content.get("Location"),
+                f"{layer_path}.{download_id}.zip",
+                unzip_output_dir=str(temp_layer_path),
+                progressbar_label="Downloading {}".format(layer.layer_arn) if show_progress else None,
+            )
+            expected_code_sha256 = content.get("CodeSha256")
+            if expected_code_sha256 and code_sha256 != expected_code_sha256:
+                raise LayerChecksumMismatch(
+                    "Downloaded content of {} doesn't match its CodeSha256, please try again.".format(layer.arn)
+                )
+
+            # remove the marker first, so that the layer isn't considered cached if it is interrupted here
+            if checksum_path.exists():
+                checksum_path.unlink()
+            if layer_path.exists():
+                shutil.rmtree(layer_path, onerror=rmtree_callback)
+            os.replace(temp_layer_path, layer_path)
+            checksum_path.write_text(code_sha256, encoding="utf-8")
+        finally:
+            shutil.rmtree(temp_layer_path, ignore_errors=True)
+
+    def _fetch_layer_content(self, layer):
+        """
+        Fetch the Layer Content (download Uri and CodeSha256) based on the LayerVersion Arn
 
         Parameters
         ----------
@@ -129,8 +191,9 @@ class LayerDownloader:
 
         Returns
         -------
-        str
-            The Uri to download the LayerVersion Content from
+        dict
+            Content of the LayerVersion, its Location is the Uri to download the LayerVersion Content from and
+            CodeSha256 is the base64 encoded SHA256 of it
 
         Raises
         ------
@@ -159,12 +222,14 @@ class LayerDownloader:
             # If it was not 'AccessDeniedException' or 'ResourceNotFoundException' re-raise
             raise e
 
-        return layer_version_response.get("Content").get("Location")
+        return layer_version_response.get("Content")
 
     @staticmethod
     def _is_layer_cached(layer_path: Path) -> bool:
         """
-        Checks if the layer is already cached on the system
+        Checks if the layer is already cached on the system. A layer is cached only after it is completely
+        extracted and verified, which is marked by the file holding its CodeSha256 next to it. Since a LayerVersion
+        can't be changed, the cached layer doesn't need to be verified against the remote CodeSha256 again.
 
         Parameters
         ----------
@@ -174,10 +239,10 @@ class LayerDownloader:
         Returns
         -------
         bool
-            True if the layer_path already exists otherwise False
+            True if the layer_path already exists and it is verified otherwise False
 
         """
-        return layer_path.exists()
+        return layer_path.exists() and layer_path.with_name(layer_path.name + LAYER_CHECKSUM_FILE_SUFFIX).exists()
 
     @staticmethod
     def _create_cache(layer_cache):
@@ -18,6 +18,8 @@ https://github.com/aws/aws-cli/blob/develop/awscli/customizations/cloudformation
 # pylint: disable=too-many-ancestors
 
 import json
+import pickle
+import threading
 from typing import cast, Dict, Optional
 from botocore.compat import OrderedDict
 import yaml
@@ -26,10 +28,26 @@ import yaml
 # TODO: we need to double check whether they are public and stable
 from yaml.resolver import ScalarNode, SequenceNode  # type: ignore
 
+try:
+    # libyaml based loader is much faster than the pure Python one, use it if PyYAML is built with libyaml
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
 from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
 
+from samcli.lib.utils.hash import str_checksum
+
 TAG_STR = "tag:yaml.org,2002:str"
 
+# Maximum number of parsed documents which are kept in the parse cache
+PARSE_CACHE_SIZE = 64
+
+# Parsed documents keyed by the checksum of their content. Documents are kept pickled, so that each caller gets its
+# own copy which it can modify freely, and unpickling is much faster than parsing the document again.
+_PARSE_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
 
 def string_representer(dumper, value):
     """
@@ -113,17 +131,52 @@ def _dict_constructor(loader, node):
     return OrderedDict(loader.construct_pairs(node))
 
 
+class CfnLoader(_SafeLoader):  # type: ignore
+    """
+    Safe YAML loader which keeps the order of the mappings and parses CloudFormation intrinsics
+    """
+
+
+CfnLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
+CfnLoader.add_multi_constructor("!", intrinsics_multi_constructor)
+
+
 def yaml_parse(yamlstr) -> Dict:
-    """Parse a yaml string"""
+    """
+    Parse a yaml string. Parsed documents are cached by their content, and a new copy of the cached document is
+    returned if the same content is parsed again.
+    """
+    key = str_checksum(yamlstr) if isinstance(yamlstr, str) else None
+    if key:
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(key)
+        if cached is not None:
+            return cast(Dict, pickle.loads(cached))
+
+    parsed = _yaml_parse(yamlstr)
+
+    if key:
+        try:
+            pickled = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return parsed
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = pickled
+            while len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    return parsed
+
+
+def _yaml_parse(yamlstr) -> Dict:
     try:
         # PyYAML doesn't support json as well as it should, so if the input
         # is actually just json it is better to parse it with the standard
         # json parser.
         return cast(Dict, json.loads(yamlstr, object_pairs_hook=OrderedDict))
     except ValueError:
-        yaml.SafeLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
-        yaml.SafeLoader.add_multi_constructor("!", intrinsics_multi_constructor)
-        return cast(Dict, yaml.safe_load(yamlstr))
+        return cast(Dict, yaml.load(yamlstr, Loader=CfnLoader))
 
 
 def parse_yaml_file(file_path, extra_context: Optional[Dict] = None) -> Dict:
@@ -2,7 +2,7 @@ import click
 
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
-from samcli.cli.command import BaseCommand
+from samcli.cli.command import BaseCommand, LazyGroup
 
 
 class TestBaseCommand(TestCase):
@@ -78,3 +78,29 @@ class TestBaseCommand(TestCase):
 
         result = cmd.get_command(None, "cmd1")
         self.assertEqual(result, None, "must not return a command")
+
+
+class TestLazyGroup(TestCase):
+    def setUp(self):
+        self.group = LazyGroup(lazy_commands={"cmd2": "a.b.cmd2", "cmd1": "a.b.cmd1"})
+
+    def test_list_commands_must_include_lazy_commands(self):
+        self.group.add_command(click.Command("cmd3"))
+
+        self.assertEqual(self.group.list_commands(ctx=None), ["cmd1", "cmd2", "cmd3"])
+
+    @patch("samcli.cli.command.importlib")
+    def test_get_command_must_import_only_requested_command_once(self, importlib_mock):
+        importlib_mock.import_module.return_value.cli = click.Command("command")
+
+        result = self.group.get_command(None, "cmd1")
+        self.assertEqual(result, importlib_mock.import_module.return_value.cli)
+        self.group.get_command(None, "cmd1")
+
+        importlib_mock.import_module.assert_called_once_with("a.b.cmd1")
+
+    @patch("samcli.cli.command.importlib")
+    def test_get_command_must_return_none_for_unknown_commands(self, importlib_mock):
+        self.assertIsNone(self.group.get_command(None, "unknown_command"))
+
+        importlib_mock.import_module.assert_not_called()
@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+from parameterized import parameterized
+
+# Libraries which take tens to hundreds of milliseconds to import, they must be imported only by the commands using them
+HEAVY_LIBRARIES = [
+    "boto3",
+    "botocore",
+    "requests",
+    "samtranslator",
+    "docker",
+    "flask",
+    "tomlkit",
+    "cookiecutter",
+    "yaml",
+    "jsonschema",
+]
+
+_LOADED_LIBRARIES_SCRIPT = """
+import json, sys
+import {module}
+print(json.dumps(sorted({{name.split(".")[0] for name in sys.modules}})))
+"""
+
+
+class TestImportTime(TestCase):
+    @parameterized.expand(
+        [
+            ("samcli.cli.main",),
+            ("samcli.commands.local.local",),
+            ("samcli.commands.pipeline.pipeline",),
+        ]
+    )
+    def test_must_not_import_heavy_libraries_on_startup(self, module):
+        output = subprocess.check_output([sys.executable, "-c", _LOADED_LIBRARIES_SCRIPT.format(module=module)])
+        loaded_libraries = set(json.loads(output))
+
+        self.assertEqual(sorted(loaded_libraries.intersection(HEAVY_LIBRARIES)), [])
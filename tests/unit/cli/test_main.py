@@ -33,6 +33,15 @@ class TestCliBase(TestCase):
             result = runner.invoke(cli, ["local", "generate-event", "s3", "put", "--debug"])
             self.assertEqual(result.exit_code, 0)
 
+    @patch("samcli.cli.options.enable_profiling")
+    def test_cli_with_trace_file(self, enable_profiling_mock):
+        mock_cfg = Mock()
+        with patch("samcli.cli.main.GlobalConfig", mock_cfg):
+            runner = CliRunner()
+            result = runner.invoke(cli, ["--trace-file", "trace.json", "local", "generate-event", "s3", "put"])
+            self.assertEqual(result.exit_code, 0)
+            enable_profiling_mock.assert_called_with("trace.json")
+
     @patch("samcli.cli.main.send_installed_metric")
     def test_cli_enable_telemetry_with_prompt(self, send_installed_metric_mock):
         with patch("samcli.cli.global_config.GlobalConfig.telemetry_enabled", new_callable=PropertyMock) as mock_flag:
@@ -65,3 +65,19 @@ class TestTemplates(TestCase):
                     IMAGE, None, "ruby2.7-image", "bundler", "hello-world-lambda-image"
                 )
                 self.assertTrue(search("mock-ruby-image-template", location))
+
+    @patch("samcli.commands.init.init_templates.requests")
+    @patch("samcli.lib.utils.git_repo.GitRepo.clone")
+    @patch("samcli.lib.utils.git_repo.GitRepo.is_clone_up_to_date")
+    def test_get_manifest_from_up_to_date_local_clone(self, is_up_to_date_mock, clone_mock, requests_mock):
+        is_up_to_date_mock.return_value = True
+        it = InitTemplates()
+        it._git_repo.local_path = Path("tests/unit/commands/init")
+        it.manifest_file_name = "test_manifest.json"
+
+        manifest = it._get_manifest()
+
+        with open("tests/unit/commands/init/test_manifest.json") as manifest_file:
+            self.assertEqual(manifest, json.load(manifest_file))
+        clone_mock.assert_called_once()
+        requests_mock.get.assert_not_called()
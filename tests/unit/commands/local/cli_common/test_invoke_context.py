@@ -549,7 +549,9 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             self.assertEqual(result, runner_mock)
 
             LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
-            lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
+            lambda_image_patch.assert_called_once_with(
+                download_mock, True, True, invoke_images=None, mount_local_layers=False
+            )
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
                 function_provider=ANY,
@@ -626,8 +628,12 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            WarmLambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
-            lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
+            WarmLambdaRuntimeMock.assert_called_with(
+                container_manager_mock, image_mock, pool_min_size=1, pool_max_size=1, pool_idle_timeout=None
+            )
+            lambda_image_patch.assert_called_once_with(
+                download_mock, True, True, invoke_images=None, mount_local_layers=False
+            )
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
                 function_provider=ANY,
@@ -701,7 +707,9 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             self.assertEqual(result, runner_mock)
 
             LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
-            lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
+            lambda_image_patch.assert_called_once_with(
+                download_mock, True, True, invoke_images=None, mount_local_layers=False
+            )
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
                 function_provider=ANY,
@@ -756,6 +764,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             aws_profile="profile",
             aws_region="region",
             invoke_images={None: "image"},
+            mount_local_layers=True,
         )
         self.context.get_cwd = Mock()
         self.context.get_cwd.return_value = cwd
@@ -775,7 +784,9 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             self.assertEqual(result, runner_mock)
 
             LambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
-            lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images={None: "image"})
+            lambda_image_patch.assert_called_once_with(
+                download_mock, True, True, invoke_images={None: "image"}, mount_local_layers=True
+            )
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
                 function_provider=ANY,
@@ -38,6 +38,7 @@ class TestCli(TestCase):
         self.parameter_overrides = {}
         self.layer_cache_basedir = "/some/layers/path"
         self.force_image_build = True
+        self.mount_local_layers = False
         self.shutdown = False
         self.region_name = "region"
         self.profile = "profile"
@@ -77,6 +78,7 @@ class TestCli(TestCase):
             parameter_overrides=self.parameter_overrides,
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
+            mount_local_layers=self.mount_local_layers,
             shutdown=self.shutdown,
             container_host=self.container_host,
             container_host_interface=self.container_host_interface,
@@ -98,6 +100,7 @@ class TestCli(TestCase):
             parameter_overrides=self.parameter_overrides,
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
+            mount_local_layers=self.mount_local_layers,
             shutdown=self.shutdown,
             aws_region=self.region_name,
             aws_profile=self.profile,
@@ -141,6 +144,7 @@ class TestCli(TestCase):
             parameter_overrides=self.parameter_overrides,
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
+            mount_local_layers=self.mount_local_layers,
             shutdown=self.shutdown,
             container_host=self.container_host,
             container_host_interface=self.container_host_interface,
@@ -162,6 +166,7 @@ class TestCli(TestCase):
             parameter_overrides=self.parameter_overrides,
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
+            mount_local_layers=self.mount_local_layers,
             shutdown=self.shutdown,
             aws_region=self.region_name,
             aws_profile=self.profile,
@@ -219,6 +224,7 @@ class TestCli(TestCase):
                 parameter_overrides=self.parameter_overrides,
                 layer_cache_basedir=self.layer_cache_basedir,
                 force_image_build=self.force_image_build,
+                mount_local_layers=self.mount_local_layers,
                 shutdown=self.shutdown,
                 container_host=self.container_host,
                 container_host_interface=self.container_host_interface,
@@ -274,6 +280,7 @@ class TestCli(TestCase):
                 parameter_overrides=self.parameter_overrides,
                 layer_cache_basedir=self.layer_cache_basedir,
                 force_image_build=self.force_image_build,
+                mount_local_layers=self.mount_local_layers,
                 shutdown=self.shutdown,
                 container_host=self.container_host,
                 container_host_interface=self.container_host_interface,
@@ -327,6 +334,7 @@ class TestCli(TestCase):
                 parameter_overrides=self.parameter_overrides,
                 layer_cache_basedir=self.layer_cache_basedir,
                 force_image_build=self.force_image_build,
+                mount_local_layers=self.mount_local_layers,
                 shutdown=self.shutdown,
                 container_host=self.container_host,
                 container_host_interface=self.container_host_interface,
@@ -368,6 +376,7 @@ class TestCli(TestCase):
                 parameter_overrides=self.parameter_overrides,
                 layer_cache_basedir=self.layer_cache_basedir,
                 force_image_build=self.force_image_build,
+                mount_local_layers=self.mount_local_layers,
                 shutdown=self.shutdown,
                 container_host=self.container_host,
                 container_host_interface=self.container_host_interface,
@@ -423,6 +432,7 @@ class TestCli(TestCase):
                 parameter_overrides=self.parameter_overrides,
                 layer_cache_basedir=self.layer_cache_basedir,
                 force_image_build=self.force_image_build,
+                mount_local_layers=self.mount_local_layers,
                 shutdown=self.shutdown,
                 container_host=self.container_host,
                 container_host_interface=self.container_host_interface,
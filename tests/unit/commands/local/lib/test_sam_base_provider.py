@@ -1,11 +1,15 @@
 from unittest import TestCase
 from unittest.mock import Mock, patch
+from samcli.lib.providers import sam_base_provider
 from samcli.lib.providers.sam_base_provider import SamBaseProvider
 from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
 from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
 
 
 class TestSamBaseProvider_get_template(TestCase):
+    def setUp(self):
+        sam_base_provider._TEMPLATE_CACHE.clear()
+
     @patch("samcli.lib.providers.sam_base_provider.ResourceMetadataNormalizer")
     @patch("samcli.lib.providers.sam_base_provider.SamTranslatorWrapper")
     @patch.object(IntrinsicResolver, "resolve_template")
@@ -24,3 +28,33 @@ class TestSamBaseProvider_get_template(TestCase):
         called_parameter_values.update(overrides)
         SamTranslatorWrapperMock.assert_called_once_with(template, parameter_values=called_parameter_values)
         translator_instance.run_plugins.assert_called_once()
+
+    @patch("samcli.lib.providers.sam_base_provider.SamTranslatorWrapper")
+    def test_must_translate_same_template_only_once(self, SamTranslatorWrapperMock):
+        SamTranslatorWrapperMock.return_value.run_plugins.side_effect = lambda: {
+            "Resources": {"Function": {"Type": "AWS::Lambda::Function", "Properties": {"Handler": {"Ref": "Handler"}}}}
+        }
+        template = {"Resources": {"Function": {"Type": "AWS::Serverless::Function"}}}
+
+        first = SamBaseProvider.get_template(template, {"Handler": "app.handler"})
+        second = SamBaseProvider.get_template(template, {"Handler": "app.handler"})
+
+        SamTranslatorWrapperMock.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(first["Resources"]["Function"]["Properties"]["Handler"], "app.handler")
+        # each caller gets its own copy of the processed template
+        first["Resources"]["Function"]["Properties"]["Handler"] = "modified"
+        self.assertEqual(SamBaseProvider.get_template(template, {"Handler": "app.handler"}), second)
+
+    @patch("samcli.lib.providers.sam_base_provider.SamTranslatorWrapper")
+    def test_must_translate_again_if_template_or_parameters_change(self, SamTranslatorWrapperMock):
+        SamTranslatorWrapperMock.return_value.run_plugins.side_effect = lambda: {"Resources": {}}
+        template = {"Resources": {"Function": {"Type": "AWS::Serverless::Function"}}}
+
+        SamBaseProvider.get_template(template, {"Handler": "app.handler"})
+        SamBaseProvider.get_template(template, {"Handler": "other.handler"})
+        template["Resources"]["Function"]["Properties"] = {"Runtime": "python3.9"}
+        SamBaseProvider.get_template(template, {"Handler": "other.handler"})
+        SamBaseProvider.get_resolved_template_dict(template, {"Handler": "other.handler"})
+
+        self.assertEqual(SamTranslatorWrapperMock.call_count, 4)
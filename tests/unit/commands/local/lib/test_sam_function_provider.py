@@ -1769,6 +1769,24 @@ class TestSamFunctionProvider_get(TestCase):
         # The returned function is the full_path sorted one if multiple ones are matched
         self.assertEqual(function3, provider.get("not-value"))
 
+    def test_lookup_uses_index_which_is_updated_when_functions_change(self):
+        provider = SamFunctionProvider([])
+        function1 = Mock(function_id="Function1", functionname="function1-name", full_path="Function1")
+        function1.name = "Function1"
+        function2 = Mock(function_id="Function2", functionname="function2-name", full_path="Stack/Function2")
+        function2.name = "Function2"
+        provider.functions = {"Function1": function1}
+
+        with patch.object(provider, "get_all") as get_all_mock:
+            self.assertEqual(function1, provider.get("function1-name"))
+            self.assertIsNone(provider.get("Function2"))
+            get_all_mock.assert_not_called()
+
+        provider.functions = {"Function1": function1, "Stack/Function2": function2}
+
+        self.assertEqual(function2, provider.get("Function2"))
+        self.assertEqual(function2, provider.get("function2-name"))
+
     def test_return_none_if_function_not_found(self):
         provider = SamFunctionProvider([])
 
@@ -1846,7 +1864,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider._set_templates_changed(["child/template.yaml"])
 
         self.assertTrue(provider.is_changed)
-        self.file_observer.unwatch.assert_has_calls([call("template.yaml"), call("child/template.yaml")])
+        self.file_observer.unwatch.assert_called_once_with("child/template.yaml")
 
     @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
     @patch("samcli.lib.providers.sam_function_provider.FileObserver")
@@ -1868,7 +1886,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider = RefreshableSamFunctionProvider(
             [stack, stack2], self.parameter_overrides, self.global_parameter_overrides
         )
-        provider._set_templates_changed(["child/template.yaml"])
+        provider._set_templates_changed(["template.yaml"])
         updated_template = {"Resources": {"a": "b", "c": "d"}}
         updated_template2 = {"Resources": {"a": "b"}}
         updated_template3 = {"Resources": {"a": "b"}}
@@ -1914,7 +1932,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider = RefreshableSamFunctionProvider(
             [stack, stack2], self.parameter_overrides, self.global_parameter_overrides
         )
-        provider._set_templates_changed(["child/template.yaml"])
+        provider._set_templates_changed(["template.yaml"])
         updated_template = {"Resources": {"a": "b", "c": "d"}}
         updated_template2 = {"Resources": {"a": "b"}}
         updated_template3 = {"Resources": {"a": "b"}}
@@ -1958,7 +1976,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider = RefreshableSamFunctionProvider(
             [stack, stack2], self.parameter_overrides, self.global_parameter_overrides
         )
-        provider._set_templates_changed(["child/template.yaml"])
+        provider._set_templates_changed(["template.yaml"])
         updated_template = {"Resources": {"a": "b", "c": "d"}}
         updated_template2 = {"Resources": {"a": "b"}}
         updated_template3 = {"Resources": {"a": "b"}}
@@ -2000,7 +2018,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider = RefreshableSamFunctionProvider(
             [stack, stack2], self.parameter_overrides, self.global_parameter_overrides
         )
-        provider._set_templates_changed(["child/template.yaml"])
+        provider._set_templates_changed(["template.yaml"])
         updated_template = {"Resources": {"a": "b", "c": "d"}}
         updated_template2 = {"Resources": {"a": "b"}}
         updated_template3 = {"Resources": {"c": "d"}}
@@ -2164,3 +2182,148 @@ class TestRefreshableSamFunctionProvider(TestCase):
         provider.stop_observer()
 
         self.file_observer.stop.assert_called_once()
+
+    @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
+    @patch("samcli.lib.providers.sam_function_provider.FileObserver")
+    @patch.object(SamFunctionProvider, "_extract_functions")
+    @patch("samcli.lib.providers.provider.SamBaseProvider.get_template")
+    def test_only_changed_nested_stack_is_reloaded(
+        self, get_template_mock, extract_mock, FileObserverMock, get_stacks_mock
+    ):
+        FileObserverMock.return_value = self.file_observer
+
+        root_function = Mock(stack_path="")
+        child_function = Mock(stack_path="childStack")
+        grandchild_function = Mock(stack_path="childStack/grandchildStack")
+        other_child_function = Mock(stack_path="otherChildStack")
+        extract_mock.return_value = {
+            "RootFunction": root_function,
+            "childStack/ChildFunction": child_function,
+            "childStack/grandchildStack/GrandchildFunction": grandchild_function,
+            "otherChildStack/OtherChildFunction": other_child_function,
+        }
+
+        template = {"Resources": {"a": "b"}}
+        get_template_mock.return_value = template
+        stack = make_root_stack(template, self.parameter_overrides)
+        child_stack = Stack("", "childStack", "child/template.yaml", {"Param": "value"}, template, {"key": "value"})
+        grandchild_stack = Stack("childStack", "grandchildStack", "grandchild/template.yaml", {}, template)
+        other_child_stack = Stack("", "otherChildStack", "other/template.yaml", {}, template)
+        provider = RefreshableSamFunctionProvider(
+            [stack, child_stack, grandchild_stack, other_child_stack],
+            self.parameter_overrides,
+            self.global_parameter_overrides,
+        )
+        provider._set_templates_changed(["grandchild/template.yaml", "child/template.yaml"])
+
+        reloaded_child_stack = Stack("", "childStack", "child/template.yaml", {"Param": "value"}, template)
+        new_grandchild_stack = Stack("childStack", "newGrandchildStack", "new/template.yaml", {}, template)
+        get_stacks_mock.return_value = [reloaded_child_stack, new_grandchild_stack], []
+        reloaded_child_function = Mock(stack_path="childStack")
+        extract_mock.return_value = {"childStack/ChildFunction": reloaded_child_function}
+        self.file_observer.watch.reset_mock()
+        self.file_observer.unwatch.reset_mock()
+
+        self.assertEqual(provider.stacks, [stack, reloaded_child_stack, new_grandchild_stack, other_child_stack])
+        self.assertFalse(provider.is_changed)
+
+        # the child stack is reloaded once together with its nested stacks, the other stacks are kept
+        get_stacks_mock.assert_called_once_with(
+            "child/template.yaml",
+            "",
+            "childStack",
+            {"Param": "value"},
+            self.global_parameter_overrides,
+            {"key": "value"},
+        )
+        extract_mock.assert_called_with([reloaded_child_stack, new_grandchild_stack], False, False)
+        self.assertEqual(list(provider.get_all()), [root_function, other_child_function, reloaded_child_function])
+        self.file_observer.watch.assert_has_calls(
+            [call("child/template.yaml"), call("new/template.yaml")], any_order=True
+        )
+        self.assertEqual(self.file_observer.watch.call_count, 2)
+        self.file_observer.unwatch.assert_not_called()
+
+    @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
+    @patch("samcli.lib.providers.sam_function_provider.FileObserver")
+    @patch.object(SamFunctionProvider, "_extract_functions")
+    @patch("samcli.lib.providers.provider.SamBaseProvider.get_template")
+    def test_removed_nested_stack_templates_are_unwatched(
+        self, get_template_mock, extract_mock, FileObserverMock, get_stacks_mock
+    ):
+        FileObserverMock.return_value = self.file_observer
+        extract_mock.return_value = {}
+
+        template = {"Resources": {"a": "b"}}
+        get_template_mock.return_value = template
+        stack = make_root_stack(template, self.parameter_overrides)
+        child_stack = Stack("", "childStack", "child/template.yaml", {}, template)
+        grandchild_stack = Stack("childStack", "grandchildStack", "grandchild/template.yaml", {}, template)
+        provider = RefreshableSamFunctionProvider(
+            [stack, child_stack, grandchild_stack], self.parameter_overrides, self.global_parameter_overrides
+        )
+        provider._set_templates_changed(["child/template.yaml"])
+
+        reloaded_child_stack = Stack("", "childStack", "child/template.yaml", {}, template)
+        get_stacks_mock.return_value = [reloaded_child_stack], []
+        self.file_observer.watch.reset_mock()
+        self.file_observer.unwatch.reset_mock()
+
+        self.assertEqual(provider.stacks, [stack, reloaded_child_stack])
+        self.file_observer.unwatch.assert_called_once_with("grandchild/template.yaml")
+        self.file_observer.watch.assert_called_once_with("child/template.yaml")
+
+    @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
+    @patch("samcli.lib.providers.sam_function_provider.FileObserver")
+    @patch.object(SamFunctionProvider, "_extract_functions")
+    @patch("samcli.lib.providers.provider.SamBaseProvider.get_template")
+    def test_does_not_reload_if_changed_templates_are_already_reloaded(
+        self, get_template_mock, extract_mock, FileObserverMock, get_stacks_mock
+    ):
+        FileObserverMock.return_value = self.file_observer
+        extract_mock.return_value = {}
+
+        template = {"Resources": {"a": "b"}}
+        get_template_mock.return_value = template
+        stack = make_root_stack(template, self.parameter_overrides)
+        child_stack = Stack("", "childStack", "child/template.yaml", {}, template)
+        provider = RefreshableSamFunctionProvider(
+            [stack, child_stack], self.parameter_overrides, self.global_parameter_overrides
+        )
+        # another caller has already claimed and reloaded the changed templates
+        provider.is_changed = True
+        extract_mock.reset_mock()
+
+        self.assertEqual(provider.stacks, [stack, child_stack])
+        self.assertFalse(provider.is_changed)
+        get_stacks_mock.assert_not_called()
+        extract_mock.assert_not_called()
+
+    @patch("samcli.lib.providers.sam_function_provider.SamLocalStackProvider.get_stacks")
+    @patch("samcli.lib.providers.sam_function_provider.FileObserver")
+    @patch.object(SamFunctionProvider, "_extract_functions")
+    @patch("samcli.lib.providers.provider.SamBaseProvider.get_template")
+    def test_reload_all_stacks_if_changed_template_does_not_belong_to_any_stack(
+        self, get_template_mock, extract_mock, FileObserverMock, get_stacks_mock
+    ):
+        FileObserverMock.return_value = self.file_observer
+        extract_mock.return_value = {}
+
+        template = {"Resources": {"a": "b"}}
+        get_template_mock.return_value = template
+        stack = make_root_stack(template, self.parameter_overrides)
+        child_stack = Stack("", "childStack", "child/template.yaml", {}, template)
+        provider = RefreshableSamFunctionProvider(
+            [stack, child_stack], self.parameter_overrides, self.global_parameter_overrides
+        )
+        provider._set_templates_changed(["child/template.yaml", "unknown/template.yaml"])
+
+        reloaded_stacks = [make_root_stack(template, self.parameter_overrides), child_stack]
+        get_stacks_mock.return_value = reloaded_stacks, []
+
+        self.assertEqual(provider.stacks, reloaded_stacks)
+        get_stacks_mock.assert_called_once_with(
+            "template.yaml",
+            parameter_overrides=self.parameter_overrides,
+            global_parameter_overrides=self.global_parameter_overrides,
+        )
@@ -32,12 +32,16 @@ class TestCli(TestCase):
         self.parameter_overrides = {}
         self.layer_cache_basedir = "/some/layers/path"
         self.force_image_build = True
+        self.mount_local_layers = False
         self.shutdown = True
         self.region_name = "region"
         self.profile = "profile"
 
         self.warm_containers = None
         self.debug_function = None
+        self.warm_containers_pool_min_size = None
+        self.warm_containers_pool_max_size = None
+        self.warm_containers_idle_timeout = None
 
         self.ctx_mock = Mock()
         self.ctx_mock.region = self.region_name
@@ -81,10 +85,14 @@ class TestCli(TestCase):
             parameter_overrides=self.parameter_overrides,
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
+            mount_local_layers=self.mount_local_layers,
             aws_region=self.region_name,
             aws_profile=self.profile,
             warm_container_initialization_mode=self.warm_containers,
             debug_function=self.debug_function,
+            warm_containers_pool_min_size=self.warm_containers_pool_min_size,
+            warm_containers_pool_max_size=self.warm_containers_pool_max_size,
+            warm_containers_idle_timeout=self.warm_containers_idle_timeout,
             shutdown=self.shutdown,
             container_host=self.container_host,
             container_host_interface=self.container_host_interface,
@@ -192,8 +200,12 @@ class TestCli(TestCase):
             parameter_overrides=self.parameter_overrides,
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
+            mount_local_layers=self.mount_local_layers,
             warm_containers=self.warm_containers,
             debug_function=self.debug_function,
+            warm_containers_pool_min_size=self.warm_containers_pool_min_size,
+            warm_containers_pool_max_size=self.warm_containers_pool_max_size,
+            warm_containers_idle_timeout=self.warm_containers_idle_timeout,
             shutdown=self.shutdown,
             container_host=self.container_host,
             container_host_interface=self.container_host_interface,
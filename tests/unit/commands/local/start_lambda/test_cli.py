@@ -27,9 +27,13 @@ class TestCli(TestCase):
         self.parameter_overrides = {}
         self.layer_cache_basedir = "/some/layers/path"
         self.force_image_build = True
+        self.mount_local_layers = False
         self.warm_containers = None
         self.shutdown = True
         self.debug_function = None
+        self.warm_containers_pool_min_size = None
+        self.warm_containers_pool_max_size = None
+        self.warm_containers_idle_timeout = None
         self.region_name = "region"
         self.profile = "profile"
 
@@ -73,10 +77,14 @@ class TestCli(TestCase):
             parameter_overrides=self.parameter_overrides,
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
+            mount_local_layers=self.mount_local_layers,
             aws_region=self.region_name,
             aws_profile=self.profile,
             warm_container_initialization_mode=self.warm_containers,
             debug_function=self.debug_function,
+            warm_containers_pool_min_size=self.warm_containers_pool_min_size,
+            warm_containers_pool_max_size=self.warm_containers_pool_max_size,
+            warm_containers_idle_timeout=self.warm_containers_idle_timeout,
             shutdown=self.shutdown,
             container_host=self.container_host,
             container_host_interface=self.container_host_interface,
@@ -161,8 +169,12 @@ class TestCli(TestCase):
             parameter_overrides=self.parameter_overrides,
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
+            mount_local_layers=self.mount_local_layers,
             warm_containers=self.warm_containers,
             debug_function=self.debug_function,
+            warm_containers_pool_min_size=self.warm_containers_pool_min_size,
+            warm_containers_pool_max_size=self.warm_containers_pool_max_size,
+            warm_containers_idle_timeout=self.warm_containers_idle_timeout,
             shutdown=self.shutdown,
             container_host=self.container_host,
             container_host_interface=self.container_host_interface,
@@ -317,6 +317,7 @@ class TestSamConfigForAllCommands(TestCase):
                 "basedir",
                 True,
                 True,
+                False,
                 True,
                 {"Key": "Value", "Key2": "Value2"},
                 "localhost",
@@ -380,10 +381,14 @@ class TestSamConfigForAllCommands(TestCase):
                 "basedir",
                 True,
                 True,
+                False,
                 {"Key": "Value", "Key2": "Value2"},
                 None,
                 False,
                 None,
+                None,
+                None,
+                None,
                 "localhost",
                 "127.0.0.1",
                 ("image",),
@@ -443,10 +448,14 @@ class TestSamConfigForAllCommands(TestCase):
                 "basedir",
                 True,
                 True,
+                False,
                 {"Key": "Value"},
                 None,
                 False,
                 None,
+                None,
+                None,
+                None,
                 "localhost",
                 "127.0.0.1",
                 ("image",),
@@ -900,6 +909,7 @@ class TestSamConfigForAllCommands(TestCase):
             "confirm_changeset": True,
             "region": "myregion",
             "signing_profiles": "function=profile:owner",
+            "max_workers": 3,
         }
 
         with samconfig_parameters(["sync"], self.scratch_dir, **config_values) as config_path:
@@ -922,6 +932,7 @@ class TestSamConfigForAllCommands(TestCase):
                 (),
                 (),
                 True,
+                3,
                 "mystack",
                 "myregion",
                 None,
@@ -1052,10 +1063,14 @@ class TestSamConfigWithOverrides(TestCase):
                 "otherbasedir",
                 True,
                 True,
+                False,
                 {"A": "123", "C": "D", "E": "F12!", "G": "H"},
                 None,
                 True,
                 None,
+                None,
+                None,
+                None,
                 "localhost",
                 "127.0.0.1",
                 ("image",),
@@ -1147,10 +1162,14 @@ class TestSamConfigWithOverrides(TestCase):
                 "envlayercache",
                 False,
                 True,
+                False,
                 {"A": "123", "C": "D", "E": "F12!", "G": "H"},
                 None,
                 False,
                 None,
+                None,
+                None,
+                None,
                 "localhost",
                 "127.0.0.1",
                 ("image",),
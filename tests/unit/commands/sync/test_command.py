@@ -44,6 +44,7 @@ class TestDoCli(TestCase):
         self.clean = True
         self.config_env = "mock-default-env"
         self.config_file = "mock-default-filename"
+        self.max_workers = 8
         MOCK_SAM_CONFIG.reset_mock()
 
     @parameterized.expand([(False, False, True), (False, False, False)])
@@ -90,6 +91,7 @@ class TestDoCli(TestCase):
             self.resource_id,
             self.resource,
             auto_dependency_layer,
+            self.max_workers,
             self.stack_name,
             self.region,
             self.profile,
@@ -216,6 +218,7 @@ class TestDoCli(TestCase):
             self.resource_id,
             self.resource,
             auto_dependency_layer,
+            self.max_workers,
             self.stack_name,
             self.region,
             self.profile,
@@ -293,7 +296,12 @@ class TestDoCli(TestCase):
             disable_rollback=False,
         )
         execute_watch_mock.assert_called_once_with(
-            self.template_file, build_context_mock, package_context_mock, deploy_context_mock, auto_dependency_layer
+            self.template_file,
+            build_context_mock,
+            package_context_mock,
+            deploy_context_mock,
+            auto_dependency_layer,
+            max_workers=self.max_workers,
         )
 
     @parameterized.expand([(True, False, True)])
@@ -340,6 +348,7 @@ class TestDoCli(TestCase):
             self.resource_id,
             self.resource,
             auto_dependency_layer,
+            self.max_workers,
             self.stack_name,
             self.region,
             self.profile,
@@ -365,6 +374,7 @@ class TestDoCli(TestCase):
             self.resource_id,
             self.resource,
             auto_dependency_layer,
+            max_workers=self.max_workers,
         )
 
 
@@ -403,8 +413,10 @@ class TestSyncCode(TestCase):
             resource_identifier_strings,
             resource_types,
             True,
+            max_workers=2,
         )
 
+        sync_flow_executor_mock.assert_called_once_with(max_workers=2)
         sync_flow_factory_mock.return_value.create_sync_flow.assert_called_once_with(ResourceIdentifier("Function1"))
         sync_flow_executor_mock.return_value.add_sync_flow.assert_called_once_with(sync_flows[0])
 
@@ -614,10 +626,20 @@ class TestWatch(TestCase):
         click_mock,
     ):
         execute_watch(
-            self.template_file, self.build_context, self.package_context, self.deploy_context, auto_dependency_layer
+            self.template_file,
+            self.build_context,
+            self.package_context,
+            self.deploy_context,
+            auto_dependency_layer,
+            max_workers=4,
         )
 
         watch_manager_mock.assert_called_once_with(
-            self.template_file, self.build_context, self.package_context, self.deploy_context, auto_dependency_layer
+            self.template_file,
+            self.build_context,
+            self.package_context,
+            self.deploy_context,
+            auto_dependency_layer,
+            max_workers=4,
         )
         watch_manager_mock.return_value.start.assert_called_once_with()
@@ -5,6 +5,7 @@ import sys
 import docker
 import json
 
+from contextlib import contextmanager
 from unittest import TestCase
 from unittest.mock import Mock, MagicMock, call, patch, ANY
 from pathlib import Path, WindowsPath
@@ -28,6 +29,7 @@ from samcli.commands.local.cli_common.user_exceptions import InvalidFunctionProp
 from samcli.lib.utils.architecture import X86_64, ARM64
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.local.docker.exceptions import ContainerExecutableNotFoundException
 from tests.unit.lib.build_module.test_build_graph import generate_function
 
 
@@ -402,7 +404,9 @@ class TestApplicationBuilder_build(TestCase):
 
         result = builder.build().artifacts
 
-        mock_parallel_build_strategy_class.assert_called_once_with(ANY, mock_cached_and_incremental_build_strategy)
+        mock_parallel_build_strategy_class.assert_called_once_with(
+            ANY, mock_cached_and_incremental_build_strategy, is_container_build=False
+        )
 
         mock_parallel_build_strategy.build.assert_called_once()
         self.assertEqual(result, mock_parallel_build_strategy.build())
@@ -1699,6 +1703,148 @@ class TestApplicationBuilder_build_function_on_container(TestCase):
 
         self.assertEqual(str(ctx.exception), reason)
 
+    @patch("samcli.lib.build.app_builder.LambdaBuildContainer")
+    @patch("samcli.lib.build.app_builder.lambda_builders_protocol_version")
+    @patch("samcli.lib.build.app_builder.LOG")
+    @patch("samcli.lib.build.app_builder.osutils")
+    def test_must_build_in_warm_container(self, osutils_mock, LOGMock, protocol_version_mock, LambdaBuildContainerMock):
+        config = Mock()
+        log_level = LOGMock.getEffectiveLevel.return_value = "foo"
+        stdout_data = "container stdout response data"
+        response = {"result": {"artifacts_dir": "/some/dir"}}
+        self.builder._parse_builder_response.return_value = response
+
+        @contextmanager
+        def mock_build(*args, stdout, stderr, **kwargs):
+            stdout.write(stdout_data.encode("utf-8"))
+            yield
+
+        container_mock = Mock()
+        container_mock.build = Mock(side_effect=mock_build)
+        pool_mock = self.builder._build_container_pool = Mock()
+        pool_mock.can_build.return_value = True
+        pool_mock.checkout.return_value.__enter__ = Mock(return_value=container_mock)
+        pool_mock.checkout.return_value.__exit__ = Mock(return_value=None)
+
+        result = self.builder._build_function_on_container(
+            config, "source_dir", "artifacts_dir", "manifest_path", "runtime", X86_64, None, {"ENV": "var"}, "image"
+        )
+        self.assertEqual(result, "artifacts_dir")
+
+        LambdaBuildContainerMock.assert_not_called()
+        self.container_manager.run.assert_not_called()
+        pool_mock.can_build.assert_called_once_with("source_dir", "manifest_path")
+        pool_mock.checkout.assert_called_once_with("runtime", X86_64, "image", {"ENV": "var"}, log_level)
+        container_mock.build.assert_called_once_with(
+            protocol_version_mock,
+            config.language,
+            config.dependency_manager,
+            config.application_framework,
+            "source_dir",
+            "manifest_path",
+            "runtime",
+            X86_64,
+            options=None,
+            executable_search_paths=config.executable_search_paths,
+            mode="mode",
+            is_building_layer=False,
+            stdout=ANY,
+            stderr=osutils_mock.stderr.return_value,
+        )
+        self.builder._parse_builder_response.assert_called_once_with(stdout_data, container_mock.image)
+        container_mock.copy.assert_called_with(response["result"]["artifacts_dir"] + "/.", "artifacts_dir")
+        self.container_manager.stop.assert_not_called()
+
+    @patch("samcli.lib.build.app_builder.LambdaBuildContainer")
+    def test_must_build_in_new_container_if_source_is_not_in_warm_containers(self, LambdaBuildContainerMock):
+        config = Mock()
+        container_mock = LambdaBuildContainerMock.return_value = Mock()
+        self.builder._parse_builder_response.return_value = {"result": {"artifacts_dir": "/some/dir"}}
+        pool_mock = self.builder._build_container_pool = Mock()
+        pool_mock.can_build.return_value = False
+
+        self.builder._build_function_on_container(
+            config, "source_dir", "artifacts_dir", "manifest_path", "runtime", X86_64, None
+        )
+
+        pool_mock.checkout.assert_not_called()
+        self.container_manager.run.assert_called_with(container_mock)
+        self.container_manager.stop.assert_called_with(container_mock)
+
+    def test_must_raise_on_unsupported_warm_container(self):
+        config = Mock()
+        container_mock = Mock()
+        container_mock.image = "image name"
+        container_mock.build.side_effect = ContainerExecutableNotFoundException(
+            "myexecutable executable not found in container"
+        )
+        pool_mock = self.builder._build_container_pool = Mock()
+        pool_mock.can_build.return_value = True
+        pool_mock.checkout.return_value.__enter__ = Mock(return_value=container_mock)
+        pool_mock.checkout.return_value.__exit__ = Mock(return_value=None)
+
+        with self.assertRaises(UnsupportedBuilderLibraryVersionError) as ctx:
+            self.builder._build_function_on_container(
+                config, "source_dir", "artifacts_dir", "manifest_path", "runtime", X86_64, {}
+            )
+
+        self.assertEqual(
+            str(ctx.exception),
+            str(UnsupportedBuilderLibraryVersionError("image name", "myexecutable executable not found in container")),
+        )
+
+
+class TestApplicationBuilder_build_container_pool(TestCase):
+    @parameterized.expand([(True,), (False,)])
+    @patch("samcli.lib.build.app_builder.BuildContainerPool")
+    @patch("samcli.lib.build.app_builder.DefaultBuildStrategy")
+    def test_must_close_build_container_pool_after_build(
+        self, is_build_successful, DefaultBuildStrategyMock, BuildContainerPoolMock
+    ):
+        container_manager = Mock()
+        builder = ApplicationBuilder(
+            Mock(),
+            "/build/dir",
+            "/base/dir",
+            "/cache/dir",
+            container_manager=container_manager,
+            stream_writer=StreamWriter(sys.stderr),
+        )
+        builder._get_build_graph = Mock()
+
+        def build():
+            self.assertEqual(builder._build_container_pool, BuildContainerPoolMock.return_value)
+            if not is_build_successful:
+                raise BuildError("Build failed", "msg")
+            return {}
+
+        DefaultBuildStrategyMock.return_value.build.side_effect = build
+
+        if is_build_successful:
+            builder.build()
+        else:
+            with self.assertRaises(BuildError):
+                builder.build()
+
+        BuildContainerPoolMock.assert_called_once_with(container_manager, "/base/dir", ANY)
+        BuildContainerPoolMock.return_value.close.assert_called_once_with()
+        self.assertIsNone(builder._build_container_pool)
+
+    @patch("samcli.lib.build.app_builder.BuildContainerPool")
+    @patch("samcli.lib.build.app_builder.DefaultBuildStrategy")
+    def test_must_not_create_build_container_pool_for_in_process_build(
+        self, DefaultBuildStrategyMock, BuildContainerPoolMock
+    ):
+        builder = ApplicationBuilder(
+            Mock(), "/build/dir", "/base/dir", "/cache/dir", stream_writer=StreamWriter(sys.stderr)
+        )
+        builder._get_build_graph = Mock()
+        DefaultBuildStrategyMock.return_value.build.return_value = {}
+
+        builder.build()
+
+        BuildContainerPoolMock.assert_not_called()
+
 
 class TestApplicationBuilder_parse_builder_response(TestCase):
     def setUp(self):
@@ -0,0 +1,103 @@
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+from samcli.lib.build.build_container_pool import BuildContainerPool
+from samcli.lib.utils.architecture import ARM64, X86_64
+
+
+@patch("samcli.lib.build.build_container_pool.WarmLambdaBuildContainer")
+class TestBuildContainerPool(TestCase):
+    def setUp(self):
+        self.container_manager = Mock()
+        self.pool = BuildContainerPool(self.container_manager, "/base/dir", 2)
+
+    def test_must_start_container_and_reuse_it(self, WarmLambdaBuildContainerMock):
+        container = WarmLambdaBuildContainerMock.return_value
+
+        with self.pool.checkout("python3.9", X86_64, None, {"A": "1"}, 20) as first:
+            self.assertEqual(first, container)
+        with self.pool.checkout("python3.9", X86_64, None, {"A": "1"}, 20) as second:
+            self.assertEqual(second, container)
+
+        WarmLambdaBuildContainerMock.assert_called_once_with(
+            "/base/dir", "python3.9", X86_64, log_level=20, env_vars={"A": "1"}, image=None
+        )
+        self.container_manager.run.assert_called_once_with(container)
+        self.container_manager.stop.assert_not_called()
+
+    def test_must_start_container_for_each_configuration(self, WarmLambdaBuildContainerMock):
+        containers = [Mock(), Mock(), Mock()]
+        WarmLambdaBuildContainerMock.side_effect = containers
+
+        with self.pool.checkout("python3.9", X86_64, None, {}, 20) as first:
+            pass
+        with self.pool.checkout("python3.9", ARM64, None, {}, 20) as second:
+            pass
+        with self.pool.checkout("python3.9", X86_64, None, {"A": "1"}, 20) as third:
+            pass
+
+        self.assertEqual([first, second, third], containers)
+
+    def test_must_start_another_container_for_concurrent_builds(self, WarmLambdaBuildContainerMock):
+        containers = [Mock(), Mock()]
+        WarmLambdaBuildContainerMock.side_effect = containers
+
+        with self.pool.checkout("python3.9", X86_64, None, {}, 20) as first:
+            with self.pool.checkout("python3.9", X86_64, None, {}, 20) as second:
+                self.assertEqual([first, second], containers)
+
+    def test_must_keep_running_container_if_build_fails(self, WarmLambdaBuildContainerMock):
+        container = WarmLambdaBuildContainerMock.return_value
+        container.is_running.return_value = True
+
+        with self.assertRaises(ValueError):
+            with self.pool.checkout("python3.9", X86_64, None, {}, 20):
+                raise ValueError()
+        with self.pool.checkout("python3.9", X86_64, None, {}, 20):
+            pass
+
+        WarmLambdaBuildContainerMock.assert_called_once()
+        self.container_manager.stop.assert_not_called()
+
+    def test_must_remove_container_which_is_not_running_anymore(self, WarmLambdaBuildContainerMock):
+        containers = [Mock(), Mock()]
+        containers[0].is_running.return_value = False
+        WarmLambdaBuildContainerMock.side_effect = containers
+
+        with self.assertRaises(ValueError):
+            with self.pool.checkout("python3.9", X86_64, None, {}, 20):
+                raise ValueError()
+        with self.pool.checkout("python3.9", X86_64, None, {}, 20) as container:
+            self.assertEqual(container, containers[1])
+
+        self.container_manager.stop.assert_called_once_with(containers[0])
+
+    def test_must_remove_container_which_fails_to_start(self, WarmLambdaBuildContainerMock):
+        container = WarmLambdaBuildContainerMock.return_value
+        self.container_manager.run.side_effect = ValueError()
+
+        with self.assertRaises(ValueError):
+            with self.pool.checkout("python3.9", X86_64, None, {}, 20):
+                pass
+
+        self.container_manager.stop.assert_called_once_with(container)
+
+    def test_must_stop_all_containers_when_closed(self, WarmLambdaBuildContainerMock):
+        containers = [Mock(), Mock()]
+        WarmLambdaBuildContainerMock.side_effect = containers
+
+        with self.pool.checkout("python3.9", X86_64, None, {}, 20):
+            pass
+        with self.pool.checkout("nodejs14.x", X86_64, None, {}, 20):
+            pass
+        self.pool.close()
+
+        self.container_manager.stop.assert_has_calls([call(containers[0]), call(containers[1])], any_order=True)
+
+    def test_can_build(self, WarmLambdaBuildContainerMock):
+        result = self.pool.can_build("/base/dir/src", "/base/dir/src/requirements.txt")
+
+        self.assertEqual(result, WarmLambdaBuildContainerMock.can_build.return_value)
+        WarmLambdaBuildContainerMock.can_build.assert_called_once_with(
+            "/base/dir", "/base/dir/src", "/base/dir/src/requirements.txt"
+        )
@@ -18,6 +18,7 @@ from samcli.lib.build.build_graph import (
     METADATA_FIELD,
     FUNCTIONS_FIELD,
     SOURCE_HASH_FIELD,
+    BUILD_DURATION_FIELD,
     ENV_VARS_FIELD,
     LAYER_NAME_FIELD,
     BUILD_METHOD_FIELD,
@@ -664,6 +665,29 @@ class TestBuildGraph(TestCase):
                 "new_manifest_value",
             )
 
+    def test_update_build_durations_should_succeed(self):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+
+            build_graph_path = Path(build_dir.parent, "build.toml")
+            build_graph_path.write_text(TestBuildGraph.BUILD_GRAPH_CONTENTS)
+
+            build_graph = BuildGraph(str(build_dir))
+            build_graph.get_function_build_definitions()[0].build_duration = 12.5
+            build_graph.get_layer_build_definitions()[0].build_duration = 3.25
+
+            build_graph.update_build_durations()
+
+            document = cast(Dict, tomlkit.loads(build_graph_path.read_text()))
+            self.assertEqual(document["function_build_definitions"][TestBuildGraph.UUID][BUILD_DURATION_FIELD], 12.5)
+            self.assertEqual(document["layer_build_definitions"][TestBuildGraph.LAYER_UUID][BUILD_DURATION_FIELD], 3.25)
+
+            # durations are read back in the next build
+            next_build_graph = BuildGraph(str(build_dir))
+            self.assertEqual(next_build_graph.get_function_build_definitions()[0].build_duration, 12.5)
+            self.assertEqual(next_build_graph.get_layer_build_definitions()[0].build_duration, 3.25)
+
     def test_empty_get_function_build_definition_with_logical_id(self):
         build_graph = BuildGraph("build_dir")
         self.assertIsNone(build_graph.get_function_build_definition_with_full_path("function_logical_id"))
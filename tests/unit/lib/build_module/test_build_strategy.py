@@ -1,4 +1,8 @@
 import itertools
+import os
+import tempfile
+import threading
+import time
 from copy import deepcopy
 from unittest import TestCase
 from unittest.mock import Mock, patch, MagicMock, call, ANY
@@ -17,6 +21,7 @@ from samcli.lib.build.build_strategy import (
     IncrementalBuildStrategy,
 )
 from samcli.lib.utils import osutils
+from samcli.lib.utils.hash import FILE_HASH_INDEX_FILE_NAME
 from pathlib import Path
 
 from samcli.lib.utils.packagetype import ZIP, IMAGE
@@ -32,15 +37,18 @@ class BuildStrategyBaseTest(TestCase):
         self.function1_1 = Mock()
         self.function1_1.inlinecode = None
         self.function1_1.get_build_dir = Mock()
-        self.function1_1.full_path = Mock()
+        self.function1_1.full_path = "Function1_1"
+        self.function1_1.layers = []
         self.function1_2 = Mock()
         self.function1_2.inlinecode = None
         self.function1_2.get_build_dir = Mock()
-        self.function1_2.full_path = Mock()
+        self.function1_2.full_path = "Function1_2"
+        self.function1_2.layers = []
         self.function2 = Mock()
         self.function2.inlinecode = None
         self.function2.get_build_dir = Mock()
-        self.function2.full_path = Mock()
+        self.function2.full_path = "Function2"
+        self.function2.layers = []
 
         self.function_build_definition1 = FunctionBuildDefinition("runtime", "codeuri", ZIP, X86_64, {}, "handler")
         self.function_build_definition2 = FunctionBuildDefinition("runtime2", "codeuri", ZIP, X86_64, {}, "handler")
@@ -122,7 +130,7 @@ class BuildStrategyTest(BuildStrategyBaseTest):
         )
 
 
-@patch("samcli.lib.build.build_strategy.osutils.copytree")
+@patch("samcli.lib.build.build_strategy.osutils.link_or_copytree")
 class DefaultBuildStrategyTest(BuildStrategyBaseTest):
     def test_layer_build_should_fail_when_no_build_method_is_provided(self, mock_copy_tree):
         given_layer = Mock()
@@ -219,6 +227,33 @@ class DefaultBuildStrategyTest(BuildStrategyBaseTest):
             self.function1_2.get_build_dir(given_build_dir),
         )
 
+    def _build_with_durations(self, download_dependencies):
+        layer = Mock()
+        layer.build_method = "build_method"
+        layer.full_path = "Layer"
+        self.layer_build_definition1.layer = layer
+        self.layer_build_definition1.build_duration = 5
+        self.layer_build_definition1.download_dependencies = download_dependencies
+        self.function_build_definition2.build_duration = 5
+        self.function_build_definition2.download_dependencies = download_dependencies
+        default_build_strategy = DefaultBuildStrategy(self.build_graph, "build_dir", Mock(), Mock())
+
+        with patch("samcli.lib.build.build_strategy.time.monotonic", side_effect=[10, 11.5, 20, 22.25]):
+            default_build_strategy.build_single_layer_definition(self.layer_build_definition1)
+            default_build_strategy.build_single_function_definition(self.function_build_definition2)
+
+    def test_build_duration_is_recorded_for_full_builds(self, mock_copy_tree):
+        self._build_with_durations(download_dependencies=True)
+
+        self.assertEqual(self.layer_build_definition1.build_duration, 1.5)
+        self.assertEqual(self.function_build_definition2.build_duration, 2.25)
+
+    def test_build_duration_is_kept_for_incremental_builds(self, mock_copy_tree):
+        self._build_with_durations(download_dependencies=False)
+
+        self.assertEqual(self.layer_build_definition1.build_duration, 5)
+        self.assertEqual(self.function_build_definition2.build_duration, 5)
+
     def test_build_single_function_definition_image_functions_with_same_metadata(self, mock_copy_tree):
         given_build_function = Mock()
         built_image = Mock()
@@ -280,7 +315,7 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
     """
 
     @patch("samcli.lib.build.build_strategy.pathlib.Path")
-    @patch("samcli.lib.build.build_strategy.osutils.copytree")
+    @patch("samcli.lib.build.build_strategy.osutils.link_or_copytree")
     @patch("samcli.lib.build.build_strategy.shutil.rmtree")
     @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_function_definition")
     @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_layer_definition")
@@ -298,7 +333,7 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
         mock_function_build.assert_called()
         mock_layer_build.assert_called()
 
-    @patch("samcli.lib.build.build_strategy.osutils.copytree")
+    @patch("samcli.lib.build.build_strategy.osutils.link_or_copytree")
     @patch("samcli.lib.build.build_strategy.pathlib.Path.exists")
     @patch("samcli.lib.build.build_strategy.dir_checksum")
     def test_if_cached_valid_when_build_single_function_definition(self, dir_checksum_mock, exists_mock, copytree_mock):
@@ -337,7 +372,33 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             cached_build_strategy.build_single_layer_definition(layer_definition)
             self.assertEqual(copytree_mock.call_count, 3)
 
-    @patch("samcli.lib.build.build_strategy.osutils.copytree")
+    @patch("samcli.lib.utils.osutils._reflink")
+    @patch("samcli.lib.build.build_strategy.dir_checksum")
+    def test_modifying_artifacts_of_valid_cache_does_not_modify_cache(self, dir_checksum_mock, reflink_mock):
+        reflink_mock.return_value = False
+        dir_checksum_mock.return_value = CachedBuildStrategyTest.SOURCE_HASH
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+            cache_dir = Path(temp_base_dir, ".aws-sam", "cache")
+            cache_function_dir = Path(cache_dir, CachedBuildStrategyTest.FUNCTION_UUID)
+            cache_function_dir.mkdir(parents=True)
+            Path(cache_function_dir, "app.py").write_text("cached")
+
+            Path(build_dir.parent, "build.toml").write_text(CachedBuildStrategyTest.BUILD_GRAPH_CONTENTS)
+            build_graph = BuildGraph(str(build_dir))
+            cached_build_strategy = CachedBuildStrategy(build_graph, Mock(), temp_base_dir, build_dir, cache_dir)
+            function = Mock(inlinecode=None, full_path="HelloWorldPython")
+            function.get_build_dir.return_value = str(Path(build_dir, "HelloWorldPython"))
+            build_definition = build_graph.get_function_build_definitions()[0]
+            build_graph.put_function_build_definition(build_definition, function)
+
+            result = cached_build_strategy.build_single_function_definition(build_definition)
+            Path(result["HelloWorldPython"], "app.py").write_text("modified")
+
+            self.assertEqual(Path(cache_function_dir, "app.py").read_text(), "cached")
+
+    @patch("samcli.lib.build.build_strategy.osutils.link_or_copytree")
     @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_function_definition")
     @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_layer_definition")
     def test_if_cached_invalid_with_no_cached_folder(self, build_layer_mock, build_function_mock, copytree_mock):
@@ -372,45 +433,126 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             redundant_cache_folder = Path(cache_dir, "redundant")
             redundant_cache_folder.mkdir(parents=True)
 
+            hash_index_file = Path(cache_dir, "file-hashes.json")
+            hash_index_file.write_text("{}")
+
             cached_build_strategy = CachedBuildStrategy(build_graph, Mock(), temp_base_dir, build_dir, cache_dir)
             cached_build_strategy._clean_redundant_cached()
             self.assertTrue(not redundant_cache_folder.exists())
+            self.assertTrue(hash_index_file.exists())
 
 
 class ParallelBuildStrategyTest(BuildStrategyBaseTest):
-    def test_given_async_context_should_call_expected_methods(self):
-        mock_async_context = Mock()
+    def _create_recording_delegate(self, started, finished, sleep=0):
+        """creates a delegate which records the order of the builds"""
         delegate_build_strategy = MagicMock(wraps=_TestBuildStrategy(self.build_graph))
-        parallel_build_strategy = ParallelBuildStrategy(self.build_graph, delegate_build_strategy, mock_async_context)
-
-        given_build_results = [
-            {"function1": "function_location1"},
-            {"function2": "function_location2"},
-            {"layer1": "layer_location1"},
-            {"layer2": "layer_location2"},
-        ]
-        mock_async_context.run_async.return_value = given_build_results
+        lock = threading.Lock()
+
+        def record_build(build_definition):
+            with lock:
+                started.append(build_definition)
+            time.sleep(sleep)
+            with lock:
+                finished.append(build_definition)
+            return {build_definition.uuid: "location"}
+
+        delegate_build_strategy.build_single_function_definition.side_effect = record_build
+        delegate_build_strategy.build_single_layer_definition.side_effect = record_build
+        return delegate_build_strategy
+
+    def test_function_is_built_after_its_layers(self):
+        self.function2.layers = [self.layer2]
+        self.layer2.full_path = "Layer2"
+        self.layer1.full_path = "Layer1"
+        # function2 would be started first if it didn't depend on layer2
+        self.function_build_definition2.build_duration = 100
+        started = []
+        finished = []
+        delegate_build_strategy = self._create_recording_delegate(started, finished)
+
+        parallel_build_strategy = ParallelBuildStrategy(
+            self.build_graph, delegate_build_strategy, max_workers=1, max_container_workers=1
+        )
+        result = parallel_build_strategy.build()
 
-        results = parallel_build_strategy.build()
+        self.assertEqual(len(result), 4)
+        self.assertLess(finished.index(self.layer_build_definition2), started.index(self.function_build_definition2))
 
-        expected_results = {}
-        for given_build_result in given_build_results:
-            expected_results.update(given_build_result)
-        self.assertEqual(results, expected_results)
+    def test_longest_builds_are_started_first(self):
+        self.layer_build_definition1.build_duration = 1
+        self.function_build_definition1.build_duration = 3
+        self.function_build_definition2.build_duration = 2
+        started = []
+        delegate_build_strategy = self._create_recording_delegate(started, [])
 
-        # assert that result has collected
-        mock_async_context.run_async.assert_has_calls([call()])
+        parallel_build_strategy = ParallelBuildStrategy(self.build_graph, delegate_build_strategy, max_workers=1)
+        parallel_build_strategy.build()
 
-        # assert that delegated function calls have been registered in async context
-        mock_async_context.add_async_task.assert_has_calls(
+        self.assertEqual(
+            started,
             [
-                call(delegate_build_strategy.build_single_layer_definition, self.layer_build_definition1),
-                call(delegate_build_strategy.build_single_layer_definition, self.layer_build_definition2),
-                call(delegate_build_strategy.build_single_function_definition, self.function_build_definition1),
-                call(delegate_build_strategy.build_single_function_definition, self.function_build_definition2),
-            ]
+                self.function_build_definition1,
+                self.function_build_definition2,
+                self.layer_build_definition1,
+                self.layer_build_definition2,
+            ],
         )
 
+    def test_container_builds_are_limited_separately(self):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def record_build(build_definition):
+            with lock:
+                running.append(build_definition)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(build_definition)
+            return {}
+
+        delegate_build_strategy = MagicMock(wraps=_TestBuildStrategy(self.build_graph))
+        delegate_build_strategy.build_single_function_definition.side_effect = record_build
+        delegate_build_strategy.build_single_layer_definition.side_effect = record_build
+
+        parallel_build_strategy = ParallelBuildStrategy(
+            self.build_graph, delegate_build_strategy, max_workers=4, max_container_workers=1, is_container_build=True
+        )
+        parallel_build_strategy.build()
+
+        self.assertEqual(max(max_running), 1)
+
+    def test_build_durations_are_recorded(self):
+        self.function_build_definition1.build_duration = 5
+        delegate_build_strategy = self._create_recording_delegate([], [])
+        parallel_build_strategy = ParallelBuildStrategy(self.build_graph, delegate_build_strategy)
+
+        with patch.object(self.build_graph, "update_build_durations") as update_build_durations_mock:
+            parallel_build_strategy.build()
+
+        update_build_durations_mock.assert_called_once_with()
+        # durations are only recorded by the delegate when a definition is actually built, e.g. not for cache hits
+        self.assertEqual(self.function_build_definition1.build_duration, 5)
+
+    def test_failed_build_stops_scheduling_and_raises(self):
+        started = []
+        delegate_build_strategy = MagicMock(wraps=_TestBuildStrategy(self.build_graph))
+
+        def failing_build(build_definition):
+            started.append(build_definition)
+            raise ValueError("build failed")
+
+        delegate_build_strategy.build_single_function_definition.side_effect = failing_build
+        delegate_build_strategy.build_single_layer_definition.side_effect = failing_build
+        parallel_build_strategy = ParallelBuildStrategy(self.build_graph, delegate_build_strategy, max_workers=1)
+
+        with self.assertRaises(ValueError):
+            parallel_build_strategy.build()
+
+        self.assertEqual(len(started), 1)
+        delegate_build_strategy.__exit__.assert_called_once_with(ValueError, ANY, ANY)
+
     def test_given_delegate_strategy_it_should_call_delegated_build_methods(self):
         # create a mock delegate build strategy
         delegate_build_strategy = MagicMock(wraps=_TestBuildStrategy(self.build_graph))
@@ -630,3 +772,40 @@ class TestCachedOrIncrementalBuildStrategyWrapper(TestCase):
                 mocked_build_graph.clean_redundant_definitions_and_update.assert_called_once()
                 clean_cache_mock.assert_called_once()
                 clean_dep_mock.assert_called_once()
+
+    @patch("samcli.lib.build.build_strategy.is_experimental_enabled")
+    def test_parallel_cached_build_saves_file_hash_index(self, mocked_read, mocked_write, patched_experimental):
+        patched_experimental.return_value = False
+        with tempfile.TemporaryDirectory() as base_dir:
+            os.mkdir(os.path.join(base_dir, "src"))
+            source_file = os.path.join(base_dir, "src", "app.py")
+            with open(source_file, "w") as source:
+                source.write("def handler(event, context): pass")
+            # files which are modified just now are not indexed, as their modification time is not reliable yet
+            os.utime(source_file, (0, 0))
+            cache_dir = os.path.join(base_dir, "cache")
+            os.mkdir(cache_dir)
+
+            build_graph = BuildGraph(os.path.join(base_dir, "build"))
+            function = Mock(inlinecode=None, layers=[], full_path="Function")
+            build_graph.put_function_build_definition(
+                FunctionBuildDefinition("provided", "src", ZIP, X86_64, {}, "handler"), function
+            )
+            delegate_build_strategy = Mock()
+            delegate_build_strategy.build_single_function_definition.return_value = {}
+            build_strategy = ParallelBuildStrategy(
+                build_graph,
+                CachedOrIncrementalBuildStrategyWrapper(
+                    build_graph,
+                    delegate_build_strategy,
+                    base_dir,
+                    os.path.join(base_dir, "build"),
+                    cache_dir,
+                    None,
+                    False,
+                ),
+            )
+
+            build_strategy.build()
+
+            self.assertTrue(os.path.exists(os.path.join(cache_dir, FILE_HASH_INDEX_FILE_NAME)))
@@ -160,6 +160,35 @@ class TestCWLogPuller_load_time_period(TestCase):
                 self.assertIn(event, call_args)
 
 
+class TestCWLogPuller_poll(TestCase):
+    def setUp(self):
+        self.log_group_name = "name"
+        real_client = botocore.session.get_session().create_client("logs", region_name="us-east-1")
+        self.client_stubber = Stubber(real_client)
+        self.consumer = Mock()
+        self.fetcher = CWLogPuller(real_client, self.consumer, self.log_group_name)
+        self.fetcher.latest_event_time = 10
+
+    def test_must_poll_from_latest_event_time(self):
+        self.client_stubber.add_response(
+            "filter_log_events",
+            {"events": [{"timestamp": 11}, {"timestamp": 12}]},
+            {"logGroupName": self.log_group_name, "interleaved": True, "startTime": 10, "filterPattern": "pattern"},
+        )
+        self.client_stubber.add_response(
+            "filter_log_events",
+            {"events": []},
+            {"logGroupName": self.log_group_name, "interleaved": True, "startTime": 13},
+        )
+
+        with self.client_stubber:
+            self.assertTrue(self.fetcher.poll("pattern"))
+            self.assertFalse(self.fetcher.poll())
+
+        self.assertEqual(self.fetcher.latest_event_time, 13)
+        self.assertEqual(self.consumer.consume.call_count, 2)
+
+
 class TestCWLogPuller_tail(TestCase):
     def setUp(self):
         self.log_group_name = "name"
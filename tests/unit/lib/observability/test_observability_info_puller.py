@@ -1,14 +1,54 @@
+from datetime import datetime
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
 
 from parameterized import parameterized, param
 
+from botocore.exceptions import ClientError
+
 from samcli.lib.observability.observability_info_puller import (
     ObservabilityEventConsumerDecorator,
     ObservabilityCombinedPuller,
+    ObservabilityEvent,
+    ObservabilityEventMerger,
+    ObservabilityPollablePuller,
+    ObservabilityPollScheduler,
 )
 
 
+class FakePollablePuller(ObservabilityPollablePuller):
+    """
+    Pollable puller which returns a batch of events with the given timestamps on each poll
+    """
+
+    def __init__(self, consumer, batches):
+        self.consumer = consumer
+        self.latest_event_time = 0
+        self._batches = list(batches)
+        self.polled_from = []
+
+    def poll(self, filter_pattern=None):
+        self.polled_from.append(self.latest_event_time)
+        batch = self._batches.pop(0) if self._batches else []
+        if isinstance(batch, Exception):
+            raise batch
+        for timestamp in batch:
+            self.consumer.consume(ObservabilityEvent(f"{id(self)}-{timestamp}", timestamp))
+            self.latest_event_time = timestamp + 1
+        return bool(batch)
+
+    def tail(self, start_time=None, filter_pattern=None):
+        pass
+
+    def load_time_period(self, start_time=None, end_time=None, filter_pattern=None):
+        for batch in self._batches:
+            for timestamp in batch:
+                self.consumer.consume(ObservabilityEvent(f"{id(self)}-{timestamp}", timestamp))
+
+    def load_events(self, event_ids):
+        pass
+
+
 class TestObservabilityEventConsumerDecorator(TestCase):
     def test_decorator(self):
         actual_consumer = Mock()
@@ -153,3 +193,210 @@ class TestObservabilityCombinedPuller(TestCase):
                 call.run_async(),
             ]
         )
+
+
+class TestObservabilityEventMerger(TestCase):
+    def setUp(self):
+        self.consumer = Mock()
+
+    def _consumed_timestamps(self):
+        return [args[0].timestamp for (args, _) in self.consumer.consume.call_args_list]
+
+    def test_ordered_sources_are_merged_in_timestamp_order(self):
+        merger = ObservabilityEventMerger()
+        source1 = merger.add_source(self.consumer, ordered=True)
+        source2 = merger.add_source(self.consumer, ordered=True)
+
+        for timestamp in [1, 4, 6]:
+            source1.consume(ObservabilityEvent("event", timestamp))
+        # nothing can be emitted until the second source produces an event
+        self.assertEqual(self._consumed_timestamps(), [])
+
+        for timestamp in [2, 3, 5]:
+            source2.consume(ObservabilityEvent("event", timestamp))
+        self.assertEqual(self._consumed_timestamps(), [1, 2, 3, 4, 5])
+
+        source1.close()
+        source2.close()
+        self.assertEqual(self._consumed_timestamps(), [1, 2, 3, 4, 5, 6])
+
+    def test_events_wait_for_watermark(self):
+        merger = ObservabilityEventMerger()
+        source1 = merger.add_source(self.consumer)
+        source2 = merger.add_source(self.consumer)
+
+        source1.consume(ObservabilityEvent("event", 5))
+        source1.advance(10)
+        self.assertEqual(self._consumed_timestamps(), [])
+
+        source2.consume(ObservabilityEvent("event", 3))
+        source2.advance(4)
+        self.assertEqual(self._consumed_timestamps(), [3])
+
+        source2.advance(10)
+        self.assertEqual(self._consumed_timestamps(), [3, 5])
+
+    def test_buffer_is_bounded(self):
+        merger = ObservabilityEventMerger(max_buffer_size=2)
+        source1 = merger.add_source(self.consumer)
+        merger.add_source(self.consumer)
+
+        for timestamp in [3, 1, 2]:
+            source1.consume(ObservabilityEvent("event", timestamp))
+
+        self.assertEqual(self._consumed_timestamps(), [1])
+        merger.flush()
+        self.assertEqual(self._consumed_timestamps(), [1, 2, 3])
+
+    @patch("samcli.lib.observability.observability_info_puller.time")
+    def test_events_are_emitted_after_max_delay(self, time_mock):
+        time_mock.time.return_value = 10
+        merger = ObservabilityEventMerger(max_delay=5000)
+        source1 = merger.add_source(self.consumer)
+        merger.add_source(self.consumer)
+
+        source1.consume(ObservabilityEvent("event", 6000))
+        time_mock.time.return_value = 12
+        source1.consume(ObservabilityEvent("event", 4000))
+        source1.consume(ObservabilityEvent("event", 8000))
+        self.assertEqual(self._consumed_timestamps(), [])
+
+        # first event waited longer than max_delay, which also releases the earlier event
+        time_mock.time.return_value = 16
+        merger.emit_ready()
+        self.assertEqual(self._consumed_timestamps(), [4000, 6000])
+
+        time_mock.time.return_value = 18
+        merger.emit_ready()
+        self.assertEqual(self._consumed_timestamps(), [4000, 6000, 8000])
+
+    @patch("samcli.lib.observability.observability_info_puller.time")
+    def test_late_ingested_events_wait_for_max_delay(self, time_mock):
+        time_mock.time.return_value = 1000
+        merger = ObservabilityEventMerger(max_delay=5000)
+        source1 = merger.add_source(self.consumer)
+        merger.add_source(self.consumer)
+
+        # event is ingested long after its timestamp, but it has not waited in the buffer yet
+        source1.consume(ObservabilityEvent("event", 100000))
+        self.assertEqual(self._consumed_timestamps(), [])
+
+        time_mock.time.return_value = 1004
+        merger.emit_ready()
+        self.assertEqual(self._consumed_timestamps(), [])
+
+        time_mock.time.return_value = 1006
+        merger.emit_ready()
+        self.assertEqual(self._consumed_timestamps(), [100000])
+
+
+@patch("samcli.lib.observability.observability_info_puller.time")
+class TestObservabilityPollScheduler(TestCase):
+    def test_quiet_pullers_are_polled_less_often(self, time_mock):
+        time_mock.monotonic.return_value = 100
+        puller1 = Mock()
+        puller2 = Mock()
+        scheduler = ObservabilityPollScheduler([puller1, puller2], min_poll_interval=1, max_poll_interval=4)
+
+        self.assertEqual(scheduler.next_poll(), (puller1, 0.0))
+        scheduler.complete_poll(had_data=True)
+        self.assertEqual(scheduler.next_poll(), (puller2, 0.0))
+        scheduler.complete_poll(had_data=False)
+
+        # puller1 had data, so it is polled again after min_poll_interval
+        self.assertEqual(scheduler.next_poll(), (puller1, 1.0))
+
+        # the interval of a puller is doubled after each empty poll, up to max_poll_interval
+        time_mock.monotonic.return_value = 101
+        scheduler.complete_poll(had_data=False)
+        self.assertEqual(scheduler.next_poll(), (puller2, 1.0))
+        time_mock.monotonic.return_value = 102
+        scheduler.complete_poll(had_data=False)
+        self.assertEqual(scheduler.next_poll(), (puller1, 1.0))
+        time_mock.monotonic.return_value = 103
+        scheduler.complete_poll(had_data=False)
+        self.assertEqual(scheduler.next_poll(), (puller2, 3.0))
+        time_mock.monotonic.return_value = 106
+        scheduler.complete_poll(had_data=False)
+        self.assertEqual(scheduler.next_poll(), (puller1, 1.0))
+        time_mock.monotonic.return_value = 107
+        scheduler.complete_poll(had_data=False)
+        self.assertEqual(scheduler.next_poll(), (puller2, 3.0))
+
+    def test_throttling_increases_gap_between_polls(self, time_mock):
+        time_mock.monotonic.return_value = 100
+        puller1 = Mock()
+        puller2 = Mock()
+        scheduler = ObservabilityPollScheduler([puller1, puller2], min_poll_interval=1, max_poll_interval=4)
+
+        scheduler.complete_poll(had_data=False, throttled=True)
+        self.assertEqual(scheduler.next_poll(), (puller2, 1.0))
+
+        time_mock.monotonic.return_value = 101
+        scheduler.complete_poll(had_data=True)
+        self.assertEqual(scheduler.next_poll(), (puller1, 0.5))
+
+    def test_puller_is_dropped_after_max_retries(self, time_mock):
+        time_mock.monotonic.return_value = 100
+        puller = Mock()
+        scheduler = ObservabilityPollScheduler([puller], max_retries=2)
+
+        self.assertTrue(scheduler.complete_poll(had_data=False))
+        self.assertFalse(scheduler.complete_poll(had_data=False))
+        self.assertIsNone(scheduler.next_poll())
+
+
+class TestObservabilityCombinedPullerMerge(TestCase):
+    def setUp(self):
+        self.consumer1 = Mock()
+        self.consumer2 = Mock()
+        self.consumed = []
+        self.consumer1.consume.side_effect = self.consumed.append
+        self.consumer2.consume.side_effect = self.consumed.append
+
+    def test_load_time_period_merges_pollable_pullers(self):
+        puller1 = FakePollablePuller(self.consumer1, [[1, 4], [7]])
+        puller2 = FakePollablePuller(self.consumer2, [[2, 3, 8]])
+        other_puller = Mock()
+
+        ObservabilityCombinedPuller([puller1, puller2, other_puller]).load_time_period("start", "end", "filter")
+
+        self.assertEqual([event.timestamp for event in self.consumed], [1, 2, 3, 4, 7, 8])
+        other_puller.load_time_period.assert_called_once_with("start", "end", "filter")
+        self.assertIs(puller1.consumer, self.consumer1)
+        self.assertIs(puller2.consumer, self.consumer2)
+
+    @patch("samcli.lib.observability.observability_info_puller.time")
+    def test_tail_polls_pollable_pullers_with_shared_scheduler(self, time_mock):
+        clock = [100.0]
+        time_mock.monotonic.side_effect = lambda: clock[0]
+        time_mock.time.side_effect = lambda: clock[0]
+        time_mock.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+        throttling_error = ClientError({"Error": {"Code": "ThrottlingException"}}, "filter_log_events")
+        puller1 = FakePollablePuller(self.consumer1, [[99500, 99900], throttling_error, [100500]])
+        puller2 = FakePollablePuller(self.consumer2, [[99600, 99950]])
+
+        combined_puller = ObservabilityCombinedPuller([puller1, puller2])
+        scheduler = ObservabilityPollScheduler([puller1, puller2], max_retries=2)
+        with patch(
+            "samcli.lib.observability.observability_info_puller.ObservabilityPollScheduler", return_value=scheduler
+        ):
+            combined_puller._tail_pollable_pullers([puller1, puller2], datetime(1970, 1, 1, 0, 1), "filter")
+
+        self.assertEqual([event.timestamp for event in self.consumed], [99500, 99600, 99900, 99950, 100500])
+        self.assertEqual(puller1.polled_from, [60000, 99901, 99901, 100501, 100501])
+        self.assertEqual(puller2.polled_from, [60000, 99951, 99951])
+        self.assertIs(puller1.consumer, self.consumer1)
+        self.assertIs(puller2.consumer, self.consumer2)
+
+    def test_non_ordered_tail_with_nested_combined_puller(self):
+        puller = FakePollablePuller(self.consumer1, [])
+        nested_puller = Mock()
+        combined_puller = ObservabilityCombinedPuller([puller, nested_puller])
+
+        with patch.object(combined_puller, "_tail_pollable_pullers") as tail_pollable_mock:
+            combined_puller.tail("start", "filter")
+
+        nested_puller.tail.assert_called_once_with("start", "filter")
+        tail_pollable_mock.assert_called_once_with([puller], "start", "filter")
@@ -10,10 +10,13 @@ from contextlib import contextmanager, closing
 from unittest import mock
 from unittest.mock import patch, Mock, MagicMock
 
+from parameterized import parameterized
+
 from samcli.commands.package.exceptions import ExportFailedError
 from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.package.uploaders import Destination
-from samcli.lib.package.utils import zip_folder, make_zip
+from samcli.lib.package.utils import zip_folder, make_zip, make_zip_with_checksum
+from samcli.lib.utils.hash import dir_checksum
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from tests.testing_utils import FileCreator
 from samcli.commands.package import exceptions
@@ -388,16 +391,16 @@ class TestArtifactExporter(unittest.TestCase):
         zip_and_upload_mock.assert_not_called()
         self.s3_uploader_mock.upload_with_dedup.assert_not_called()
 
-    @patch("samcli.lib.package.utils.make_zip")
-    def test_zip_folder(self, make_zip_mock):
+    @patch("samcli.lib.package.utils.make_zip_with_checksum")
+    def test_zip_folder(self, make_zip_with_checksum_mock):
         zip_file_name = "name.zip"
-        make_zip_mock.return_value = zip_file_name
+        make_zip_with_checksum_mock.return_value = (zip_file_name, "md5")
 
         with self.make_temp_dir() as dirname:
             with zip_folder(dirname) as actual_zip_file_name:
-                self.assertEqual(actual_zip_file_name, (zip_file_name, mock.ANY))
+                self.assertEqual(actual_zip_file_name, (zip_file_name, "md5"))
 
-        make_zip_mock.assert_called_once_with(mock.ANY, dirname)
+        make_zip_with_checksum_mock.assert_called_once_with(mock.ANY, dirname)
 
     @patch("samcli.lib.package.packageable_resources.upload_local_artifacts")
     def test_resource_zip(self, upload_local_artifacts_mock):
@@ -840,6 +843,7 @@ class TestArtifactExporter(unittest.TestCase):
     @patch("samcli.lib.package.artifact_exporter.Template")
     def test_export_cloudformation_stack(self, TemplateMock):
         stack_resource = CloudFormationStackResource(self.uploaders_mock, self.code_signer_mock)
+        stack_resource.max_workers = 3
 
         resource_id = "id"
         property_name = stack_resource.PROPERTY_NAME
@@ -871,6 +875,7 @@ class TestArtifactExporter(unittest.TestCase):
                 normalize_parameters=True,
                 normalize_template=True,
                 parent_stack_id="id",
+                max_workers=3,
             )
             template_instance_mock.export.assert_called_once_with()
             self.s3_uploader_mock.upload.assert_called_once_with(mock.ANY, mock.ANY)
@@ -1047,6 +1052,7 @@ class TestArtifactExporter(unittest.TestCase):
                 normalize_parameters=True,
                 normalize_template=True,
                 parent_stack_id="id",
+                max_workers=None,
             )
             template_instance_mock.export.assert_called_once_with()
             self.s3_uploader_mock.upload.assert_called_once_with(mock.ANY, mock.ANY)
@@ -1215,6 +1221,97 @@ class TestArtifactExporter(unittest.TestCase):
             resource_type2_class.assert_called_once_with(self.uploaders_mock, self.code_signer_mock)
             resource_type2_instance.export.assert_called_once_with("Resource2", mock.ANY, template_dir)
 
+            # artifacts are uploaded concurrently, their progress bars would overwrite each other
+            quiet_uploaders = self.uploaders_mock.without_progressbar.return_value
+            self.assertEqual(resource_type1_instance.uploaders, quiet_uploaders)
+            self.assertEqual(resource_type2_instance.uploaders, quiet_uploaders)
+
+    @parameterized.expand([(1, 2), (None, 1), (4, 1)])
+    def test_template_export_keeps_progressbar(self, max_workers, artifact_count):
+        resource_class = Mock()
+        resource_class.RESOURCE_TYPE = "resource_type"
+        resource_class.ARTIFACT_TYPE = ZIP
+        resource_instances = [Mock() for _ in range(artifact_count)]
+        resource_class.side_effect = resource_instances
+        template_dict = {
+            "Resources": {
+                f"Resource{index}": {"Type": "resource_type", "Properties": {"foo": "bar"}}
+                for index in range(artifact_count)
+            }
+        }
+
+        template_exporter = Template(
+            None,
+            None,
+            self.uploaders_mock,
+            self.code_signer_mock,
+            [resource_class],
+            template_str=json.dumps(template_dict),
+            max_workers=max_workers,
+        )
+        # template_dir and code_signer are only set when the template is read from a file
+        template_exporter.template_dir = "dir"
+        template_exporter.code_signer = self.code_signer_mock
+        template_exporter.export()
+
+        self.uploaders_mock.without_progressbar.assert_not_called()
+        for resource_instance in resource_instances:
+            resource_instance.export.assert_called_once()
+
+    def test_template_export_passes_max_workers_to_nested_stacks(self):
+        template_dict = {"Resources": {"Stack": {"Type": "AWS::CloudFormation::Stack", "Properties": {}}}}
+
+        template_exporter = Template(
+            None,
+            None,
+            self.uploaders_mock,
+            self.code_signer_mock,
+            [CloudFormationStackResource],
+            template_str=json.dumps(template_dict),
+            max_workers=2,
+        )
+        # template_dir and code_signer are only set when the template is read from a file
+        template_exporter.template_dir = "dir"
+        template_exporter.code_signer = self.code_signer_mock
+        with patch.object(CloudFormationStackResource, "export", autospec=True) as export_mock:
+            template_exporter.export()
+
+        stack_resource = export_mock.call_args[0][0]
+        export_mock.assert_called_once_with(stack_resource, "Stack", {}, "dir")
+        self.assertEqual(stack_resource.max_workers, 2)
+
+    @patch("samcli.lib.package.packageable_resources.upload_local_artifacts")
+    def test_template_export_uploads_duplicate_artifacts_once(self, upload_local_artifacts_mock):
+        upload_local_artifacts_mock.return_value = "s3://foo/bar"
+        self.code_signer_mock.should_sign_package.return_value = False
+
+        with tempfile.TemporaryDirectory() as template_dir:
+            os.mkdir(os.path.join(template_dir, "src"))
+            template_str = json.dumps(
+                {
+                    "Resources": {
+                        "Function1": {"Type": "AWS::Serverless::Function", "Properties": {"CodeUri": "src"}},
+                        "Function2": {"Type": "AWS::Serverless::Function", "Properties": {"CodeUri": "./src/"}},
+                    }
+                }
+            )
+            template_path = os.path.join(template_dir, "template.yaml")
+            with open(template_path, "w") as template_file:
+                template_file.write(template_str)
+
+            template_exporter = Template(
+                template_path,
+                template_dir,
+                self.uploaders_mock,
+                self.code_signer_mock,
+                resources_to_export=frozenset([ServerlessFunctionResource]),
+            )
+            exported_template = template_exporter.export()
+
+        upload_local_artifacts_mock.assert_called_once()
+        for function in ["Function1", "Function2"]:
+            self.assertEqual(exported_template["Resources"][function]["Properties"]["CodeUri"], "s3://foo/bar")
+
     @patch("samcli.lib.package.artifact_exporter.yaml_parse")
     def test_cdk_template_export(self, yaml_parse_mock):
         parent_dir = os.path.sep
@@ -1636,6 +1733,95 @@ class TestArtifactExporter(unittest.TestCase):
                 os.remove(zipfile_name)
             test_file_creator.remove_all()
 
+    def test_make_zip_reproducible(self):
+        test_file_creator = FileCreator()
+        test_file_creator.append_file(
+            "index.js", "exports handler = (event, context, callback) => {callback(null, event);}"
+        )
+        test_file_creator.append_file("lib/b.js", "b")
+        test_file_creator.append_file("lib/a.js", "a")
+
+        dirname = test_file_creator.rootdir
+
+        random_name = "".join(random.choice(string.ascii_letters) for _ in range(10))
+        outfile = os.path.join(tempfile.gettempdir(), random_name)
+
+        zipfile_name = None
+        try:
+            zipfile_name = make_zip(outfile, dirname, reproducible=True)
+            with open(zipfile_name, "rb") as f:
+                first_zip_contents = f.read()
+
+            # touching the files must not change the zip contents
+            os.utime(os.path.join(dirname, "index.js"), (1000000000, 1000000000))
+            zipfile_name = make_zip(outfile, dirname, reproducible=True)
+            with open(zipfile_name, "rb") as f:
+                second_zip_contents = f.read()
+
+            self.assertEqual(first_zip_contents, second_zip_contents)
+
+            with closing(zipfile.ZipFile(zipfile_name, "r")) as zf:
+                infolist = zf.infolist()
+                self.assertEqual([info.filename for info in infolist], ["index.js", "lib/a.js", "lib/b.js"])
+                for info in infolist:
+                    self.assertEqual(info.date_time, (1980, 1, 1, 0, 0, 0))
+        finally:
+            if zipfile_name:
+                os.remove(zipfile_name)
+            test_file_creator.remove_all()
+
+    def test_make_zip_with_checksum_matches_dir_checksum(self):
+        test_file_creator = FileCreator()
+        test_file_creator.append_file("index.js", "index")
+        test_file_creator.append_file("lib/a.js", "a")
+        test_file_creator.append_file("lib-b/b.js", "b")
+
+        dirname = test_file_creator.rootdir
+
+        random_name = "".join(random.choice(string.ascii_letters) for _ in range(10))
+        outfile = os.path.join(tempfile.gettempdir(), random_name)
+
+        zipfile_name = None
+        try:
+            zipfile_name, checksum = make_zip_with_checksum(outfile, dirname)
+            self.assertEqual(checksum, dir_checksum(dirname, followlinks=True))
+
+            with closing(zipfile.ZipFile(zipfile_name, "r")) as zf:
+                # entries are sorted by their path within the archive
+                self.assertEqual(zf.namelist(), ["index.js", "lib-b/b.js", "lib/a.js"])
+        finally:
+            if zipfile_name:
+                os.remove(zipfile_name)
+            test_file_creator.remove_all()
+
+    @patch("samcli.lib.package.utils.ZIP_CHUNK_SIZE", 4)
+    def test_make_zip_with_checksum_streams_files_in_chunks(self):
+        test_file_creator = FileCreator()
+        test_file_creator.append_file("index.js", "const index = 'larger than a single chunk';")
+        test_file_creator.append_file("lib/a.js", "a")
+        test_file_creator.append_file("lib/empty.js", "")
+
+        dirname = test_file_creator.rootdir
+
+        random_name = "".join(random.choice(string.ascii_letters) for _ in range(10))
+        outfile = os.path.join(tempfile.gettempdir(), random_name)
+
+        zipfile_name = None
+        try:
+            zipfile_name, checksum = make_zip_with_checksum(outfile, dirname)
+            self.assertEqual(checksum, dir_checksum(dirname, followlinks=True))
+
+            with closing(zipfile.ZipFile(zipfile_name, "r")) as zf:
+                self.assertEqual(zf.read("index.js"), b"const index = 'larger than a single chunk';")
+                self.assertEqual(zf.read(os.path.join("lib", "a.js")), b"a")
+                self.assertEqual(zf.read(os.path.join("lib", "empty.js")), b"")
+                for info in zf.infolist():
+                    self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+        finally:
+            if zipfile_name:
+                os.remove(zipfile_name)
+            test_file_creator.remove_all()
+
     @patch("shutil.copyfile")
     @patch("tempfile.mkdtemp")
     def test_copy_to_temp_dir(self, mkdtemp_mock, copyfile_mock):
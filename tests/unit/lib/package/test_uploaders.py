@@ -0,0 +1,32 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from samcli.lib.package.ecr_uploader import ECRUploader
+from samcli.lib.package.s3_uploader import S3Uploader
+from samcli.lib.package.uploaders import Destination, Uploaders
+
+
+class TestUploaders(TestCase):
+    def test_without_progressbar(self):
+        s3_uploader = S3Uploader(Mock(), "bucket")
+        ecr_uploader = ECRUploader(Mock(), Mock(), "repo", None)
+        uploaders = Uploaders(s3_uploader, ecr_uploader)
+
+        quiet_uploaders = uploaders.without_progressbar()
+
+        self.assertTrue(quiet_uploaders.get(Destination.S3).no_progressbar)
+        self.assertTrue(quiet_uploaders.get(Destination.ECR).no_progressbar)
+        self.assertEqual(quiet_uploaders.s3.bucket_name, "bucket")
+        self.assertIs(quiet_uploaders.s3.s3, s3_uploader.s3)
+        self.assertEqual(quiet_uploaders.ecr.ecr_repo, "repo")
+        # the original uploaders keep their progress bars
+        self.assertFalse(s3_uploader.no_progressbar)
+        self.assertFalse(ecr_uploader.no_progressbar)
+
+    def test_without_progressbar_keeps_missing_uploaders(self):
+        uploaders = Uploaders(None, None)
+
+        quiet_uploaders = uploaders.without_progressbar()
+
+        self.assertIsNone(quiet_uploaders.s3)
+        self.assertIsNone(quiet_uploaders.ecr)
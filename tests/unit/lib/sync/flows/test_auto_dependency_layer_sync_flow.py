@@ -106,7 +106,7 @@ class TestAutoDependencyLayerSyncFlow(TestCase):
                 "build_dir", dependencies_dir, ANY, self.function_identifier, runtime
             )
             patched_make_zip.assert_called_with(
-                os.path.join(tmpdir, f"data-{uuid_hex}"), self.sync_flow._artifact_folder
+                os.path.join(tmpdir, f"data-{uuid_hex}"), self.sync_flow._artifact_folder, reproducible=True
             )
             patched_file_checksum.assert_called_with(zipfile, ANY)
 
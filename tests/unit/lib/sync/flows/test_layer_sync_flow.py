@@ -96,7 +96,7 @@ class TestLayerSyncFlow(TestCase):
 
         patched_tempfile.gettempdir.assert_called_once()
         patched_os.path.join.assert_called_with(ANY, ANY)
-        patched_make_zip.assert_called_with(ANY, self.layer_sync_flow._artifact_folder)
+        patched_make_zip.assert_called_with(ANY, self.layer_sync_flow._artifact_folder, reproducible=True)
 
         patched_file_checksum.assert_called_with(ANY, ANY)
 
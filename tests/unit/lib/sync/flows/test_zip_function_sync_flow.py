@@ -55,13 +55,92 @@ class TestZipFunctionSyncFlow(TestCase):
 
         get_mock.assert_called_once_with("Function1")
         self.assertEqual(sync_flow._artifact_folder, "ArtifactFolder1")
-        make_zip_mock.assert_called_once_with("temp_folder" + os.sep + "data-uuid_value", "ArtifactFolder1")
+        make_zip_mock.assert_called_once_with(
+            "temp_folder" + os.sep + "data-uuid_value", "ArtifactFolder1", reproducible=True
+        )
         file_checksum_mock.assert_called_once_with("zip_file", sha256_mock.return_value)
         self.assertEqual("sha256_value", sync_flow._local_sha)
         sync_flow._get_lock_chain.assert_called_once()
         sync_flow._get_lock_chain.return_value.__enter__.assert_called_once()
         sync_flow._get_lock_chain.return_value.__exit__.assert_called_once()
 
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.file_checksum")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.make_zip")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.ApplicationBuilder")
+    @patch("samcli.lib.sync.sync_flow.Session")
+    def test_gather_resources_reuses_coalesced_build(
+        self, session_mock, builder_mock, make_zip_mock, file_checksum_mock
+    ):
+        build_result = MagicMock()
+        build_result.artifacts = {"Function1": "ArtifactFolder1"}
+        build_coalescer = MagicMock()
+        build_coalescer.get_build.return_value.build_result = build_result
+        sync_flow = self.create_function_sync_flow()
+        sync_flow._build_coalescer = build_coalescer
+        sync_flow.has_locks = MagicMock(return_value=True)
+        sync_flow._get_lock_chain = MagicMock()
+
+        def assert_zipped_while_locked(*args, **kwargs):
+            sync_flow._get_lock_chain.return_value.__exit__.assert_not_called()
+            return "zip_file"
+
+        make_zip_mock.side_effect = assert_zipped_while_locked
+
+        sync_flow.gather_resources()
+
+        build_coalescer.get_build.assert_called_once_with("Function1", True, sync_flow._queued_time)
+        builder_mock.assert_not_called()
+        self.assertEqual(sync_flow._artifact_folder, "ArtifactFolder1")
+        self.assertEqual(sync_flow._build_graph, build_result.build_graph)
+        make_zip_mock.assert_called_once_with(ANY, "ArtifactFolder1", reproducible=True)
+
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.time.time")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.BuildCoalescer.get_build_group")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.file_checksum")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.make_zip")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.ApplicationBuilder")
+    @patch("samcli.lib.sync.sync_flow.Session")
+    def test_gather_resources_builds_functions_with_same_build_definition(
+        self, session_mock, builder_mock, make_zip_mock, file_checksum_mock, get_build_group_mock, time_mock
+    ):
+        time_mock.return_value = 1000
+        build_coalescer = MagicMock()
+        build_coalescer.get_build.return_value = None
+        sync_flow = self.create_function_sync_flow()
+        sync_flow._build_coalescer = build_coalescer
+        sync_flow._function = MagicMock(full_path="Function1")
+        other_function = MagicMock(full_path="Function2")
+        get_build_group_mock.return_value = [sync_flow._function, other_function]
+        sync_flow.has_locks = MagicMock(return_value=True)
+        sync_flow._get_lock_chain = MagicMock()
+
+        sync_flow.gather_resources()
+
+        resources = sync_flow._build_context.collect_build_resources.return_value
+        resources.add_functions.assert_called_once_with([other_function])
+        self.assertEqual(builder_mock.call_args[0][0], resources)
+        build_coalescer.put_build.assert_called_once_with(1000, True, builder_mock.return_value.build.return_value)
+
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.file_checksum")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.make_zip")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.ApplicationBuilder")
+    @patch("samcli.lib.sync.sync_flow.Session")
+    def test_gather_resources_does_not_coalesce_builds_without_locks(
+        self, session_mock, builder_mock, make_zip_mock, file_checksum_mock
+    ):
+        build_coalescer = MagicMock()
+        sync_flow = self.create_function_sync_flow()
+        sync_flow._build_coalescer = build_coalescer
+        sync_flow.has_locks = MagicMock(return_value=False)
+
+        sync_flow.gather_resources()
+
+        build_coalescer.get_build.assert_not_called()
+        build_coalescer.put_build.assert_not_called()
+        resources = sync_flow._build_context.collect_build_resources.return_value
+        resources.add_functions.assert_not_called()
+        builder_mock.return_value.build.assert_called_once_with()
+
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.base64.b64decode")
     @patch("samcli.lib.sync.sync_flow.Session")
     def test_compare_remote_true(self, session_mock, b64decode_mock):
@@ -0,0 +1,74 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from samcli.lib.build.app_builder import ApplicationBuildResult
+from samcli.lib.sync.build_coalescer import BuildCoalescer
+from samcli.lib.utils.packagetype import IMAGE, ZIP
+
+
+def _function(full_path, codeuri="src", runtime="python3.8", packagetype=ZIP, layers=None, inlinecode=None):
+    function = MagicMock()
+    function.full_path = full_path
+    function.codeuri = codeuri
+    function.runtime = runtime
+    function.packagetype = packagetype
+    function.architecture = "x86_64"
+    function.metadata = None
+    function.handler = "app.handler"
+    function.inlinecode = inlinecode
+    function.layers = layers or []
+    return function
+
+
+class TestBuildCoalescer(TestCase):
+    def setUp(self):
+        self.coalescer = BuildCoalescer()
+
+    def test_get_build_group(self):
+        layer = MagicMock(full_path="Layer1")
+        function1 = _function("Function1")
+        function2 = _function("Function2")
+        function3 = _function("Function3", codeuri="other")
+        function4 = _function("Function4", runtime="python3.9")
+        function5 = _function("Function5", layers=[layer])
+        function6 = _function("Function6", packagetype=IMAGE)
+        function7 = _function("Function7", inlinecode="code")
+        functions = [function1, function2, function3, function4, function5, function6, function7]
+
+        self.assertEqual(BuildCoalescer.get_build_group(function1, functions), [function1, function2])
+        self.assertEqual(BuildCoalescer.get_build_group(function5, functions), [function5])
+        self.assertEqual(BuildCoalescer.get_build_group(function6, functions), [function6])
+
+    @patch("samcli.lib.sync.build_coalescer.os.path.isdir")
+    def test_get_build(self, isdir_mock):
+        isdir_mock.return_value = True
+        build_result = ApplicationBuildResult(MagicMock(), {"Function1": "artifact1", "Function2": "artifact2"})
+
+        self.coalescer.put_build(100, True, build_result)
+
+        self.assertEqual(self.coalescer.get_build("Function2", True, 99).build_result, build_result)
+        self.assertEqual(self.coalescer.get_build("Function1", True, 100).build_result, build_result)
+
+    @patch("samcli.lib.sync.build_coalescer.os.path.isdir")
+    def test_get_build_not_reused(self, isdir_mock):
+        isdir_mock.return_value = True
+        self.coalescer.put_build(100, True, ApplicationBuildResult(MagicMock(), {"Function1": "artifact1"}))
+
+        # queued after the build was started
+        self.assertIsNone(self.coalescer.get_build("Function1", True, 101))
+        # built with different dependency mode
+        self.assertIsNone(self.coalescer.get_build("Function1", False, 99))
+        # not built
+        self.assertIsNone(self.coalescer.get_build("Function2", True, 99))
+
+        isdir_mock.return_value = False
+        self.assertIsNone(self.coalescer.get_build("Function1", True, 99))
+
+    @patch("samcli.lib.sync.build_coalescer.os.path.isdir")
+    def test_put_build_keeps_newer_build(self, isdir_mock):
+        isdir_mock.return_value = True
+        newer_result = ApplicationBuildResult(MagicMock(), {"Function1": "artifact1"})
+        self.coalescer.put_build(200, True, newer_result)
+        self.coalescer.put_build(100, True, ApplicationBuildResult(MagicMock(), {"Function1": "artifact1"}))
+
+        self.assertEqual(self.coalescer.get_build("Function1", True, 150).build_result, newer_result)
@@ -11,6 +11,7 @@ from samcli.lib.sync.exceptions import (
 )
 from unittest import TestCase
 from unittest.mock import ANY, MagicMock, call, patch
+from concurrent.futures import Future
 
 from samcli.lib.sync.sync_flow_executor import (
     SyncFlowExecutor,
@@ -70,11 +71,8 @@ class TestContinuousSyncFlowExecutor(TestCase):
         self.executor._stop_flag = True
         self.assertTrue(self.executor.should_stop())
 
-    @patch("samcli.lib.sync.continuous_sync_flow_executor.time.time")
-    @patch("samcli.lib.sync.sync_flow_executor.time.sleep")
-    def test_execute_high_level_logic(self, sleep_mock, time_mock):
+    def test_execute_high_level_logic(self):
         exception_handler_mock = MagicMock()
-        time_mock.return_value = 1001
 
         flow1 = MagicMock()
         flow2 = MagicMock()
@@ -86,27 +84,26 @@ class TestContinuousSyncFlowExecutor(TestCase):
 
         result1 = SyncFlowResult(flow1, [flow3])
 
-        future1 = MagicMock()
-        future2 = MagicMock()
-        future3 = MagicMock()
-
         exception1 = MagicMock(spec=Exception)
         sync_flow_exception = MagicMock(spec=SyncFlowException)
         sync_flow_exception.sync_flow = flow2
         sync_flow_exception.exception = exception1
 
-        future1.done.side_effect = [False, False, True]
-        future1.exception.return_value = None
-        future1.result.return_value = result1
+        future1 = Future()
+        future1.set_result(result1)
+        future2 = Future()
+        future2.set_exception(sync_flow_exception)
+        future3 = Future()
 
-        future2.done.side_effect = [False, False, False, True]
-        future2.exception.return_value = sync_flow_exception
+        def submit(_, sync_flow):
+            if sync_flow == flow3:
+                # stop the executor once the last flow is submitted
+                self.executor.stop()
+                future3.set_result(SyncFlowResult(flow3, []))
+                return future3
+            return future1 if sync_flow == flow1 else future2
 
-        future3.done.side_effect = [False, False, False, True]
-        future3.exception.return_value = None
-
-        self.thread_pool_executor.submit = MagicMock()
-        self.thread_pool_executor.submit.side_effect = [future1, future2, future3]
+        self.thread_pool_executor.submit = MagicMock(side_effect=submit)
 
         self.executor._flow_queue.put(task1)
         self.executor._flow_queue.put(task2)
@@ -114,21 +111,6 @@ class TestContinuousSyncFlowExecutor(TestCase):
         self.executor.add_sync_flow = MagicMock()
         self.executor.add_sync_flow.side_effect = lambda x: self.executor._flow_queue.put(task3)
 
-        self.executor.should_stop = MagicMock()
-        self.executor.should_stop.side_effect = [
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            True,
-        ]
-
         self.executor.execute(exception_handler=exception_handler_mock)
 
         self.thread_pool_executor.submit.assert_has_calls(
@@ -141,4 +123,34 @@ class TestContinuousSyncFlowExecutor(TestCase):
         self.executor.add_sync_flow.assert_called_once_with(flow3)
 
         exception_handler_mock.assert_called_once_with(sync_flow_exception)
-        self.assertEqual(len(sleep_mock.mock_calls), 10)
+        self.assertFalse(self.executor.should_stop())
+
+    @patch("samcli.lib.sync.sync_flow_executor.time.time")
+    def test_delayed_sync_flow_task_is_kept_until_ready(self, time_mock):
+        time_mock.return_value = 1000
+        sync_flow = MagicMock()
+        task = DelayedSyncFlowTask(sync_flow, True, 1000, 15)
+
+        self.executor._add_sync_flow_task(task)
+        self.executor._add_sync_flow_task(DelayedSyncFlowTask(sync_flow, True, 1000, 15))
+
+        self.assertTrue(self.executor._flow_queue.empty())
+        self.assertEqual(self.executor._delayed_tasks, [(1015, ANY, task)])
+        self.assertEqual(self.executor._get_wait_timeout(), 15)
+
+        time_mock.return_value = 1016
+        self.thread_pool_executor.submit = MagicMock(return_value=Future())
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.assertEqual(self.executor._delayed_tasks, [])
+        self.thread_pool_executor.submit.assert_called_once_with(SyncFlowExecutor._sync_flow_execute_wrapper, sync_flow)
+
+    def test_stop_clears_pending_tasks(self):
+        self.executor._flow_queue.put(DelayedSyncFlowTask(MagicMock(), False, 1000, 0))
+        self.executor._delayed_tasks.append((1015, 0, DelayedSyncFlowTask(MagicMock(), False, 1000, 15)))
+
+        self.executor.stop()
+
+        self.assertTrue(self.executor._flow_queue.empty())
+        self.assertEqual(self.executor._delayed_tasks, [])
+        self.assertTrue(self.executor._can_exit())
@@ -13,6 +13,8 @@ from samcli.lib.sync.exceptions import (
 )
 from unittest import TestCase
 from unittest.mock import ANY, MagicMock, call, patch
+from concurrent.futures import Future
+import time
 
 from samcli.lib.sync.sync_flow_executor import (
     SyncFlowExecutor,
@@ -203,11 +205,8 @@ class TestSyncFlowExecutor(TestCase):
         self.executor._running_flag = True
         self.assertTrue(self.executor.is_running())
 
-    @patch("samcli.lib.sync.sync_flow_executor.time.time")
-    @patch("samcli.lib.sync.sync_flow_executor.time.sleep")
-    def test_execute_high_level_logic(self, sleep_mock, time_mock):
+    def test_execute_high_level_logic(self):
         exception_handler_mock = MagicMock()
-        time_mock.return_value = 1001
 
         flow1 = MagicMock()
         flow2 = MagicMock()
@@ -219,24 +218,17 @@ class TestSyncFlowExecutor(TestCase):
 
         result1 = SyncFlowResult(flow1, [flow3])
 
-        future1 = MagicMock()
-        future2 = MagicMock()
-        future3 = MagicMock()
-
         exception1 = MagicMock(spec=Exception)
         sync_flow_exception = MagicMock(spec=SyncFlowException)
         sync_flow_exception.sync_flow = flow2
         sync_flow_exception.exception = exception1
 
-        future1.done.side_effect = [False, False, True]
-        future1.exception.return_value = None
-        future1.result.return_value = result1
-
-        future2.done.side_effect = [False, False, False, True]
-        future2.exception.return_value = sync_flow_exception
-
-        future3.done.side_effect = [False, False, False, True]
-        future3.exception.return_value = None
+        future1 = Future()
+        future1.set_result(result1)
+        future2 = Future()
+        future2.set_exception(sync_flow_exception)
+        future3 = Future()
+        future3.set_result(SyncFlowResult(flow3, []))
 
         self.thread_pool_executor.submit = MagicMock()
         self.thread_pool_executor.submit.side_effect = [future1, future2, future3]
@@ -249,6 +241,7 @@ class TestSyncFlowExecutor(TestCase):
 
         self.executor.execute(exception_handler=exception_handler_mock)
 
+        self.thread_pool_executor_mock.assert_called_once_with(max_workers=None)
         self.thread_pool_executor.submit.assert_has_calls(
             [
                 call(SyncFlowExecutor._sync_flow_execute_wrapper, flow1),
@@ -259,4 +252,181 @@ class TestSyncFlowExecutor(TestCase):
         self.executor.add_sync_flow.assert_called_once_with(flow3)
 
         exception_handler_mock.assert_called_once_with(sync_flow_exception)
-        self.assertEqual(len(sleep_mock.mock_calls), 6)
+        self.assertFalse(self.executor.is_running())
+
+    def test_same_sync_flow_waits_for_running_one(self):
+        flow = MagicMock()
+        running_future = Future()
+        queued_future = Future()
+        queued_future.set_result(SyncFlowResult(flow, []))
+        self.thread_pool_executor.submit = MagicMock(side_effect=[running_future, queued_future])
+
+        self.executor._flow_queue.put(SyncFlowTask(flow, False))
+        self.executor._flow_queue.put(SyncFlowTask(flow, False))
+
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.assertEqual(self.thread_pool_executor.submit.call_count, 1)
+        self.assertEqual(len(self.executor._blocked_tasks), 1)
+        self.assertTrue(self.executor._flow_queue.empty())
+
+        running_future.set_result(SyncFlowResult(flow, []))
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.assertEqual(self.executor._blocked_tasks, [])
+        self.assertFalse(self.executor._flow_queue.empty())
+
+        self.executor._execute_step(self.thread_pool_executor, None)
+        self.assertEqual(self.thread_pool_executor.submit.call_count, 2)
+
+    def test_dedup_includes_blocked_tasks(self):
+        sync_flow = MagicMock()
+        self.executor._blocked_tasks.append(SyncFlowTask(sync_flow, True))
+
+        self.executor._add_sync_flow_task(SyncFlowTask(sync_flow, True))
+
+        self.assertTrue(self.executor._flow_queue.empty())
+
+    def test_sync_flow_waits_for_claimed_locks(self):
+        flow1 = MagicMock()
+        flow2 = MagicMock()
+        flow1.get_lock_keys.return_value = ["Function1_Build"]
+        flow2.get_lock_keys.return_value = ["Function1_Build", "Function1_UpdateFunctionCode"]
+        self.lock_distributor.get_locks.return_value = {}
+        self.thread_pool_executor.submit = MagicMock(side_effect=[Future(), Future()])
+
+        self.executor._flow_queue.put(SyncFlowTask(flow1, False))
+        self.executor._flow_queue.put(SyncFlowTask(flow2, False))
+
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.thread_pool_executor.submit.assert_called_once_with(SyncFlowExecutor._sync_flow_execute_wrapper, flow1)
+        self.assertEqual(self.executor._lock_waiting_tasks, [SyncFlowTask(flow2, False)])
+        self.assertFalse(self.executor._can_exit())
+
+        self.executor._on_lock_released("Function1_Build")
+        self.assertTrue(self.executor._lock_released)
+
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.thread_pool_executor.submit.assert_called_with(SyncFlowExecutor._sync_flow_execute_wrapper, flow2)
+        self.assertEqual(self.executor._lock_waiting_tasks, [])
+        self.assertFalse(self.executor._lock_released)
+
+    def test_sync_flow_waits_for_held_locks(self):
+        flow = MagicMock()
+        flow.get_lock_keys.return_value = ["Function1_Build"]
+        lock = MagicMock()
+        lock.locked.return_value = True
+        self.lock_distributor.get_locks.return_value = {"Function1_Build": lock}
+        self.thread_pool_executor.submit = MagicMock(return_value=Future())
+
+        self.executor._flow_queue.put(SyncFlowTask(flow, False))
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.thread_pool_executor.submit.assert_not_called()
+        self.lock_distributor.get_locks.assert_called_with(["Function1_Build"])
+
+        lock.locked.return_value = False
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.thread_pool_executor.submit.assert_called_once_with(SyncFlowExecutor._sync_flow_execute_wrapper, flow)
+
+    def test_finished_sync_flow_releases_lock_claims(self):
+        flow1 = MagicMock()
+        flow2 = MagicMock()
+        flow1.get_lock_keys.return_value = ["Function1_Build"]
+        flow2.get_lock_keys.return_value = ["Function1_Build"]
+        self.lock_distributor.get_locks.return_value = {}
+        future1 = Future()
+        self.thread_pool_executor.submit = MagicMock(side_effect=[future1, Future()])
+
+        self.executor._flow_queue.put(SyncFlowTask(flow1, False))
+        self.executor._flow_queue.put(SyncFlowTask(flow2, False))
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        # flow1 finishes without ever acquiring its lock
+        future1.set_result(SyncFlowResult(flow1, []))
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.assertEqual(self.executor._claimed_lock_keys, {})
+        self.assertTrue(self.executor._lock_released)
+
+        self.executor._execute_step(self.thread_pool_executor, None)
+
+        self.thread_pool_executor.submit.assert_called_with(SyncFlowExecutor._sync_flow_execute_wrapper, flow2)
+
+    def test_dedup_includes_lock_waiting_tasks(self):
+        sync_flow = MagicMock()
+        self.executor._lock_waiting_tasks.append(SyncFlowTask(sync_flow, True))
+
+        self.executor._add_sync_flow_task(SyncFlowTask(sync_flow, True))
+
+        self.assertTrue(self.executor._flow_queue.empty())
+
+    def test_max_workers(self):
+        executor = SyncFlowExecutor(max_workers=3)
+
+        executor.execute()
+
+        self.thread_pool_executor_mock.assert_called_with(max_workers=3)
+
+
+class TestSyncFlowExecutorWithThreads(TestCase):
+    def test_finished_sync_flow_wakes_executor_up(self):
+        executor = SyncFlowExecutor(max_workers=2)
+        flow1 = MagicMock()
+        flow2 = MagicMock()
+        flow1.execute.side_effect = lambda: time.sleep(0.05) or [flow2]
+        flow2.execute.return_value = []
+        executor.add_sync_flow(flow1)
+
+        start = time.time()
+        executor.execute()
+
+        flow1.execute.assert_called_once_with()
+        flow2.execute.assert_called_once_with()
+        # dependent flow is started right away instead of the next polling interval
+        self.assertLess(time.time() - start, 5)
+
+    def test_sync_flow_starts_when_shared_lock_is_released(self):
+        executor = SyncFlowExecutor(max_workers=2)
+        lock_key = "Function1_Build"
+        events = []
+
+        def create_flow(name, hold_time, work_time):
+            flow = MagicMock()
+            flow.get_lock_keys.return_value = [lock_key]
+            flow.set_locks_with_distributor.side_effect = lambda distributor: setattr(
+                flow, "lock", distributor.get_lock(lock_key)
+            )
+
+            def execute():
+                # the scheduler must not dispatch a flow whose lock is still held
+                events.append((name, "acquired", flow.lock.acquire(blocking=False)))
+                time.sleep(hold_time)
+                flow.lock.release()
+                events.append((name, "released", True))
+                time.sleep(work_time)
+                events.append((name, "finished", True))
+                return []
+
+            flow.execute.side_effect = execute
+            return flow
+
+        executor.add_sync_flow(create_flow("flow1", 0.1, 0.5))
+        executor.add_sync_flow(create_flow("flow2", 0, 0))
+
+        executor.execute()
+
+        self.assertEqual(
+            events,
+            [
+                ("flow1", "acquired", True),
+                ("flow1", "released", True),
+                ("flow2", "acquired", True),
+                ("flow2", "released", True),
+                ("flow2", "finished", True),
+                ("flow1", "finished", True),
+            ],
+        )
@@ -1,9 +1,16 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
 import requests
 
 from unittest.mock import patch, Mock, ANY
 from unittest import TestCase
 
-from samcli.lib.telemetry.telemetry import Telemetry
+from samcli.lib.telemetry.telemetry import Telemetry, flush_in_background, MAX_SPOOLED_METRICS
 
 
 class TestTelemetry(TestCase):
@@ -17,16 +24,24 @@ class TestTelemetry(TestCase):
         self.test_installation_id = "TestInstallationId"
         self.url = "some_test_url"
 
+        self.temp_dir = tempfile.mkdtemp()
+        self.spool_path = Path(self.temp_dir, "spool.jsonl")
+
         self.metric_mock = Mock()
         self.metric_mock.get_metric_name.return_value = "metric_name"
         self.metric_mock.get_data.return_value = {"a": "1", "b": "2"}
 
     def tearDown(self):
         self.global_config_patcher.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def _read_spool(self):
+        with open(self.spool_path, "r") as spool_file:
+            return [json.loads(line) for line in spool_file]
 
     @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_must_add_metric_with_attributes_to_registry(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
+    def test_must_spool_metric_with_attributes_without_sending(self, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
 
         metric_name = "mymetric"
         attrs = {"a": 1, "b": 2}
@@ -37,26 +52,93 @@ class TestTelemetry(TestCase):
 
         telemetry.emit(metric_mock)
 
-        expected = {"metrics": [{metric_name: {"a": 1, "b": 2}}]}
-        requests_mock.post.assert_called_once_with(ANY, json=expected, timeout=ANY)
+        requests_mock.post.assert_not_called()
+        self.assertEqual(self._read_spool(), [{metric_name: {"a": 1, "b": 2}}])
+        self.assertTrue(telemetry.has_spooled_metrics())
 
     @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_default_request_should_be_fire_and_forget(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
+    def test_flush_must_send_spooled_metrics_in_a_batch(self, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
 
         telemetry.emit(self.metric_mock)
-        requests_mock.post.assert_called_once_with(ANY, json=ANY, timeout=(2, 0.1))  # 100ms response timeout
+        telemetry.emit(self.metric_mock)
+        telemetry.flush()
+
+        expected = {"metrics": [{"metric_name": {"a": "1", "b": "2"}}, {"metric_name": {"a": "1", "b": "2"}}]}
+        requests_mock.post.assert_called_once_with(self.url, json=expected, timeout=(2, 2))
+        self.assertFalse(telemetry.has_spooled_metrics())
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    @patch("samcli.lib.telemetry.telemetry.MAX_BATCH_SIZE", 2)
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_flush_must_split_metrics_into_batches(self, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
+
+        for _ in range(5):
+            telemetry.emit(self.metric_mock)
+        telemetry.flush()
+
+        self.assertEqual([len(c.kwargs["json"]["metrics"]) for c in requests_mock.post.call_args_list], [2, 2, 1])
+
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_flush_must_keep_metrics_if_backend_is_not_reachable(self, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
+        requests_mock.exceptions.Timeout = requests.exceptions.Timeout
+        requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
+        requests_mock.post.side_effect = requests.exceptions.ConnectionError()
+
+        telemetry.emit(self.metric_mock)
+        telemetry.flush()
+
+        self.assertEqual(self._read_spool(), [{"metric_name": {"a": "1", "b": "2"}}])
+        self.assertEqual(os.listdir(self.temp_dir), ["spool.jsonl"])
+
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_flush_must_drop_oldest_metrics_if_spool_is_full(self, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
+        requests_mock.exceptions.Timeout = requests.exceptions.Timeout
+        requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
+        requests_mock.post.side_effect = requests.exceptions.ConnectionError()
+
+        telemetry._spool(*[{"metric": index} for index in range(MAX_SPOOLED_METRICS + 10)])
+        telemetry.flush()
+
+        spooled_metrics = self._read_spool()
+        self.assertEqual(len(spooled_metrics), MAX_SPOOLED_METRICS)
+        self.assertEqual(spooled_metrics[0], {"metric": 10})
+
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_flush_must_send_metrics_of_abandoned_flushes(self, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
+        abandoned_path = Path(self.temp_dir, "spool.jsonl.abandoned")
+        abandoned_path.write_text(json.dumps({"abandoned": {}}) + "\n")
+        os.utime(abandoned_path, (time.time() - 3600, time.time() - 3600))
+        in_progress_path = Path(self.temp_dir, "spool.jsonl.in_progress")
+        in_progress_path.write_text(json.dumps({"in_progress": {}}) + "\n")
+
+        telemetry.flush()
+
+        requests_mock.post.assert_called_once_with(self.url, json={"metrics": [{"abandoned": {}}]}, timeout=ANY)
+        self.assertEqual(os.listdir(self.temp_dir), ["spool.jsonl.in_progress"])
+
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_flush_must_do_nothing_if_nothing_spooled(self, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
+
+        telemetry.flush()
+
+        requests_mock.post.assert_not_called()
 
     @patch("samcli.lib.telemetry.telemetry.requests")
     def test_request_must_wait_for_2_seconds_for_response(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
 
-        telemetry._send(self.metric_mock, wait_for_response=True)
+        telemetry._send([{}], wait_for_response=True)
         requests_mock.post.assert_called_once_with(ANY, json=ANY, timeout=(2, 2))
 
     @patch("samcli.lib.telemetry.telemetry.requests")
     def test_must_swallow_timeout_exception(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
 
         # If we Mock the entire requests library, this statement will run into issues
         #   `except requests.exceptions.Timeout`
@@ -69,47 +151,121 @@ class TestTelemetry(TestCase):
         requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
         requests_mock.post.side_effect = requests.exceptions.Timeout()
 
-        telemetry.emit(self.metric_mock)
+        self.assertTrue(telemetry._send([{}]))
 
     @patch("samcli.lib.telemetry.telemetry.requests")
     def test_must_swallow_connection_error_exception(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
 
         requests_mock.exceptions.Timeout = requests.exceptions.Timeout
         requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
         requests_mock.post.side_effect = requests.exceptions.ConnectionError()
 
-        telemetry.emit(self.metric_mock)
+        self.assertFalse(telemetry._send([{}]))
 
     @patch("samcli.lib.telemetry.telemetry.requests")
     def test_must_raise_on_other_requests_exception(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
 
         requests_mock.exceptions.Timeout = requests.exceptions.Timeout
         requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
         requests_mock.post.side_effect = IOError()
 
         with self.assertRaises(IOError):
-            telemetry.emit(self.metric_mock)
+            telemetry._send([{}])
+
+    def test_must_swallow_spool_errors(self):
+        telemetry = Telemetry(url=self.url, spool_path=Path(self.temp_dir, "not_a_dir", "spool.jsonl"))
+        Path(self.temp_dir, "not_a_dir").write_text("")
+
+        telemetry.emit(self.metric_mock)
 
     @patch("samcli.lib.telemetry.telemetry.DEFAULT_ENDPOINT_URL")
     def test_must_use_default_endpoint_url_if_not_customized(self, default_endpoint_url_mock):
-        telemetry = Telemetry()
+        telemetry = Telemetry(spool_path=self.spool_path)
 
         self.assertEqual(telemetry._url, default_endpoint_url_mock)
 
-    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_must_use_spool_file_in_config_dir_if_not_customized(self):
+        self.gc_mock.return_value.config_dir = self.temp_dir
+        telemetry = Telemetry()
+
+        self.assertEqual(telemetry._spool_path, Path(self.temp_dir, "telemetry-spool.jsonl"))
+
     @patch("samcli.lib.telemetry.telemetry.GlobalConfig")
-    def test_must_not_send_when_telemetry_disabled(self, gc_mock, requests_mock):
-        telemetry = Telemetry(url=self.url)
+    def test_must_not_spool_when_telemetry_disabled(self, gc_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
         gc_mock.return_value.telemetry_enabled = False
         telemetry.emit(self.metric_mock)
-        requests_mock.post.assert_not_called()
+        self.assertFalse(telemetry.has_spooled_metrics())
 
     @patch("samcli.lib.telemetry.telemetry.requests")
     @patch("samcli.lib.telemetry.telemetry.GlobalConfig")
-    def test_must_send_when_telemetry_disabled_but_forced(self, gc_mock, requests_mock):
-        telemetry = Telemetry(url=self.url)
+    def test_must_send_immediately_when_telemetry_disabled_but_forced(self, gc_mock, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
         gc_mock.return_value.telemetry_enabled = False
         telemetry.emit(self.metric_mock, force_emit=True)
-        requests_mock.post.assert_called()
+        self.assertFalse(telemetry.has_spooled_metrics())
+        requests_mock.post.assert_called_once_with(
+            self.url, json={"metrics": [{"metric_name": {"a": "1", "b": "2"}}]}, timeout=ANY
+        )
+
+    @patch("samcli.lib.telemetry.telemetry.requests")
+    def test_flush_must_drop_spooled_metrics_when_telemetry_disabled(self, requests_mock):
+        telemetry = Telemetry(url=self.url, spool_path=self.spool_path)
+        telemetry.emit(self.metric_mock)
+        self.gc_mock.return_value.telemetry_enabled = False
+
+        telemetry.flush()
+
+        requests_mock.post.assert_not_called()
+        self.assertFalse(telemetry.has_spooled_metrics())
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+@patch("samcli.lib.telemetry.telemetry.subprocess")
+@patch("samcli.lib.telemetry.telemetry.threading")
+@patch("samcli.lib.telemetry.telemetry.Telemetry")
+class TestFlushInBackground(TestCase):
+    def test_must_start_detached_process_on_exit(self, telemetry_mock, threading_mock, subprocess_mock):
+        telemetry_mock.return_value.has_spooled_metrics.return_value = True
+
+        with patch("samcli.lib.telemetry.telemetry.sys") as sys_mock:
+            sys_mock.frozen = False
+            sys_mock.platform = "linux"
+            flush_in_background(on_exit=False)
+            subprocess_mock.Popen.assert_not_called()
+
+            flush_in_background(on_exit=True)
+
+        subprocess_mock.Popen.assert_called_once_with(
+            [sys_mock.executable, "-m", "samcli.lib.telemetry.telemetry"],
+            stdin=subprocess_mock.DEVNULL,
+            stdout=subprocess_mock.DEVNULL,
+            stderr=subprocess_mock.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+        threading_mock.Thread.assert_not_called()
+
+    def test_must_start_daemon_thread_on_start_if_frozen(self, telemetry_mock, threading_mock, subprocess_mock):
+        telemetry_mock.return_value.has_spooled_metrics.return_value = True
+
+        with patch("samcli.lib.telemetry.telemetry.sys") as sys_mock:
+            sys_mock.frozen = True
+            flush_in_background(on_exit=True)
+            threading_mock.Thread.assert_not_called()
+
+            flush_in_background(on_exit=False)
+
+        threading_mock.Thread.assert_called_once_with(target=telemetry_mock.return_value.flush, daemon=True)
+        threading_mock.Thread.return_value.start.assert_called_once_with()
+        subprocess_mock.Popen.assert_not_called()
+
+    def test_must_not_flush_if_nothing_spooled(self, telemetry_mock, threading_mock, subprocess_mock):
+        telemetry_mock.return_value.has_spooled_metrics.return_value = False
+
+        flush_in_background(on_exit=True)
+
+        subprocess_mock.Popen.assert_not_called()
+        threading_mock.Thread.assert_not_called()
@@ -1,7 +1,9 @@
 """
 Unit tests for file observer
 """
-
+import os
+import tempfile
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
 
@@ -15,8 +17,10 @@ from samcli.lib.utils.file_observer import (
     ImageObserver,
     ImageObserverException,
     LambdaFunctionObserver,
+    PathChecksum,
     SingletonFileObserver,
 )
+from samcli.lib.utils.hash import dir_checksum
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 
 
@@ -67,8 +71,8 @@ class FileObserver_watch(TestCase):
             FileObserver(self.on_change)
 
     @patch("samcli.lib.utils.file_observer.Path")
-    @patch("samcli.lib.utils.file_observer.calculate_checksum")
-    def test_path_get_watched_successfully(self, calculate_checksum_mock, PathMock):
+    @patch("samcli.lib.utils.file_observer.PathChecksum")
+    def test_path_get_watched_successfully(self, PathChecksumMock, PathMock):
         path_str = "path"
         parent_path = "parent_path"
         check_sum = "1234565432"
@@ -79,7 +83,7 @@ class FileObserver_watch(TestCase):
 
         path_mock.exists.return_value = True
 
-        calculate_checksum_mock.return_value = check_sum
+        PathChecksumMock.return_value.checksum = check_sum
 
         self.observer.watch(path_str)
 
@@ -106,8 +110,8 @@ class FileObserver_watch(TestCase):
         )
 
     @patch("samcli.lib.utils.file_observer.Path")
-    @patch("samcli.lib.utils.file_observer.calculate_checksum")
-    def test_parent_path_get_watched_only_one_time(self, calculate_checksum_mock, PathMock):
+    @patch("samcli.lib.utils.file_observer.PathChecksum")
+    def test_parent_path_get_watched_only_one_time(self, PathChecksumMock, PathMock):
         path1_str = "path1"
         path2_str = "path2"
         parent_path = "parent_path"
@@ -119,7 +123,7 @@ class FileObserver_watch(TestCase):
 
         path_mock.exists.return_value = True
 
-        calculate_checksum_mock.return_value = check_sum
+        PathChecksumMock.return_value.checksum = check_sum
 
         self.observer.watch(path1_str)
         self.observer.watch(path2_str)
@@ -336,7 +340,7 @@ class FileObserver_on_change(TestCase):
 
         path_mock.exists.return_value = True
 
-        self.observer._single_file_observer.on_change(event)
+        self.observer._single_file_observer._process_events([event])
 
         self.assertEqual(
             self.observer._single_file_observer._observed_paths_per_group,
@@ -365,7 +369,7 @@ class FileObserver_on_change(TestCase):
 
         path_mock.exists.return_value = True
 
-        self.observer._single_file_observer.on_change(event)
+        self.observer._single_file_observer._process_events([event])
 
         self.assertEqual(
             self.observer._single_file_observer._observed_paths_per_group,
@@ -393,7 +397,7 @@ class FileObserver_on_change(TestCase):
 
         path_mock.exists.side_effect = [False, True]
 
-        self.observer._single_file_observer.on_change(event)
+        self.observer._single_file_observer._process_events([event])
 
         self.assertEqual(
             self.observer._single_file_observer._observed_paths_per_group,
@@ -406,6 +410,145 @@ class FileObserver_on_change(TestCase):
         )
         self.on_change.assert_called_once_with(["parent_path1/path1"])
 
+    @patch("samcli.lib.utils.file_observer.Path")
+    def test_only_changed_sub_paths_are_rehashed(self, PathMock):
+        event1 = Mock(event_type="modified", src_path="parent_path1/path1/sub_path1")
+        event2 = Mock(event_type="modified", src_path="parent_path1/path1/sub_path2")
+        PathMock.return_value.exists.return_value = True
+
+        path_checksum_mock = Mock()
+        path_checksum_mock.checksum = "123456543"
+        self.observer._single_file_observer._path_checksums = {"parent_path1/path1": path_checksum_mock}
+
+        self.observer._single_file_observer._process_events([event1, event2])
+
+        path_checksum_mock.update.assert_called_once_with(
+            ["parent_path1/path1/sub_path1", "parent_path1/path1/sub_path2"]
+        )
+        self.on_change.assert_called_once_with(["parent_path1/path1"])
+
+    @patch("samcli.lib.utils.file_observer.Path")
+    @patch("samcli.lib.utils.file_observer.calculate_checksum")
+    def test_sibling_path_with_same_prefix_is_not_affected(self, calculate_checksum_mock, PathMock):
+        event = Mock(event_type="modified", src_path="parent_path1/path10/sub_path")
+
+        self.observer._single_file_observer._process_events([event])
+
+        calculate_checksum_mock.assert_not_called()
+        self.on_change.assert_not_called()
+
+    @patch("samcli.lib.utils.file_observer.Path")
+    def test_file_renamed_into_observed_path_is_rehashed(self, PathMock):
+        event = Mock(event_type="moved", src_path="parent_path1/tmp_file", dest_path="parent_path1/path1/sub_path")
+        PathMock.return_value.exists.return_value = True
+
+        path_checksum_mock = Mock()
+        path_checksum_mock.checksum = "123456543"
+        self.observer._single_file_observer._path_checksums = {"parent_path1/path1": path_checksum_mock}
+
+        self.observer._single_file_observer._process_events([event])
+
+        path_checksum_mock.update.assert_called_once_with(["parent_path1/path1/sub_path"])
+        self.on_change.assert_called_once_with(["parent_path1/path1"])
+
+    @patch("samcli.lib.utils.file_observer.Path")
+    def test_file_renamed_between_observed_paths_updates_both_paths(self, PathMock):
+        event = Mock(
+            event_type="moved", src_path="parent_path1/path1/sub_path", dest_path="parent_path1/path2/sub_path"
+        )
+        PathMock.return_value.exists.return_value = True
+
+        path1_checksum_mock = Mock(checksum="1111")
+        path2_checksum_mock = Mock(checksum="2222")
+        self.observer._single_file_observer._path_checksums = {
+            "parent_path1/path1": path1_checksum_mock,
+            "parent_path1/path2": path2_checksum_mock,
+        }
+
+        self.observer._single_file_observer._process_events([event])
+
+        path1_checksum_mock.update.assert_called_once_with(["parent_path1/path1/sub_path"])
+        path2_checksum_mock.update.assert_called_once_with(["parent_path1/path2/sub_path"])
+        self.on_change.assert_called_once_with(["parent_path1/path1", "parent_path1/path2"])
+
+    @patch("samcli.lib.utils.file_observer.threading")
+    def test_events_are_debounced_and_coalesced(self, threading_mock):
+        single_file_observer = self.observer._single_file_observer
+        event1 = Mock(event_type="modified", src_path="parent_path1/path1/sub_path")
+        event2 = Mock(event_type="modified", src_path="parent_path1/path2/sub_path")
+
+        with patch.object(single_file_observer, "_process_events") as process_events_mock:
+            single_file_observer.on_change(event1)
+            single_file_observer.on_change(event2)
+
+            threading_mock.Timer.assert_called_once_with(
+                single_file_observer._debounce_interval, single_file_observer._process_pending_events
+            )
+            threading_mock.Timer.return_value.start.assert_called_once()
+            process_events_mock.assert_not_called()
+
+            single_file_observer._process_pending_events()
+            process_events_mock.assert_called_once_with([event1, event2])
+
+            # a new timer is started for the events received after the batch is processed
+            single_file_observer.on_change(event1)
+            self.assertEqual(threading_mock.Timer.call_count, 2)
+
+
+class TestPathChecksum(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.temp_dir.name, "code")
+        os.makedirs(os.path.join(self.root, "sub_dir"))
+        Path(self.root, "app.py").write_text("app")
+        Path(self.root, "sub_dir", "lib.py").write_text("lib")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_checksum_matches_dir_checksum(self):
+        self.assertEqual(PathChecksum(self.root).checksum, dir_checksum(self.root))
+
+    def test_checksum_of_file(self):
+        file_path = os.path.join(self.root, "app.py")
+        path_checksum = PathChecksum(file_path)
+        Path(file_path).write_text("changed app")
+        path_checksum.update([file_path])
+        self.assertEqual(path_checksum.checksum, calculate_checksum(file_path))
+
+    def test_checksum_updated_for_changed_files(self):
+        path_checksum = PathChecksum(self.root)
+        lib_path = os.path.join(self.root, "sub_dir", "lib.py")
+        Path(lib_path).write_text("changed lib")
+
+        path_checksum.update([lib_path])
+
+        self.assertEqual(path_checksum.checksum, dir_checksum(self.root))
+
+    def test_checksum_updated_for_created_and_deleted_paths(self):
+        path_checksum = PathChecksum(self.root)
+        os.makedirs(os.path.join(self.root, "new_dir", "nested"))
+        Path(self.root, "new_dir", "nested", "new.py").write_text("new")
+        os.remove(os.path.join(self.root, "sub_dir", "lib.py"))
+        os.rmdir(os.path.join(self.root, "sub_dir"))
+
+        # only the parent directory of the created and deleted directories is reported
+        path_checksum.update([self.root])
+
+        self.assertEqual(path_checksum.checksum, dir_checksum(self.root))
+
+    def test_checksum_updated_for_deleted_file(self):
+        path_checksum = PathChecksum(self.root)
+        lib_path = os.path.join(self.root, "sub_dir", "lib.py")
+        os.remove(lib_path)
+
+        path_checksum.update([lib_path])
+
+        self.assertEqual(path_checksum.checksum, dir_checksum(self.root))
+
+    def test_checksum_is_none_for_non_existent_path(self):
+        self.assertIsNone(PathChecksum(os.path.join(self.root, "missing")).checksum)
+
 
 class FileObserver_start(TestCase):
     @patch("samcli.lib.utils.file_observer.uuid.uuid4")
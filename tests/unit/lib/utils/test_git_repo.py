@@ -1,14 +1,22 @@
+import json
+import shutil
 import subprocess
+import tempfile
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch, MagicMock, ANY, call
 import os
-from samcli.lib.utils.git_repo import GitRepo, rmtree_callback, CloneRepoException, CloneRepoUnstableStateException
+from samcli.lib.utils.git_repo import (
+    GitRepo,
+    rmtree_callback,
+    CloneRepoException,
+    CloneRepoUnstableStateException,
+    CLONE_INDEX_FILE_NAME,
+    GIT_CACHE_DIR_NAME,
+)
 
 REPO_URL = "REPO URL"
 REPO_NAME = "REPO NAME"
-CLONE_DIR = os.path.normpath("/tmp/local/clone/dir")
-EXPECTED_DEFAULT_CLONE_PATH = os.path.normpath(os.path.join(CLONE_DIR, REPO_NAME))
 COMMIT = "123"
 
 
@@ -16,7 +24,6 @@ class TestGitRepo(TestCase):
     def setUp(self):
         self.repo = GitRepo(url=REPO_URL)
         self.local_clone_dir = MagicMock()
-        self.local_clone_dir.joinpath.side_effect = lambda sub_dir: os.path.normpath(os.path.join(CLONE_DIR, sub_dir))
 
     def test_ensure_clone_directory_exists(self):
         self.repo._ensure_clone_directory_exists(self.local_clone_dir)  # No exception is thrown
@@ -47,177 +54,181 @@ class TestGitRepo(TestCase):
         with self.assertRaises(OSError):
             self.repo._git_executable()
 
-    @patch("samcli.lib.utils.git_repo.Path.exists")
-    @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_happy_case(self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock):
-        path_exist_mock.return_value = False
-        self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME)
-        self.local_clone_dir.mkdir.assert_called_once_with(mode=0o700, parents=True, exist_ok=True)
-        popen_mock.assert_called_once_with(["git"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        check_output_mock.assert_has_calls(
-            [call(["git", "clone", self.repo.url, REPO_NAME], cwd=ANY, stderr=subprocess.STDOUT)]
+
+class TestGitRepoClone(TestCase):
+    def setUp(self):
+        self.repo = GitRepo(url=REPO_URL)
+        self.clone_dir = Path(tempfile.mkdtemp())
+        self.clone_path = self.clone_dir.joinpath(REPO_NAME)
+        self.cache_path = self.clone_dir.joinpath(GIT_CACHE_DIR_NAME, REPO_NAME)
+        self.missing_commits = set()
+
+        self.popen_patch = patch("samcli.lib.utils.git_repo.subprocess.Popen")
+        self.popen_mock = self.popen_patch.start()
+        self.check_output_patch = patch("samcli.lib.utils.git_repo.check_output", side_effect=self._git)
+        self.check_output_mock = self.check_output_patch.start()
+
+    def tearDown(self):
+        self.check_output_patch.stop()
+        self.popen_patch.stop()
+        shutil.rmtree(self.clone_dir)
+
+    def _git(self, command, cwd, stderr):
+        """Emulates the git commands run in the cache repository, the checked out commit is written to manifest.json"""
+        if command[1] == "init":
+            Path(cwd, ".git").mkdir()
+        elif command[1] == "fetch":
+            if command[-1] in self.missing_commits:
+                raise subprocess.CalledProcessError(128, command, b"fatal: couldn't find remote ref")
+            Path(cwd, ".git", "FETCH_HEAD").write_text(command[-1])
+        elif command[1] == "checkout":
+            Path(cwd, "manifest.json").write_text(Path(cwd, ".git", "FETCH_HEAD").read_text())
+        elif command[1] == "rev-parse":
+            return Path(cwd, ".git", "FETCH_HEAD").read_text().encode("utf-8") + b"\n"
+        return b""
+
+    def _git_commands(self):
+        return [c.args[0][1] for c in self.check_output_mock.call_args_list]
+
+    def test_clone_happy_case(self):
+        path = self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME)
+
+        self.assertEqual(path, self.clone_path)
+        self.assertEqual(self.repo.local_path, self.clone_path)
+        self.popen_mock.assert_called_with(["git"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self.check_output_mock.assert_has_calls(
+            [
+                call(["git", "init", "-q"], cwd=self.cache_path, stderr=subprocess.STDOUT),
+                call(
+                    ["git", "fetch", "-q", "--depth", "1", "--no-tags", REPO_URL, "HEAD"],
+                    cwd=self.cache_path,
+                    stderr=subprocess.STDOUT,
+                ),
+                call(
+                    ["git", "checkout", "-q", "--force", "--detach", "FETCH_HEAD"],
+                    cwd=self.cache_path,
+                    stderr=subprocess.STDOUT,
+                ),
+            ]
         )
-        shutil_mock.rmtree.assert_not_called()
-        shutil_mock.copytree.assert_called_with(ANY, EXPECTED_DEFAULT_CLONE_PATH, ignore=ANY)
-        shutil_mock.ignore_patterns.assert_called_with("*.git")
+        self.assertEqual(self.clone_path.joinpath("manifest.json").read_text(), "HEAD")
+        self.assertFalse(self.clone_path.joinpath(".git").exists())
 
-    @patch("samcli.lib.utils.git_repo.Path.exists")
-    @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_create_new_local_repo(
-        self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock
-    ):
-        path_exist_mock.return_value = False
-        self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME)
-        shutil_mock.rmtree.assert_not_called()
-        shutil_mock.copytree.assert_called_with(ANY, EXPECTED_DEFAULT_CLONE_PATH, ignore=ANY)
-        shutil_mock.ignore_patterns.assert_called_with("*.git")
-
-    @patch("samcli.lib.utils.git_repo.Path.exists")
-    @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_replace_current_local_repo_if_replace_existing_flag_is_set(
-        self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock
-    ):
-        path_exist_mock.return_value = True
-        self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME, replace_existing=True)
-        self.local_clone_dir.mkdir.assert_called_once_with(mode=0o700, parents=True, exist_ok=True)
-        shutil_mock.rmtree.assert_called_with(EXPECTED_DEFAULT_CLONE_PATH, onerror=rmtree_callback)
-        shutil_mock.copytree.assert_called_with(ANY, EXPECTED_DEFAULT_CLONE_PATH, ignore=ANY)
-        shutil_mock.ignore_patterns.assert_called_with("*.git")
+    def test_clone_with_commit(self):
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, commit=COMMIT)
+
+        self.check_output_mock.assert_any_call(
+            ["git", "fetch", "-q", "--depth", "1", "--no-tags", REPO_URL, COMMIT],
+            cwd=self.cache_path,
+            stderr=subprocess.STDOUT,
+        )
+        self.assertEqual(self.clone_path.joinpath("manifest.json").read_text(), COMMIT)
+        with open(self.clone_path.joinpath(CLONE_INDEX_FILE_NAME)) as index_file:
+            index = json.load(index_file)
+        self.assertEqual(index["url"], REPO_URL)
+        self.assertEqual(index["commit"], COMMIT)
+        self.assertEqual(list(index["files"].keys()), ["manifest.json"])
+
+    def test_clone_must_not_run_git_if_local_clone_is_up_to_date(self):
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True, commit=COMMIT)
+        self.check_output_mock.reset_mock()
+
+        repo = GitRepo(url=REPO_URL)
+        path = repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True, commit=COMMIT)
+
+        self.assertEqual(path, self.clone_path)
+        self.assertTrue(repo.clone_attempted)
+        self.check_output_mock.assert_not_called()
+
+    def test_clone_must_fetch_only_new_commit_into_existing_cache(self):
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True, commit=COMMIT)
+        self.check_output_mock.reset_mock()
+
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True, commit="456")
+
+        self.assertEqual(self._git_commands(), ["fetch", "checkout", "clean", "rev-parse"])
+        self.assertEqual(self.clone_path.joinpath("manifest.json").read_text(), "456")
+
+    def test_clone_must_update_local_clone_if_its_files_are_changed(self):
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True, commit=COMMIT)
+        self.clone_path.joinpath("manifest.json").write_text("changed")
+
+        self.assertFalse(self.repo.is_clone_up_to_date(self.clone_dir, REPO_NAME, COMMIT))
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True, commit=COMMIT)
+
+        self.assertEqual(self.clone_path.joinpath("manifest.json").read_text(), COMMIT)
+
+    def test_clone_must_not_be_up_to_date_for_other_url_or_without_commit(self):
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True, commit=COMMIT)
+
+        self.assertTrue(self.repo.is_clone_up_to_date(self.clone_dir, REPO_NAME, COMMIT))
+        self.assertFalse(self.repo.is_clone_up_to_date(self.clone_dir, REPO_NAME, ""))
+        self.assertFalse(GitRepo(url="other url").is_clone_up_to_date(self.clone_dir, REPO_NAME, COMMIT))
+
+    @patch("samcli.lib.utils.git_repo.LOG")
+    def test_clone_must_use_latest_commit_if_commit_not_exist(self, log_mock):
+        self.missing_commits.add(COMMIT)
+
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, commit=COMMIT)
+
+        self.assertEqual(self.clone_path.joinpath("manifest.json").read_text(), "HEAD")
+        log_mock.warning.assert_called_with("WARN: Commit not exist: %s, using the latest one", COMMIT)
+        self.assertFalse(self.repo.is_clone_up_to_date(self.clone_dir, REPO_NAME, COMMIT))
+
+    def test_clone_replace_current_local_repo_if_replace_existing_flag_is_set(self):
+        self.clone_path.mkdir()
+        self.clone_path.joinpath("old_file").write_text("old")
+
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True)
+
+        self.assertFalse(self.clone_path.joinpath("old_file").exists())
+        self.assertTrue(self.clone_path.joinpath("manifest.json").exists())
+
+    def test_clone_fail_if_current_local_repo_exists_and_replace_existing_flag_is_not_set(self):
+        self.clone_path.mkdir()
 
-    @patch("samcli.lib.utils.git_repo.Path.exists")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_fail_if_current_local_repo_exists_and_replace_existing_flag_is_not_set(
-        self, platform_mock, popen_mock, check_output_mock, path_exist_mock
-    ):
-        path_exist_mock.return_value = True
         with self.assertRaises(CloneRepoException):
-            self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME)  # replace_existing=False by default
+            self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME)  # replace_existing=False by default
 
-    @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_attempt_is_set_to_true_after_clone(self, platform_mock, popen_mock, check_output_mock, shutil_mock):
+    def test_clone_attempt_is_set_to_true_after_clone(self):
         self.assertFalse(self.repo.clone_attempted)
-        self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME)
+        self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME)
         self.assertTrue(self.repo.clone_attempted)
 
-    @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_attempt_is_set_to_true_even_if_clone_failed(
-        self, platform_mock, popen_mock, check_output_mock, shutil_mock
-    ):
-        check_output_mock.side_effect = subprocess.CalledProcessError("fail", "fail", "not found".encode("utf-8"))
+    def test_clone_attempt_is_set_to_true_even_if_clone_failed(self):
+        self.check_output_mock.side_effect = subprocess.CalledProcessError("fail", "fail", "not found".encode("utf-8"))
         self.assertFalse(self.repo.clone_attempted)
-        try:
-            with self.assertRaises(CloneRepoException):
-                self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME)
-        except:
-            pass
+        with self.assertRaises(CloneRepoException):
+            self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME)
         self.assertTrue(self.repo.clone_attempted)
 
     @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_failed_to_create_the_clone_directory(
-        self, platform_mock, popen_mock, check_output_mock, shutil_mock
-    ):
-        self.local_clone_dir.mkdir.side_effect = OSError
-        try:
-            with self.assertRaises(OSError):
-                self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME)
-        except:
-            pass
-        self.local_clone_dir.mkdir.assert_called_once_with(mode=0o700, parents=True, exist_ok=True)
-        popen_mock.assert_not_called()
-        check_output_mock.assert_not_called()
+    def test_clone_failed_to_create_the_clone_directory(self, shutil_mock):
+        clone_dir = MagicMock()
+        clone_dir.mkdir.side_effect = OSError
+        with self.assertRaises(OSError):
+            self.repo.clone(clone_dir=clone_dir, clone_name=REPO_NAME)
+        clone_dir.mkdir.assert_called_once_with(mode=0o700, parents=True, exist_ok=True)
+        self.popen_mock.assert_not_called()
+        self.check_output_mock.assert_not_called()
         shutil_mock.assert_not_called()
 
-    @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_when_the_subprocess_fail(self, platform_mock, popen_mock, check_output_mock, shutil_mock):
-        check_output_mock.side_effect = subprocess.CalledProcessError("fail", "fail", "any reason".encode("utf-8"))
+    def test_clone_when_the_subprocess_fail(self):
+        self.check_output_mock.side_effect = subprocess.CalledProcessError("fail", "fail", "any reason".encode("utf-8"))
         with self.assertRaises(CloneRepoException):
-            self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME)
+            self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME)
 
     @patch("samcli.lib.utils.git_repo.LOG")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_when_the_git_repo_not_found(self, platform_mock, popen_mock, check_output_mock, log_mock):
-        check_output_mock.side_effect = subprocess.CalledProcessError("fail", "fail", "not found".encode("utf-8"))
-        try:
-            with self.assertRaises(CloneRepoException):
-                self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME)
-        except Exception:
-            pass
-        log_mock.warning.assert_called()
-
-    @patch("samcli.lib.utils.git_repo.Path.exists")
-    @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_when_failed_to_move_cloned_repo_from_temp_to_final_destination(
-        self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock
-    ):
-        path_exist_mock.return_value = True
-        shutil_mock.copytree.side_effect = OSError
-        try:
-            with self.assertRaises(CloneRepoUnstableStateException):
-                self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME, replace_existing=True)
-        except Exception:
-            pass
-        shutil_mock.rmtree.assert_called_once_with(EXPECTED_DEFAULT_CLONE_PATH, onerror=rmtree_callback)
-        shutil_mock.copytree.assert_called_once_with(ANY, EXPECTED_DEFAULT_CLONE_PATH, ignore=ANY)
-        shutil_mock.ignore_patterns.assert_called_once_with("*.git")
-
-    @patch("samcli.lib.utils.git_repo.LOG")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    def test_checkout_commit_when_commit_not_exist(self, check_output_mock, log_mock):
-        check_output_mock.side_effect = subprocess.CalledProcessError(
-            "fail", "fail", "fatal: reference is not a tree".encode("utf-8")
-        )
-        try:
-            with self.assertRaises(CloneRepoException):
-                self.repo._checkout_commit(repo_dir="test", commit="1234")
-        except Exception:
-            pass
+    def test_clone_when_the_git_repo_not_found(self, log_mock):
+        self.check_output_mock.side_effect = subprocess.CalledProcessError("fail", "fail", "not found".encode("utf-8"))
+        with self.assertRaises(CloneRepoException):
+            self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME)
         log_mock.warning.assert_called()
 
-    @patch("samcli.lib.utils.git_repo.Path.exists")
-    @patch("samcli.lib.utils.git_repo.shutil")
-    @patch("samcli.lib.utils.git_repo.check_output")
-    @patch("samcli.lib.utils.git_repo.subprocess.Popen")
-    @patch("samcli.lib.utils.git_repo.platform.system")
-    def test_clone_with_commit(self, platform_mock, popen_mock, check_output_mock, shutil_mock, path_exist_mock):
-        path_exist_mock.return_value = False
-        self.repo.clone(clone_dir=self.local_clone_dir, clone_name=REPO_NAME, commit=COMMIT)
-        self.local_clone_dir.mkdir.assert_called_once_with(mode=0o700, parents=True, exist_ok=True)
-        popen_mock.assert_has_calls(
-            [call(["git"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)],
-            [call(["git"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)],
-        )
-        check_output_mock.assert_has_calls(
-            [call(["git", "clone", self.repo.url, REPO_NAME], cwd=ANY, stderr=subprocess.STDOUT)],
-            [call(["git", "checkout", COMMIT], cwd=ANY, stderr=subprocess.STDOUT)],
-        )
-        shutil_mock.rmtree.assert_not_called()
-        shutil_mock.copytree.assert_called_with(ANY, EXPECTED_DEFAULT_CLONE_PATH, ignore=ANY)
-        shutil_mock.ignore_patterns.assert_called_with("*.git")
+    @patch("samcli.lib.utils.git_repo.shutil.copytree")
+    def test_clone_when_failed_to_move_cloned_repo_from_cache_to_final_destination(self, copytree_mock):
+        self.clone_path.mkdir()
+        copytree_mock.side_effect = OSError
+        with self.assertRaises(CloneRepoUnstableStateException):
+            self.repo.clone(clone_dir=self.clone_dir, clone_name=REPO_NAME, replace_existing=True)
+        copytree_mock.assert_called_once_with(str(self.cache_path), os.path.normpath(self.clone_path), ignore=ANY)
@@ -5,7 +5,7 @@ import tempfile
 from unittest import TestCase
 from unittest.mock import patch
 
-from samcli.lib.utils.hash import dir_checksum, str_checksum
+from samcli.lib.utils.hash import dir_checksum, str_checksum, FileHashIndex
 
 
 class TestHash(TestCase):
@@ -122,3 +122,65 @@ class TestHash(TestCase):
     def test_str_checksum(self):
         checksum = str_checksum("Hello, World!")
         self.assertEqual(checksum, "65a8e27d8879283831b664bd8b7f0ad4")
+
+
+class TestFileHashIndex(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "test-file")
+        with open(self.file_path, "w") as f:
+            f.write("Testfile")
+        # move modification time out of the racy window, so that the file can be indexed
+        os.utime(self.file_path, (0, 0))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_unchanged_file_is_not_read_again(self):
+        hash_index = FileHashIndex()
+        checksum = hash_index.file_checksum(self.file_path)
+
+        with patch("samcli.lib.utils.hash.file_checksum") as file_checksum_mock:
+            self.assertEqual(hash_index.file_checksum(self.file_path), checksum)
+            file_checksum_mock.assert_not_called()
+
+    def test_changed_file_is_read_again(self):
+        hash_index = FileHashIndex()
+        checksum_before = hash_index.file_checksum(self.file_path)
+
+        with open(self.file_path, "w") as f:
+            f.write("Changed test file")
+        os.utime(self.file_path, (1, 1))
+
+        self.assertNotEqual(hash_index.file_checksum(self.file_path), checksum_before)
+
+    def test_recently_modified_file_is_not_indexed(self):
+        hash_index = FileHashIndex()
+        os.utime(self.file_path)
+        hash_index.file_checksum(self.file_path)
+
+        with patch("samcli.lib.utils.hash.file_checksum") as file_checksum_mock:
+            hash_index.file_checksum(self.file_path)
+            file_checksum_mock.assert_called_once()
+
+    def test_index_is_persisted(self):
+        index_file = os.path.join(self.temp_dir, "index.json")
+        hash_index = FileHashIndex(index_file)
+        checksum = hash_index.file_checksum(self.file_path)
+        hash_index.save()
+
+        with patch("samcli.lib.utils.hash.file_checksum") as file_checksum_mock:
+            self.assertEqual(FileHashIndex(index_file).file_checksum(self.file_path), checksum)
+            file_checksum_mock.assert_not_called()
+
+    def test_corrupted_index_is_ignored(self):
+        index_file = os.path.join(self.temp_dir, "index.json")
+        with open(index_file, "w") as f:
+            f.write("not a json")
+
+        self.assertEqual(
+            FileHashIndex(index_file).file_checksum(self.file_path), FileHashIndex().file_checksum(self.file_path)
+        )
+
+    def test_dir_checksum_with_index(self):
+        self.assertEqual(dir_checksum(self.temp_dir, hash_index=FileHashIndex()), dir_checksum(self.temp_dir))
@@ -0,0 +1,31 @@
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.utils.lazy_module import LazyModule
+
+
+class TestLazyModule(TestCase):
+    @patch("samcli.lib.utils.lazy_module.importlib")
+    def test_must_not_import_module_until_attribute_is_accessed(self, importlib_mock):
+        module = LazyModule("some.module")
+
+        importlib_mock.import_module.assert_not_called()
+
+        self.assertEqual(module.some_attribute, importlib_mock.import_module.return_value.some_attribute)
+        self.assertEqual(module.other_attribute, importlib_mock.import_module.return_value.other_attribute)
+
+        importlib_mock.import_module.assert_called_once_with("some.module")
+
+    def test_must_proxy_attributes_of_module(self):
+        module = LazyModule("json")
+
+        self.assertIs(module.dumps, sys.modules["json"].dumps)
+        self.assertIn("loads", dir(module))
+        self.assertEqual(module.__name__, "json")
+
+    def test_must_raise_if_attribute_does_not_exist(self):
+        module = LazyModule("json")
+
+        with self.assertRaises(AttributeError):
+            module.not_an_attribute
@@ -1,6 +1,6 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, call, patch
-from samcli.lib.utils.lock_distributor import LockChain, LockDistributor, LockDistributorType
+from samcli.lib.utils.lock_distributor import LockChain, LockDistributor, LockDistributorType, ObservableLock
 
 
 class TestLockChain(TestCase):
@@ -101,3 +101,22 @@ class TestLockDistributor(TestCase):
         self.assertEqual(result["B"], locks[2])
         self.assertEqual(result["C"], locks[3])
         self.assertEqual(distributor.get_locks(keys)["A"], locks[1])
+
+    def test_thread_get_locks_with_release_callback(self):
+        release_callback = MagicMock()
+        distributor = LockDistributor(LockDistributorType.THREAD, None, release_callback)
+        lock = distributor.get_lock("A")
+
+        self.assertIsInstance(lock, ObservableLock)
+        with lock:
+            self.assertTrue(lock.locked())
+            release_callback.assert_not_called()
+        self.assertFalse(lock.locked())
+        release_callback.assert_called_once_with("A")
+        self.assertIs(distributor.get_lock("A"), lock)
+
+    @patch("samcli.lib.utils.lock_distributor.multiprocessing.Lock")
+    def test_process_get_locks_ignores_release_callback(self, process_lock_mock):
+        distributor = LockDistributor(LockDistributorType.PROCESS, None, MagicMock())
+
+        self.assertEqual(distributor.get_lock("A"), process_lock_mock.return_value)
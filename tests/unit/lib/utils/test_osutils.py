@@ -3,7 +3,11 @@ Tests OSUtils file
 """
 
 import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
 
 from unittest import TestCase
 from unittest.mock import patch
@@ -77,3 +81,116 @@ class Test_convert_files_to_unix_line_endings:
         patched_open.assert_any_call(os.path.join("b", target_file), "rb")
         patched_open.assert_any_call(os.path.join("a", target_file), "wb")
         patched_open.assert_any_call(os.path.join("b", target_file), "wb")
+
+
+class Test_link_or_copytree(TestCase):
+    def setUp(self):
+        self.source = tempfile.mkdtemp()
+        self.destination = os.path.join(tempfile.mkdtemp(), "destination")
+        os.makedirs(os.path.join(self.source, "sub"))
+        with open(os.path.join(self.source, "file"), "w") as f:
+            f.write("content")
+        with open(os.path.join(self.source, "sub", "nested"), "w") as f:
+            f.write("nested content")
+
+    def tearDown(self):
+        shutil.rmtree(self.source, ignore_errors=True)
+        shutil.rmtree(os.path.dirname(self.destination), ignore_errors=True)
+        osutils._REFLINK_UNSUPPORTED_DEVICES.clear()
+        osutils._HARDLINK_UNSUPPORTED_DEVICES.clear()
+
+    def _read(self, *path):
+        with open(os.path.join(self.destination, *path)) as f:
+            return f.read()
+
+    def test_must_materialize_tree(self):
+        osutils.link_or_copytree(self.source, self.destination)
+
+        self.assertEqual(self._read("file"), "content")
+        self.assertEqual(self._read("sub", "nested"), "nested content")
+
+    @patch("samcli.lib.utils.osutils._reflink")
+    def test_must_hardlink_when_reflink_is_not_supported(self, reflink_mock):
+        reflink_mock.return_value = False
+
+        osutils.link_or_copytree(self.source, self.destination)
+        osutils.link_or_copytree(self.source, self.destination)
+
+        self.assertTrue(os.path.samefile(os.path.join(self.source, "file"), os.path.join(self.destination, "file")))
+        # not supported devices are not tried again
+        self.assertEqual(reflink_mock.call_count, 1)
+
+    @patch("samcli.lib.utils.osutils.os.link")
+    @patch("samcli.lib.utils.osutils._reflink")
+    def test_must_copy_when_links_are_not_supported(self, reflink_mock, link_mock):
+        reflink_mock.return_value = False
+        link_mock.side_effect = OSError("not supported")
+
+        osutils.link_or_copytree(self.source, self.destination)
+
+        self.assertEqual(self._read("sub", "nested"), "nested content")
+        self.assertFalse(os.path.samefile(os.path.join(self.source, "file"), os.path.join(self.destination, "file")))
+        self.assertEqual(link_mock.call_count, 1)
+
+    @patch("samcli.lib.utils.osutils._reflink")
+    def test_must_copy_when_hardlinks_are_not_allowed(self, reflink_mock):
+        reflink_mock.return_value = False
+
+        osutils.link_or_copytree(self.source, self.destination, allow_hardlinks=False)
+
+        self.assertEqual(self._read("sub", "nested"), "nested content")
+        self.assertFalse(os.path.samefile(os.path.join(self.source, "file"), os.path.join(self.destination, "file")))
+
+    def test_must_replace_existing_files(self):
+        os.makedirs(self.destination)
+        with open(os.path.join(self.destination, "file"), "w") as f:
+            f.write("old content")
+
+        osutils.link_or_copytree(self.source, self.destination)
+
+        self.assertEqual(self._read("file"), "content")
+
+    @patch("samcli.lib.utils.osutils._reflink")
+    def test_break_hardlinks(self, reflink_mock):
+        reflink_mock.return_value = False
+        osutils.link_or_copytree(self.source, self.destination)
+
+        osutils.break_hardlinks(self.destination)
+        with open(os.path.join(self.destination, "file"), "w") as f:
+            f.write("modified")
+
+        with open(os.path.join(self.source, "file")) as f:
+            self.assertEqual(f.read(), "content")
+        self.assertEqual(sorted(os.listdir(self.destination)), sorted(os.listdir(self.source)))
+
+
+class Test_file_lock(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.lock_file = os.path.join(self.temp_dir, "file.lock")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_must_create_lock_file(self):
+        with osutils.file_lock(self.lock_file):
+            self.assertTrue(os.path.exists(self.lock_file))
+
+    def test_must_run_code_blocks_one_at_a_time(self):
+        events = []
+
+        def locked_block(name):
+            with osutils.file_lock(self.lock_file):
+                events.append(f"{name} start")
+                time.sleep(0.05)
+                events.append(f"{name} end")
+
+        threads = [threading.Thread(target=locked_block, args=(name,)) for name in ("a", "b", "c")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(events), 6)
+        for index in range(0, len(events), 2):
+            self.assertEqual(events[index].split()[0], events[index + 1].split()[0])
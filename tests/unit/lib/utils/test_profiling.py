@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.utils import profiling
+from samcli.lib.utils.profiling import (
+    enable_profiling,
+    is_profiling_enabled,
+    profile_phase,
+    profiled,
+)
+
+
+class TestProfiling(TestCase):
+    def setUp(self):
+        self.profiler_patch = patch.object(profiling, "_PROFILER", None)
+        self.profiler_patch.start()
+        self.atexit_patch = patch("samcli.lib.utils.profiling.atexit")
+        self.atexit_mock = self.atexit_patch.start()
+
+    def tearDown(self):
+        self.atexit_patch.stop()
+        self.profiler_patch.stop()
+
+    def test_phases_are_not_recorded_if_not_enabled(self):
+        @profiled("category")
+        def function():
+            return "result"
+
+        with profile_phase("phase", "category"):
+            self.assertEqual(function(), "result")
+
+        self.assertFalse(is_profiling_enabled())
+
+    def test_phases_are_recorded_as_chrome_trace_events(self):
+        enable_profiling("trace.json")
+
+        @profiled("category", "function_phase")
+        def function():
+            with profile_phase("inner_phase", "other_category", key="value"):
+                return "result"
+
+        self.assertTrue(is_profiling_enabled())
+        self.assertEqual(function(), "result")
+
+        trace = profiling._PROFILER.get_trace()
+        events = {event["name"]: event for event in trace["traceEvents"]}
+        self.assertEqual(events["inner_phase"]["ph"], "X")
+        self.assertEqual(events["inner_phase"]["cat"], "other_category")
+        self.assertEqual(events["inner_phase"]["args"], {"key": "value"})
+        self.assertEqual(events["function_phase"]["cat"], "category")
+        self.assertEqual(events["function_phase"]["tid"], threading.get_ident())
+        # the inner phase is nested in the function phase
+        self.assertGreaterEqual(events["inner_phase"]["ts"], events["function_phase"]["ts"])
+        self.assertLessEqual(events["inner_phase"]["dur"], events["function_phase"]["dur"])
+        self.assertEqual(events["thread_name"]["args"], {"name": threading.current_thread().name})
+
+    def test_phase_is_recorded_when_it_raises(self):
+        enable_profiling("trace.json")
+
+        with self.assertRaises(ValueError):
+            with profile_phase("phase", "category"):
+                raise ValueError()
+
+        trace = profiling._PROFILER.get_trace()
+        self.assertIn("phase", [event["name"] for event in trace["traceEvents"]])
+
+    def test_trace_file_is_written_on_exit(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_file = os.path.join(temp_dir, "trace.json")
+            enable_profiling(trace_file)
+            enable_profiling(trace_file)
+            self.atexit_mock.register.assert_called_once_with(profiling._PROFILER.write)
+
+            with profile_phase("phase", "category"):
+                pass
+            profiling._PROFILER.write()
+
+            with open(trace_file) as trace:
+                trace_data = json.load(trace)
+            self.assertIn("phase", [event["name"] for event in trace_data["traceEvents"]])
@@ -1,7 +1,12 @@
+import io
+import os
+import shutil
+import tarfile
+import tempfile
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
 
-from samcli.lib.utils.tar import create_tarball
+from samcli.lib.utils.tar import create_tarball, extract_tarball, stream_tarball
 
 
 class TestTar(TestCase):
@@ -62,3 +67,108 @@ class TestTar(TestCase):
         temp_file_mock.seek.assert_called_once_with(0)
         temp_file_mock.close.assert_called_once()
         tarfile_open_patch.assert_called_once_with(fileobj=temp_file_mock, mode="w")
+
+
+class TestStreamTarball(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.layer_dir = os.path.join(self.temp_dir, "layer")
+        os.makedirs(os.path.join(self.layer_dir, "sub"))
+        os.makedirs(os.path.join(self.layer_dir, "ignored"))
+        with open(os.path.join(self.layer_dir, "file"), "w") as f:
+            f.write("content")
+        with open(os.path.join(self.layer_dir, "sub", "large_file"), "wb") as f:
+            f.write(os.urandom(3 * 1024 * 1024 + 100))
+        with open(os.path.join(self.layer_dir, "ignored", "file"), "w") as f:
+            f.write("ignored")
+        os.link(os.path.join(self.layer_dir, "file"), os.path.join(self.layer_dir, "hardlink"))
+        self.dockerfile = os.path.join(self.temp_dir, "dockerfile")
+        with open(self.dockerfile, "w") as f:
+            f.write("FROM base")
+        self.tar_paths = {self.dockerfile: "Dockerfile", self.layer_dir: "/layer1"}
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_must_generate_same_tarball_as_create_tarball(self):
+        def tar_filter(tar_info):
+            tar_info.mode = 0o500
+            return tar_info
+
+        for current_filter in (None, tar_filter):
+            with create_tarball(self.tar_paths, tar_filter=current_filter) as tarballfile:
+                expected = tarballfile.read()
+
+            actual = b"".join(stream_tarball(self.tar_paths, tar_filter=current_filter))
+
+            self.assertEqual(actual, expected)
+
+    def test_must_skip_entries_filtered_out(self):
+        def tar_filter(tar_info):
+            return None if tar_info.name.endswith("ignored") else tar_info
+
+        content = b"".join(stream_tarball(self.tar_paths, tar_filter=tar_filter))
+
+        with tarfile.open(fileobj=io.BytesIO(content)) as archive:
+            names = archive.getnames()
+            self.assertEqual(archive.extractfile("layer1/file").read(), b"content")
+            self.assertTrue(archive.getmember("layer1/hardlink").islnk())
+        self.assertNotIn("layer1/ignored", names)
+        self.assertNotIn("layer1/ignored/file", names)
+        self.assertIn("layer1/sub/large_file", names)
+
+    def test_must_generate_chunks_and_report_progress(self):
+        progress_callback = Mock()
+
+        chunks = list(stream_tarball(self.tar_paths, progress_callback=progress_callback))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunks))
+        self.assertEqual(len(b"".join(chunks)) % tarfile.RECORDSIZE, 0)
+        sizes = [args[0] for args, _ in progress_callback.call_args_list]
+        self.assertEqual(sizes, sorted(sizes))
+        self.assertEqual(sizes[-1], sum(len(chunk) for chunk in chunks))
+
+
+class TestExtractTarball(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_dir, "source")
+        os.makedirs(os.path.join(self.source_dir, "sub"))
+        with open(os.path.join(self.source_dir, "file"), "w") as f:
+            f.write("content")
+        self.large_content = os.urandom(3 * 1024 * 1024 + 100)
+        with open(os.path.join(self.source_dir, "sub", "large_file"), "wb") as f:
+            f.write(self.large_content)
+        os.chmod(os.path.join(self.source_dir, "file"), 0o755)
+        self.output_dir = os.path.join(self.temp_dir, "output")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_must_extract_tarball_from_chunks(self):
+        content = b"".join(stream_tarball({self.source_dir: "."}))
+        # chunks of different sizes, like the ones received from Docker, including empty ones
+        chunks = [content[:1], b"", content[1:700], content[700 : 1024 * 1024 + 3], content[1024 * 1024 + 3 :]]
+
+        extract_tarball(chunks, self.output_dir)
+
+        with open(os.path.join(self.output_dir, "file")) as f:
+            self.assertEqual(f.read(), "content")
+        with open(os.path.join(self.output_dir, "sub", "large_file"), "rb") as f:
+            self.assertEqual(f.read(), self.large_content)
+        if os.name != "nt":
+            self.assertEqual(os.stat(os.path.join(self.output_dir, "file")).st_mode & 0o777, 0o755)
+
+    def test_must_extract_while_chunks_are_being_received(self):
+        content = b"".join(stream_tarball({self.source_dir: "."}))
+        extracted_before_last_chunk = []
+
+        def chunks():
+            yield content[: len(content) // 2]
+            extracted_before_last_chunk.append(os.path.exists(os.path.join(self.output_dir, "file")))
+            yield content[len(content) // 2 :]
+
+        extract_tarball(chunks(), self.output_dir)
+
+        self.assertEqual(extracted_before_last_chunk, [True])
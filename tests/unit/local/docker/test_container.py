@@ -554,7 +554,7 @@ class TestContainer_wait_for_result(TestCase):
         stderr_mock = Mock()
         response = Mock()
         response.content = b'{"hello":"world"}'
-        mock_requests.post.return_value = response
+        mock_requests.Session.return_value.post.return_value = response
 
         patched_socket.return_value = self.socket_mock
 
@@ -575,7 +575,7 @@ class TestContainer_wait_for_result(TestCase):
         host = self.container._container_host
         port = self.container.rapid_port_host
         self.socket_mock.connect_ex.assert_called_with((host, port))
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.post.assert_called_with(
             self.container.URL.format(host=host, port=port, function_name="function"),
             data=b"{}",
             timeout=(self.container.RAPID_CONNECTION_TIMEOUT, None),
@@ -596,7 +596,11 @@ class TestContainer_wait_for_result(TestCase):
         stdout_mock = Mock()
         stderr_mock = Mock()
         self.container.rapid_port_host = "7077"
-        mock_requests.post.side_effect = [RequestException(), RequestException(), RequestException()]
+        mock_requests.Session.return_value.post.side_effect = [
+            RequestException(),
+            RequestException(),
+            RequestException(),
+        ]
 
         patched_socket.return_value = self.socket_mock
 
@@ -605,8 +609,8 @@ class TestContainer_wait_for_result(TestCase):
                 event=self.event, full_path=self.name, stdout=stdout_mock, stderr=stderr_mock
             )
 
-        self.assertEqual(mock_requests.post.call_count, 3)
-        calls = mock_requests.post.call_args_list
+        self.assertEqual(mock_requests.Session.return_value.post.call_count, 3)
+        calls = mock_requests.Session.return_value.post.call_args_list
         self.assertEqual(
             calls,
             [
@@ -642,7 +646,7 @@ class TestContainer_wait_for_result(TestCase):
 
         stdout_mock = Mock()
         stderr_mock = Mock()
-        mock_requests.post.side_effect = ContainerResponseException()
+        mock_requests.Session.return_value.post.side_effect = ContainerResponseException()
 
         patched_socket.return_value = self.socket_mock
 
@@ -676,7 +680,7 @@ class TestContainer_wait_for_result(TestCase):
                 event=self.event, full_path=self.name, stdout=stdout_mock, stderr=stderr_mock
             )
 
-        self.assertEqual(mock_requests.post.call_count, 0)
+        self.assertEqual(mock_requests.Session.return_value.post.call_count, 0)
 
 
 class TestContainer_wait_for_logs(TestCase):
@@ -806,6 +810,71 @@ class TestContainer_wait_for_socket_connection(TestCase):
 
         self.container._wait_for_socket_connection()
 
+    @patch("samcli.local.docker.container.time")
+    @patch("socket.socket")
+    def test_retries_with_backoff_until_able_to_connect(self, patched_socket, time_mock):
+        socket_mock = Mock()
+        socket_mock.connect_ex.side_effect = [111] * 7 + [0]
+        patched_socket.return_value = socket_mock
+        time_mock.time.return_value = 0
+
+        self.container._wait_for_socket_connection()
+
+        self.assertEqual(
+            time_mock.sleep.call_args_list,
+            [call(0.005), call(0.01), call(0.02), call(0.04), call(0.08), call(0.1), call(0.1)],
+        )
+        self.assertEqual(socket_mock.close.call_count, 8)
+
+    @patch("socket.socket")
+    def test_does_not_wait_again_once_connected(self, patched_socket):
+        socket_mock = Mock()
+        socket_mock.connect_ex.return_value = 0
+        patched_socket.return_value = socket_mock
+
+        self.container._wait_for_socket_connection()
+        self.container._wait_for_socket_connection()
+
+        socket_mock.connect_ex.assert_called_once()
+
+        # container is restarted, so it should wait for the socket again
+        self.container.is_created = Mock(return_value=True)
+        self.container.start()
+        self.container._wait_for_socket_connection()
+        self.assertEqual(socket_mock.connect_ex.call_count, 2)
+
+
+class TestContainer_http_session(TestCase):
+    def setUp(self):
+        self.mock_docker_client = Mock()
+        self.container = Container(IMAGE, "cmd", "working_dir", "host_dir", docker_client=self.mock_docker_client)
+        self.container.id = "someid"
+        self.container.is_created = Mock(return_value=True)
+
+    @patch("samcli.local.docker.container.requests")
+    def test_session_is_reused_across_invokes(self, mock_requests):
+        session_mock = mock_requests.Session.return_value
+        session_mock.post.return_value = Mock(content=b"{}")
+
+        self.container.wait_for_http_response("name", "{}", Mock())
+        self.container.wait_for_http_response("name", "{}", Mock())
+
+        mock_requests.Session.assert_called_once()
+        self.assertEqual(session_mock.post.call_count, 2)
+
+    @patch("samcli.local.docker.container.requests")
+    def test_session_is_closed_when_container_is_deleted(self, mock_requests):
+        session_mock = mock_requests.Session.return_value
+        session_mock.post.return_value = Mock(content=b"{}")
+        self.container.wait_for_http_response("name", "{}", Mock())
+
+        self.container.delete()
+
+        session_mock.close.assert_called_once()
+        self.container.is_created.return_value = True
+        self.container.wait_for_http_response("name", "{}", Mock())
+        self.assertEqual(mock_requests.Session.call_count, 2)
+
 
 class TestContainer_image(TestCase):
     def test_must_return_image_value(self):
@@ -821,9 +890,8 @@ class TestContainer_copy(TestCase):
         self.container = Container(IMAGE, "cmd", "dir", "dir", docker_client=self.mock_client)
         self.container.id = "containerid"
 
-    @patch("samcli.local.docker.container.tempfile")
-    @patch("samcli.local.docker.container.tarfile")
-    def test_must_copy_files_from_container(self, tarfile_mock, tempfile_mock):
+    @patch("samcli.local.docker.container.extract_tarball")
+    def test_must_copy_files_from_container(self, extract_tarball_mock):
         source = "source"
         dest = "dest"
 
@@ -831,24 +899,11 @@ class TestContainer_copy(TestCase):
         real_container_mock = self.mock_client.containers.get.return_value = Mock()
         real_container_mock.get_archive.return_value = (tar_stream, "ignored")
 
-        tempfile_ctxmgr = tempfile_mock.NamedTemporaryFile.return_value = Mock()
-        fp_mock = Mock()
-        tempfile_ctxmgr.__enter__ = Mock(return_value=fp_mock)
-        tempfile_ctxmgr.__exit__ = Mock()
-
-        tarfile_ctxmgr = tarfile_mock.open.return_value = Mock()
-        tar_mock = Mock()
-        tarfile_ctxmgr.return_value.__enter__ = Mock(return_value=tar_mock)
-        tarfile_ctxmgr.return_value.__exit__ = Mock()
-
         self.container.copy(source, dest)
 
-        # Make sure archive data is written to the file
-        fp_mock.write.assert_has_calls([call(x) for x in tar_stream], any_order=False)
-
-        # Make sure we open the tarfile right and extract to right location
-        tarfile_mock.open.assert_called_with(fileobj=fp_mock, mode="r")
-        tar_mock.extractall(path=dest)
+        real_container_mock.get_archive.assert_called_once_with(source)
+        # Make sure the archive is extracted from the stream to right location
+        extract_tarball_mock.assert_called_once_with(tar_stream, dest)
 
     def test_raise_if_container_is_not_created(self):
         source = "source"
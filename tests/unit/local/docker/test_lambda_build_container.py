@@ -6,18 +6,19 @@ import json
 import pathlib
 
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from parameterized import parameterized
 
 from samcli.lib.utils.architecture import X86_64, ARM64
-from samcli.local.docker.lambda_build_container import LambdaBuildContainer
+from samcli.local.docker.exceptions import ContainerExecutableNotFoundException
+from samcli.local.docker.lambda_build_container import LambdaBuildContainer, WarmLambdaBuildContainer
 
 
 class TestLambdaBuildContainer_init(TestCase):
-    @patch.object(LambdaBuildContainer, "_make_request")
-    @patch.object(LambdaBuildContainer, "_get_image")
-    @patch.object(LambdaBuildContainer, "_get_entrypoint")
+    @patch.object(LambdaBuildContainer, "make_request")
+    @patch.object(LambdaBuildContainer, "get_image")
+    @patch.object(LambdaBuildContainer, "get_entrypoint")
     @patch.object(LambdaBuildContainer, "_get_container_dirs")
     def test_must_init_class(self, get_container_dirs_mock, get_entrypoint_mock, get_image_mock, make_request_mock):
 
@@ -84,7 +85,7 @@ class TestLambdaBuildContainer_make_request(TestCase):
             "manifest_dir": "manifest_dir",
         }
 
-        result = LambdaBuildContainer._make_request(
+        result = LambdaBuildContainer.make_request(
             "protocol",
             "language",
             "dependency",
@@ -174,7 +175,7 @@ class TestLambdaBuildContainer_get_image(TestCase):
         ]
     )
     def test_must_get_image_name(self, runtime, architecture, expected_image_name):
-        self.assertEqual(expected_image_name, LambdaBuildContainer._get_image(runtime, architecture))
+        self.assertEqual(expected_image_name, LambdaBuildContainer.get_image(runtime, architecture))
 
 
 class TestLambdaBuildContainer_get_image_tag(TestCase):
@@ -190,7 +191,7 @@ class TestLambdaBuildContainer_get_image_tag(TestCase):
 
 class TestLambdaBuildContainer_get_entrypoint(TestCase):
     def test_must_get_entrypoint(self):
-        self.assertEqual(["lambda-builders", "requestjson"], LambdaBuildContainer._get_entrypoint("requestjson"))
+        self.assertEqual(["lambda-builders", "requestjson"], LambdaBuildContainer.get_entrypoint("requestjson"))
 
 
 class TestLambdaBuildContainer_convert_to_container_dirs(TestCase):
@@ -200,7 +201,7 @@ class TestLambdaBuildContainer_convert_to_container_dirs(TestCase):
         mapping = {str(pathlib.Path(".").resolve()): "/first", "../foo": "/second", "/some/abs/path": "/third"}
 
         expected = ["/first", "/second", "/third"]
-        result = LambdaBuildContainer._convert_to_container_dirs(input, mapping)
+        result = LambdaBuildContainer.convert_to_container_dirs(input, mapping)
 
         self.assertEqual(result, expected)
 
@@ -210,7 +211,7 @@ class TestLambdaBuildContainer_convert_to_container_dirs(TestCase):
         mapping = {"/known/path": "/first"}
 
         expected = ["/first", "/unknown/path"]
-        result = LambdaBuildContainer._convert_to_container_dirs(input, mapping)
+        result = LambdaBuildContainer.convert_to_container_dirs(input, mapping)
 
         self.assertEqual(result, expected)
 
@@ -220,6 +221,113 @@ class TestLambdaBuildContainer_convert_to_container_dirs(TestCase):
         mapping = {"/known/path": "/first"}
 
         expected = None
-        result = LambdaBuildContainer._convert_to_container_dirs(input, mapping)
+        result = LambdaBuildContainer.convert_to_container_dirs(input, mapping)
 
         self.assertEqual(result, expected)
+
+
+class TestWarmLambdaBuildContainer(TestCase):
+    def setUp(self):
+        self.mount_dir = str(pathlib.Path("/base/dir").resolve())
+        self.container = WarmLambdaBuildContainer(
+            "/base/dir", "python3.9", ARM64, log_level="log-level", env_vars={"A": "1"}
+        )
+        self.container.docker_client = Mock()
+        self.container.id = "container-id"
+        self.api_client = self.container.docker_client.api
+        self.api_client.exec_create.side_effect = lambda *args, **kwargs: {"Id": "exec-{}".format(args[1][0])}
+        self.api_client.exec_start.return_value = [(b"response", None), (None, b"logs")]
+        self.api_client.exec_inspect.return_value = {"ExitCode": 0}
+
+    def test_must_init_class(self):
+        self.assertEqual(self.container.image, "public.ecr.aws/sam/build-python3.9:latest-arm64")
+        self.assertEqual(self.container.executable_name, "lambda-builders")
+        self.assertEqual(self.container._entrypoint, ["tail", "-f", "/dev/null"])
+        self.assertEqual(self.container._working_dir, "/tmp/samcli/mount")
+        self.assertEqual(self.container._host_dir, self.mount_dir)
+        self.assertEqual(self.container._env_vars, {"A": "1", "LAMBDA_BUILDERS_LOG_LEVEL": "log-level"})
+        self.assertEqual(self.container._additional_volumes, None)
+
+    @parameterized.expand(
+        [
+            ("/base/dir/src", "/base/dir/src/requirements.txt", True),
+            ("/base/dir", "/base/dir/requirements.txt", True),
+            ("/base/dir/src", "/other/requirements.txt", False),
+            ("/base/other", "/base/dir/requirements.txt", False),
+        ]
+    )
+    def test_can_build(self, source_dir, manifest_path, expected):
+        self.assertEqual(WarmLambdaBuildContainer.can_build("/base/dir", source_dir, manifest_path), expected)
+
+    @patch("samcli.local.docker.lambda_build_container.uuid")
+    @patch.object(LambdaBuildContainer, "make_request")
+    def test_must_build_in_running_container(self, make_request_mock, uuid_mock):
+        uuid_mock.uuid4.return_value.hex = "job"
+        make_request_mock.return_value = "request"
+        stdout = Mock()
+        stderr = Mock()
+
+        with self.container.build(
+            "protocol",
+            "language",
+            "dependency",
+            "application",
+            "/base/dir/src",
+            "/base/dir/manifest/requirements.txt",
+            "python3.9",
+            ARM64,
+            options="options",
+            executable_search_paths=["/base/dir/src", "/not/mounted"],
+            mode="mode",
+            stdout=stdout,
+            stderr=stderr,
+        ):
+            self.api_client.exec_create.assert_called_once_with(
+                "container-id", ["lambda-builders", "request"], workdir="/tmp/samcli/mount/src"
+            )
+
+        make_request_mock.assert_called_once_with(
+            "protocol",
+            "language",
+            "dependency",
+            "application",
+            {
+                "source_dir": "/tmp/samcli/mount/src",
+                "artifacts_dir": "/tmp/samcli/jobs/job/artifacts",
+                "scratch_dir": "/tmp/samcli/jobs/job/scratch",
+                "manifest_dir": "/tmp/samcli/mount/manifest",
+            },
+            "requirements.txt",
+            "python3.9",
+            None,
+            "options",
+            ["/tmp/samcli/mount/src", "/not/mounted"],
+            "mode",
+            ARM64,
+            False,
+        )
+        self.api_client.exec_start.assert_any_call("exec-lambda-builders", stream=True, demux=True)
+        stdout.write.assert_called_once_with(b"response")
+        stderr.write.assert_called_once_with(b"logs")
+        self.api_client.exec_create.assert_called_with(
+            "container-id", ["rm", "-rf", "/tmp/samcli/jobs/job"], workdir="/tmp/samcli/mount"
+        )
+
+    @parameterized.expand([(126,), (127,)])
+    def test_must_raise_if_builder_executable_not_found(self, exit_code):
+        self.api_client.exec_inspect.return_value = {"ExitCode": exit_code}
+
+        with self.assertRaises(ContainerExecutableNotFoundException):
+            with self.container.build(
+                "protocol",
+                "language",
+                "dependency",
+                "application",
+                "/base/dir/src",
+                "/base/dir/src/requirements.txt",
+                "python3.9",
+                ARM64,
+            ):
+                pass
+
+        self.assertEqual(self.api_client.exec_create.call_args[0][1][:2], ["rm", "-rf"])
@@ -83,6 +83,7 @@ class TestLambdaContainer_init(TestCase):
         expected_env_vars = {**self.env_var, **debug_settings[1]}
 
         image_builder_mock = Mock()
+        image_builder_mock.get_layers_volumes.return_value = {}
 
         container = LambdaContainer(
             image_config=self.image_config,
@@ -155,6 +156,7 @@ class TestLambdaContainer_init(TestCase):
         expected_env_vars = {**self.env_var}
 
         image_builder_mock = Mock()
+        image_builder_mock.get_layers_volumes.return_value = {}
 
         container = LambdaContainer(
             image_config=self.image_config,
@@ -228,6 +230,7 @@ class TestLambdaContainer_init(TestCase):
         }
 
         image_builder_mock = Mock()
+        image_builder_mock.get_layers_volumes.return_value = {}
 
         container = LambdaContainer(
             image_config=self.image_config,
@@ -304,6 +307,7 @@ class TestLambdaContainer_init(TestCase):
         expected_env_vars = {**self.env_var, **self.debug_options.container_env_vars}
 
         image_builder_mock = Mock()
+        image_builder_mock.get_layers_volumes.return_value = {}
 
         container = LambdaContainer(
             image_config=self.image_config,
@@ -384,6 +388,7 @@ class TestLambdaContainer_init(TestCase):
         expected_env_vars = {**self.env_var}
 
         image_builder_mock = Mock()
+        image_builder_mock.get_layers_volumes.return_value = {}
 
         container = LambdaContainer(
             image_config=self.image_config,
@@ -426,6 +431,7 @@ class TestLambdaContainer_init(TestCase):
         runtime = "foo"
 
         image_builder_mock = Mock()
+        image_builder_mock.get_layers_volumes.return_value = {}
 
         with self.assertRaises(ValueError) as context:
             LambdaContainer(
@@ -502,6 +508,18 @@ class TestLambdaContainer_get_image(TestCase):
         image_builder.build.assert_called_with("foo", ZIP, None, [], "arm64", function_name=None)
 
 
+class TestLambdaContainer_get_layers_volumes(TestCase):
+    def test_must_return_layers_volumes(self):
+        expected = {"/layers": {"bind": "/opt", "mode": "ro"}}
+
+        image_builder = Mock()
+        image_builder.get_layers_volumes.return_value = expected
+
+        self.assertEqual(LambdaContainer._get_layers_volumes(image_builder, ZIP, ["layer"]), expected)
+
+        image_builder.get_layers_volumes.assert_called_with(ZIP, ["layer"])
+
+
 class TestLambdaContainer_get_debug_settings(TestCase):
     def setUp(self):
 
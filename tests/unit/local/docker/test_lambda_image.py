@@ -1,5 +1,9 @@
 import io
+import os
+import shutil
+import tarfile
 import tempfile
+from pathlib import Path
 
 from unittest import TestCase
 from unittest.mock import patch, Mock, mock_open, ANY, call
@@ -197,7 +201,8 @@ class TestLambdaImage(TestCase):
         self, runtime, image_name, generate_docker_image_version_patch, build_image_patch
     ):
         layer_downloader_mock = Mock()
-        layer_downloader_mock.download_all.return_value = ["layers1"]
+        downloaded_layer = Mock(is_defined_within_template=False)
+        layer_downloader_mock.download_all.return_value = [downloaded_layer]
 
         generate_docker_image_version_patch.return_value = "image-version"
 
@@ -215,12 +220,12 @@ class TestLambdaImage(TestCase):
         self.assertEqual(actual_image_id, "samcli/lambda:image-version")
 
         layer_downloader_mock.download_all.assert_called_once_with(["layers1"], True)
-        generate_docker_image_version_patch.assert_called_once_with(["layers1"], runtime, X86_64)
+        generate_docker_image_version_patch.assert_called_once_with([downloaded_layer], runtime, X86_64)
         docker_client_mock.images.get.assert_called_once_with("samcli/lambda:image-version")
         build_image_patch.assert_called_once_with(
             image_name,
             "samcli/lambda:image-version",
-            ["layers1"],
+            [downloaded_layer],
             X86_64,
             stream=stream,
         )
@@ -237,7 +242,8 @@ class TestLambdaImage(TestCase):
         self, runtime, image_name, generate_docker_image_version_patch, build_image_patch
     ):
         layer_downloader_mock = Mock()
-        layer_downloader_mock.download_all.return_value = ["layers1"]
+        downloaded_layer = Mock(is_defined_within_template=False)
+        layer_downloader_mock.download_all.return_value = [downloaded_layer]
 
         generate_docker_image_version_patch.return_value = "image-version"
 
@@ -255,12 +261,12 @@ class TestLambdaImage(TestCase):
         self.assertEqual(actual_image_id, "samcli/lambda:image-version")
 
         layer_downloader_mock.download_all.assert_called_once_with(["layers1"], False)
-        generate_docker_image_version_patch.assert_called_once_with(["layers1"], runtime, ARM64)
+        generate_docker_image_version_patch.assert_called_once_with([downloaded_layer], runtime, ARM64)
         docker_client_mock.images.get.assert_called_once_with("samcli/lambda:image-version")
         build_image_patch.assert_called_once_with(
             image_name,
             "samcli/lambda:image-version",
-            ["layers1"],
+            [downloaded_layer],
             ARM64,
             stream=stream,
         )
@@ -273,13 +279,177 @@ class TestLambdaImage(TestCase):
 
         layer_mock = Mock()
         layer_mock.name = "layer1"
+        layer_mock.is_defined_within_template = False
 
-        image_version = LambdaImage._generate_docker_image_version([layer_mock], "runtime", ARM64)
+        lambda_image = LambdaImage(Mock(), False, False, docker_client=Mock())
+        image_version = lambda_image._generate_docker_image_version([layer_mock], "runtime", ARM64)
 
         self.assertEqual(image_version, "runtime-arm64-thisisahexdigestofshahash")
 
         hashlib_patch.sha256.assert_called_once_with(b"layer1")
 
+    def test_generate_docker_image_version_with_checksum_of_local_layers(self):
+        layer_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache_dir)
+        local_layer = self._create_local_layer(layer_cache_dir, "local_layer", "content")
+        downloaded_layer = Mock(codeuri="/not/read", is_defined_within_template=False)
+        downloaded_layer.name = "downloaded_layer"
+
+        lambda_image = LambdaImage(Mock(layer_cache=layer_cache_dir), False, False, docker_client=Mock())
+        image_version = lambda_image._generate_docker_image_version([downloaded_layer, local_layer], "runtime", ARM64)
+
+        self.assertRegex(image_version, r"^runtime-arm64-[0-9a-f]{25}-[0-9a-f]{16}-[0-9a-f]{16}$")
+        self.assertEqual(
+            image_version,
+            lambda_image._generate_docker_image_version([downloaded_layer, local_layer], "runtime", ARM64),
+        )
+
+        Path(local_layer.codeuri, "file").write_text("changed")
+        changed_image_version = lambda_image._generate_docker_image_version(
+            [downloaded_layer, local_layer], "runtime", ARM64
+        )
+
+        self.assertNotEqual(image_version, changed_image_version)
+        self.assertEqual(image_version.rsplit("-", 1)[0], changed_image_version.rsplit("-", 1)[0])
+
+    def test_generate_docker_image_version_with_same_layers_of_other_project(self):
+        layer_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache_dir)
+        Path(layer_cache_dir, "project1").mkdir()
+        Path(layer_cache_dir, "project2").mkdir()
+        layer1 = self._create_local_layer(Path(layer_cache_dir, "project1"), "local_layer", "content")
+        layer2 = self._create_local_layer(Path(layer_cache_dir, "project2"), "local_layer", "content")
+
+        lambda_image = LambdaImage(Mock(layer_cache=layer_cache_dir), False, False, docker_client=Mock())
+
+        self.assertNotEqual(
+            lambda_image._generate_layers_image_prefix([layer1], "runtime", ARM64),
+            lambda_image._generate_layers_image_prefix([layer2], "runtime", ARM64),
+        )
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    def test_not_building_image_with_unchanged_local_layers(self, build_image_patch):
+        layer_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache_dir)
+        local_layer = self._create_local_layer(layer_cache_dir, "local_layer", "content")
+        layer_downloader_mock = Mock(layer_cache=layer_cache_dir)
+        layer_downloader_mock.download_all.return_value = [local_layer]
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value = Mock()
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, False, docker_client=docker_client_mock)
+        image_id = lambda_image.build("python3.8", ZIP, None, [local_layer], X86_64, function_name="function")
+
+        self.assertTrue(image_id.startswith("samcli/lambda:python3.8-x86_64-"))
+        build_image_patch.assert_not_called()
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    def test_building_image_with_changed_local_layers_removes_outdated_images(self, build_image_patch):
+        layer_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache_dir)
+        local_layer = self._create_local_layer(layer_cache_dir, "local_layer", "content")
+        layer_downloader_mock = Mock(layer_cache=layer_cache_dir)
+        layer_downloader_mock.download_all.return_value = [local_layer]
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, False, docker_client=Mock())
+        image_version = lambda_image._generate_docker_image_version([local_layer], "python3.8", X86_64)
+        outdated_prefix = lambda_image._generate_layers_image_prefix([local_layer], "python3.8", X86_64)
+        other_project_prefix = outdated_prefix.rsplit("-", 1)[0] + "-0123456789abcdef"
+        self.assertTrue(image_version.startswith(f"{outdated_prefix}-"))
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.side_effect = ImageNotFound("image not found")
+        docker_client_mock.images.list.return_value = [
+            Mock(id="outdated", tags=[f"samcli/lambda:{outdated_prefix}-0123456789abcdef"]),
+            Mock(id="other_layers", tags=["samcli/lambda:python3.8-x86_64-0123456789abcdef012345678-0123456789abcdef"]),
+            Mock(id="without_local_layers", tags=[f"samcli/lambda:{outdated_prefix.rsplit('-', 1)[0]}"]),
+            Mock(id="other_project", tags=[f"samcli/lambda:{other_project_prefix}-0123456789abcdef"]),
+        ]
+        lambda_image.docker_client = docker_client_mock
+
+        image_id = lambda_image.build("python3.8", ZIP, None, [local_layer], X86_64, function_name="function")
+
+        self.assertEqual(image_id, f"samcli/lambda:{image_version}")
+        docker_client_mock.images.list.assert_called_with(name="samcli/lambda")
+        docker_client_mock.images.remove.assert_called_once_with("outdated")
+        build_image_patch.assert_called_once_with(
+            "public.ecr.aws/sam/emulation-python3.8:latest-x86_64", image_id, [local_layer], X86_64, stream=ANY
+        )
+
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    def test_building_image_without_layers_if_local_layers_are_mounted(self, build_image_patch):
+        layer_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache_dir)
+        local_layer = self._create_local_layer(layer_cache_dir, "local_layer", "content")
+        layer_downloader_mock = Mock(layer_cache=layer_cache_dir)
+        layer_downloader_mock.download_all.return_value = [local_layer]
+
+        docker_client_mock = Mock()
+        docker_client_mock.images.get.return_value = Mock()
+
+        lambda_image = LambdaImage(
+            layer_downloader_mock, False, False, docker_client=docker_client_mock, mount_local_layers=True
+        )
+        image_id = lambda_image.build("python3.8", ZIP, None, [local_layer], X86_64, function_name="function")
+
+        self.assertEqual(image_id, f"public.ecr.aws/sam/emulation-python3.8:{RAPID_IMAGE_TAG_PREFIX}-{version}-x86_64")
+        self.assertEqual(
+            lambda_image.get_layers_volumes(ZIP, [local_layer]),
+            {local_layer.codeuri: {"bind": "/opt", "mode": "ro"}},
+        )
+        build_image_patch.assert_not_called()
+
+    def test_get_layers_volumes_must_merge_multiple_layers(self):
+        layer_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache_dir)
+        layer1 = self._create_local_layer(layer_cache_dir, "layer1", "content1")
+        layer2 = self._create_local_layer(layer_cache_dir, "layer2", "content2")
+        Path(layer1.codeuri, "layer1_file").write_text("layer1")
+        layer_downloader_mock = Mock(layer_cache=layer_cache_dir)
+        layer_downloader_mock.download_all.return_value = [layer1, layer2]
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, False, docker_client=Mock(), mount_local_layers=True)
+        volumes = lambda_image.get_layers_volumes(ZIP, [layer1, layer2])
+
+        ((merged_dir, mount),) = volumes.items()
+        self.assertEqual(mount, {"bind": "/opt", "mode": "ro"})
+        self.assertEqual(Path(merged_dir, "file").read_text(), "content2")
+        self.assertEqual(Path(merged_dir, "layer1_file").read_text(), "layer1")
+        self.assertEqual(lambda_image.get_layers_volumes(ZIP, [layer1, layer2]), volumes)
+
+        Path(layer1.codeuri, "new_file").write_text("new")
+        changed_volumes = lambda_image.get_layers_volumes(ZIP, [layer1, layer2])
+
+        self.assertNotEqual(changed_volumes, volumes)
+        self.assertTrue(Path(list(changed_volumes.keys())[0], "new_file").exists())
+        # it may still be mounted by a running container
+        self.assertTrue(Path(merged_dir).exists())
+
+    def test_get_layers_volumes_must_be_empty_if_layers_are_not_mounted(self):
+        layer_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache_dir)
+        local_layer = self._create_local_layer(layer_cache_dir, "local_layer", "content")
+        downloaded_layer = Mock(codeuri=layer_cache_dir, is_defined_within_template=False)
+        layer_downloader_mock = Mock(layer_cache=layer_cache_dir)
+
+        lambda_image = LambdaImage(layer_downloader_mock, False, False, docker_client=Mock())
+        self.assertEqual(lambda_image.get_layers_volumes(ZIP, [local_layer]), {})
+
+        lambda_image.mount_local_layers = True
+        self.assertEqual(lambda_image.get_layers_volumes(IMAGE, [local_layer]), {})
+        layer_downloader_mock.download_all.return_value = [downloaded_layer]
+        self.assertEqual(lambda_image.get_layers_volumes(ZIP, [downloaded_layer]), {})
+
+    @staticmethod
+    def _create_local_layer(parent_dir, name, content):
+        layer_dir = Path(parent_dir, name)
+        layer_dir.mkdir()
+        Path(layer_dir, "file").write_text(content)
+        layer = Mock(codeuri=str(layer_dir), is_defined_within_template=True)
+        layer.name = name
+        return layer
+
     @patch("samcli.local.docker.lambda_image.docker")
     def test_generate_dockerfile(self, docker_patch):
         docker_client_mock = Mock()
@@ -304,11 +474,11 @@ class TestLambdaImage(TestCase):
 
         self.assertEqual(LambdaImage._generate_dockerfile("python", [layer_mock], ARM64), expected_docker_file)
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
-    def test_build_image(self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch):
+    def test_build_image(self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
 
@@ -322,7 +492,7 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock.layer_cache = "cached layers"
 
         tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        stream_tarball_patch.return_value = tarball_fileobj
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
@@ -347,15 +517,57 @@ class TestLambdaImage(TestCase):
             decode=True,
             platform="linux/arm64",
         )
+        stream_tarball_patch.assert_called_once_with(
+            {
+                str(docker_full_path_mock): "Dockerfile",
+                LambdaImage._RAPID_SOURCE_PATH: "/aws-lambda-rie-arm64",
+                "somevalue": "/name",
+            },
+            tar_filter=ANY,
+            progress_callback=ANY,
+        )
+        tarball_fileobj.close.assert_called_once()
 
         docker_full_path_mock.unlink.assert_called_once()
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.BUILD_CONTEXT_PROGRESS_STEP", 1024 * 1024)
+    def test_build_image_streams_build_context_with_progress(self):
+        layer_cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, layer_cache_dir)
+        rapid_dir = Path(layer_cache_dir, "rapid")
+        rapid_dir.mkdir()
+        Path(rapid_dir, "aws-lambda-rie-x86_64").write_bytes(b"rapid")
+        layer = self._create_local_layer(layer_cache_dir, "layer1", "content")
+        Path(layer.codeuri, "large_file").write_bytes(b"0" * 3 * 1024 * 1024)
+
+        received_contexts = []
+
+        def build(fileobj, **kwargs):
+            received_contexts.append(b"".join(fileobj))
+            return [{"stream": "Done"}]
+
+        docker_client_mock = Mock()
+        docker_client_mock.api.build.side_effect = build
+        stream_writer_mock = Mock()
+
+        with patch.object(LambdaImage, "_RAPID_SOURCE_PATH", rapid_dir):
+            LambdaImage(Mock(layer_cache=layer_cache_dir), True, False, docker_client=docker_client_mock)._build_image(
+                "base_image", "docker_tag", [layer], X86_64, stream=stream_writer_mock
+            )
+
+        with tarfile.open(fileobj=io.BytesIO(received_contexts[0])) as archive:
+            self.assertEqual(archive.extractfile("layer1/large_file").read(), b"0" * 3 * 1024 * 1024)
+            self.assertIn("Dockerfile", archive.getnames())
+        # 3 dots for the build context and 1 for the build log
+        self.assertEqual(stream_writer_mock.write.call_args_list.count(call(".")), 4)
+        self.assertEqual([name for name in os.listdir(layer_cache_dir) if name.startswith("dockerfile")], [])
+
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
     def test_build_image_fails_with_BuildError(
-        self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
     ):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
@@ -370,7 +582,7 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock.layer_cache = "cached layers"
 
         tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        stream_tarball_patch.return_value = tarball_fileobj
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
@@ -399,12 +611,12 @@ class TestLambdaImage(TestCase):
 
         docker_full_path_mock.unlink.assert_not_called()
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
     def test_build_image_fails_with_BuildError_from_output(
-        self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
     ):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
@@ -419,7 +631,7 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock.layer_cache = "cached layers"
 
         tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        stream_tarball_patch.return_value = tarball_fileobj
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
@@ -448,12 +660,12 @@ class TestLambdaImage(TestCase):
 
         docker_full_path_mock.unlink.assert_not_called()
 
-    @patch("samcli.local.docker.lambda_image.create_tarball")
+    @patch("samcli.local.docker.lambda_image.stream_tarball")
     @patch("samcli.local.docker.lambda_image.uuid")
     @patch("samcli.local.docker.lambda_image.Path")
     @patch("samcli.local.docker.lambda_image.LambdaImage._generate_dockerfile")
     def test_build_image_fails_with_ApiError(
-        self, generate_dockerfile_patch, path_patch, uuid_patch, create_tarball_patch
+        self, generate_dockerfile_patch, path_patch, uuid_patch, stream_tarball_patch
     ):
         uuid_patch.uuid4.return_value = "uuid"
         generate_dockerfile_patch.return_value = "Dockerfile content"
@@ -467,7 +679,7 @@ class TestLambdaImage(TestCase):
         layer_downloader_mock.layer_cache = "cached layers"
 
         tarball_fileobj = Mock()
-        create_tarball_patch.return_value.__enter__.return_value = tarball_fileobj
+        stream_tarball_patch.return_value = tarball_fileobj
 
         layer_version1 = Mock()
         layer_version1.codeuri = "somevalue"
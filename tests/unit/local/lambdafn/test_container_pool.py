@@ -0,0 +1,120 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samcli.local.lambdafn.container_pool import WarmContainerPool
+
+
+class TestWarmContainerPool(TestCase):
+    def test_must_create_container_if_there_is_no_idle_container(self):
+        pool = WarmContainerPool()
+        container = Mock()
+        create_container = Mock(return_value=container)
+
+        result, evicted = pool.checkout(create_container)
+
+        self.assertEqual(result, container)
+        self.assertEqual(evicted, [])
+        self.assertEqual(pool.size, 1)
+        self.assertIsNone(pool.get_idle_container())
+
+    def test_must_reuse_returned_container(self):
+        pool = WarmContainerPool()
+        container = Mock()
+        create_container = Mock(return_value=container)
+
+        result, _ = pool.checkout(create_container)
+        pool.release(result)
+        result, _ = pool.checkout(create_container)
+
+        self.assertEqual(result, container)
+        create_container.assert_called_once()
+
+    def test_must_create_containers_up_to_max_size(self):
+        pool = WarmContainerPool(max_size=2)
+        container1 = Mock()
+        container2 = Mock()
+        create_container = Mock(side_effect=[container1, container2])
+
+        self.assertEqual(pool.checkout(create_container)[0], container1)
+        self.assertEqual(pool.checkout(create_container)[0], container2)
+        self.assertEqual(pool.get_containers(), [container1, container2])
+
+    def test_must_wait_for_container_when_pool_is_full(self):
+        pool = WarmContainerPool(max_size=1)
+        container = Mock()
+        create_container = Mock(return_value=container)
+        checked_out, _ = pool.checkout(create_container)
+
+        results = []
+        waiting_thread = threading.Thread(target=lambda: results.append(pool.checkout(create_container)[0]))
+        waiting_thread.start()
+        waiting_thread.join(0.1)
+        self.assertEqual(results, [])
+
+        pool.release(checked_out)
+        waiting_thread.join(5)
+
+        self.assertEqual(results, [container])
+        create_container.assert_called_once()
+
+    def test_must_not_return_container_when_pool_is_cleared_while_waiting(self):
+        pool = WarmContainerPool(max_size=1)
+        container = Mock()
+        pool.checkout(Mock(return_value=container))
+
+        results = []
+        waiting_thread = threading.Thread(target=lambda: results.append(pool.checkout(Mock())[0]))
+        waiting_thread.start()
+
+        self.assertEqual(pool.clear(), [container])
+        waiting_thread.join(5)
+        self.assertEqual(results, [None])
+
+    def test_release_of_unknown_container(self):
+        pool = WarmContainerPool()
+        is_owned, evicted = pool.release(Mock())
+
+        self.assertFalse(is_owned)
+        self.assertEqual(evicted, [])
+
+    def test_must_create_new_container_in_place_of_discarded_one(self):
+        pool = WarmContainerPool(max_size=1)
+        container1 = Mock()
+        container2 = Mock()
+        create_container = Mock(side_effect=[container1, container2])
+
+        pool.checkout(create_container)
+        self.assertTrue(pool.discard(container1))
+        self.assertFalse(pool.discard(container1))
+
+        self.assertEqual(pool.checkout(create_container)[0], container2)
+        self.assertEqual(pool.get_containers(), [container2])
+
+    def test_creation_failure_frees_the_slot(self):
+        pool = WarmContainerPool(max_size=1)
+
+        with self.assertRaises(ValueError):
+            pool.checkout(Mock(side_effect=ValueError()))
+
+        self.assertEqual(pool.size, 0)
+
+    @patch("samcli.local.lambdafn.container_pool.time")
+    def test_must_evict_idle_containers_above_min_size(self, time_mock):
+        time_mock.monotonic.return_value = 100
+        pool = WarmContainerPool(min_size=1, max_size=2, idle_timeout=10)
+        container1 = Mock()
+        container2 = Mock()
+        create_container = Mock(side_effect=[container1, container2])
+
+        pool.checkout(create_container)
+        pool.checkout(create_container)
+        pool.release(container1)
+        pool.release(container2)
+
+        time_mock.monotonic.return_value = 115
+        _, evicted = pool.checkout(create_container)
+
+        # least recently used container is evicted, min_size containers are kept
+        self.assertEqual(evicted, [container1])
+        self.assertEqual(pool.get_containers(), [container2])
@@ -11,6 +11,7 @@ from samcli.lib.providers.provider import LayerVersion
 from samcli.local.lambdafn.env_vars import EnvironmentVariables
 from samcli.local.lambdafn.runtime import LambdaRuntime, _unzip_file, WarmLambdaRuntime, _require_container_reloading
 from samcli.local.lambdafn.config import FunctionConfig
+from samcli.local.lambdafn.container_pool import WarmContainerPool
 
 
 class LambdaRuntime_create(TestCase):
@@ -657,6 +658,90 @@ class TestWarmLambdaRuntime_invoke(TestCase):
         # Finally block
         self.manager_mock.stop.assert_not_called()
 
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_return_container_to_pool_after_invoke(self, LambdaContainerMock, LambdaFunctionObserverMock):
+        container = Mock()
+        container.is_running.return_value = True
+        LambdaContainerMock.return_value = container
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock())
+        self.runtime._get_code_dir = MagicMock()
+
+        self.runtime.invoke(self.func_config, "event")
+        self.runtime.invoke(self.func_config, "event")
+
+        # second invocation reuses the container which is returned back to the pool
+        LambdaContainerMock.assert_called_once()
+        self.assertEqual(self.runtime._container_pools[self.full_path].get_idle_container(), container)
+        self.manager_mock.stop.assert_not_called()
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_create_new_container_for_concurrent_invoke(self, LambdaContainerMock, LambdaFunctionObserverMock):
+        container1 = Mock()
+        container2 = Mock()
+        LambdaContainerMock.side_effect = [container1, container2]
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock(), pool_max_size=2)
+        self.runtime._get_code_dir = MagicMock()
+
+        result1 = self.runtime._checkout_container(self.func_config, None, None, None)
+        result2 = self.runtime._checkout_container(self.func_config, None, None, None)
+
+        self.assertEqual(result1, container1)
+        self.assertEqual(result2, container2)
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_discard_idle_container_which_does_not_exist(self, LambdaContainerMock, LambdaFunctionObserverMock):
+        dead_container = Mock()
+        dead_container.is_created.return_value = False
+        new_container = Mock()
+        LambdaContainerMock.side_effect = [dead_container, new_container]
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock())
+        self.runtime._get_code_dir = MagicMock()
+
+        result1 = self.runtime._checkout_container(self.func_config, None, None, None)
+        self.runtime._on_invoke_done(result1)
+        result2 = self.runtime._checkout_container(self.func_config, None, None, None)
+
+        self.assertEqual(result1, dead_container)
+        self.assertEqual(result2, new_container)
+        # the new container is not validated, as it has just been created
+        new_container.is_created.assert_not_called()
+        self.assertEqual(self.runtime._container_pools[self.full_path].get_containers(), [new_container])
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_use_single_container_for_debugged_function(self, LambdaContainerMock, LambdaFunctionObserverMock):
+        debug_options = Mock()
+        debug_options.debug_function = self.name
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock(), pool_max_size=5)
+        self.runtime._get_code_dir = MagicMock()
+        self.runtime._checkout_container(self.func_config, debug_options, None, None)
+
+        self.assertEqual(self.runtime._container_pools[self.full_path].max_size, 1)
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_stop_container_if_its_pool_is_terminated_during_invoke(
+        self, LambdaContainerMock, LambdaFunctionObserverMock
+    ):
+        container = Mock()
+        LambdaContainerMock.return_value = container
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock())
+        self.runtime._get_code_dir = MagicMock()
+
+        result = self.runtime._checkout_container(self.func_config, None, None, None)
+        self.runtime._container_pools = {}
+        self.runtime._on_invoke_done(result)
+
+        self.manager_mock.stop.assert_called_once_with(container)
+
 
 class TestWarmLambdaRuntime_create(TestCase):
     DEFAULT_MEMORY = 128
@@ -750,7 +835,7 @@ class TestWarmLambdaRuntime_create(TestCase):
 
         self.manager_mock.create.assert_called_with(container)
         # validate that the created container got cached
-        self.assertEqual(self.runtime._containers[self.full_path], container)
+        self.assertEqual(self.runtime._container_pools[self.full_path].get_containers(), [container])
         lambda_function_observer_mock.watch.assert_called_with(self.func_config)
         lambda_function_observer_mock.start.assert_called_with()
 
@@ -816,7 +901,7 @@ class TestWarmLambdaRuntime_create(TestCase):
         self.manager_mock.create.assert_has_calls([call(container), call(container2)])
         self.manager_mock.stop.assert_called_with(container)
         # validate that the created container got cached
-        self.assertEqual(self.runtime._containers[self.full_path], container2)
+        self.assertEqual(self.runtime._container_pools[self.full_path].get_containers(), [container2])
         self.assertEqual(result, container2)
 
     @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
@@ -883,7 +968,7 @@ class TestWarmLambdaRuntime_create(TestCase):
         )
         self.manager_mock.create.assert_called_with(container)
         # validate that the created container got cached
-        self.assertEqual(self.runtime._containers[self.full_path], container)
+        self.assertEqual(self.runtime._container_pools[self.full_path].get_containers(), [container])
 
 
 class TestWarmLambdaRuntime_get_code_dir(TestCase):
@@ -924,9 +1009,9 @@ class TestWarmLambdaRuntime_clean_warm_containers_related_resources(TestCase):
         self.observer_mock = Mock()
         self.func1_container_mock = Mock()
         self.func2_container_mock = Mock()
-        self.runtime._containers = {
-            "func_name1": self.func1_container_mock,
-            "func_name2": self.func2_container_mock,
+        self.runtime._container_pools = {
+            "func_name1": _create_pool(self.func1_container_mock),
+            "func_name2": _create_pool(self.func2_container_mock),
         }
         self.runtime._observer = self.observer_mock
         self.runtime._observer.is_alive.return_value = True
@@ -1009,21 +1094,16 @@ class TestWarmLambdaRuntime_on_code_change(TestCase):
 
         self.func1_container_mock = Mock()
         self.func2_container_mock = Mock()
-        self.runtime._containers = {
-            self.func1_full_path: self.func1_container_mock,
-            self.func2_full_path: self.func2_container_mock,
+        self.runtime._container_pools = {
+            self.func1_full_path: _create_pool(self.func1_container_mock),
+            self.func2_full_path: _create_pool(self.func2_container_mock),
         }
 
     def test_only_one_container_get_stopped_when_its_code_dir_got_changed(self):
         self.runtime._on_code_change([self.func_config1])
 
         self.manager_mock.stop.assert_called_with(self.func1_container_mock)
-        self.assertEqual(
-            self.runtime._containers,
-            {
-                self.func2_full_path: self.func2_container_mock,
-            },
-        )
+        self.assertEqual(list(self.runtime._container_pools.keys()), [self.func2_full_path])
 
         self.observer_mock.unwatch.assert_called_with(self.func_config1)
 
@@ -1037,7 +1117,7 @@ class TestWarmLambdaRuntime_on_code_change(TestCase):
                 call(self.func2_container_mock),
             ],
         )
-        self.assertEqual(self.runtime._containers, {})
+        self.assertEqual(self.runtime._container_pools, {})
 
         self.assertEqual(
             self.observer_mock.unwatch.call_args_list,
@@ -1048,6 +1128,13 @@ class TestWarmLambdaRuntime_on_code_change(TestCase):
         )
 
 
+def _create_pool(*containers):
+    pool = WarmContainerPool()
+    for container in containers:
+        pool.add(container)
+    return pool
+
+
 class TestUnzipFile(TestCase):
     @patch("samcli.local.lambdafn.runtime.tempfile")
     @patch("samcli.local.lambdafn.runtime.unzip")
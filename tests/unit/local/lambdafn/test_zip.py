@@ -1,3 +1,5 @@
+import base64
+import hashlib
 import os
 import platform
 import shutil
@@ -183,8 +185,9 @@ class TestUnzipFromUri(TestCase):
 
         os_patch.environ.get.return_value = True
 
-        unzip_from_uri("uri", "layer_zip_path", "output_zip_dir", "layer_arn")
+        code_sha256 = unzip_from_uri("uri", "layer_zip_path", "output_zip_dir", "layer_arn")
 
+        self.assertEqual(code_sha256, base64.b64encode(hashlib.sha256(b"data1").digest()).decode("utf-8"))
         requests_patch.get.assert_called_with("uri", stream=True, verify=True)
         get_request_mock.iter_content.assert_called_with(chunk_size=None)
         open_patch.assert_called_with("layer_zip_path", "wb")
@@ -195,6 +198,31 @@ class TestUnzipFromUri(TestCase):
         unzip_patch.assert_called_with("layer_zip_path", "output_zip_dir", permission=0o700)
         os_patch.environ.get.assert_called_with("AWS_CA_BUNDLE", True)
 
+    @patch("samcli.local.lambdafn.zip.unzip")
+    @patch("samcli.local.lambdafn.zip.Path")
+    @patch("samcli.local.lambdafn.zip.progressbar")
+    @patch("samcli.local.lambdafn.zip.requests")
+    @patch("samcli.local.lambdafn.zip.open")
+    @patch("samcli.local.lambdafn.zip.os")
+    def test_unzip_from_uri_without_progressbar(
+        self, os_patch, open_patch, requests_patch, progressbar_patch, path_patch, unzip_patch
+    ):
+        get_request_mock = Mock()
+        get_request_mock.headers = {"Content-length": "200"}
+        get_request_mock.iter_content.return_value = [b"data1"]
+        requests_patch.get.return_value = get_request_mock
+
+        file_mock = Mock()
+        open_patch.return_value.__enter__.return_value = file_mock
+
+        os_patch.environ.get.return_value = True
+
+        unzip_from_uri("uri", "layer_zip_path", "output_zip_dir", progressbar_label=None)
+
+        progressbar_patch.assert_not_called()
+        file_mock.write.assert_called_with(b"data1")
+        unzip_patch.assert_called_with("layer_zip_path", "output_zip_dir", permission=0o700)
+
     @patch("samcli.local.lambdafn.zip.unzip")
     @patch("samcli.local.lambdafn.zip.Path")
     @patch("samcli.local.lambdafn.zip.progressbar")
@@ -1,6 +1,11 @@
 import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from unittest import TestCase
-from unittest.mock import Mock, call, patch
+from unittest.mock import ANY, Mock, call, patch
 
 from botocore.exceptions import NoCredentialsError, ClientError
 from pathlib import Path
@@ -8,10 +13,20 @@ from pathlib import Path
 from parameterized import parameterized
 
 from samcli.local.layers.layer_downloader import LayerDownloader
-from samcli.commands.local.cli_common.user_exceptions import CredentialsRequired, ResourceNotFound
+from samcli.commands.local.cli_common.user_exceptions import (
+    CredentialsRequired,
+    LayerChecksumMismatch,
+    ResourceNotFound,
+)
 
 
 class TestDownloadLayers(TestCase):
+    def setUp(self):
+        self.layer_cache = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.layer_cache)
+
     @patch("samcli.local.layers.layer_downloader.LayerDownloader._create_cache")
     def test_initialization(self, create_cache_patch):
         create_cache_patch.return_value = None
@@ -23,7 +38,7 @@ class TestDownloadLayers(TestCase):
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
     def test_download_all_without_force(self, download_patch):
-        download_patch.side_effect = ["/home/layer1", "/home/layer2"]
+        download_patch.side_effect = lambda layer, force, show_progress: "/home/" + layer
 
         download_layers = LayerDownloader("/home", ".", Mock())
 
@@ -31,11 +46,13 @@ class TestDownloadLayers(TestCase):
 
         self.assertEqual(acutal_results, ["/home/layer1", "/home/layer2"])
 
-        download_patch.assert_has_calls([call("layer1", False), call("layer2", False)])
+        download_patch.assert_has_calls(
+            [call("layer1", False, show_progress=False), call("layer2", False, show_progress=False)], any_order=True
+        )
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
     def test_download_all_with_force(self, download_patch):
-        download_patch.side_effect = ["/home/layer1", "/home/layer2"]
+        download_patch.side_effect = lambda layer, force, show_progress: "/home/" + layer
 
         download_layers = LayerDownloader("/home", ".", Mock())
 
@@ -43,7 +60,20 @@ class TestDownloadLayers(TestCase):
 
         self.assertEqual(acutal_results, ["/home/layer1", "/home/layer2"])
 
-        download_patch.assert_has_calls([call("layer1", True), call("layer2", True)])
+        download_patch.assert_has_calls(
+            [call("layer1", True, show_progress=False), call("layer2", True, show_progress=False)], any_order=True
+        )
+
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader.download")
+    def test_download_all_with_single_layer_shows_progress(self, download_patch):
+        download_patch.return_value = "/home/layer1"
+
+        download_layers = LayerDownloader("/home", ".", Mock())
+
+        acutal_results = download_layers.download_all(["layer1"])
+
+        self.assertEqual(acutal_results, ["/home/layer1"])
+        download_patch.assert_called_once_with("layer1", False)
 
     @patch("samcli.local.layers.layer_downloader.LayerDownloader._create_cache")
     @patch("samcli.local.layers.layer_downloader.LayerDownloader._is_layer_cached")
@@ -92,52 +122,167 @@ class TestDownloadLayers(TestCase):
         resolve_code_path_patch.assert_called_once_with(".", "codeuri")
 
     @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
-    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_uri")
-    @patch("samcli.local.layers.layer_downloader.LayerDownloader._create_cache")
-    @patch("samcli.local.layers.layer_downloader.LayerDownloader._is_layer_cached")
-    def test_download_layer(
-        self, is_layer_cached_patch, create_cache_patch, fetch_layer_uri_patch, unzip_from_uri_patch
-    ):
-        is_layer_cached_patch.return_value = False
-
-        download_layers = LayerDownloader("/home", ".", Mock())
-
-        layer_mock = Mock()
-        layer_mock.is_defined_within_template = False
-        layer_mock.name = "layer1"
-        layer_mock.arn = "arn:layer:layer1:1"
-        layer_mock.layer_arn = "arn:layer:layer1"
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_content")
+    def test_download_layer(self, fetch_layer_content_patch, unzip_from_uri_patch):
+        fetch_layer_content_patch.return_value = {"Location": "layer/uri", "CodeSha256": "sha256"}
+        unzip_from_uri_patch.side_effect = self._unzip
 
-        fetch_layer_uri_patch.return_value = "layer/uri"
+        download_layers = LayerDownloader(self.layer_cache, ".", Mock())
+        layer_mock = self._create_layer_mock()
 
         actual = download_layers.download(layer_mock)
 
-        self.assertEqual(actual.codeuri, str(Path("/home/layer1").resolve()))
-
-        create_cache_patch.assert_called_once_with("/home")
-        fetch_layer_uri_patch.assert_called_once_with(layer_mock)
+        layer_path = Path(self.layer_cache, "layer1").resolve()
+        self.assertEqual(actual.codeuri, str(layer_path))
+        self.assertEqual(layer_path.joinpath("file").read_text(), "content")
+        self.assertEqual(Path(self.layer_cache, "layer1.sha256").read_text(), "sha256")
+        self.assertEqual(sorted(os.listdir(self.layer_cache)), sorted(["layer1", "layer1.sha256", "layer1" + ".lock"]))
+        fetch_layer_content_patch.assert_called_once_with(layer_mock)
         unzip_from_uri_patch.assert_called_once_with(
             "layer/uri",
-            str(Path("/home/layer1.zip").resolve()),
-            unzip_output_dir=str(Path("/home/layer1").resolve()),
+            ANY,
+            unzip_output_dir=ANY,
             progressbar_label="Downloading arn:layer:layer1",
         )
 
-    def test_layer_is_cached(self):
-        download_layers = LayerDownloader("/", ".", Mock())
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_content")
+    def test_download_layer_without_progress(self, fetch_layer_content_patch, unzip_from_uri_patch):
+        fetch_layer_content_patch.return_value = {"Location": "layer/uri", "CodeSha256": "sha256"}
+        unzip_from_uri_patch.side_effect = self._unzip
+
+        download_layers = LayerDownloader(self.layer_cache, ".", Mock())
+
+        download_layers.download(self._create_layer_mock(), show_progress=False)
+
+        unzip_from_uri_patch.assert_called_once_with("layer/uri", ANY, unzip_output_dir=ANY, progressbar_label=None)
+
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_content")
+    def test_download_layer_replaces_cached_layer_with_force(self, fetch_layer_content_patch, unzip_from_uri_patch):
+        fetch_layer_content_patch.return_value = {"Location": "layer/uri", "CodeSha256": "sha256"}
+        unzip_from_uri_patch.side_effect = self._unzip
+        self._create_cached_layer("layer1", "old_sha256")
+
+        download_layers = LayerDownloader(self.layer_cache, ".", Mock())
+
+        download_layers.download(self._create_layer_mock(), force=True)
+
+        self.assertEqual(os.listdir(Path(self.layer_cache, "layer1")), ["file"])
+        self.assertEqual(Path(self.layer_cache, "layer1.sha256").read_text(), "sha256")
 
-        layer_path = Mock()
-        layer_path.exists.return_value = True
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_content")
+    def test_download_layer_fails_if_checksum_does_not_match(self, fetch_layer_content_patch, unzip_from_uri_patch):
+        fetch_layer_content_patch.return_value = {"Location": "layer/uri", "CodeSha256": "other_sha256"}
+        unzip_from_uri_patch.side_effect = self._unzip
+
+        download_layers = LayerDownloader(self.layer_cache, ".", Mock())
+
+        with self.assertRaises(LayerChecksumMismatch):
+            download_layers.download(self._create_layer_mock())
+
+        self.assertEqual(os.listdir(self.layer_cache), ["layer1.lock"])
+
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_content")
+    def test_download_layer_skips_layer_downloaded_while_waiting_for_lock(
+        self, fetch_layer_content_patch, unzip_from_uri_patch
+    ):
+        download_layers = LayerDownloader(self.layer_cache, ".", Mock())
+
+        @contextmanager
+        def lock_downloaded_by_other_process(lock_file_path):
+            self._create_cached_layer("layer1", "sha256")
+            yield
+
+        with patch("samcli.local.layers.layer_downloader.file_lock", lock_downloaded_by_other_process):
+            actual = download_layers.download(self._create_layer_mock())
+
+        self.assertEqual(actual.codeuri, str(Path(self.layer_cache, "layer1").resolve()))
+        fetch_layer_content_patch.assert_not_called()
+        unzip_from_uri_patch.assert_not_called()
+
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.LayerDownloader._fetch_layer_content")
+    def test_download_all_downloads_layers_concurrently(self, fetch_layer_content_patch, unzip_from_uri_patch):
+        fetch_layer_content_patch.return_value = {"Location": "layer/uri", "CodeSha256": "sha256"}
+        barrier = threading.Barrier(2, timeout=10)
+
+        def unzip(*args, **kwargs):
+            # both downloads have to be in progress at the same time to pass the barrier
+            barrier.wait()
+            return self._unzip(*args, **kwargs)
+
+        unzip_from_uri_patch.side_effect = unzip
+
+        download_layers = LayerDownloader(self.layer_cache, ".", Mock())
+
+        actual = download_layers.download_all([self._create_layer_mock("layer1"), self._create_layer_mock("layer2")])
 
-        self.assertTrue(download_layers._is_layer_cached(layer_path))
+        self.assertEqual(
+            [layer.codeuri for layer in actual],
+            [str(Path(self.layer_cache, "layer1").resolve()), str(Path(self.layer_cache, "layer2").resolve())],
+        )
+
+    @patch("samcli.local.layers.layer_downloader.unzip_from_uri")
+    @patch("samcli.local.layers.layer_downloader.boto3")
+    def test_download_all_creates_lambda_client_once(self, boto3_patch, unzip_from_uri_patch):
+        unzip_from_uri_patch.side_effect = self._unzip
+        lambda_client_mock = Mock()
+        lambda_client_mock.get_layer_version.return_value = {
+            "Content": {"Location": "layer/uri", "CodeSha256": "sha256"}
+        }
+
+        def create_client(service_name):
+            # creating the client takes a while, so that concurrent downloads would create their own clients
+            time.sleep(0.05)
+            return lambda_client_mock
+
+        boto3_patch.client.side_effect = create_client
+
+        download_layers = LayerDownloader(self.layer_cache, ".", Mock())
+        layer_names = ["layer1", "layer2", "layer3", "layer4"]
+
+        actual = download_layers.download_all([self._create_layer_mock(name) for name in layer_names])
+
+        self.assertEqual(
+            [layer.codeuri for layer in actual], [str(Path(self.layer_cache, name).resolve()) for name in layer_names]
+        )
+        boto3_patch.client.assert_called_once_with("lambda")
+        self.assertEqual(lambda_client_mock.get_layer_version.call_count, 4)
+
+    def test_layer_is_cached(self):
+        self._create_cached_layer("layer1", "sha256")
+
+        self.assertTrue(LayerDownloader._is_layer_cached(Path(self.layer_cache, "layer1")))
 
     def test_layer_is_not_cached(self):
-        download_layers = LayerDownloader("/", ".", Mock())
+        self.assertFalse(LayerDownloader._is_layer_cached(Path(self.layer_cache, "layer1")))
+
+    def test_partially_extracted_layer_is_not_cached(self):
+        Path(self.layer_cache, "layer1").mkdir()
 
-        layer_path = Mock()
-        layer_path.exists.return_value = False
+        self.assertFalse(LayerDownloader._is_layer_cached(Path(self.layer_cache, "layer1")))
 
-        self.assertFalse(download_layers._is_layer_cached(layer_path))
+    def _create_layer_mock(self, name="layer1"):
+        layer_mock = Mock()
+        layer_mock.is_defined_within_template = False
+        layer_mock.name = name
+        layer_mock.arn = f"arn:layer:{name}:1"
+        layer_mock.layer_arn = f"arn:layer:{name}"
+        return layer_mock
+
+    def _create_cached_layer(self, name, code_sha256):
+        Path(self.layer_cache, name).mkdir()
+        Path(self.layer_cache, name, "old_file").write_text("content")
+        Path(self.layer_cache, name + ".sha256").write_text(code_sha256)
+
+    @staticmethod
+    def _unzip(uri, layer_zip_path, unzip_output_dir, progressbar_label):
+        Path(unzip_output_dir).mkdir()
+        Path(unzip_output_dir, "file").write_text("content")
+        return "sha256"
 
     @patch("samcli.local.layers.layer_downloader.Path")
     def test_create_cache(self, path_patch):
@@ -150,20 +295,22 @@ class TestDownloadLayers(TestCase):
         cache_path_mock.mkdir.assert_called_once_with(parents=True, exist_ok=True, mode=0o700)
 
 
-class TestLayerDownloader_fetch_layer_uri(TestCase):
-    def test_fetch_layer_uri_is_successful(self):
+class TestLayerDownloader_fetch_layer_content(TestCase):
+    def test_fetch_layer_content_is_successful(self):
         lambda_client_mock = Mock()
-        lambda_client_mock.get_layer_version.return_value = {"Content": {"Location": "some/uri"}}
+        lambda_client_mock.get_layer_version.return_value = {
+            "Content": {"Location": "some/uri", "CodeSha256": "sha256"}
+        }
         download_layers = LayerDownloader("/", ".", Mock(), lambda_client_mock)
 
         layer = Mock()
         layer.layer_arn = "arn"
         layer.version = 1
-        actual_uri = download_layers._fetch_layer_uri(layer=layer)
+        actual_content = download_layers._fetch_layer_content(layer=layer)
 
-        self.assertEqual(actual_uri, "some/uri")
+        self.assertEqual(actual_content, {"Location": "some/uri", "CodeSha256": "sha256"})
 
-    def test_fetch_layer_uri_fails_with_no_creds(self):
+    def test_fetch_layer_content_fails_with_no_creds(self):
         lambda_client_mock = Mock()
         lambda_client_mock.get_layer_version.side_effect = NoCredentialsError()
         download_layers = LayerDownloader("/", ".", Mock(), lambda_client_mock)
@@ -173,9 +320,9 @@ class TestLayerDownloader_fetch_layer_uri(TestCase):
         layer.version = 1
 
         with self.assertRaises(CredentialsRequired):
-            download_layers._fetch_layer_uri(layer=layer)
+            download_layers._fetch_layer_content(layer=layer)
 
-    def test_fetch_layer_uri_fails_with_AccessDeniedException(self):
+    def test_fetch_layer_content_fails_with_AccessDeniedException(self):
         lambda_client_mock = Mock()
         lambda_client_mock.get_layer_version.side_effect = ClientError(
             error_response={"Error": {"Code": "AccessDeniedException"}}, operation_name="lambda"
@@ -187,9 +334,9 @@ class TestLayerDownloader_fetch_layer_uri(TestCase):
         layer.version = 1
 
         with self.assertRaises(CredentialsRequired):
-            download_layers._fetch_layer_uri(layer=layer)
+            download_layers._fetch_layer_content(layer=layer)
 
-    def test_fetch_layer_uri_fails_with_ResourceNotFoundException(self):
+    def test_fetch_layer_content_fails_with_ResourceNotFoundException(self):
         lambda_client_mock = Mock()
         lambda_client_mock.get_layer_version.side_effect = ClientError(
             error_response={"Error": {"Code": "ResourceNotFoundException"}}, operation_name="lambda"
@@ -201,9 +348,9 @@ class TestLayerDownloader_fetch_layer_uri(TestCase):
         layer.version = 1
 
         with self.assertRaises(ResourceNotFound):
-            download_layers._fetch_layer_uri(layer=layer)
+            download_layers._fetch_layer_content(layer=layer)
 
-    def test_fetch_layer_uri_re_raises_client_error(self):
+    def test_fetch_layer_content_re_raises_client_error(self):
         lambda_client_mock = Mock()
         lambda_client_mock.get_layer_version.side_effect = ClientError(
             error_response={"Error": {"Code": "Unknown"}}, operation_name="lambda"
@@ -215,4 +362,4 @@ class TestLayerDownloader_fetch_layer_uri(TestCase):
         layer.version = 1
 
         with self.assertRaises(ClientError):
-            download_layers._fetch_layer_uri(layer=layer)
+            download_layers._fetch_layer_content(layer=layer)
@@ -13,7 +13,11 @@
 from botocore.compat import OrderedDict
 
 from unittest import TestCase
-from samcli.yamlhelper import yaml_parse, yaml_dump
+from unittest.mock import patch
+
+import yaml
+
+from samcli.yamlhelper import yaml_parse, yaml_dump, CfnLoader
 
 
 class TestYaml(TestCase):
@@ -161,3 +165,25 @@ class TestYaml(TestCase):
         )
         actual = yaml_dump(template)
         self.assertEqual(actual, expected)
+
+    def test_loader_uses_libyaml_if_available(self):
+        if yaml.__with_libyaml__:
+            self.assertTrue(issubclass(CfnLoader, yaml.CSafeLoader))
+        else:
+            self.assertTrue(issubclass(CfnLoader, yaml.SafeLoader))
+
+    def test_parsed_documents_are_cached(self):
+        output = yaml_parse(self.yaml_with_tags)
+
+        with patch("samcli.yamlhelper._yaml_parse") as yaml_parse_mock:
+            output_again = yaml_parse(self.yaml_with_tags)
+
+        yaml_parse_mock.assert_not_called()
+        self.assertEqual(output, output_again)
+        self.assertIsNot(output, output_again)
+
+    def test_cached_documents_are_not_modified_by_callers(self):
+        output = yaml_parse(self.yaml_with_tags)
+        output["Resource"]["Key1"] = "modified"
+
+        self.assertEqual(yaml_parse(self.yaml_with_tags), self.parsed_yaml_dict)